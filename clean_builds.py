@@ -1,17 +1,66 @@
 #!/usr/bin/env python3
-"""Clean up old build artifacts"""
+"""Clean up old build artifacts
+
+Targets are renamed into a trash folder next to them (a cheap rename on the
+same filesystem), so the command returns right away; a detached process
+then deletes the trash on a thread pool. Use --wait to delete in the
+foreground and --dry-run for a JSON report of what would be reclaimed.
+
+--smart keeps caches that are still valid: each cache's inputs (lock files,
+Podfile, toolchain versions) are fingerprinted on every run, and only caches
+whose fingerprint changed are removed. DerivedData is also trimmed, least
+recently used first, to a size cap.
+"""
+import argparse
+import glob
+import hashlib
+import itertools
+import json
 import os
+import queue
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Defaults; each can be overridden on the command line or in the environment
+PROJECT_ROOT = os.environ.get(
+    "N3RD_PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__))
+)
+DERIVED_DATA = os.environ.get(
+    "N3RD_DERIVED_DATA", os.path.expanduser("~/Library/Developer/Xcode/DerivedData")
+)
+TEMP_DIR = os.environ.get("N3RD_TEMP_DIR", tempfile.gettempdir())
+TEMP_PATTERNS = ["flutter_tools.*", "*xcresult*"]
+
+# Hidden folder created next to each target to receive it
+TRASH_NAME = ".clean_builds_trash"
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# --smart: fingerprints of each cache's inputs, kept in the project root
+FINGERPRINT_FILE = ".clean_builds_fingerprints.json"
+DERIVED_DATA_CAP_GB = 20
+# Files (relative to the project root) and tools each cache depends on
+CACHE_INPUTS = {
+    "build": (["pubspec.lock"], ["flutter"]),
+    "pods": (["pubspec.lock", "ios/Podfile"], ["flutter", "pod"]),
+    "derivedData": ([], ["flutter", "xcodebuild"]),
+}
+TOOL_VERSION_COMMANDS = {
+    "flutter": ["flutter", "--version", "--machine"],
+    "pod": ["pod", "--version"],
+    "xcodebuild": ["xcodebuild", "-version"],
+}
 
-PROJECT_ROOT = "/Users/gerardandre/n3rd_game"
+_trash_counter = itertools.count()
 
 def run_command(cmd, description):
-    """Run a shell command and print status"""
+    """Run a command (argument list) and print status"""
     print(f"{description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode == 0:
             print(f"  ✅ {description} completed")
         else:
@@ -19,88 +68,428 @@ def run_command(cmd, description):
     except Exception as e:
         print(f"  ❌ {description} failed: {e}")
 
-def remove_directory(path, description):
-    """Remove a directory if it exists"""
-    if os.path.exists(path):
+def format_size(size):
+    """Human-readable size, like du -h"""
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+def _scan(path):
+    """Sizes of the files directly in path, plus its subdirectories"""
+    total = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total, subdirs
+
+def get_size(path, executor):
+    """Total size of a file or directory tree in bytes
+
+    Directories are scanned concurrently on executor, one task per folder;
+    finished scans arrive on a queue, so each costs O(1) to collect.
+    Symlinks are counted but not followed.
+    """
+    if not os.path.isdir(path) or os.path.islink(path):
         try:
-            size = get_dir_size(path)
-            shutil.rmtree(path)
-            print(f"  ✅ Removed {description} ({size})")
-        except Exception as e:
-            print(f"  ❌ Failed to remove {description}: {e}")
-    else:
+            return os.lstat(path).st_size
+        except OSError:
+            return 0
+
+    finished = queue.Queue()
+    def submit(folder):
+        executor.submit(_scan, folder).add_done_callback(finished.put)
+
+    total = 0
+    submit(path)
+    pending = 1
+    while pending:
+        size, subdirs = finished.get().result()
+        pending += len(subdirs) - 1
+        total += size
+        for subdir in subdirs:
+            submit(subdir)
+    return total
+
+def collect_targets(project_root, derived_data, temp_dir):
+    """Everything a full clean removes, as (path, description) pairs"""
+    targets = [
+        (os.path.join(project_root, "build"), "Flutter build directory"),
+        (os.path.join(project_root, "ios", "Pods"), "iOS Pods"),
+        (os.path.join(project_root, "ios", "Podfile.lock"), "Podfile.lock (file)"),
+    ]
+    if os.path.isdir(derived_data):
+        for item in sorted(os.listdir(derived_data)):
+            if item != TRASH_NAME:
+                targets.append((os.path.join(derived_data, item), f"DerivedData/{item}"))
+    for pattern in TEMP_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(temp_dir, pattern))):
+            targets.append((path, f"Temp {os.path.basename(path)}"))
+    return targets
+
+def build_report(targets, workers):
+    """Bytes reclaimable per target, measured concurrently"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = [get_size(path, executor) if os.path.lexists(path) else None
+                 for path, _ in targets]
+    entries = [
+        {
+            "path": path,
+            "description": description,
+            "exists": size is not None,
+            "bytes": size or 0,
+        }
+        for (path, description), size in zip(targets, sizes)
+    ]
+    return {
+        "targets": entries,
+        "totalBytes": sum(entry["bytes"] for entry in entries),
+    }
+
+def _tool_version(name):
+    """Version output of a build tool, or None when it isn't installed"""
+    try:
+        result = subprocess.run(TOOL_VERSION_COMMANDS[name], capture_output=True,
+                                text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def _file_digest(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def cache_fingerprints(project_root):
+    """Fingerprint of the inputs behind each cache in CACHE_INPUTS"""
+    # The version probes are slow (flutter especially); run them together
+    with ThreadPoolExecutor(max_workers=len(TOOL_VERSION_COMMANDS)) as executor:
+        tools = dict(zip(TOOL_VERSION_COMMANDS,
+                         executor.map(_tool_version, TOOL_VERSION_COMMANDS)))
+    fingerprints = {}
+    for cache, (files, tool_names) in CACHE_INPUTS.items():
+        inputs = {
+            "files": {f: _file_digest(os.path.join(project_root, f)) for f in files},
+            "tools": {name: tools[name] for name in tool_names},
+        }
+        fingerprints[cache] = hashlib.sha256(
+            json.dumps(inputs, sort_keys=True).encode()
+        ).hexdigest()
+    return fingerprints
+
+def load_fingerprints(project_root):
+    try:
+        with open(os.path.join(project_root, FINGERPRINT_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_fingerprints(project_root, fingerprints):
+    path = os.path.join(project_root, FINGERPRINT_FILE)
+    with open(path + ".tmp", "w") as f:
+        json.dump(fingerprints, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def _last_used(path):
+    """When Xcode last used a DerivedData entry (its info.plist is rewritten on use)"""
+    times = []
+    for candidate in (path, os.path.join(path, "info.plist")):
+        try:
+            times.append(os.stat(candidate).st_mtime)
+        except OSError:
+            pass
+    return max(times, default=0)
+
+def lru_derived_data(derived_data, cap_bytes, workers):
+    """DerivedData entries to remove, oldest first, to fit under cap_bytes"""
+    if not os.path.isdir(derived_data):
+        return []
+    entries = [os.path.join(derived_data, item) for item in os.listdir(derived_data)
+               if item != TRASH_NAME]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = {path: get_size(path, executor) for path in entries}
+    total = sum(sizes.values())
+    evicted = []
+    for path in sorted(entries, key=_last_used):
+        if total <= cap_bytes:
+            break
+        evicted.append((path, f"DerivedData/{os.path.basename(path)} "
+                              f"(least recently used, {format_size(sizes[path])})"))
+        total -= sizes[path]
+    return evicted
+
+def smart_targets(project_root, derived_data, temp_dir, cap_bytes, workers,
+                  previous, current):
+    """Targets for --smart: only caches whose fingerprint changed
+
+    Caches without a recorded fingerprint are kept (their fingerprint is
+    recorded for next time). Returns (targets, whether build/ is stale).
+    """
+    def changed(cache):
+        return cache in previous and previous[cache] != current[cache]
+
+    derived_data = os.path.abspath(derived_data)
+    temp_dir = os.path.abspath(temp_dir)
+    targets = []
+    if changed("build"):
+        targets.append((os.path.join(project_root, "build"),
+                        "Flutter build directory (Flutter or pubspec.lock changed)"))
+    if changed("pods"):
+        targets += [
+            (os.path.join(project_root, "ios", "Pods"),
+             "iOS Pods (Podfile, pubspec.lock or CocoaPods changed)"),
+            (os.path.join(project_root, "ios", "Podfile.lock"), "Podfile.lock (file)"),
+        ]
+    for path, description in collect_targets(project_root, derived_data, temp_dir):
+        parent = os.path.dirname(path)
+        if parent == derived_data and changed("derivedData"):
+            targets.append((path, f"{description} (Xcode or Flutter changed)"))
+        elif parent == temp_dir:
+            # Temp files are never reused
+            targets.append((path, description))
+    if not changed("derivedData"):
+        targets += lru_derived_data(derived_data, cap_bytes, workers)
+    return targets, changed("build")
+
+def trash_dir_for(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), TRASH_NAME)
+
+def move_to_trash(path, description):
+    """Rename path into the trash folder next to it
+
+    Returns the trash folder, or None when path doesn't exist. Falls back to
+    deleting in place when the rename isn't possible.
+    """
+    if not os.path.lexists(path):
         print(f"  ℹ️  {description} not found (already clean)")
+        return None
 
-def get_dir_size(path):
-    """Get directory size in human-readable format"""
+    trash = trash_dir_for(path)
     try:
-        result = subprocess.run(
-            ["du", "-sh", path],
-            capture_output=True,
-            text=True,
-            stderr=subprocess.DEVNULL
-        )
-        if result.returncode == 0:
-            return result.stdout.split()[0]
-    except:
+        os.makedirs(trash, exist_ok=True)
+        name = f"{os.path.basename(path)}.{os.getpid()}.{next(_trash_counter)}"
+        os.rename(path, os.path.join(trash, name))
+        print(f"  ✅ Moved {description} to trash")
+        return trash
+    except OSError as e:
+        print(f"  ⚠️  Could not move {description} to trash ({e}), deleting now")
+        remove_path(path)
+        return None
+
+def remove_path(path):
+    """Delete a file, symlink or directory tree; errors are ignored"""
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+    except OSError:
         pass
-    return "unknown size"
+
+def purge_trash(trash_dirs, workers=DEFAULT_WORKERS):
+    """Delete the contents of trash folders on a thread pool
+
+    Trashed directories are split into their top-level entries so one large
+    tree doesn't hold up the others. Returns the number of trashed items.
+    """
+    trashed = []
+    for trash in trash_dirs:
+        try:
+            trashed += [os.path.join(trash, name) for name in os.listdir(trash)]
+        except OSError:
+            pass
+    children = []
+    for path in trashed:
+        if os.path.isdir(path) and not os.path.islink(path):
+            try:
+                children += [os.path.join(path, name) for name in os.listdir(path)]
+            except OSError:
+                pass
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(remove_path, children))
+        list(executor.map(remove_path, trashed))
+    for trash in trash_dirs:
+        try:
+            os.rmdir(trash)
+        except OSError:
+            pass
+    return len(trashed)
+
+def spawn_purge(trash_dirs, workers):
+    """Delete trash folders from a detached background process"""
+    log_path = os.path.join(tempfile.gettempdir(), "clean_builds_purge.log")
+    with open(log_path, "a") as log:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--purge", *trash_dirs,
+             "--workers", str(workers)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    return log_path
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Clean up old Flutter/Xcode build artifacts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Clean this checkout; deletion continues in the background
+  python3 clean_builds.py
+
+  # Show what would be removed and how much space it frees
+  python3 clean_builds.py --dry-run
+
+  # Keep caches whose inputs haven't changed; cap DerivedData at 10 GB
+  python3 clean_builds.py --smart --derived-data-cap 10
+
+  # Linux build host: other checkout, no Xcode, wait for deletion to finish
+  python3 clean_builds.py --project-root /srv/n3rd_game --wait
+
+Environment: N3RD_PROJECT_ROOT, N3RD_DERIVED_DATA, N3RD_TEMP_DIR
+        """,
+    )
+    parser.add_argument("--project-root", default=PROJECT_ROOT,
+                        help=f"Flutter project to clean (default: {PROJECT_ROOT})")
+    parser.add_argument("--derived-data", default=DERIVED_DATA,
+                        help="Xcode DerivedData folder (default: ~/Library/Developer/Xcode/DerivedData)")
+    parser.add_argument("--temp-dir", default=TEMP_DIR,
+                        help=f"Temp folder holding flutter_tools.* and xcresult files (default: {TEMP_DIR})")
+    parser.add_argument("--smart", action="store_true",
+                        help="Only remove caches whose inputs changed, and cap DerivedData")
+    parser.add_argument("--derived-data-cap", type=float, default=DERIVED_DATA_CAP_GB,
+                        metavar="GB",
+                        help=f"DerivedData size cap for --smart (default: {DERIVED_DATA_CAP_GB} GB)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only report bytes reclaimable per target, as JSON")
+    parser.add_argument("--report", metavar="PATH",
+                        help="Write the --dry-run report to PATH instead of stdout")
+    parser.add_argument("--wait", action="store_true",
+                        help="Delete in the foreground instead of a background process")
+    parser.add_argument("--skip-flutter-clean", action="store_true",
+                        help="Don't run flutter clean")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads for sizing and deletion (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--purge", nargs="+", metavar="TRASH_DIR", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.derived_data_cap < 0:
+        parser.error("--derived-data-cap can't be negative")
+    return args
 
 def main():
+    args = parse_args()
+
+    if args.purge:
+        # Background half of a normal run
+        start = time.monotonic()
+        count = purge_trash(args.purge, args.workers)
+        print(f"Purged {count} items from {', '.join(args.purge)} "
+              f"in {time.monotonic() - start:.1f}s")
+        return
+
+    project_root = os.path.abspath(args.project_root)
+    if not os.path.isdir(project_root):
+        print(f"❌ Project root not found: {project_root}")
+        sys.exit(1)
+    # Only --smart needs fingerprints up front; a full clean records them
+    # at the end, once deletion is under way
+    fingerprints = None
+    build_stale = True
+    if args.smart:
+        fingerprints = cache_fingerprints(project_root)
+        targets, build_stale = smart_targets(
+            project_root, args.derived_data, args.temp_dir,
+            int(args.derived_data_cap * 1024 ** 3), args.workers,
+            load_fingerprints(project_root), fingerprints,
+        )
+    else:
+        targets = collect_targets(project_root, args.derived_data, args.temp_dir)
+
+    if args.dry_run:
+        report = build_report(targets, args.workers)
+        report["projectRoot"] = project_root
+        report["mode"] = "smart" if args.smart else "full"
+        output = json.dumps(report, indent=2)
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(output + "\n")
+            print(f"Reclaimable: {format_size(report['totalBytes'])} "
+                  f"across {sum(t['exists'] for t in report['targets'])} targets "
+                  f"(report written to {args.report})")
+        else:
+            print(output)
+        return
+
     print("🧹 Cleaning old builds...")
     print("")
-    
-    os.chdir(PROJECT_ROOT)
-    
+
     # Stop processes
     print("1. Stopping running processes...")
-    run_command("pkill -f 'flutter run'", "Stopped flutter processes")
-    run_command("pkill -f 'xcodebuild'", "Stopped xcodebuild processes")
-    print("")
-    
-    # Flutter clean
-    print("2. Running flutter clean...")
-    run_command("flutter clean", "Flutter clean")
+    run_command(["pkill", "-f", "flutter run"], "Stopped flutter processes")
+    run_command(["pkill", "-f", "xcodebuild"], "Stopped xcodebuild processes")
     print("")
-    
-    # Remove directories
-    print("3. Removing build directories...")
-    remove_directory(f"{PROJECT_ROOT}/build", "Flutter build directory")
-    remove_directory(f"{PROJECT_ROOT}/ios/Pods", "iOS Pods")
-    remove_directory(f"{PROJECT_ROOT}/ios/Podfile.lock", "Podfile.lock (file)")
-    
-    # Xcode artifacts
+
+    # Move everything out of the way first; the renames are instant
+    print("2. Moving build artifacts to trash...")
+    trash_dirs = set()
+    for path, description in targets:
+        trash = move_to_trash(path, description)
+        if trash:
+            trash_dirs.add(trash)
+    # Leftovers from an interrupted earlier run
+    for parent in (project_root, os.path.join(project_root, "ios"),
+                   args.derived_data, args.temp_dir):
+        trash = os.path.join(parent, TRASH_NAME)
+        if os.path.isdir(trash):
+            trash_dirs.add(trash)
     print("")
-    print("4. Removing Xcode artifacts...")
-    derived_data = os.path.expanduser("~/Library/Developer/Xcode/DerivedData")
-    if os.path.exists(derived_data):
-        # Remove contents but keep directory
-        for item in os.listdir(derived_data):
-            remove_directory(os.path.join(derived_data, item), f"DerivedData/{item}")
+
+    # Flutter clean (fast now that build/ is gone)
+    if args.smart and not build_stale:
+        print("3. Skipping flutter clean (build inputs unchanged)")
+        print("")
+    elif not args.skip_flutter_clean:
+        print("3. Running flutter clean...")
+        run_command(["flutter", "clean"], "Flutter clean")
+        print("")
+
+    print("4. Deleting trash...")
+    if not trash_dirs:
+        print("  ℹ️  Nothing to delete")
+    elif args.wait:
+        count = purge_trash(sorted(trash_dirs), args.workers)
+        print(f"  ✅ Deleted {count} items")
     else:
-        print("  ℹ️  Xcode DerivedData not found")
-    
-    # Temporary files
-    print("")
-    print("5. Cleaning temporary files...")
-    temp_patterns = [
-        "/var/folders/zf/y8sx6ccd0z91l8qb8by0slpc0000gn/T/flutter_tools.*",
-        "/var/folders/zf/y8sx6ccd0z91l8qb8by0slpc0000gn/T/*xcresult*"
-    ]
-    for pattern in temp_patterns:
-        run_command(f"rm -rf {pattern}", f"Cleaned {pattern}")
-    
+        log_path = spawn_purge(sorted(trash_dirs), args.workers)
+        print(f"  ✅ Deleting in the background (log: {log_path})")
+
+    # Recorded after the clean: the next build uses these inputs
+    save_fingerprints(project_root, fingerprints or cache_fingerprints(project_root))
+
     print("")
     print("✅ Cleanup complete!")
     print("")
     print("📊 Current disk space:")
-    result = subprocess.run(["df", "-h", "/"], capture_output=True, text=True)
-    if result.returncode == 0:
-        lines = result.stdout.strip().split('\n')
-        if len(lines) > 1:
-            print(lines[-1])
+    usage = shutil.disk_usage(project_root)
+    print(f"  {format_size(usage.free)} free of {format_size(usage.total)}")
     print("")
 
 if __name__ == "__main__":
     main()
-
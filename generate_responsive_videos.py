@@ -8,15 +8,99 @@ Usage: python3 generate_responsive_videos.py input_video.mp4 output_folder/ [--p
 import subprocess
 import sys
 import os
+import re
 import argparse
+import contextlib
+import filecmp
+import glob
+import hashlib
+import io
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python histogram fallback
+    np = None
+
 TARGETS = {
     'standard': (1080, 1920),
     'tall': (1080, 2340),
     'extra_tall': (1080, 2400)
 }
 
+# Kept out of the output folder, which may be the bundled assets/
+CACHE_DIR_NAME = '.video_cache'
+CACHE_MANIFEST = 'manifest.json'
+
+# Frames sampled (and their downscaled edge length) for solid padding colour
+COLOR_SAMPLES = 8
+COLOR_SAMPLE_SIZE = 64
+
+# Cheaper blur padding: blur at 1/BLUR_DOWNSCALE resolution, then upscale.
+# static_blur averages BACKGROUND_SAMPLES frames into one still background.
+BLUR_DOWNSCALE = 4
+BACKGROUND_SAMPLES = 16
+PADDING_MODES = ['blur', 'fast_blur', 'static_blur', 'solid', 'mirror', 'black']
+
+# Chunked encoding never cuts a chunk shorter than this
+MIN_CHUNK_SECONDS = 2.0
+
+# Size-budget mode: CRF search range and the trial segments it samples
+DEFAULT_CRF = 18
+CRF_RANGE = (14, 40)
+TRIAL_SEGMENTS = 3
+TRIAL_SECONDS = 2.0
+# Written to the working directory by default, like the build cache
+CRF_REPORT_NAME = 'crf_report.json'
+
+# Extra x264 settings per encoding profile. 'startup' targets the clips
+# VideoCacheService preloads on cold start: an IDR at frame 0 and every
+# second after (no scene-cut keyframes), closed GOPs so the loop point
+# decodes cleanly, no B-frames (no reorder delay before the first frame)
+# and the fastdecode tune.
+ENCODE_PROFILES = {
+    'default': [],
+    'startup': [
+        '-force_key_frames', 'expr:gte(t,n_forced*1)',
+        '-sc_threshold', '0',
+        '-bf', '0',
+        '-tune', 'fastdecode',
+        '-x264-params', 'open-gop=0',
+    ],
+}
+STARTUP_BENCHMARK_RUNS = 5
+
+# Poster frames and low-res previews written alongside each variant from
+# the same decode: <base>_<variant>.<format> and <base>_<variant>_preview.mp4
+POSTER_FORMATS = {
+    'webp': ['-c:v', 'libwebp', '-quality', '80'],
+    'jpg': ['-q:v', '3'],
+}
+PREVIEW_SUFFIX = '_preview'
+PREVIEW_DOWNSCALE = 4
+PREVIEW_FPS = 15
+PREVIEW_CRF = 32
+
+# Asset manifest written next to the variants for VideoPathHelper and
+# VideoCacheService. Priorities mirror VideoCacheService._preloadVideos
+# (lower loads first); other videos are loaded on demand.
+ASSET_MANIFEST_NAME = 'video_manifest.json'
+# Folder registered in pubspec.yaml that the app loads the manifest from
+BUNDLED_ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+PRELOAD_PRIORITY = {
+    'logoloadingscreen': 0,
+    'titlescreen': 1,
+    'modeselectionscreen': 2,
+}
+
+_dominant_colors = {}
+_file_hashes = {}
+
 def check_ffmpeg():
     """Check if FFmpeg is installed."""
     try:
@@ -26,166 +110,413 @@ def check_ffmpeg():
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
-def get_video_info(input_path):
-    """Get video dimensions and frame rate."""
+@lru_cache(maxsize=None)
+def probe_video(input_path):
+    """Memoised read_video_info() for sources, which don't change mid-run."""
+    return read_video_info(input_path)
+
+def read_video_info(input_path):
+    """Probe dimensions, frame rate, duration and frame count in one call."""
     cmd = [
         'ffprobe', '-v', 'error',
         '-select_streams', 'v:0',
-        '-show_entries', 'stream=width,height,r_frame_rate',
-        '-of', 'csv=s=x:p=0',
+        '-show_entries',
+        'stream=width,height,r_frame_rate,nb_frames:format=duration',
+        '-of', 'json',
         input_path
     ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    info = json.loads(result.stdout)
+    stream = info['streams'][0]
+    num, _, den = stream.get('r_frame_rate', '0/1').partition('/')
+    nb_frames = stream.get('nb_frames')
+    return {
+        'width': int(stream['width']),
+        'height': int(stream['height']),
+        'fps': float(num) / float(den or 1) if float(den or 1) else None,
+        'duration': float(info.get('format', {}).get('duration') or 0),
+        'nb_frames': int(nb_frames) if str(nb_frames).isdigit() else None,
+    }
+
+def get_video_info(input_path):
+    """Get video dimensions and frame rate."""
     try:
-        result = subprocess.run(cmd, capture_output=True, 
-                               text=True, check=True)
-        parts = result.stdout.strip().split('x')
-        width = int(parts[0])
-        height = int(parts[1])
-        fps = parts[2].split('/')[0] if len(parts) > 2 else None
-        return width, height, fps
+        info = probe_video(input_path)
+        fps = info['fps']
+        return info['width'], info['height'], (f"{fps:g}" if fps else None)
     except Exception as e:
         print(f"Error getting video info: {e}")
         return None, None, None
 
-def get_dominant_color(input_path):
-    """Detect dominant color from video by extracting middle frame."""
-    import tempfile
-    
+def read_sample_frames(input_path, samples=COLOR_SAMPLES,
+                       size=COLOR_SAMPLE_SIZE):
+    """Stream ``samples`` evenly spaced, downscaled RGB frames over a pipe.
+
+    One ffmpeg process decodes the source and writes raw ``rgb24`` frames
+    to stdout; nothing touches the disk. Returns the raw bytes.
+    """
+    duration = probe_video(input_path)['duration']
+    rate = samples / duration if duration > 0 else 1
+    cmd = [
+        'ffmpeg', '-v', 'error',
+        '-i', input_path,
+        '-vf', f"fps={rate:.6f},scale={size}:{size}",
+        '-frames:v', str(samples),
+        '-f', 'rawvideo',
+        '-pix_fmt', 'rgb24',
+        '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return result.stdout
+
+def dominant_color_from_pixels(pixels):
+    """Pick the most common colour in raw ``rgb24`` bytes.
+
+    Pixels are bucketed into a 16x16x16 histogram; the result is the mean
+    of the pixels in the fullest bucket, so it is an actual colour from the
+    video rather than the washed-out average of the whole frame.
+    """
+    usable = len(pixels) - len(pixels) % 3
+    if usable == 0:
+        return "000000"
+
+    if np is not None:
+        rgb = np.frombuffer(pixels[:usable], dtype=np.uint8).reshape(-1, 3)
+        quantized = rgb >> 4
+        bins = ((quantized[:, 0].astype(np.int32) << 8) |
+                (quantized[:, 1].astype(np.int32) << 4) |
+                quantized[:, 2])
+        top = np.bincount(bins, minlength=4096).argmax()
+        r, g, b = rgb[bins == top].mean(axis=0).round().astype(int)
+    else:
+        counts = {}
+        for i in range(0, usable, 3):
+            key = ((pixels[i] >> 4) << 8) | ((pixels[i + 1] >> 4) << 4) | (pixels[i + 2] >> 4)
+            count, rs, gs, bs = counts.get(key, (0, 0, 0, 0))
+            counts[key] = (count + 1, rs + pixels[i], gs + pixels[i + 1],
+                           bs + pixels[i + 2])
+        count, rs, gs, bs = max(counts.values())
+        r, g, b = (round(rs / count), round(gs / count), round(bs / count))
+
+    return f"{int(r):02X}{int(g):02X}{int(b):02X}"
+
+def get_dominant_color(input_path, samples=COLOR_SAMPLES, cache=None):
+    """Detect the dominant colour across evenly spaced frames.
+
+    Results are memoised per source hash (and persisted in ``cache`` when
+    given) so every variant of a source reuses one analysis.
+    """
     try:
-        # Get video duration
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            input_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration = float(result.stdout.strip())
-        middle_time = duration / 2
-        
-        # Extract frame, scale to 1x1, get RGB
-        with tempfile.NamedTemporaryFile(suffix='.rgb', delete=False) as temp_file:
-            temp_path = temp_file.name
-            
+        key = f"{file_sha256(input_path)}:{samples}"
+        if key in _dominant_colors:
+            return _dominant_colors[key]
+        if cache is not None and key in cache.colors:
+            _dominant_colors[key] = cache.colors[key]
+            return _dominant_colors[key]
+
+        color = dominant_color_from_pixels(
+            read_sample_frames(input_path, samples))
+        _dominant_colors[key] = color
+        if cache is not None:
+            cache.colors[key] = color
+        return color
+    except Exception:
+        return "000000"  # Fallback to black
+
+def get_static_background(input_path, samples=BACKGROUND_SAMPLES):
+    """Average evenly spaced frames into one low-res still for static_blur.
+
+    The still is written at 1/BLUR_DOWNSCALE of the source size, named by
+    source hash and reused by every variant and later runs. Returns the
+    image path, or None on failure.
+    """
+    try:
+        background_dir = os.path.join(tempfile.gettempdir(),
+                                      'responsive_video_backgrounds')
+        os.makedirs(background_dir, exist_ok=True)
+        background_path = os.path.join(
+            background_dir, f"{file_sha256(input_path)}_{samples}.png")
+        if os.path.exists(background_path):
+            return background_path
+
+        temp_path = background_path[:-4] + f".{os.getpid()}.tmp.png"
+        duration = probe_video(input_path)['duration']
+        rate = samples / duration if duration > 0 else 1
         cmd = [
-            'ffmpeg', '-ss', str(middle_time),
+            'ffmpeg', '-v', 'error',
             '-i', input_path,
-            '-vf', 'scale=1:1',
-            '-frames:v', '1',
-            '-f', 'rawvideo',
-            '-pix_fmt', 'rgb24',
+            '-vf', (
+                f"fps={rate:.6f},"
+                f"scale=iw/{BLUR_DOWNSCALE}:ih/{BLUR_DOWNSCALE},"
+                f"tmix=frames={samples}"
+            ),
+            '-update', '1',
             '-y',
             temp_path
         ]
-        
-        subprocess.run(cmd, capture_output=True, check=True, stderr=subprocess.DEVNULL)
-        
-        # Read RGB values (3 bytes)
-        if os.path.exists(temp_path) and os.path.getsize(temp_path) >= 3:
-            with open(temp_path, 'rb') as f:
-                rgb = f.read(3)
-                hex_color = f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
-            os.unlink(temp_path)
-            return hex_color
-        else:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            return "000000"
+        subprocess.run(cmd, capture_output=True, check=True)
+        # Parallel batch jobs may race to build the same still
+        os.replace(temp_path, background_path)
+        return background_path
     except Exception:
-        return "000000"  # Fallback to black
+        return None
 
-def generate_video_version(input_path, output_path, target_width, 
-                          target_height, padding_mode='blur', keep_audio=False):
-    """Generate a responsive video version."""
-    orig_width, orig_height, fps = get_video_info(input_path)
-    
-    if orig_width is None:
-        print(f"  ✗ Failed to get video info")
-        return False
-    
-    # Calculate scale
+def build_video_filter(orig_width, orig_height, target_width, target_height,
+                       padding_mode='blur', dominant_color=None,
+                       src='', dst='', prefix='', background_path=None):
+    """Build the scale/pad/crop filter chain for one variant.
+
+    With the default empty labels the result is a plain ``-vf`` chain. When
+    ``src``/``dst`` are given (e.g. ``[v0]``/``[out0]``) it becomes one branch
+    of a ``-filter_complex`` graph; ``prefix`` keeps internal pad labels unique
+    across branches. ``static_blur`` needs ``background_path`` from
+    get_static_background().
+    """
     scale = target_width / orig_width
     scaled_height = int(orig_height * scale)
-    
-    print(f"  Original: {orig_width}x{orig_height}")
-    print(f"  Scaled: {target_width}x{scaled_height}")
-    print(f"  Target: {target_width}x{target_height}")
-    
-    # Build FFmpeg command
+
     if scaled_height < target_height:
-        # Extend canvas
         padding = target_height - scaled_height
         padding_top = padding // 2
         padding_bottom = padding - padding_top
-        print(f"  → Extending canvas (adding {padding}px padding, mode: {padding_mode})")
-        
+
         if padding_mode == 'blur':
             vf = (
-                f"scale={target_width}:{scaled_height}:"
+                f"{src}scale={target_width}:{scaled_height}:"
                 f"force_original_aspect_ratio=decrease,"
-                f"split[main][blurred];"
-                f"[blurred]scale={target_width}:{target_height},boxblur=50[bg];"
-                f"[bg][main]overlay=(W-w)/2:(H-h)/2"
+                f"split[{prefix}main][{prefix}blurred];"
+                f"[{prefix}blurred]scale={target_width}:{target_height},boxblur=50[{prefix}bg];"
+                f"[{prefix}bg][{prefix}main]overlay=(W-w)/2:(H-h)/2{dst}"
+            )
+        elif padding_mode == 'fast_blur':
+            # Same look as blur, but the blur runs on a downscaled canvas
+            small_width = target_width // BLUR_DOWNSCALE
+            small_height = target_height // BLUR_DOWNSCALE
+            vf = (
+                f"{src}scale={target_width}:{scaled_height}:"
+                f"force_original_aspect_ratio=decrease,"
+                f"split[{prefix}main][{prefix}blurred];"
+                f"[{prefix}blurred]scale={small_width}:{small_height},"
+                f"boxblur={50 // BLUR_DOWNSCALE},"
+                f"scale={target_width}:{target_height}[{prefix}bg];"
+                f"[{prefix}bg][{prefix}main]overlay=(W-w)/2:(H-h)/2{dst}"
+            )
+        elif padding_mode == 'static_blur':
+            # One pre-averaged still, blurred once and looped behind the video
+            small_width = target_width // BLUR_DOWNSCALE
+            small_height = target_height // BLUR_DOWNSCALE
+            vf = (
+                f"{src}scale={target_width}:{scaled_height}:"
+                f"force_original_aspect_ratio=decrease[{prefix}main];"
+                f"movie='{background_path}',"
+                f"scale={small_width}:{small_height},"
+                f"boxblur={50 // BLUR_DOWNSCALE},"
+                f"scale={target_width}:{target_height},"
+                f"loop=loop=-1:size=1[{prefix}bg];"
+                f"[{prefix}bg][{prefix}main]overlay=(W-w)/2:(H-h)/2:shortest=1{dst}"
             )
         elif padding_mode == 'solid':
             # Solid color padding using dominant video color
-            dominant_color = get_dominant_color(input_path)
-            print(f"  → Using dominant color: #{dominant_color}")
             vf = (
-                f"scale={target_width}:{scaled_height}:"
+                f"{src}scale={target_width}:{scaled_height}:"
                 f"force_original_aspect_ratio=decrease,"
                 f"pad={target_width}:{target_height}:"
-                f"(ow-iw)/2:(oh-ih)/2:color=0x{dominant_color}"
+                f"(ow-iw)/2:(oh-ih)/2:color=0x{dominant_color or '000000'}{dst}"
             )
         elif padding_mode == 'mirror':
             # Mirror mode: crop top/bottom edges and flip them
             vf = (
-                f"scale={target_width}:{scaled_height}:"
+                f"{src}scale={target_width}:{scaled_height}:"
                 f"force_original_aspect_ratio=decrease,"
-                f"split[main][top][bottom];"
-                f"[top]crop={target_width}:{padding_top}:0:0,vflip[top_mirror];"
-                f"[bottom]crop={target_width}:{padding_bottom}:0:{scaled_height-padding_bottom},vflip[bottom_mirror];"
-                f"[top_mirror][main][bottom_mirror]vstack=inputs=3"
+                f"split[{prefix}main][{prefix}top][{prefix}bottom];"
+                f"[{prefix}top]crop={target_width}:{padding_top}:0:0,vflip[{prefix}top_mirror];"
+                f"[{prefix}bottom]crop={target_width}:{padding_bottom}:0:{scaled_height-padding_bottom},vflip[{prefix}bottom_mirror];"
+                f"[{prefix}top_mirror][{prefix}main][{prefix}bottom_mirror]vstack=inputs=3{dst}"
             )
         else:  # black
             vf = (
-                f"scale={target_width}:{scaled_height}:"
+                f"{src}scale={target_width}:{scaled_height}:"
                 f"force_original_aspect_ratio=decrease,"
                 f"pad={target_width}:{target_height}:"
-                f"(ow-iw)/2:(oh-ih)/2:color=black"
+                f"(ow-iw)/2:(oh-ih)/2:color=black{dst}"
             )
-            
     elif scaled_height > target_height:
         # Crop from center
         crop_y = (scaled_height - target_height) // 2
-        print(f"  → Cropping (removing {scaled_height - target_height}px from center)")
         vf = (
-            f"scale={target_width}:-1,"
-            f"crop={target_width}:{target_height}:0:{crop_y}"
+            f"{src}scale={target_width}:-1,"
+            f"crop={target_width}:{target_height}:0:{crop_y}{dst}"
         )
     else:
         # Perfect fit
+        vf = f"{src}scale={target_width}:{target_height}{dst}"
+
+    return vf
+
+def describe_layout(orig_width, orig_height, target_width, target_height,
+                    padding_mode):
+    """Print how a source will be fitted onto a target canvas."""
+    scaled_height = int(orig_height * (target_width / orig_width))
+
+    print(f"  Original: {orig_width}x{orig_height}")
+    print(f"  Scaled: {target_width}x{scaled_height}")
+    print(f"  Target: {target_width}x{target_height}")
+
+    if scaled_height < target_height:
+        padding = target_height - scaled_height
+        print(f"  → Extending canvas (adding {padding}px padding, mode: {padding_mode})")
+    elif scaled_height > target_height:
+        print(f"  → Cropping (removing {scaled_height - target_height}px from center)")
+    else:
         print(f"  → Perfect fit - resizing only")
-        vf = f"scale={target_width}:{target_height}"
-    
-    cmd = [
-        'ffmpeg', '-i', input_path,
-        '-vf', vf,
+
+def needs_padding(orig_width, orig_height, target_width, target_height):
+    """Return True if the scaled source is shorter than the target canvas."""
+    return int(orig_height * (target_width / orig_width)) < target_height
+
+def encoder_args(threads=None, crf=None, profile=None):
+    """Video encoder settings shared by every output."""
+    args = [
         '-c:v', 'libx264',
         '-preset', 'slow',
-        '-crf', '18',
+        '-crf', str(crf if crf is not None else DEFAULT_CRF),
+        *ENCODE_PROFILES[profile or 'default'],
         '-pix_fmt', 'yuv420p',
         '-movflags', '+faststart',
-        '-y',  # Overwrite
-        output_path
     ]
+    if threads:
+        args += ['-threads', str(threads)]
+    return args
+
+def side_output_paths(output_path, extras=None):
+    """Poster/preview paths for a variant, keyed by kind.
+
+    ``extras`` is ``{'poster': 'webp'|'jpg'|None, 'preview': bool}``.
+    """
+    extras = extras or {}
+    stem = os.path.splitext(output_path)[0]
+    paths = {}
+    if extras.get('poster'):
+        paths['poster'] = f"{stem}.{extras['poster']}"
+    if extras.get('preview'):
+        paths['preview'] = f"{stem}{PREVIEW_SUFFIX}.mp4"
+    return paths
+
+def side_outputs(src, prefix, output_path, extras=None):
+    """Filter graph text and output args for a variant's poster/preview.
+
+    ``src`` is the labelled variant stream. Returns ``(graph, main label,
+    output args)``; the graph is empty and ``src`` is returned unchanged
+    when no side outputs are requested. The main label must be mapped to
+    the variant's own output.
+    """
+    paths = side_output_paths(output_path, extras)
+    if not paths:
+        return '', src, []
+
+    labels = ''.join(f"[{prefix}{kind}]" for kind in ['main', *paths])
+    graph = f";{src}split={len(paths) + 1}{labels}"
+    args = []
+    if 'poster' in paths:
+        args += [
+            '-map', f"[{prefix}poster]",
+            '-frames:v', '1',
+            *POSTER_FORMATS[extras['poster']],
+            '-y', paths['poster']
+        ]
+    if 'preview' in paths:
+        graph += (
+            f";[{prefix}preview]scale=iw/{PREVIEW_DOWNSCALE}:-2,"
+            f"fps={PREVIEW_FPS}[{prefix}preview_out]"
+        )
+        args += [
+            '-map', f"[{prefix}preview_out]",
+            '-an',
+            '-c:v', 'libx264',
+            '-preset', 'veryfast',
+            '-crf', str(PREVIEW_CRF),
+            '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart',
+            '-y', paths['preview']
+        ]
+    return graph, f"[{prefix}main]", args
+
+def prepare_video_filter(input_path, orig_width, orig_height, target_width,
+                         target_height, padding_mode, dominant_color=None):
+    """Run any per-source analysis the padding mode needs and build the -vf.
+
+    Returns None (after printing why) if the analysis fails.
+    """
+    if (padding_mode == 'solid' and
+            needs_padding(orig_width, orig_height, target_width, target_height)):
+        dominant_color = dominant_color or get_dominant_color(input_path)
+        print(f"  → Using dominant color: #{dominant_color}")
+
+    background_path = None
+    if (padding_mode == 'static_blur' and
+            needs_padding(orig_width, orig_height, target_width, target_height)):
+        background_path = get_static_background(input_path)
+        if background_path is None:
+            print(f"  ✗ Failed to build static background")
+            return None
+
+    return build_video_filter(orig_width, orig_height, target_width,
+                              target_height, padding_mode, dominant_color,
+                              background_path=background_path)
+
+def generate_video_version(input_path, output_path, target_width, 
+                          target_height, padding_mode='blur', keep_audio=False,
+                          threads=None, dominant_color=None, crf=None,
+                          profile=None, extras=None):
+    """Generate a responsive video version.
+
+    Posters and previews requested in ``extras`` are written by the same
+    ffmpeg process.
+    """
+    orig_width, orig_height, fps = get_video_info(input_path)
+    
+    if orig_width is None:
+        print(f"  ✗ Failed to get video info")
+        return False
+    
+    describe_layout(orig_width, orig_height, target_width, target_height,
+                    padding_mode)
+
+    vf = prepare_video_filter(input_path, orig_width, orig_height,
+                              target_width, target_height, padding_mode,
+                              dominant_color)
+    if vf is None:
+        return False
+    
+    side_graph, main_label, side_args = side_outputs(
+        '[variant]', 'side_', output_path, extras)
+    if side_graph:
+        cmd = [
+            'ffmpeg', '-i', input_path,
+            '-filter_complex', f"[0:v]{vf}[variant]{side_graph}",
+            '-map', main_label,
+            *(['-map', '0:a?'] if keep_audio else []),
+            *encoder_args(threads, crf, profile),
+            '-y',  # Overwrite
+            output_path,
+            *side_args
+        ]
+        audio_index = cmd.index(output_path) - 1
+    else:
+        cmd = [
+            'ffmpeg', '-i', input_path,
+            '-vf', vf,
+            *encoder_args(threads, crf, profile),
+            '-y',  # Overwrite
+            output_path
+        ]
+        audio_index = len(cmd) - 1
     
     # Add audio handling
     if keep_audio:
-        cmd.insert(-1, '-c:a')
-        cmd.insert(-1, 'copy')
+        cmd[audio_index:audio_index] = ['-c:a', 'copy']
     else:
-        cmd.insert(-1, '-an')  # Strip audio
+        cmd.insert(audio_index, '-an')  # Strip audio
     
     try:
         subprocess.run(cmd, check=True, 
@@ -193,11 +524,1019 @@ def generate_video_version(input_path, output_path, target_width,
                      stderr=subprocess.DEVNULL)
         file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
         print(f"  ✓ Created: {output_path} ({file_size:.2f} MB)")
+        for side_path in side_output_paths(output_path, extras).values():
+            print(f"  ✓ Created: {side_path}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"  ✗ Failed: {e}")
         return False
 
+def generate_all_versions(input_path, outputs, padding_mode='blur',
+                          keep_audio=False, threads=None, dominant_color=None,
+                          crfs=None, profile=None, extras=None):
+    """Generate every variant from a single decode of the source.
+
+    ``outputs`` maps variant name to ``(output_path, width, height)``. The
+    source is probed once, decoded once and ``split`` into one filter branch
+    per variant; all outputs are written by the same ffmpeg process.
+    ``crfs`` optionally maps variant name to its own CRF.
+    """
+    orig_width, orig_height, fps = get_video_info(input_path)
+
+    if orig_width is None:
+        print(f"  ✗ Failed to get video info")
+        return False
+
+    if padding_mode == 'solid' and any(
+            needs_padding(orig_width, orig_height, width, height)
+            for _, width, height in outputs.values()):
+        dominant_color = dominant_color or get_dominant_color(input_path)
+        print(f"  → Using dominant color: #{dominant_color}")
+
+    background_path = None
+    if padding_mode == 'static_blur' and any(
+            needs_padding(orig_width, orig_height, width, height)
+            for _, width, height in outputs.values()):
+        background_path = get_static_background(input_path)
+        if background_path is None:
+            print(f"  ✗ Failed to build static background")
+            return False
+
+    names = list(outputs)
+    branches = [f"[0:v]split={len(names)}" + ''.join(f"[v_{n}]" for n in names)]
+    output_args = []
+    for name in names:
+        output_path, width, height = outputs[name]
+        print(f"{name} ({width}x{height}):")
+        describe_layout(orig_width, orig_height, width, height, padding_mode)
+        side_graph, main_label, side_args = side_outputs(
+            f"[out_{name}]", f"{name}_side_", output_path, extras)
+        branches.append(build_video_filter(
+            orig_width, orig_height, width, height, padding_mode,
+            dominant_color, src=f"[v_{name}]", dst=f"[out_{name}]",
+            prefix=f"{name}_", background_path=background_path) + side_graph)
+
+        output_args += ['-map', main_label]
+        if keep_audio:
+            output_args += ['-map', '0:a?', '-c:a', 'copy']
+        else:
+            output_args.append('-an')
+        output_args += [*encoder_args(threads, (crfs or {}).get(name), profile),
+                        '-y', output_path, *side_args]
+
+    cmd = [
+        'ffmpeg', '-i', input_path,
+        '-filter_complex', ';'.join(branches),
+        *output_args
+    ]
+
+    try:
+        subprocess.run(cmd, check=True,
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError as e:
+        print(f"  ✗ Failed: {e}")
+        return False
+
+    for output_path, _, _ in outputs.values():
+        file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
+        print(f"  ✓ Created: {output_path} ({file_size:.2f} MB)")
+        for side_path in side_output_paths(output_path, extras).values():
+            print(f"  ✓ Created: {side_path}")
+    return True
+
+def measure_ssim(reference_path, distorted_path):
+    """Return the mean SSIM of two videos with the same dimensions, or None."""
+    cmd = [
+        'ffmpeg', '-i', distorted_path, '-i', reference_path,
+        '-lavfi', 'ssim', '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    match = re.search(r'All:([0-9.]+)', result.stderr)
+    return float(match.group(1)) if match else None
+
+def get_frame_times(input_path):
+    """Return sorted video frame timestamps and the keyframe indices.
+
+    Reads packet headers only (no decode), so it is cheap even for long
+    sources.
+    """
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0',
+        input_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    packets = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if pts_time and pts_time != 'N/A':
+            packets.append((float(pts_time), 'K' in flags))
+    packets.sort()
+    times = [pts for pts, _ in packets]
+    keyframes = [i for i, (_, key) in enumerate(packets) if key]
+    return times, keyframes
+
+def count_frames(path):
+    """Count video packets (one per frame) without decoding.
+
+    Returns ``(frame_count, duration)``; not memoised, so it is safe to call
+    on files this process just wrote.
+    """
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-count_packets',
+        '-show_entries', 'stream=nb_read_packets:format=duration',
+        '-of', 'json',
+        path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    info = json.loads(result.stdout)
+    return (int(info['streams'][0]['nb_read_packets']),
+            float(info['format']['duration']))
+
+def plan_chunks(frame_times, keyframes, target_chunks,
+                min_seconds=MIN_CHUNK_SECONDS):
+    """Split a frame list into ``(first_frame, frame_count)`` chunks.
+
+    Cuts prefer source keyframes so each chunk's seek is cheap. If the
+    source has too few keyframes the cuts fall back to evenly spaced
+    frames; segments are re-encoded from an accurate seek so any frame is
+    a valid cut.
+    """
+    total = len(frame_times)
+    if total == 0 or target_chunks <= 1:
+        return [(0, total)]
+    duration = frame_times[-1] - frame_times[0]
+    chunk_seconds = max(min_seconds, duration / target_chunks)
+
+    if len(keyframes) > target_chunks:
+        cuts = [0]
+        for index in keyframes:
+            if (frame_times[index] - frame_times[cuts[-1]] >= chunk_seconds and
+                    frame_times[-1] - frame_times[index] >= min_seconds):
+                cuts.append(index)
+    else:
+        count = max(1, min(target_chunks, int(duration // min_seconds)))
+        cuts = [round(i * total / count) for i in range(count)]
+    return [
+        (start, end - start)
+        for start, end in zip(cuts, cuts[1:] + [total])
+    ]
+
+def _encode_chunk(input_path, seek_time, frame_count, vf, threads,
+                  segment_path, crf=None, profile=None):
+    """Process pool entry point: encode one chunk, return (ok, error)."""
+    cmd = [
+        'ffmpeg', '-v', 'error',
+        '-ss', f"{seek_time:.6f}",
+        '-i', input_path,
+        '-frames:v', str(frame_count),
+        '-vf', vf,
+        *encoder_args(threads, crf, profile),
+        '-an',
+        '-y',
+        segment_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return result.returncode == 0, result.stderr.strip()
+
+def generate_video_version_chunked(input_path, output_path, target_width,
+                                   target_height, padding_mode='blur',
+                                   keep_audio=False, dominant_color=None,
+                                   max_workers=None, crf=None, profile=None):
+    """Generate a variant by encoding chunks of the source in parallel.
+
+    Chunks are encoded on a process pool with identical settings, joined
+    with the concat demuxer (no re-encode) and checked against the source
+    for frame count and duration.
+    """
+    orig_width, orig_height, fps = get_video_info(input_path)
+
+    if orig_width is None:
+        print(f"  ✗ Failed to get video info")
+        return False
+
+    describe_layout(orig_width, orig_height, target_width, target_height,
+                    padding_mode)
+
+    vf = prepare_video_filter(input_path, orig_width, orig_height,
+                              target_width, target_height, padding_mode,
+                              dominant_color)
+    if vf is None:
+        return False
+
+    try:
+        frame_times, keyframes = get_frame_times(input_path)
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"  ✗ Failed to read frame timestamps: {e}")
+        return False
+
+    cpu_count = os.cpu_count() or 1
+    chunks = plan_chunks(frame_times, keyframes,
+                         (max_workers or cpu_count) * 2)
+    if len(chunks) < 2:
+        print(f"  → Too short to chunk, encoding in one pass")
+        return generate_video_version(input_path, output_path, target_width,
+                                      target_height, padding_mode, keep_audio,
+                                      dominant_color=dominant_color, crf=crf,
+                                      profile=profile)
+
+    workers, threads = plan_workers(len(chunks), max_workers)
+    print(f"  → {len(chunks)} chunks on {workers} workers x {threads} threads")
+
+    # Seek half a frame early so rounding in pts_time can't skip the first
+    # frame of a chunk; the accurate seek still drops the previous one.
+    half_frame = 0.5 / fps_value(fps, frame_times)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        segments = [
+            os.path.join(work_dir, f"chunk_{i:04d}.mp4")
+            for i in range(len(chunks))
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_encode_chunk, input_path,
+                            max(0.0, frame_times[start] - half_frame),
+                            count, vf, threads, segment, crf, profile)
+                for (start, count), segment in zip(chunks, segments)
+            ]
+            for i, future in enumerate(futures):
+                ok, error = future.result()
+                if not ok:
+                    print(f"  ✗ Chunk {i} failed: {error}")
+                    return False
+
+        list_path = os.path.join(work_dir, 'chunks.txt')
+        with open(list_path, 'w') as f:
+            for segment in segments:
+                f.write(f"file '{segment}'\n")
+
+        cmd = ['ffmpeg', '-v', 'error', '-f', 'concat', '-safe', '0',
+               '-i', list_path]
+        if keep_audio:
+            cmd += ['-i', input_path, '-map', '0:v', '-map', '1:a?',
+                    '-c:a', 'copy']
+        cmd += ['-c:v', 'copy', '-movflags', '+faststart', '-y', output_path]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"  ✗ Join failed: {result.stderr.strip()}")
+            return False
+
+    try:
+        output_frames, output_duration = count_frames(output_path)
+    except (subprocess.CalledProcessError, ValueError, KeyError,
+            IndexError) as e:
+        print(f"  ✗ Failed to verify joined output: {e}")
+        return False
+
+    source_duration = probe_video(input_path)['duration']
+    if output_frames != len(frame_times):
+        print(f"  ✗ Frame count mismatch: {output_frames} != {len(frame_times)}")
+        return False
+    if abs(output_duration - source_duration) > 2 * half_frame + 0.05:
+        print(f"  ✗ Duration mismatch: {output_duration:.3f}s != "
+              f"{source_duration:.3f}s")
+        return False
+
+    file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
+    print(f"  ✓ Created: {output_path} ({file_size:.2f} MB, "
+          f"{output_frames} frames verified)")
+    return True
+
+def fps_value(fps, frame_times):
+    """Frame rate as a float, falling back to the mean frame spacing."""
+    try:
+        if fps and float(fps) > 0:
+            return float(fps)
+    except ValueError:
+        pass
+    if len(frame_times) > 1:
+        return (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
+    return 30.0
+
+def sample_segments(duration, segments=TRIAL_SEGMENTS, seconds=TRIAL_SECONDS):
+    """Evenly spaced ``(start, length)`` windows for trial encodes."""
+    if duration <= segments * seconds:
+        return [(0.0, duration)]
+    step = duration / segments
+    return [
+        (i * step + (step - seconds) / 2, seconds)
+        for i in range(segments)
+    ]
+
+def segment_ssim(input_path, encoded_path, vf, start=None, length=None):
+    """SSIM of an encode against the same filter applied to the source.
+
+    This measures encoder loss only; scaling and padding are identical on
+    both sides.
+    """
+    window = []
+    if start is not None:
+        window = ['-ss', f"{start:.3f}", '-t', f"{length:.3f}"]
+    cmd = [
+        'ffmpeg', '-i', encoded_path,
+        *window, '-i', input_path,
+        '-filter_complex', f"[1:v]{vf}[ref];[0:v][ref]ssim",
+        '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    match = re.search(r'All:([0-9.]+)', result.stderr)
+    return float(match.group(1)) if match else None
+
+def trial_encode(input_path, vf, crf, segments, work_dir, threads=None,
+                 profile=None):
+    """Encode the sample windows at ``crf``.
+
+    Returns ``(estimated_bytes, ssim)`` where the size is extrapolated from
+    the trial bytes to the full source duration.
+    """
+    duration = probe_video(input_path)['duration']
+    total_bytes = 0
+    scores = []
+    for i, (start, length) in enumerate(segments):
+        trial_path = os.path.join(work_dir, f"trial_{crf}_{i}.mp4")
+        cmd = [
+            'ffmpeg', '-v', 'error',
+            '-ss', f"{start:.3f}", '-t', f"{length:.3f}",
+            '-i', input_path,
+            '-vf', vf,
+            *encoder_args(threads, crf, profile),
+            '-an',
+            '-y',
+            trial_path
+        ]
+        subprocess.run(cmd, capture_output=True, check=True)
+        total_bytes += os.path.getsize(trial_path)
+        ssim = segment_ssim(input_path, trial_path, vf, start, length)
+        if ssim is not None:
+            scores.append(ssim)
+    sampled = sum(length for _, length in segments) or 1
+    estimated = int(total_bytes * max(duration, sampled) / sampled)
+    return estimated, (min(scores) if scores else None)
+
+def choose_crf(input_path, vf, max_bytes=None, min_ssim=None, threads=None,
+               profile=None):
+    """Binary-search the CRF for a size budget and/or quality floor.
+
+    Size and SSIM both fall as CRF rises, so the search finds the lowest
+    CRF whose estimate fits ``max_bytes`` and the highest CRF that still
+    meets ``min_ssim``. If both are set and conflict, quality wins and the
+    result is marked ``over_budget``.
+    """
+    segments = sample_segments(probe_video(input_path)['duration'])
+    trials = {}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        def trial(crf):
+            if crf not in trials:
+                trials[crf] = trial_encode(input_path, vf, crf, segments,
+                                           work_dir, threads, profile)
+            return trials[crf]
+
+        def search(passes, prefer_low):
+            # Smallest passing CRF when prefer_low, else largest
+            lo, hi = CRF_RANGE
+            found = None
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                if passes(mid):
+                    found = mid
+                    if prefer_low:
+                        hi = mid - 1
+                    else:
+                        lo = mid + 1
+                elif prefer_low:
+                    lo = mid + 1
+                else:
+                    hi = mid - 1
+            return found
+
+        size_crf = ssim_crf = None
+        if max_bytes:
+            size_crf = search(lambda c: trial(c)[0] <= max_bytes, True)
+        if min_ssim:
+            ssim_crf = search(
+                lambda c: (trial(c)[1] or 0) >= min_ssim, False)
+
+    status = 'ok'
+    if max_bytes and min_ssim:
+        if size_crf is not None and ssim_crf is not None and size_crf <= ssim_crf:
+            crf = size_crf
+        else:
+            crf = ssim_crf if ssim_crf is not None else CRF_RANGE[0]
+            status = 'over_budget'
+    elif max_bytes:
+        crf = size_crf if size_crf is not None else CRF_RANGE[1]
+        if size_crf is None:
+            status = 'over_budget'
+    else:
+        crf = ssim_crf if ssim_crf is not None else CRF_RANGE[0]
+        if ssim_crf is None:
+            status = 'below_min_ssim'
+
+    estimated, trial_ssim = trials.get(crf, (None, None))
+    return {
+        'crf': crf,
+        'status': status,
+        'estimated_bytes': estimated,
+        'trial_ssim': trial_ssim,
+        'trials': len(trials),
+    }
+
+def plan_budget_crf(input_path, width, height, padding_mode, max_bytes=None,
+                    min_ssim=None, dominant_color=None, threads=None,
+                    profile=None):
+    """Pick a CRF for one variant; returns the choice dict or None."""
+    orig_width, orig_height, fps = get_video_info(input_path)
+    if orig_width is None:
+        return None
+    with contextlib.redirect_stdout(io.StringIO()):
+        vf = prepare_video_filter(input_path, orig_width, orig_height, width,
+                                  height, padding_mode, dominant_color)
+    if vf is None:
+        return None
+    choice = choose_crf(input_path, vf, max_bytes, min_ssim, threads, profile)
+    choice['vf'] = vf
+    return choice
+
+def finish_budget_report(choice, output_path, input_path):
+    """Measure the final encode and return its report entry."""
+    entry = {
+        'source': input_path,
+        'crf': choice['crf'],
+        'status': choice['status'],
+        'estimated_bytes': choice['estimated_bytes'],
+        'trial_ssim': choice['trial_ssim'],
+        'trials': choice['trials'],
+        'bytes': os.path.getsize(output_path),
+        'ssim': segment_ssim(input_path, output_path, choice['vf']),
+    }
+    print(f"  → CRF {entry['crf']}: {entry['bytes']} bytes, "
+          f"SSIM {entry['ssim'] if entry['ssim'] is not None else 'n/a'} "
+          f"({entry['status']})")
+    return entry
+
+def write_crf_report(report_path, entries):
+    """Merge ``entries`` (keyed by output file name) into the JSON report."""
+    report = {}
+    if os.path.exists(report_path):
+        try:
+            with open(report_path, 'r') as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            report = {}
+    report.update(entries)
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"CRF report: {report_path} ({len(entries)} updated)")
+
+def compare_outputs(output_folder, reference_folder, base_name):
+    """Compare generated variants against a reference folder.
+
+    Reports byte-identical files directly and falls back to SSIM otherwise.
+    """
+    print(f"Comparing against: {reference_folder}")
+    for variant in TARGETS:
+        file_name = f"{base_name}_{variant}.mp4"
+        output_path = os.path.join(output_folder, file_name)
+        reference_path = os.path.join(reference_folder, file_name)
+        if not (os.path.exists(output_path) and os.path.exists(reference_path)):
+            print(f"  ⚠ {variant}: missing output or reference")
+            continue
+        if filecmp.cmp(output_path, reference_path, shallow=False):
+            print(f"  ✓ {variant}: byte-identical")
+            continue
+        ssim = measure_ssim(reference_path, output_path)
+        if ssim is None:
+            print(f"  ✗ {variant}: SSIM measurement failed")
+        else:
+            print(f"  ✓ {variant}: SSIM {ssim:.5f}")
+
+def benchmark_padding_modes(input_path, modes, reference_mode='blur'):
+    """Encode every variant in each padding mode and report speed/quality.
+
+    Prints encode fps (source frames x variants / wall time) and the mean
+    SSIM of each mode against ``reference_mode``. Outputs go to a
+    temporary directory and are discarded.
+    """
+    info = probe_video(input_path)
+    frames = info['nb_frames'] or round(info['duration'] * (info['fps'] or 0))
+    modes = [reference_mode] + [m for m in modes if m != reference_mode]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for mode in modes:
+            started = time.monotonic()
+            ok = True
+            with contextlib.redirect_stdout(io.StringIO()):
+                for variant, (width, height) in TARGETS.items():
+                    output_path = os.path.join(work_dir, f"{mode}_{variant}.mp4")
+                    ok = generate_video_version(input_path, output_path, width,
+                                                height, mode) and ok
+            seconds = time.monotonic() - started
+            if not ok:
+                print(f"  ✗ {mode}: encode failed")
+                continue
+
+            scores = []
+            for variant in TARGETS:
+                ssim = measure_ssim(
+                    os.path.join(work_dir, f"{reference_mode}_{variant}.mp4"),
+                    os.path.join(work_dir, f"{mode}_{variant}.mp4"))
+                if ssim is not None:
+                    scores.append(ssim)
+            results[mode] = (seconds, scores)
+
+    print(f"{'Mode':<12} {'Time':>8} {'FPS':>8} {'SSIM':>8}")
+    for mode, (seconds, scores) in results.items():
+        fps = frames * len(TARGETS) / seconds if seconds else 0
+        ssim = f"{sum(scores) / len(scores):.5f}" if scores else 'n/a'
+        print(f"{mode:<12} {seconds:>7.1f}s {fps:>8.1f} {ssim:>8}")
+    return results
+
+def _median_seconds(cmd, runs):
+    """Median wall time of ``runs`` executions of ``cmd``."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=True)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def measure_startup(path, runs=STARTUP_BENCHMARK_RUNS):
+    """Measure how quickly a clip opens and shows its first frame.
+
+    Returns a dict with median ``open`` (container probe) and
+    ``first_frame`` (open + decode frame 0) seconds, plus layout facts that
+    explain them: keyframe interval, B-frames and whether moov is first.
+    """
+    open_seconds = _median_seconds([
+        'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+        '-of', 'csv=p=0', path
+    ], runs)
+    first_frame_seconds = _median_seconds([
+        'ffmpeg', '-v', 'error', '-i', path, '-frames:v', '1',
+        '-f', 'null', '-'
+    ], runs)
+
+    frame_times, keyframes = get_frame_times(path)
+    gaps = [b - a for a, b in zip(keyframes, keyframes[1:])]
+    result = subprocess.run([
+        'ffprobe', '-v', 'error', '-select_streams', 'v:0',
+        '-show_entries', 'stream=has_b_frames', '-of', 'csv=p=0', path
+    ], capture_output=True, text=True, check=True)
+
+    with open(path, 'rb') as f:
+        head = f.read(64 * 1024)
+    moov, mdat = head.find(b'moov'), head.find(b'mdat')
+    return {
+        'open': open_seconds,
+        'first_frame': first_frame_seconds,
+        'keyframe_at_zero': bool(keyframes) and keyframes[0] == 0,
+        'max_gop': max(gaps) if gaps else len(frame_times),
+        'b_frames': int(result.stdout.strip() or 0),
+        'faststart': moov != -1 and (mdat == -1 or moov < mdat),
+        'bytes': os.path.getsize(path),
+    }
+
+def benchmark_startup(input_path, padding_mode='blur', variant='standard',
+                      runs=STARTUP_BENCHMARK_RUNS):
+    """Encode one variant with each profile and compare startup latency."""
+    width, height = TARGETS[variant]
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for profile in ENCODE_PROFILES:
+            output_path = os.path.join(work_dir, f"{profile}.mp4")
+            with contextlib.redirect_stdout(io.StringIO()):
+                ok = generate_video_version(input_path, output_path, width,
+                                            height, padding_mode,
+                                            profile=profile)
+            if not ok:
+                print(f"  ✗ {profile}: encode failed")
+                continue
+            results[profile] = measure_startup(output_path, runs)
+
+    print(f"{'Profile':<10} {'Open':>8} {'1st frame':>10} {'GOP':>5} "
+          f"{'B':>3} {'Faststart':>10} {'Bytes':>10}")
+    for profile, r in results.items():
+        print(f"{profile:<10} {r['open'] * 1000:>6.1f}ms "
+              f"{r['first_frame'] * 1000:>8.1f}ms {r['max_gop']:>5} "
+              f"{r['b_frames']:>3} {'yes' if r['faststart'] else 'no':>10} "
+              f"{r['bytes']:>10}")
+    return results
+
+def file_sha256(path):
+    """Hash a file in chunks so large sources aren't read into memory.
+
+    Memoised on path, size and mtime so repeated lookups are free.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        _file_hashes[memo_key] = digest.hexdigest()
+    return _file_hashes[memo_key]
+
+@lru_cache(maxsize=None)
+def get_ffmpeg_version():
+    """First line of ``ffmpeg -version``; part of every cache key."""
+    try:
+        result = subprocess.run(['ffmpeg', '-version'], capture_output=True,
+                                text=True, check=True)
+        return result.stdout.splitlines()[0].strip()
+    except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        return 'unknown'
+
+def variant_cache_key(source_hash, width, height, padding_mode, keep_audio,
+                      options=None):
+    """Key a variant by its source content and every output-affecting setting.
+
+    ``options`` holds any extra mode flags (e.g. chunked encoding) that
+    change the bytes written.
+    """
+    settings = {
+        'source': source_hash,
+        'size': [width, height],
+        'padding_mode': padding_mode,
+        'keep_audio': keep_audio,
+        'encoder': encoder_args(profile=(options or {}).get('profile')),
+        'ffmpeg': get_ffmpeg_version(),
+        'options': options or {},
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+class BuildCache:
+    """Persistent manifest of encoded variants, keyed by output path.
+
+    An entry is a hit when its key matches and the output on disk still
+    has the recorded size and mtime, so deleted or hand-edited outputs are
+    re-encoded.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, CACHE_MANIFEST)
+        self.entries = {}
+        self.colors = {}
+        self.hits = []
+        self.misses = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    manifest = json.load(f)
+                self.entries = manifest.get('entries', {})
+                self.colors = manifest.get('colors', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠ Ignoring unreadable cache manifest: {e}")
+
+    def lookup(self, output_path, key, side_paths=()):
+        """Return True if ``output_path`` is up to date for ``key``.
+
+        Any poster/preview in ``side_paths`` must also still exist.
+        """
+        entry = self.entries.get(os.path.abspath(output_path))
+        hit = False
+        if (entry and entry.get('key') == key and
+                all(os.path.exists(path) for path in side_paths)):
+            try:
+                stat = os.stat(output_path)
+                hit = (stat.st_size == entry.get('size') and
+                       stat.st_mtime_ns == entry.get('mtime_ns'))
+            except OSError:
+                hit = False
+        (self.hits if hit else self.misses).append(output_path)
+        return hit
+
+    def record(self, output_path, key, source_path):
+        """Remember a freshly written output."""
+        stat = os.stat(output_path)
+        self.entries[os.path.abspath(output_path)] = {
+            'key': key,
+            'source': os.path.abspath(source_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    def save(self):
+        """Write the manifest atomically."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'version': 1, 'entries': self.entries,
+                       'colors': self.colors}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def prune(self):
+        """Drop entries whose source or output no longer exists."""
+        stale = [
+            output_path for output_path, entry in self.entries.items()
+            if not os.path.exists(entry.get('source', '')) or
+            not os.path.exists(output_path)
+        ]
+        for output_path in stale:
+            del self.entries[output_path]
+        return stale
+
+    def report(self):
+        """Print the hit/miss summary for this run."""
+        print(f"Cache: {len(self.hits)} hit, {len(self.misses)} miss")
+        for output_path in self.hits:
+            print(f"  = {os.path.basename(output_path)} (unchanged, skipped)")
+        for output_path in self.misses:
+            print(f"  + {os.path.basename(output_path)}")
+
+def profile_options(budget=None, profile=None, extras=None):
+    """Cache-key options for a budget search, profile and side outputs."""
+    options = dict(budget or {})
+    if profile and profile != 'default':
+        options['profile'] = profile
+    if extras and any(extras.values()):
+        options['extras'] = extras
+    return options
+
+def split_cached(cache, input_path, outputs, padding_mode, keep_audio,
+                 force=False, options=None):
+    """Split ``outputs`` into variants that still need encoding.
+
+    Returns ``(pending, keys)`` where ``pending`` is the subset of
+    ``outputs`` to encode and ``keys`` maps each variant to its cache key.
+    Without a cache everything is pending.
+    """
+    if cache is None:
+        return dict(outputs), {}
+    source_hash = file_sha256(input_path)
+    keys = {
+        variant: variant_cache_key(source_hash, width, height, padding_mode,
+                                   keep_audio, options)
+        for variant, (_, width, height) in outputs.items()
+    }
+    pending = {}
+    for variant, output in outputs.items():
+        if force:
+            cache.misses.append(output[0])
+            pending[variant] = output
+        elif not cache.lookup(output[0], keys[variant],
+                              side_output_paths(output[0],
+                                                (options or {}).get('extras')).values()):
+            pending[variant] = output
+    return pending, keys
+
+def record_outputs(cache, input_path, outputs, keys):
+    """Record successfully written outputs in the cache, if any."""
+    if cache is None:
+        return
+    for variant, (output_path, _, _) in outputs.items():
+        if os.path.exists(output_path):
+            cache.record(output_path, keys[variant], input_path)
+
+def build_asset_manifest(output_folder):
+    """Describe every ``<base>_<variant>.mp4`` in ``output_folder``.
+
+    Each base video lists the variants that exist with dimensions,
+    duration, byte size, content hash and any poster/preview file, plus a
+    suggested preload priority (null when it should load on demand).
+    """
+    videos = {}
+    for path in sorted(glob.glob(os.path.join(output_folder, '*.mp4'))):
+        stem = Path(path).stem
+        variant = next((v for v in sorted(TARGETS, key=len, reverse=True)
+                        if stem.endswith(f"_{v}")), None)
+        if variant is None:
+            continue
+        base = stem[:-len(variant) - 1]
+        info = read_video_info(path)
+        video = videos.setdefault(base, {
+            'priority': PRELOAD_PRIORITY.get(base),
+            'variants': {},
+        })
+        entry = video['variants'][variant] = {
+            'file': os.path.basename(path),
+            'width': info['width'],
+            'height': info['height'],
+            'duration': round(info['duration'], 3),
+            'bytes': os.path.getsize(path),
+            'sha256': file_sha256(path),
+        }
+        for poster_format in POSTER_FORMATS:
+            if os.path.exists(f"{path[:-4]}.{poster_format}"):
+                entry['poster'] = f"{stem}.{poster_format}"
+                break
+        if os.path.exists(f"{path[:-4]}{PREVIEW_SUFFIX}.mp4"):
+            entry['preview'] = f"{stem}{PREVIEW_SUFFIX}.mp4"
+    return {'version': 1, 'videos': videos}
+
+def write_asset_manifest(output_folder):
+    """Rebuild the asset manifest for ``output_folder``; returns its path."""
+    manifest = build_asset_manifest(output_folder)
+    manifest_path = os.path.join(output_folder, ASSET_MANIFEST_NAME)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'), sort_keys=True)
+    os.replace(temp_path, manifest_path)
+    variant_count = sum(len(v['variants']) for v in manifest['videos'].values())
+    print(f"Asset manifest: {manifest_path} "
+          f"({len(manifest['videos'])} videos, {variant_count} variants)")
+    if os.path.abspath(output_folder) != BUNDLED_ASSET_DIR:
+        print(f"⚠ The app only bundles {BUNDLED_ASSET_DIR}/; copy the variants "
+              f"and {ASSET_MANIFEST_NAME} there (or generate into it)")
+    return manifest_path
+
+def verify_asset_manifest(output_folder):
+    """Check the manifest against the files on disk; returns problem list."""
+    manifest_path = os.path.join(output_folder, ASSET_MANIFEST_NAME)
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        return [f"cannot read {manifest_path}: {e}"]
+
+    problems = []
+    listed = set()
+    for base, video in manifest.get('videos', {}).items():
+        for variant, entry in video.get('variants', {}).items():
+            path = os.path.join(output_folder, entry['file'])
+            listed.add(entry['file'])
+            if not os.path.exists(path):
+                problems.append(f"{base}/{variant}: missing {entry['file']}")
+            elif os.path.getsize(path) != entry['bytes']:
+                problems.append(f"{base}/{variant}: size changed")
+            elif file_sha256(path) != entry['sha256']:
+                problems.append(f"{base}/{variant}: content changed")
+
+    suffixes = tuple(f"_{variant}.mp4" for variant in TARGETS)
+    for path in sorted(glob.glob(os.path.join(output_folder, '*.mp4'))):
+        name = os.path.basename(path)
+        if name.endswith(suffixes) and name not in listed:
+            problems.append(f"{name}: on disk but not in manifest")
+    return problems
+
+def find_batch_inputs(pattern):
+    """Resolve a --batch directory or glob to source videos.
+
+    Files that already carry a variant or preview suffix
+    (``*_standard.mp4``, ``*_preview.mp4`` etc.) are skipped so re-running
+    into the same folder doesn't pick up outputs.
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.mp4')
+    suffixes = tuple(f"_{variant}" for variant in TARGETS) + (PREVIEW_SUFFIX,)
+    return [
+        path for path in sorted(glob.glob(pattern))
+        if os.path.isfile(path) and not Path(path).stem.endswith(suffixes)
+    ]
+
+def plan_workers(job_count, max_workers=None, cpu_count=None):
+    """Pick (workers, threads per job) for the batch pool.
+
+    x264 doesn't keep every core busy at the start and end of a file, so
+    running several narrower encodes side by side fills those gaps. Each
+    job gets an equal share of the cores.
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    workers = max_workers or max(1, cpu_count // 2)
+    workers = max(1, min(workers, job_count, cpu_count))
+    threads = max(1, cpu_count // workers)
+    return workers, threads
+
+def _run_batch_job(input_path, variant, outputs, padding_mode, keep_audio,
+                   threads, dominant_color=None, budget=None, profile=None,
+                   extras=None):
+    """Process pool entry point.
+
+    Returns ``(ok, captured log, seconds, budget report entries)``.
+    """
+    log = io.StringIO()
+    started = time.monotonic()
+    report = {}
+    with contextlib.redirect_stdout(log):
+        try:
+            selected = outputs if variant is None else {variant: outputs[variant]}
+            choices = {}
+            if budget:
+                for name, (_, width, height) in selected.items():
+                    choices[name] = plan_budget_crf(
+                        input_path, width, height, padding_mode,
+                        dominant_color=dominant_color, threads=threads,
+                        profile=profile, **budget)
+                    if choices[name] is None:
+                        raise RuntimeError(f"CRF search failed for {name}")
+            crfs = {name: choice['crf'] for name, choice in choices.items()}
+
+            if variant is None:
+                ok = generate_all_versions(input_path, outputs, padding_mode,
+                                           keep_audio, threads, dominant_color,
+                                           crfs, profile, extras)
+            else:
+                output_path, width, height = outputs[variant]
+                ok = generate_video_version(input_path, output_path, width,
+                                            height, padding_mode, keep_audio,
+                                            threads, dominant_color,
+                                            crfs.get(variant), profile, extras)
+            if ok:
+                for name, choice in choices.items():
+                    output_path = selected[name][0]
+                    report[os.path.basename(output_path)] = finish_budget_report(
+                        choice, output_path, input_path)
+        except Exception as e:
+            print(f"  ✗ Failed: {e}")
+            ok = False
+    return ok, log.getvalue(), time.monotonic() - started, report
+
+def run_batch(inputs, output_folder, padding_mode='blur', keep_audio=False,
+              single_decode=False, max_workers=None, cache=None, force=False,
+              budget=None, budget_report=None, profile=None, extras=None):
+    """Encode every (input, variant) job on a process pool.
+
+    With ``single_decode`` each input is one job that writes all variants.
+    Variants already in ``cache`` are skipped. ``budget`` holds
+    ``max_bytes``/``min_ssim`` for a per-variant CRF search, whose results
+    are added to ``budget_report``. A failing job is reported and the rest
+    of the batch keeps going. Returns the list of failed job labels.
+    """
+    jobs = []
+    cache_keys = {}
+    colors = {}
+    for input_path in inputs:
+        base_name = Path(input_path).stem
+        outputs = {
+            variant: (
+                os.path.join(output_folder, f"{base_name}_{variant}.mp4"),
+                width,
+                height
+            )
+            for variant, (width, height) in TARGETS.items()
+        }
+        outputs, cache_keys[input_path] = split_cached(
+            cache, input_path, outputs, padding_mode, keep_audio, force,
+            profile_options(budget, profile, extras))
+        if not outputs:
+            continue
+        if padding_mode == 'solid':
+            # Analyse once here so parallel variant jobs don't each repeat it
+            colors[input_path] = get_dominant_color(input_path, cache=cache)
+        if single_decode:
+            jobs.append((input_path, None, outputs))
+        else:
+            jobs.extend((input_path, variant, outputs) for variant in outputs)
+
+    if not jobs:
+        print("Nothing to encode - all variants are up to date")
+        return []
+
+    workers, threads = plan_workers(len(jobs), max_workers)
+    print(f"Jobs: {len(jobs)} ({len(inputs)} inputs)")
+    print(f"Workers: {workers} x {threads} threads")
+    print()
+
+    failed = []
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_run_batch_job, input_path, variant, outputs,
+                        padding_mode, keep_audio, threads,
+                        colors.get(input_path), budget, profile, extras):
+                (input_path, variant, outputs)
+            for input_path, variant, outputs in jobs
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            input_path, variant, outputs = futures[future]
+            label = f"{Path(input_path).name} [{variant or 'all'}]"
+            try:
+                ok, log, seconds, report = future.result()
+            except Exception as e:
+                ok, log, seconds, report = False, f"  ✗ Failed: {e}\n", 0.0, {}
+            mark = '✓' if ok else '✗'
+            print(f"[{done}/{len(jobs)}] {mark} {label} ({seconds:.1f}s)")
+            if not ok:
+                failed.append(label)
+                print(log, end='')
+            else:
+                if budget_report is not None:
+                    budget_report.update(report)
+                written = outputs if variant is None else {variant: outputs[variant]}
+                record_outputs(cache, input_path, written,
+                               cache_keys[input_path])
+
+    print()
+    print(f"Batch finished in {time.monotonic() - started:.1f}s "
+          f"({len(jobs) - len(failed)} ok, {len(failed)} failed)")
+    return failed
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate responsive video wallpaper versions',
@@ -210,16 +1549,52 @@ Examples:
   # Preserve audio
   python3 generate_responsive_videos.py input.mp4 output/ --keep-audio
   
-  # Batch process all MP4 files in current directory
-  for video in *.mp4; do 
-    python3 generate_responsive_videos.py "$video" output/ --padding-mode blur
-  done
+  # Decode the source once and write all variants from one ffmpeg process
+  python3 generate_responsive_videos.py input.mp4 output/ --single-decode
+
+  # Check single-decode outputs against a per-variant reference run
+  python3 generate_responsive_videos.py input.mp4 output/ --single-decode \\
+      --compare-with reference/
+
+  # Batch process all MP4 files in a directory on a process pool
+  python3 generate_responsive_videos.py --batch assets/ output/ --padding-mode blur
+
+  # Batch with a glob and an explicit worker count
+  python3 generate_responsive_videos.py --batch 'assets/*screen.mp4' output/ --jobs 4
+
+  # Unchanged variants are skipped; --force re-encodes everything
+  python3 generate_responsive_videos.py --batch assets/ output/ --force
+
+  # Use every core on one long video by encoding keyframe chunks in parallel
+  python3 generate_responsive_videos.py assets/modeselection3.mp4 output/ --chunked
+
+  # Posters and tiny previews for instant paint during cold start
+  python3 generate_responsive_videos.py input.mp4 output/ --poster webp --preview
+
+  # Search CRF per variant to fit 500 KB while keeping SSIM >= 0.97
+  python3 generate_responsive_videos.py input.mp4 output/ \\
+      --max-bytes 500000 --min-ssim 0.97
+
+  # Cold-start clips: fast open and first frame, clean loop point
+  python3 generate_responsive_videos.py assets/titlescreen.mp4 output/ --profile startup
+
+  # Compare time-to-first-frame of the startup profile with the default
+  python3 generate_responsive_videos.py assets/titlescreen.mp4 output/ --benchmark-startup
+
+  # Compare cheaper blur modes with blur (encode fps and SSIM)
+  python3 generate_responsive_videos.py input.mp4 output/ --benchmark-padding
+
+  # Check the asset manifest written with the variants
+  python3 generate_responsive_videos.py --verify output/
+
+  # Drop cache entries for sources that were deleted
+  python3 generate_responsive_videos.py --prune-cache output/
         """
     )
-    parser.add_argument('input', help='Input video file')
+    parser.add_argument('input', nargs='?', help='Input video file')
     parser.add_argument('output_folder', help='Output folder')
     parser.add_argument('--padding-mode', 
-                       choices=['blur', 'solid', 'mirror', 'black'],
+                       choices=PADDING_MODES,
                        default='blur',
                        help='Padding mode for extended canvases (default: blur)')
     parser.add_argument('--keep-audio', 
@@ -227,17 +1602,171 @@ Examples:
                        help='Preserve audio track (default: strip audio)')
     parser.add_argument('--base-name', 
                        help='Base name for output files (default: input filename)')
+    parser.add_argument('--single-decode',
+                       action='store_true',
+                       help='Decode the source once and encode all variants '
+                            'from one filter graph (default: one ffmpeg run per variant)')
+    parser.add_argument('--compare-with',
+                       metavar='DIR',
+                       help='After encoding, compare outputs with same-named '
+                            'files in DIR (byte-identical or SSIM)')
+    parser.add_argument('--batch',
+                       metavar='DIR_OR_GLOB',
+                       help='Process every MP4 in a directory (or matching a '
+                            'glob) in parallel instead of a single input')
+    parser.add_argument('--jobs',
+                       type=int,
+                       help='Parallel encode jobs for --batch or --chunked '
+                            '(default: derived from CPU count)')
+    parser.add_argument('--cache-dir',
+                       help=f'Build cache location (default: {CACHE_DIR_NAME})')
+    parser.add_argument('--force',
+                       action='store_true',
+                       help='Re-encode every variant even if the cache says '
+                            'it is up to date')
+    parser.add_argument('--chunked',
+                       action='store_true',
+                       help='Split each variant at keyframes and encode the '
+                            'chunks in parallel (for long single inputs)')
+    parser.add_argument('--poster',
+                       choices=list(POSTER_FORMATS),
+                       help='Also write a first-frame poster per variant '
+                            '(<base>_<variant>.<format>) from the same decode')
+    parser.add_argument('--preview',
+                       action='store_true',
+                       help='Also write a tiny low-bitrate preview clip per '
+                            f'variant (<base>_<variant>{PREVIEW_SUFFIX}.mp4)')
+    parser.add_argument('--max-bytes',
+                       type=int,
+                       help='Per-variant size budget; CRF is searched with '
+                            'short trial encodes (default: fixed CRF 18)')
+    parser.add_argument('--min-ssim',
+                       type=float,
+                       help='Per-variant quality floor for the CRF search '
+                            '(e.g. 0.97)')
+    parser.add_argument('--crf-report',
+                       help='JSON report of chosen CRF, size and SSIM '
+                            f'(default: {CRF_REPORT_NAME})')
+    parser.add_argument('--profile',
+                       choices=list(ENCODE_PROFILES),
+                       default='default',
+                       help='Encoding profile; "startup" tunes GOP, keyframes, '
+                            'B-frames and decode for fast open and smooth '
+                            'looping (default: default)')
+    parser.add_argument('--benchmark-startup',
+                       action='store_true',
+                       help='Encode INPUT with each profile and compare open '
+                            'and first-frame latency, then exit')
+    parser.add_argument('--benchmark-padding',
+                       nargs='*',
+                       metavar='MODE',
+                       choices=PADDING_MODES,
+                       help='Time each padding mode (default: blur, fast_blur, '
+                            'static_blur) on INPUT and report encode fps and '
+                            'SSIM against blur, then exit')
+    parser.add_argument('--verify',
+                       action='store_true',
+                       help=f'Check OUTPUT_FOLDER/{ASSET_MANIFEST_NAME} against '
+                            'the files on disk, then exit')
+    parser.add_argument('--prune-cache',
+                       action='store_true',
+                       help='Remove cache entries whose source or output no '
+                            'longer exists, then exit')
     
     args = parser.parse_args()
+
+    cache = BuildCache(args.cache_dir or CACHE_DIR_NAME)
+
+    if args.verify:
+        problems = verify_asset_manifest(args.output_folder)
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        if problems:
+            print(f"⚠ Manifest out of date ({len(problems)} problems)")
+            sys.exit(1)
+        print("✓ Manifest matches files on disk")
+        sys.exit(0)
+
+    if args.prune_cache:
+        stale = cache.prune()
+        cache.save()
+        print(f"Pruned {len(stale)} cache entries "
+              f"({len(cache.entries)} remaining)")
+        for output_path in stale:
+            print(f"  - {output_path}")
+        sys.exit(0)
     
     if not check_ffmpeg():
         print("Error: FFmpeg is not installed.")
         print("Install with: brew install ffmpeg (macOS) or apt-get install ffmpeg (Linux)")
         sys.exit(1)
     
+    if args.chunked and (args.batch or args.single_decode):
+        parser.error('--chunked works on a single input without --single-decode')
+    if args.chunked and (args.poster or args.preview):
+        parser.error('--poster/--preview are not supported with --chunked')
+    extras = {'poster': args.poster, 'preview': args.preview}
+
+    budget = None
+    if args.max_bytes or args.min_ssim:
+        budget = {'max_bytes': args.max_bytes, 'min_ssim': args.min_ssim}
+    budget_report = {}
+    crf_report_path = args.crf_report or CRF_REPORT_NAME
+
+    if args.batch:
+        if args.input or args.base_name:
+            parser.error('--batch cannot be combined with an input file or --base-name')
+        inputs = find_batch_inputs(args.batch)
+        if not inputs:
+            print(f"Error: No input videos match '{args.batch}'.")
+            sys.exit(1)
+
+        os.makedirs(args.output_folder, exist_ok=True)
+
+        print("=" * 50)
+        print(f"Batch: {args.batch}")
+        print(f"Padding mode: {args.padding_mode}")
+        print(f"Audio: {'Preserved' if args.keep_audio else 'Stripped'}")
+        print(f"Decode: {'Single pass' if args.single_decode else 'Per variant'}")
+        print("=" * 50)
+        failed = run_batch(inputs, args.output_folder, args.padding_mode,
+                           args.keep_audio, args.single_decode, args.jobs,
+                           cache, args.force, budget, budget_report,
+                           args.profile, extras)
+        cache.save()
+        if budget_report:
+            write_crf_report(crf_report_path, budget_report)
+        write_asset_manifest(args.output_folder)
+        print()
+        cache.report()
+        print("=" * 50)
+        if failed:
+            print("⚠ Some jobs failed:")
+            for label in failed:
+                print(f"  - {label}")
+        else:
+            print("✓ Processing complete!")
+            print(f"All versions saved to: {args.output_folder}")
+        print("=" * 50)
+        sys.exit(1 if failed else 0)
+
+    if not args.input:
+        parser.error('an input file or --batch is required')
+
     if not os.path.exists(args.input):
         print(f"Error: Input file '{args.input}' not found.")
         sys.exit(1)
+
+    if args.benchmark_startup:
+        print(f"Benchmarking startup latency on {args.input}...")
+        benchmark_startup(args.input, args.padding_mode)
+        sys.exit(0)
+
+    if args.benchmark_padding is not None:
+        modes = args.benchmark_padding or ['blur', 'fast_blur', 'static_blur']
+        print(f"Benchmarking padding modes on {args.input}...")
+        benchmark_padding_modes(args.input, modes)
+        sys.exit(0)
     
     os.makedirs(args.output_folder, exist_ok=True)
     
@@ -248,25 +1777,126 @@ Examples:
     print(f"Base name: {base_name}")
     print(f"Padding mode: {args.padding_mode}")
     print(f"Audio: {'Preserved' if args.keep_audio else 'Stripped'}")
+    print(f"Decode: {'Single pass' if args.single_decode else 'Per variant'}")
+    print(f"Profile: {args.profile}")
+    if args.chunked:
+        print("Encode: Chunked (parallel)")
     print("=" * 50)
     print()
     
-    success = True
-    for variant, (width, height) in TARGETS.items():
-        output_path = os.path.join(
-            args.output_folder, 
-            f"{base_name}_{variant}.mp4"
+    outputs = {
+        variant: (
+            os.path.join(args.output_folder, f"{base_name}_{variant}.mp4"),
+            width,
+            height
         )
-        print(f"Generating {variant} version ({width}x{height})...")
-        if not generate_video_version(
-            args.input, 
-            output_path, 
-            width, 
-            height,
+        for variant, (width, height) in TARGETS.items()
+    }
+
+    options = profile_options(budget, args.profile, extras)
+    if args.chunked:
+        options['chunked'] = True
+    pending, keys = split_cached(cache, args.input, outputs,
+                                 args.padding_mode, args.keep_audio,
+                                 args.force, options)
+    dominant_color = None
+    if pending and args.padding_mode == 'solid':
+        dominant_color = get_dominant_color(args.input, cache=cache)
+
+    choices = {}
+    if budget:
+        for variant, (_, width, height) in pending.items():
+            print(f"Searching CRF for {variant}...")
+            try:
+                choices[variant] = plan_budget_crf(args.input, width, height,
+                                                   args.padding_mode,
+                                                   dominant_color=dominant_color,
+                                                   profile=args.profile,
+                                                   **budget)
+            except (subprocess.CalledProcessError, OSError) as e:
+                print(f"  ✗ CRF search failed: {e}")
+                sys.exit(1)
+            if choices[variant] is None:
+                print(f"  ✗ CRF search failed")
+                sys.exit(1)
+            print(f"  → CRF {choices[variant]['crf']} "
+                  f"({choices[variant]['trials']} trials, "
+                  f"{choices[variant]['status']})")
+        print()
+    crfs = {variant: choice['crf'] for variant, choice in choices.items()}
+
+    success = True
+    if not pending:
+        print("All variants are up to date")
+        print()
+    elif args.single_decode:
+        print(f"Generating {len(pending)} versions from one decode...")
+        success = generate_all_versions(
+            args.input,
+            pending,
             args.padding_mode,
-            args.keep_audio
-        ):
-            success = False
+            args.keep_audio,
+            dominant_color=dominant_color,
+            crfs=crfs,
+            profile=args.profile,
+            extras=extras
+        )
+        if success:
+            record_outputs(cache, args.input, pending, keys)
+            for variant, choice in choices.items():
+                output_path = pending[variant][0]
+                budget_report[os.path.basename(output_path)] = (
+                    finish_budget_report(choice, output_path, args.input))
+        print()
+    else:
+        for variant, (output_path, width, height) in pending.items():
+            print(f"Generating {variant} version ({width}x{height})...")
+            if args.chunked:
+                ok = generate_video_version_chunked(
+                    args.input,
+                    output_path,
+                    width,
+                    height,
+                    args.padding_mode,
+                    args.keep_audio,
+                    dominant_color=dominant_color,
+                    max_workers=args.jobs,
+                    crf=crfs.get(variant),
+                    profile=args.profile
+                )
+            else:
+                ok = generate_video_version(
+                    args.input, 
+                    output_path, 
+                    width, 
+                    height,
+                    args.padding_mode,
+                    args.keep_audio,
+                    dominant_color=dominant_color,
+                    crf=crfs.get(variant),
+                    profile=args.profile,
+                    extras=extras
+                )
+            if ok:
+                if variant in choices:
+                    budget_report[os.path.basename(output_path)] = (
+                        finish_budget_report(choices[variant], output_path,
+                                             args.input))
+                record_outputs(cache, args.input,
+                               {variant: pending[variant]}, keys)
+            else:
+                success = False
+            print()
+
+    cache.save()
+    cache.report()
+    if budget_report:
+        write_crf_report(crf_report_path, budget_report)
+    write_asset_manifest(args.output_folder)
+    print()
+
+    if args.compare_with:
+        compare_outputs(args.output_folder, args.compare_with, base_name)
         print()
     
     print("=" * 50)
@@ -0,0 +1,198 @@
+import 'dart:convert';
+import 'dart:typed_data';
+import 'package:flutter/services.dart';
+import 'package:n3rd_game/models/difficulty_level.dart';
+import 'package:n3rd_game/services/trivia_generator_service.dart';
+
+/// Lazy reader for the binary template bundle written by
+/// `scripts/consolidate_trivia_templates.py --bundle`.
+///
+/// The bundle stores every unique string once and each template as varint
+/// indexes into that string table, with an offset index by theme. Opening
+/// a bundle only reads the header and the theme index; a theme's templates
+/// (and the strings they use) are decoded the first time the theme is
+/// requested and then kept.
+///
+/// Every template comes with its difficulty and tiered distractor pools
+/// (authored, or split at build time), so nothing is classified at runtime.
+///
+/// This is an alternative to compiling `trivia_templates_consolidated.dart`
+/// into the app. Writing it to [assetPath] ships it: `pubspec.yaml` already
+/// bundles every file directly in `assets/`.
+class TriviaTemplateBundle {
+  /// Default asset path of the bundle
+  static const String assetPath = 'assets/trivia_templates.bin';
+
+  static const int _version = 2;
+  static const int _headerSize = 16;
+  static const int _themeEntrySize = 12;
+
+  final Uint8List _bytes;
+  final ByteData _data;
+  final int _offsetsStart;
+  final int _blobStart;
+  final int _recordsStart;
+  final List<String?> _strings;
+  final Map<String, _ThemeEntry> _themes;
+  final Map<String, List<TriviaTemplate>> _decoded = {};
+
+  TriviaTemplateBundle._(
+    this._bytes,
+    this._data,
+    this._offsetsStart,
+    this._blobStart,
+    this._recordsStart,
+    this._strings,
+    this._themes,
+  );
+
+  /// Load the bundle from the asset bundle
+  static Future<TriviaTemplateBundle> load({
+    AssetBundle? bundle,
+    String path = assetPath,
+  }) async {
+    final data = await (bundle ?? rootBundle).load(path);
+    return TriviaTemplateBundle.fromBytes(
+      data.buffer.asUint8List(data.offsetInBytes, data.lengthInBytes),
+    );
+  }
+
+  /// Open a bundle from raw bytes
+  ///
+  /// Throws [FormatException] if the bytes aren't a supported bundle.
+  factory TriviaTemplateBundle.fromBytes(Uint8List bytes) {
+    final data = ByteData.sublistView(bytes);
+    if (bytes.length < _headerSize ||
+        ascii.decode(bytes.sublist(0, 4), allowInvalid: true) != 'N3TB') {
+      throw const FormatException('Not a trivia template bundle');
+    }
+    final version = data.getUint16(4, Endian.little);
+    if (version != _version) {
+      throw FormatException('Unsupported trivia bundle version $version');
+    }
+
+    final stringCount = data.getUint32(8, Endian.little);
+    final themeCount = data.getUint32(12, Endian.little);
+    const offsetsStart = _headerSize;
+    final blobStart = offsetsStart + 4 * (stringCount + 1);
+    final blobLength = data.getUint32(blobStart - 4, Endian.little);
+    final indexStart = blobStart + blobLength;
+    final recordsStart = indexStart + themeCount * _themeEntrySize;
+    if (recordsStart > bytes.length) {
+      throw const FormatException('Truncated trivia template bundle');
+    }
+
+    final bundle = TriviaTemplateBundle._(
+      bytes,
+      data,
+      offsetsStart,
+      blobStart,
+      recordsStart,
+      List<String?>.filled(stringCount, null),
+      {},
+    );
+    for (int i = 0; i < themeCount; i++) {
+      final entry = indexStart + i * _themeEntrySize;
+      final name = bundle._string(data.getUint32(entry, Endian.little));
+      bundle._themes[name] = _ThemeEntry(
+        data.getUint32(entry + 4, Endian.little),
+        data.getUint32(entry + 8, Endian.little),
+      );
+    }
+    return bundle;
+  }
+
+  /// Themes in the bundle, in bundle order
+  List<String> get themes => _themes.keys.toList();
+
+  /// Number of templates in [theme] without decoding them
+  int templateCount(String theme) => _themes[theme]?.count ?? 0;
+
+  /// Total number of templates in the bundle
+  int get totalTemplateCount =>
+      _themes.values.fold<int>(0, (sum, entry) => sum + entry.count);
+
+  /// Whether [theme] has already been decoded
+  bool isDecoded(String theme) => _decoded.containsKey(theme);
+
+  /// Templates for [theme], decoded on first use
+  ///
+  /// Returns an empty list for unknown themes.
+  List<TriviaTemplate> templatesForTheme(String theme) {
+    final cached = _decoded[theme];
+    if (cached != null) return cached;
+
+    final entry = _themes[theme];
+    if (entry == null) return const [];
+
+    final reader = _VarintReader(_bytes, _recordsStart + entry.offset);
+    final templates = List<TriviaTemplate>.generate(entry.count, (_) {
+      final pattern = _string(reader.next());
+      final correctPool = _readPool(reader);
+      final distractorPool = _readPool(reader);
+      final difficulty = reader.next();
+      final tierMask = reader.next();
+      final distractorPools = <DistractorTier, List<String>>{
+        for (final tier in DistractorTier.values)
+          if (tierMask & (1 << tier.index) != 0) tier: _readPool(reader),
+      };
+      return TriviaTemplate(
+        categoryPattern: pattern,
+        correctPool: correctPool,
+        distractorPool: distractorPool,
+        theme: theme,
+        distractorPools: distractorPools,
+        difficulty: difficulty == 0
+            ? DifficultyLevel.medium
+            : DifficultyLevel.values[difficulty - 1],
+      );
+    }, growable: false);
+    return _decoded[theme] = List.unmodifiable(templates);
+  }
+
+  List<String> _readPool(_VarintReader reader) {
+    final length = reader.next();
+    return List<String>.generate(
+      length,
+      (_) => _string(reader.next()),
+      growable: false,
+    );
+  }
+
+  String _string(int id) {
+    final cached = _strings[id];
+    if (cached != null) return cached;
+
+    final start = _data.getUint32(_offsetsStart + 4 * id, Endian.little);
+    final end = _data.getUint32(_offsetsStart + 4 * (id + 1), Endian.little);
+    return _strings[id] = utf8.decode(
+      Uint8List.sublistView(_bytes, _blobStart + start, _blobStart + end),
+    );
+  }
+}
+
+class _ThemeEntry {
+  final int offset;
+  final int count;
+
+  const _ThemeEntry(this.offset, this.count);
+}
+
+/// Reads unsigned LEB128 varints from a byte list
+class _VarintReader {
+  final Uint8List _bytes;
+  int _position;
+
+  _VarintReader(this._bytes, this._position);
+
+  int next() {
+    int value = 0;
+    int shift = 0;
+    while (true) {
+      final byte = _bytes[_position++];
+      value |= (byte & 0x7F) << shift;
+      if (byte < 0x80) return value;
+      shift += 7;
+    }
+  }
+}
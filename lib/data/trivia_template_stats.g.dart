@@ -0,0 +1,1558 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Written by scripts/consolidate_trivia_templates.py
+
+/// Build-time statistics for the templates in
+/// `trivia_templates_consolidated.dart`.
+///
+/// Every template was validated when this file was written, so
+/// [EditionTriviaTemplates] can skip its startup checks in release builds
+/// as long as the loaded templates still match [themeContentHashes].
+/// [editionThemes] only references themes that exist. The `base` entries
+/// do the same for `TriviaGeneratorService`'s built-in templates.
+class TriviaTemplateStats {
+  static const int templateCount = 760;
+
+  static const int totalPossibleCombinations = 377003135;
+
+  static const int duplicatePatternCount = 13;
+
+  static const int overlappingTemplatePairs = 7;
+
+  static const Map<String, int> themeTemplateCounts = {
+    'african_culture': 10,
+    'agriculture': 10,
+    'animals': 3,
+    'arts': 8,
+    'asian_american_culture': 10,
+    'astronomy': 10,
+    'automotive': 6,
+    'aviation': 10,
+    'black_culture': 10,
+    'business': 10,
+    'caribbean_culture': 10,
+    'economics': 10,
+    'geography': 10,
+    'high_school_american_literature': 1,
+    'high_school_biology': 1,
+    'high_school_calculus': 1,
+    'high_school_chemistry': 1,
+    'high_school_economics': 1,
+    'high_school_government': 1,
+    'high_school_history': 1,
+    'high_school_literature': 1,
+    'high_school_physics': 1,
+    'high_school_rhetoric': 1,
+    'history': 10,
+    'indigenous_culture': 10,
+    'kids_ancient_history': 2,
+    'kids_animals': 1,
+    'kids_biology': 2,
+    'kids_body': 1,
+    'kids_civics': 2,
+    'kids_colors': 1,
+    'kids_dinosaurs': 1,
+    'kids_earth_science': 1,
+    'kids_ecosystems': 2,
+    'kids_energy': 2,
+    'kids_food': 1,
+    'kids_geography': 1,
+    'kids_geology': 1,
+    'kids_geology_advanced': 2,
+    'kids_grammar': 2,
+    'kids_house': 1,
+    'kids_machines': 1,
+    'kids_math': 1,
+    'kids_moon_phases': 2,
+    'kids_numbers': 1,
+    'kids_plants': 1,
+    'kids_science': 1,
+    'kids_shapes': 1,
+    'kids_sky': 1,
+    'kids_space': 1,
+    'kids_time': 1,
+    'kids_us_government': 2,
+    'kids_water_cycle': 2,
+    'kids_weather': 1,
+    'kids_weather_advanced': 1,
+    'latino_culture': 10,
+    'literature': 10,
+    'medicine': 20,
+    'middle_eastern_culture': 10,
+    'middle_school_art_history': 1,
+    'middle_school_cell_division': 1,
+    'middle_school_chemistry': 1,
+    'middle_school_civics': 1,
+    'middle_school_ecology': 1,
+    'middle_school_economics': 1,
+    'middle_school_geometry': 1,
+    'middle_school_literature': 1,
+    'middle_school_physics': 1,
+    'middle_school_plate_tectonics': 1,
+    'military': 10,
+    'movies': 1,
+    'music': 1,
+    'philosophy': 10,
+    'religion': 10,
+    'science': 37,
+    'sports': 10,
+    'technology': 10,
+    'test_prep_algebra': 1,
+    'test_prep_chemistry': 1,
+    'test_prep_geometry': 1,
+    'test_prep_literature': 1,
+    'test_prep_logic': 1,
+    'test_prep_scientific_method': 1,
+    'test_prep_statistics': 1,
+    'test_prep_vocabulary': 1,
+    'test_prep_world_history': 1,
+    'test_prep_writing': 1,
+    'transportation': 4,
+    'weather': 20,
+    'psychology_mental_health': 10,
+    'neuroscience_brain_science': 10,
+    'environmental_science': 10,
+    'oceanography_marine_science': 10,
+    'genetics_biotechnology': 10,
+    'cybersecurity_digital_privacy': 10,
+    'data_science_analytics': 10,
+    'artificial_intelligence_ml': 10,
+    'quantum_physics': 10,
+    'space_exploration_astronautics': 10,
+    'sustainable_energy_renewables': 10,
+    'nanotechnology_materials_science': 10,
+    'pharmacology_drug_development': 10,
+    'immunology_vaccines': 10,
+    'bioinformatics_computational_biology': 10,
+    'robotics_automation': 10,
+    'cryptocurrency_blockchain': 10,
+    'climate_science_meteorology': 10,
+    'aerospace_engineering': 10,
+    'renewable_energy_technologies': 10,
+    'materials_science_engineering': 10,
+    'biomedical_engineering': 10,
+    'neuroengineering_brain_computer_interface': 10,
+    'synthetic_biology_bioengineering': 10,
+    'quantum_computing_algorithms': 10,
+    'advanced_mathematics_topology': 10,
+    'computational_chemistry': 10,
+    'particle_physics_high_energy': 10,
+    'astrophysics_cosmology': 10,
+    'advanced_physics_theoretical': 10,
+    'molecular_biology_genetics': 10,
+    'systems_biology_networks': 10,
+    'protein_engineering_design': 10,
+    'advanced_chemistry_organic': 10,
+    'electrical_engineering_circuits': 10,
+    'mechanical_engineering_design': 10,
+    'statistical_methods_data_analysis': 10,
+    'information_theory_compression': 10,
+    'machine_learning_neural_networks': 10,
+  };
+
+  /// FNV-1a hash of each theme's template text (see content_hash)
+  static const Map<String, int> themeContentHashes = {
+    'african_culture': 2197947277,
+    'agriculture': 3556400288,
+    'animals': 799955682,
+    'arts': 2319582554,
+    'asian_american_culture': 1562606063,
+    'astronomy': 1158144639,
+    'automotive': 1869415744,
+    'aviation': 2309726586,
+    'black_culture': 2936440084,
+    'business': 3818257439,
+    'caribbean_culture': 1319979654,
+    'economics': 856199315,
+    'geography': 1636451835,
+    'high_school_american_literature': 5718401,
+    'high_school_biology': 1480097791,
+    'high_school_calculus': 3392886904,
+    'high_school_chemistry': 1004980222,
+    'high_school_economics': 3986293589,
+    'high_school_government': 121201404,
+    'high_school_history': 926402920,
+    'high_school_literature': 543029463,
+    'high_school_physics': 932912318,
+    'high_school_rhetoric': 1118198420,
+    'history': 1394953818,
+    'indigenous_culture': 3565688814,
+    'kids_ancient_history': 455170809,
+    'kids_animals': 757997884,
+    'kids_biology': 29011323,
+    'kids_body': 2877381537,
+    'kids_civics': 737328407,
+    'kids_colors': 336429216,
+    'kids_dinosaurs': 2942416438,
+    'kids_earth_science': 3743842187,
+    'kids_ecosystems': 888800565,
+    'kids_energy': 263658331,
+    'kids_food': 1334083907,
+    'kids_geography': 3928463564,
+    'kids_geology': 457787741,
+    'kids_geology_advanced': 1034776517,
+    'kids_grammar': 1767448649,
+    'kids_house': 3085743981,
+    'kids_machines': 4030309100,
+    'kids_math': 175390845,
+    'kids_moon_phases': 1111174385,
+    'kids_numbers': 2960409097,
+    'kids_plants': 2795793592,
+    'kids_science': 1550109033,
+    'kids_shapes': 2112783941,
+    'kids_sky': 3771097046,
+    'kids_space': 2776667466,
+    'kids_time': 4044803758,
+    'kids_us_government': 2820897945,
+    'kids_water_cycle': 4032701197,
+    'kids_weather': 777819768,
+    'kids_weather_advanced': 2379262402,
+    'latino_culture': 273080477,
+    'literature': 3393836213,
+    'medicine': 1751052271,
+    'middle_eastern_culture': 2922070410,
+    'middle_school_art_history': 1693822617,
+    'middle_school_cell_division': 2830099421,
+    'middle_school_chemistry': 887709313,
+    'middle_school_civics': 464292833,
+    'middle_school_ecology': 3702366937,
+    'middle_school_economics': 1750426520,
+    'middle_school_geometry': 4112796726,
+    'middle_school_literature': 244343782,
+    'middle_school_physics': 2991832415,
+    'middle_school_plate_tectonics': 4193143508,
+    'military': 3396572242,
+    'movies': 2492914510,
+    'music': 494056576,
+    'philosophy': 2466996266,
+    'religion': 1471740362,
+    'science': 421431760,
+    'sports': 2336783655,
+    'technology': 2481729680,
+    'test_prep_algebra': 1202506613,
+    'test_prep_chemistry': 3076894741,
+    'test_prep_geometry': 3997616817,
+    'test_prep_literature': 2146083324,
+    'test_prep_logic': 1763294415,
+    'test_prep_scientific_method': 769775643,
+    'test_prep_statistics': 320406489,
+    'test_prep_vocabulary': 1193877344,
+    'test_prep_world_history': 305057443,
+    'test_prep_writing': 3994962548,
+    'transportation': 690015851,
+    'weather': 4094562691,
+    'psychology_mental_health': 4167837965,
+    'neuroscience_brain_science': 3710380261,
+    'environmental_science': 3004900565,
+    'oceanography_marine_science': 3538376073,
+    'genetics_biotechnology': 229057000,
+    'cybersecurity_digital_privacy': 2631951592,
+    'data_science_analytics': 588185768,
+    'artificial_intelligence_ml': 3749162528,
+    'quantum_physics': 73552928,
+    'space_exploration_astronautics': 669430117,
+    'sustainable_energy_renewables': 1984769355,
+    'nanotechnology_materials_science': 455658646,
+    'pharmacology_drug_development': 3653461589,
+    'immunology_vaccines': 3164264202,
+    'bioinformatics_computational_biology': 3361210324,
+    'robotics_automation': 235515047,
+    'cryptocurrency_blockchain': 3928900967,
+    'climate_science_meteorology': 858954563,
+    'aerospace_engineering': 2309961281,
+    'renewable_energy_technologies': 3516843980,
+    'materials_science_engineering': 2320354060,
+    'biomedical_engineering': 4281101112,
+    'neuroengineering_brain_computer_interface': 3270098214,
+    'synthetic_biology_bioengineering': 248441053,
+    'quantum_computing_algorithms': 2056507162,
+    'advanced_mathematics_topology': 3695824975,
+    'computational_chemistry': 1078312892,
+    'particle_physics_high_energy': 2134727904,
+    'astrophysics_cosmology': 610992965,
+    'advanced_physics_theoretical': 460595483,
+    'molecular_biology_genetics': 3428450686,
+    'systems_biology_networks': 2476028325,
+    'protein_engineering_design': 661004900,
+    'advanced_chemistry_organic': 3281622661,
+    'electrical_engineering_circuits': 1471686519,
+    'mechanical_engineering_design': 3139279625,
+    'statistical_methods_data_analysis': 2093082063,
+    'information_theory_compression': 398777334,
+    'machine_learning_neural_networks': 4066773291,
+  };
+
+  static const Map<String, int> themeCombinations = {
+    'african_culture': 5567380,
+    'agriculture': 5187000,
+    'animals': 1556100,
+    'arts': 4149600,
+    'asian_american_culture': 5187000,
+    'astronomy': 5187000,
+    'automotive': 3112200,
+    'aviation': 5187000,
+    'black_culture': 4764060,
+    'business': 5187000,
+    'caribbean_culture': 5187000,
+    'economics': 5187000,
+    'geography': 5187000,
+    'high_school_american_literature': 518700,
+    'high_school_biology': 518700,
+    'high_school_calculus': 518700,
+    'high_school_chemistry': 518700,
+    'high_school_economics': 518700,
+    'high_school_government': 518700,
+    'high_school_history': 518700,
+    'high_school_literature': 136800,
+    'high_school_physics': 136800,
+    'high_school_rhetoric': 518700,
+    'history': 4708200,
+    'indigenous_culture': 5187000,
+    'kids_ancient_history': 1037400,
+    'kids_animals': 518700,
+    'kids_biology': 1037400,
+    'kids_body': 326040,
+    'kids_civics': 1037400,
+    'kids_colors': 1140,
+    'kids_dinosaurs': 518700,
+    'kids_earth_science': 39900,
+    'kids_ecosystems': 1037400,
+    'kids_energy': 1037400,
+    'kids_food': 518700,
+    'kids_geography': 39900,
+    'kids_geology': 136800,
+    'kids_geology_advanced': 2280,
+    'kids_grammar': 9120,
+    'kids_house': 250800,
+    'kids_machines': 22800,
+    'kids_math': 11400,
+    'kids_moon_phases': 127680,
+    'kids_numbers': 95760,
+    'kids_plants': 518700,
+    'kids_science': 4560,
+    'kids_shapes': 39900,
+    'kids_sky': 250800,
+    'kids_space': 63840,
+    'kids_time': 39900,
+    'kids_us_government': 2280,
+    'kids_water_cycle': 191520,
+    'kids_weather': 326040,
+    'kids_weather_advanced': 39900,
+    'latino_culture': 5967900,
+    'literature': 5187000,
+    'medicine': 10374000,
+    'middle_eastern_culture': 5187000,
+    'middle_school_art_history': 518700,
+    'middle_school_cell_division': 22800,
+    'middle_school_chemistry': 518700,
+    'middle_school_civics': 518700,
+    'middle_school_ecology': 518700,
+    'middle_school_economics': 136800,
+    'middle_school_geometry': 4560,
+    'middle_school_literature': 518700,
+    'middle_school_physics': 39900,
+    'middle_school_plate_tectonics': 22800,
+    'military': 5187000,
+    'movies': 518700,
+    'music': 518700,
+    'philosophy': 5187000,
+    'religion': 5967900,
+    'science': 19191900,
+    'sports': 5187000,
+    'technology': 5187000,
+    'test_prep_algebra': 518700,
+    'test_prep_chemistry': 136800,
+    'test_prep_geometry': 136800,
+    'test_prep_literature': 518700,
+    'test_prep_logic': 518700,
+    'test_prep_scientific_method': 518700,
+    'test_prep_statistics': 518700,
+    'test_prep_vocabulary': 518700,
+    'test_prep_world_history': 518700,
+    'test_prep_writing': 518700,
+    'transportation': 2074800,
+    'weather': 9680425,
+    'psychology_mental_health': 5187000,
+    'neuroscience_brain_science': 5109195,
+    'environmental_science': 5083260,
+    'oceanography_marine_science': 5187000,
+    'genetics_biotechnology': 5187000,
+    'cybersecurity_digital_privacy': 5187000,
+    'data_science_analytics': 5109195,
+    'artificial_intelligence_ml': 5109195,
+    'quantum_physics': 5187000,
+    'space_exploration_astronautics': 5187000,
+    'sustainable_energy_renewables': 5187000,
+    'nanotechnology_materials_science': 5005455,
+    'pharmacology_drug_development': 5109195,
+    'immunology_vaccines': 5109195,
+    'bioinformatics_computational_biology': 5187000,
+    'robotics_automation': 5187000,
+    'cryptocurrency_blockchain': 5039580,
+    'climate_science_meteorology': 5005455,
+    'aerospace_engineering': 5187000,
+    'renewable_energy_technologies': 5187000,
+    'materials_science_engineering': 5031390,
+    'biomedical_engineering': 5187000,
+    'neuroengineering_brain_computer_interface': 5109195,
+    'synthetic_biology_bioengineering': 5039580,
+    'quantum_computing_algorithms': 5187000,
+    'advanced_mathematics_topology': 4858035,
+    'computational_chemistry': 5187000,
+    'particle_physics_high_energy': 5187000,
+    'astrophysics_cosmology': 5109195,
+    'advanced_physics_theoretical': 5187000,
+    'molecular_biology_genetics': 5109195,
+    'systems_biology_networks': 5187000,
+    'protein_engineering_design': 5187000,
+    'advanced_chemistry_organic': 5187000,
+    'electrical_engineering_circuits': 5187000,
+    'mechanical_engineering_design': 4858035,
+    'statistical_methods_data_analysis': 5187000,
+    'information_theory_compression': 5187000,
+    'machine_learning_neural_networks': 5187000,
+  };
+
+  /// `possibleCombinations` of each template, in template order
+  static const Map<String, List<int>> templateCombinations = {
+    'african_culture': [518700, 518700, 518700, 1046500, 371280, 518700, 518700, 518700, 518700, 518700],
+    'agriculture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'animals': [518700, 518700, 518700],
+    'arts': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'asian_american_culture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'astronomy': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'automotive': [518700, 518700, 518700, 518700, 518700, 518700],
+    'aviation': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'black_culture': [518700, 518700, 518700, 518700, 518700, 518700, 95760, 518700, 518700, 518700],
+    'business': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'caribbean_culture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'economics': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'geography': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'high_school_american_literature': [518700],
+    'high_school_biology': [518700],
+    'high_school_calculus': [518700],
+    'high_school_chemistry': [518700],
+    'high_school_economics': [518700],
+    'high_school_government': [518700],
+    'high_school_history': [518700],
+    'high_school_literature': [136800],
+    'high_school_physics': [136800],
+    'high_school_rhetoric': [518700],
+    'history': [39900, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'indigenous_culture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'kids_ancient_history': [518700, 518700],
+    'kids_animals': [518700],
+    'kids_biology': [518700, 518700],
+    'kids_body': [326040],
+    'kids_civics': [518700, 518700],
+    'kids_colors': [1140],
+    'kids_dinosaurs': [518700],
+    'kids_earth_science': [39900],
+    'kids_ecosystems': [518700, 518700],
+    'kids_energy': [518700, 518700],
+    'kids_food': [518700],
+    'kids_geography': [39900],
+    'kids_geology': [136800],
+    'kids_geology_advanced': [1140, 1140],
+    'kids_grammar': [4560, 4560],
+    'kids_house': [250800],
+    'kids_machines': [22800],
+    'kids_math': [11400],
+    'kids_moon_phases': [63840, 63840],
+    'kids_numbers': [95760],
+    'kids_plants': [518700],
+    'kids_science': [4560],
+    'kids_shapes': [39900],
+    'kids_sky': [250800],
+    'kids_space': [63840],
+    'kids_time': [39900],
+    'kids_us_government': [1140, 1140],
+    'kids_water_cycle': [95760, 95760],
+    'kids_weather': [326040],
+    'kids_weather_advanced': [39900],
+    'latino_culture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 1299600, 518700],
+    'literature': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'medicine': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'middle_eastern_culture': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'middle_school_art_history': [518700],
+    'middle_school_cell_division': [22800],
+    'middle_school_chemistry': [518700],
+    'middle_school_civics': [518700],
+    'middle_school_ecology': [518700],
+    'middle_school_economics': [136800],
+    'middle_school_geometry': [4560],
+    'middle_school_literature': [518700],
+    'middle_school_physics': [39900],
+    'middle_school_plate_tectonics': [22800],
+    'military': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'movies': [518700],
+    'music': [518700],
+    'philosophy': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'religion': [518700, 1299600, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'science': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'sports': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'technology': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'test_prep_algebra': [518700],
+    'test_prep_chemistry': [136800],
+    'test_prep_geometry': [136800],
+    'test_prep_literature': [518700],
+    'test_prep_logic': [518700],
+    'test_prep_scientific_method': [518700],
+    'test_prep_statistics': [518700],
+    'test_prep_vocabulary': [518700],
+    'test_prep_world_history': [518700],
+    'test_prep_writing': [518700],
+    'transportation': [518700, 518700, 518700, 518700],
+    'weather': [136800, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 207025, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'psychology_mental_health': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'neuroscience_brain_science': [518700, 518700, 518700, 440895, 518700, 518700, 518700, 518700, 518700, 518700],
+    'environmental_science': [414960, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'oceanography_marine_science': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'genetics_biotechnology': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'cybersecurity_digital_privacy': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'data_science_analytics': [518700, 518700, 518700, 440895, 518700, 518700, 518700, 518700, 518700, 518700],
+    'artificial_intelligence_ml': [518700, 518700, 440895, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'quantum_physics': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'space_exploration_astronautics': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'sustainable_energy_renewables': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'nanotechnology_materials_science': [518700, 518700, 518700, 414960, 518700, 518700, 518700, 518700, 518700, 440895],
+    'pharmacology_drug_development': [518700, 518700, 440895, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'immunology_vaccines': [440895, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'bioinformatics_computational_biology': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'robotics_automation': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'cryptocurrency_blockchain': [518700, 518700, 371280, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'climate_science_meteorology': [518700, 518700, 440895, 518700, 518700, 518700, 414960, 518700, 518700, 518700],
+    'aerospace_engineering': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'renewable_energy_technologies': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'materials_science_engineering': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 440895, 518700, 440895],
+    'biomedical_engineering': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'neuroengineering_brain_computer_interface': [518700, 518700, 440895, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'synthetic_biology_bioengineering': [518700, 518700, 518700, 518700, 518700, 518700, 371280, 518700, 518700, 518700],
+    'quantum_computing_algorithms': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'advanced_mathematics_topology': [518700, 518700, 414960, 518700, 440895, 371280, 518700, 518700, 518700, 518700],
+    'computational_chemistry': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'particle_physics_high_energy': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'astrophysics_cosmology': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 440895, 518700, 518700],
+    'advanced_physics_theoretical': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'molecular_biology_genetics': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 440895],
+    'systems_biology_networks': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'protein_engineering_design': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'advanced_chemistry_organic': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'electrical_engineering_circuits': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'mechanical_engineering_design': [414960, 518700, 518700, 518700, 440895, 371280, 518700, 518700, 518700, 518700],
+    'statistical_methods_data_analysis': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'information_theory_compression': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+    'machine_learning_neural_networks': [518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700, 518700],
+  };
+
+  /// Tier of each distractor, one letter per `distractorPool` item:
+  /// o = obvious, r = related, s = subtle
+  static const Map<String, List<String>> distractorTiers = {
+    'african_culture': ['rrrrrrrrrooorrssosos', 'ooooosoooooooooooooo', 'ooosoooooooooooooooo', 'soooooooooooooooooooooooo', 'oooooooooooooooooo', 'oooooooooooooooooooo', 'rroorroorrrsooososso', 'sooooooooooooooosooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'agriculture': ['rooroooooooooorsssos', 'oorsooossosooooooooo', 'ooosoooooooooooooooo', 'ooooooooosoooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooorooooooooooossss', 'oooroooorrrrssooooss', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'animals': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'arts': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooooooooosoooo', 'oooooooosooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'asian_american_culture': ['oooooooooooooosooooo', 'oooooooooooooooooooo', 'oooooooosooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'sooooooooooooooooooo', 'oooorrrrorrororrssss', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'astronomy': ['ooosooooosoooooooooo', 'oooooooooooooooooooo', 'oooorooooorssooososo', 'ooooosoooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'soooooooooooooooooos', 'ooooooosooooossooooo', 'oooooooooooooooooooo'],
+    'automotive': ['oooooooooooooooooooo', 'rrorrrroooorrssssooo', 'oooooooooooooooooooo', 'ooooossooooooossoooo', 'oooooooooooooosooooo', 'oooooooooooooooooooo'],
+    'aviation': ['ssoooooooooooooooooo', 'oooooooooooooooooooo', 'oooosooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooosoooooosooo', 'rrrrorooooorrrrrssss', 'oosoosoosooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrorrorooorrrrsssso'],
+    'black_culture': ['rrrrorrrrrrososososo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'osooosooosoooooooooo', 'oooooooooooooooooooo', 'ooooooosoooososooooo', 'ooooooooooooooooooos'],
+    'business': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrrrsoosssooooooo', 'soooosooooooooooosoo', 'oooooooooosooooooooo'],
+    'caribbean_culture': ['oooooooooooooooooooo', 'ooosoooooooooooooooo', 'oooooooooooooooooooo', 'oooooosooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrrrrssossooooooo', 'oooooooooooooooooooo'],
+    'economics': ['oooooooooosooooossoo', 'roorroooooossssooooo', 'oooooosoooooooooosoo', 'ooooooooosoooooooooo', 'orrorrrrrrrssssooooo', 'orrorrrrssssoooooooo', 'oooooooooooooooooooo', 'osoooooooooooooooooo', 'osooooooooooosoooooo', 'ooooosoooooooooooooo'],
+    'geography': ['oooooooooooooooooooo', 'oorrrrrrrrorrrrssoss', 'oooooooooooooooooooo', 'rooooororrororssssoo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'high_school_american_literature': ['ooooooooosoooooooooo'],
+    'high_school_biology': ['oooooooooooooooooooo'],
+    'high_school_calculus': ['oooooooooooooooooooo'],
+    'high_school_chemistry': ['oooooooooooooooooooo'],
+    'high_school_economics': ['oooooooooooooooooooo'],
+    'high_school_government': ['oooooossssoooooooooo'],
+    'high_school_history': ['oooooooooooooooooooo'],
+    'high_school_literature': ['oooooooooooooooooooo'],
+    'high_school_physics': ['sssooooooooooooooooo'],
+    'high_school_rhetoric': ['ooooooooooooooooooso'],
+    'history': ['oooooooooooooooooooo', 'oooooooooooooosooooo', 'oooooooooooooooooooo', 'ooooooooooooooosoooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrorrrssssooooooo', 'rroooroosooooooossos', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'indigenous_culture': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'orssoooooooooosoosoo', 'oooooooooooooooooooo', 'sooooosooooooooooooo', 'ooooooosoooooooooooo', 'sooooooooooooooooooo', 'oooooooooooooooooooo', 'oosooooooooooooooooo', 'oooooooooosooooooooo'],
+    'kids_ancient_history': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_animals': ['oooooooooooooooooooo'],
+    'kids_biology': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_body': ['oooooooooooooooooooo'],
+    'kids_civics': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_colors': ['oooooooooooooooooooo'],
+    'kids_dinosaurs': ['oooooooooooooooooooo'],
+    'kids_earth_science': ['oooooooooooooooooooo'],
+    'kids_ecosystems': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_energy': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_food': ['oooooooooooooooooooo'],
+    'kids_geography': ['ooooosoooooooooooooo'],
+    'kids_geology': ['oooooooooooooooooooo'],
+    'kids_geology_advanced': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_grammar': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_house': ['oooooooooooooooooooo'],
+    'kids_machines': ['ooooooooooooooooosoo'],
+    'kids_math': ['oooooooooooooooooooo'],
+    'kids_moon_phases': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_numbers': ['oooororrrroooossssoo'],
+    'kids_plants': ['oooooooooooooooooooo'],
+    'kids_science': ['oooooooooooooooooooo'],
+    'kids_shapes': ['oooooooooooooooooooo'],
+    'kids_sky': ['ooooooooosoooooooooo'],
+    'kids_space': ['oooooooooooooooooooo'],
+    'kids_time': ['oooooooooooooooooooo'],
+    'kids_us_government': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_water_cycle': ['oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'kids_weather': ['ooooooooooooooooooos'],
+    'kids_weather_advanced': ['ooooooooosoooooooooo'],
+    'latino_culture': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooosooooooooooo', 'oooooooooooooooooooo', 'ooooooooooooooosoooo', 'oooooooooooooooooooo'],
+    'literature': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooorrssssooooooo', 'oooooooooooooooooooo', 'ooosoooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooooooooooooso', 'oooooosooooooooooooo', 'oosooooooooosoosoooo'],
+    'medicine': ['oooooooooooooooooooo', 'oooooooooooooooosooo', 'sssooooooooooooooooo', 'rrooorrrrsoosssooooo', 'oooooooooooooooooooo', 'ooosoooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrooroorrrrrrrrssss', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrrrrsssooosooooo', 'oooooooooooorsoossso', 'ooooooooooooooooooos', 'oooooooooooooooooooo', 'osoooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'middle_eastern_culture': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooooooooooosoo', 'oooooooooooooooosooo'],
+    'middle_school_art_history': ['oooooooooooooooooooo'],
+    'middle_school_cell_division': ['oooooooooooooooooooo'],
+    'middle_school_chemistry': ['oooooooooooooooooooo'],
+    'middle_school_civics': ['oooooooooooooooooooo'],
+    'middle_school_ecology': ['oooooooooooooooooooo'],
+    'middle_school_economics': ['oooooooooooooooooooo'],
+    'middle_school_geometry': ['oooooooooooooooooooo'],
+    'middle_school_literature': ['oooooooooooooooooooo'],
+    'middle_school_physics': ['rrrrrrrrssssoooooooo'],
+    'middle_school_plate_tectonics': ['oooooooooooooooooooo'],
+    'military': ['oooooososssooooooooo', 'oooooosooooooooooooo', 'osoooooooooooooooooo', 'osoooooooooooooooooo', 'ssssoooooooooooooooo', 'oooooooosooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'movies': ['oooooooooooooooooooo'],
+    'music': ['oooooooooooooooooooo'],
+    'philosophy': ['oooooooooooooosooooo', 'oooooooossooooooooso', 'oosssooooooooooooooo', 'ooooooosooooooosoooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooosooooooooooooooo', 'ooooooooooosoooosooo', 'oooooooooooossooooos'],
+    'religion': ['oooooooooosooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooosooooooooooooo', 'oooooosooooooooooooo', 'oooosoooooooooooooso'],
+    'science': ['oosooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooosooooooosoosoo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooosooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooosoooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'osooooooooosoooooooo', 'oooooooooooooooooooo', 'orrororooooorooossss', 'ooooosoooooossoooooo', 'ooooooooooooooosoooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooossssooooooo', 'oooooooooooooooossss', 'ssoooooooooooosooooo', 'rroossssoooooooooooo', 'rrrorrrrrssssooooooo', 'oorssoooosoosooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'sports': ['oooooooooooooooooooo', 'ossooooosooooooooooo', 'oooooooooooooooooooo', 'oooosooooooooooooooo', 'ooorrrrrsssosooooooo', 'oooosooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'technology': ['oosooooooooooooosooo', 'ooooossooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oosooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'osoooooooooooooooooo', 'oooooooooosooooooooo', 'oooooooooooooooooooo'],
+    'test_prep_algebra': ['oooosooooooooooooooo'],
+    'test_prep_chemistry': ['ssossooooooooooooooo'],
+    'test_prep_geometry': ['oooooooooooooooooooo'],
+    'test_prep_literature': ['oooooooooooooooooooo'],
+    'test_prep_logic': ['ooooooooooooooooosoo'],
+    'test_prep_scientific_method': ['oooooooooooooooooooo'],
+    'test_prep_statistics': ['oooooooooooooooooooo'],
+    'test_prep_vocabulary': ['ooooooooooosoooooooo'],
+    'test_prep_world_history': ['sooooooooooooooooooo'],
+    'test_prep_writing': ['oooooooooooooooooooo'],
+    'transportation': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooooooooooosoo', 'ooooooooooosoosoooso'],
+    'weather': ['oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rsossosooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooososooooooo', 'oosoooooooooooooosoo', 'oooososooooooooosooo', 'ooooooooooooooosoooo', 'ooooooooooooosooosoo', 'oooooooooooooooooooo', 'ooooooooooosooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooosoooooooosoooo', 'oooooooooooooooooooo', 'ooosossooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo'],
+    'psychology_mental_health': ['oooooooooooooooooooo', 'orrrrrorrrsososoooso', 'oorrrrrrroroooosssos', 'oooooooooooooooooooo', 'roooooossooosoosoooo', 'oooooooooosoooooooso', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'orrrrrrrorrroorossss'],
+    'neuroscience_brain_science': ['rrroooooooorssssoooo', 'ooorrsosooooososoooo', 'ooooosooooooosssoooo', 'ooosooosooooooooooo', 'rrrrroooooorossssooo', 'rrrrrrssssoooooooooo', 'oooooooooooooooooooo', 'oooooosoosoooooooooo', 'oooooooooooooooooooo', 'rrrrrsooooooooooosss'],
+    'environmental_science': ['osoooooooosssooooooo', 'rorrssssoooooooooooo', 'oosoooooooooooooooso', 'sooosooooooooosooooo', 'rooorrrsssooooosoooo', 'oororosoosoosoooooso', 'oooooooooooooooooooo', 'osssoooooooooooooooo', 'ooooooooooooooooooos', 'ooorrrssossooooooooo'],
+    'oceanography_marine_science': ['rrrrrrrrrrsssoooosoo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'oooooooosooooooooooo', 'soooooooooooooooooso', 'sooooosooooooooooooo', 'ooooooooooooooooosss'],
+    'genetics_biotechnology': ['osoooosoooooooosoooo', 'oossoooooooooooooooo', 'sooooosooooooooosooo', 'oooooooooooooooooooo', 'oooooooooorrooosssso', 'rrrrrrrrssssoooooooo', 'oooooooooooooooosooo', 'oooossooooooooooooso', 'rrrroooooossssoooooo', 'oooooooooooooooooooo'],
+    'cybersecurity_digital_privacy': ['rrrrrrrrssssoooooooo', 'oooooooooooooooooooo', 'oooooosoosooosoooooo', 'oorooooosoosososoooo', 'rrrrrrrrssssoooooooo', 'ssoooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrrrrssssoooooooo', 'rrrrroroorrssssooooo', 'oooooooooooooooooooo'],
+    'data_science_analytics': ['ooooooooooooorrrssss', 'oooooooooooooooooooo', 'orooorrsssooosoooooo', 'rrroroosooossoooooo', 'sooooooooooooooooooo', 'rrrrrrrrssssoooooooo', 'oooooooooooooooooooo', 'rrrrrrrrrrorrsooosss', 'oooooooooooooooooooo', 'oooososooooooooooooo'],
+    'artificial_intelligence_ml': ['rrrrrorrrssssooooooo', 'sososooooooooooooooo', 'rrrrorrrrrrrrsssooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'soooooosooooosoooooo', 'osssoosooooooooooooo', 'oooooooooooooooooooo', 'oooooooooooosoooosso', 'rrrrooooroorrrrsssso'],
+    'quantum_physics': ['oooooooooooooooooooo', 'ooooosooooooooooooos', 'ooooosssoooooooooooo', 'rorsssoooooooosooooo', 'sssooooooooooooooooo', 'rsrrrsssoooooooooooo', 'sssooooooooooooooooo', 'ssooooooooooooooosoo', 'rrrssossoooooooooooo', 'sssooooooooooooooooo'],
+    'space_exploration_astronautics': ['oooroooororrsssosooo', 'rrroorrrsooooosososo', 'roorrooooorrrrrrssss', 'rrrorrrororssossoooo', 'rrroroorrrrrrrssosso', 'oooooooororssoososoo', 'ooororososooooossooo', 'rorrorooooooorssooss', 'rooooooorrosososooso', 'rorrooooorrrrrrrssss'],
+    'sustainable_energy_renewables': ['rrrrrrorosssooooooos', 'ossoorrroorrrrrooooo', 'ooosoooooooooooooooo', 'ooooooooorrrsssosooo', 'rrrrrrorossooossoooo', 'rrrorooooorrrrssssoo', 'roorrrssossooooooooo', 'rrrrrrorosssooooooos', 'rrrrrooooroooooossss', 'soooooooooooooooooso'],
+    'nanotechnology_materials_science': ['rooooroorrrrrrsoosss', 'oooroorrrrrrsoosssoo', 'oooooooooosooooooooo', 'oosoooooooooooosoooo', 'rrrrrrrrssssoooooooo', 'soooosoooooooooooooo', 'oooooosooooooooossoo', 'rrrrrrsooorsooooooss', 'rrrrrrrrssssoooooooo', 'oosoooooooosooooooo'],
+    'pharmacology_drug_development': ['rrrrrorrrossssoooooo', 'oooooooooooooooooooo', 'oooooooooooooooooso', 'orooooooororssosooso', 'sooooooooooooooooooo', 'rrrssooosoooooosoooo', 'oosoooossoooooosoooo', 'orrrrrrrrssssooooooo', 'orrooooooosoossoosoo', 'oooooooooooooooooooo'],
+    'immunology_vaccines': ['ssooooooosooooooooo', 'rrrrrrrrsosssooooooo', 'rrooorrrossoooosooos', 'roooorrrrrrrorrssoss', 'rrrrssssoooooooooooo', 'soooooooooooooooooos', 'oooooooooooooooooooo', 'oooorrorrsoooosoooss', 'rrrrrrrosssoooooooso', 'ooooooooooooooosoooo'],
+    'bioinformatics_computational_biology': ['sooooosooooooooooooo', 'orrrrrrrrrrssssooooo', 'ooooooooooooooooooos', 'oorrrrosoooooooossso', 'rrrrrrrrssssoooooooo', 'rrrrrrrrrsssooosoooo', 'ooorrsssoooooooosooo', 'sooooooooooooooooooo', 'ooooooooooooosoossoo', 'sooooooooooooooooooo'],
+    'robotics_automation': ['ooooooooooooooooooos', 'orrooossooooooooooss', 'sooooooooooooooooooo', 'oooooosoossooooooooo', 'ssooooosoooooooooooo', 'osoooooosooooooooooo', 'rrooorrrrrrssssooooo', 'ooooooosooooooooosss', 'ooossooooooooooooooo', 'rrrrrorrrssssooooooo'],
+    'cryptocurrency_blockchain': ['oooooooooooooooooooo', 'oooooooooosooooooooo', 'oooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooosoooooooooo', 'oooosoosoooooooooooo', 'oooooooooooooooooooo', 'sosooooooooosooooooo', 'osoooooooooooooooooo', 'rrroossssooooooooooo'],
+    'climate_science_meteorology': ['ossooooooooooooooooo', 'ooooooooooooooooosoo', 'roorrrrrrrsssoooooo', 'orooososoooooososooo', 'rrrrooorrrrrrrrsssso', 'ooooooooosoooooooooo', 'oooooooooooosooooooo', 'rrrrrrorroooooososss', 'rososososooooooooooo', 'ssooooooooooooosoooo'],
+    'aerospace_engineering': ['roooorororrrsssosooo', 'orrrossosooosooooooo', 'osoooooooooooooooooo', 'oooooooooooooooooooo', 'ooooooooosoooooooooo', 'ooorsooossoosooooooo', 'orsosssooooooooooooo', 'ooooooooooorsssoooso', 'soooooooooosoooooooo', 'oooooooooooooooooooo'],
+    'renewable_energy_technologies': ['ooororrssooooossoooo', 'orrorrorroorssssoooo', 'ororoorrrorssssooooo', 'rrrrrrorrororssoooss', 'rrroroorrssosoooosoo', 'rrsosssooooooooooooo', 'oooooooooooooooooooo', 'rooorororrrssossoooo', 'osoorrrrooooosoosoos', 'rrrrrrrrssooooooooss'],
+    'materials_science_engineering': ['oooooooooooosooooooo', 'ororrsssoooosooooooo', 'ororoorssooooosoooos', 'oooooooooooooooooooo', 'ooooooooooooooosooos', 'rrrrrrrrssssoooooooo', 'rrrrooooorrssoooooss', 'ooooooooooooooooooo', 'oooooooooooooooooooo', 'soooosooooooooooooo'],
+    'biomedical_engineering': ['orooorsooooooooossso', 'oooooooooooooorrssss', 'oooooooooooooooooooo', 'oorooroosoosoossoooo', 'sooooooooossoooooooo', 'oooooosooooooooooooo', 'oooooosooooosoossooo', 'roroorrooososssooooo', 'oooooooooooorrssssoo', 'ooosoooooooossoosooo'],
+    'neuroengineering_brain_computer_interface': ['oooooooooooooooooooo', 'rrrrrroorrssssoooooo', 'oooorrrrorrrrrrrsss', 'rororororrrrrorrssss', 'ooooooooooooooooosss', 'rrorrooooooossooosos', 'rororrrrorrssssooooo', 'orrrrrrrsssosooooooo', 'oorooooooosoooooosss', 'rrrorrrrrssssooooooo'],
+    'synthetic_biology_bioengineering': ['rrossssooooooooooooo', 'sooooooooosooooososo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'rrrrrrrrrssssooooooo', 'rrrrrrrrssssoooooooo', 'rrrrrrrssssooooooo', 'roooooorooooroorssss', 'rrroorrrrrssssoooooo', 'oooooooosooosooooooo'],
+    'quantum_computing_algorithms': ['rrooorororrssssooooo', 'rrooooooooorrroossss', 'rorrrrrrrrrrssossooo', 'roooooorrssooossoooo', 'roororroroooorrsssos', 'sooosossoooooooooooo', 'rrrrorroorrssssooooo', 'roooorooooooorssosos', 'rrorororsooosoossooo', 'rrrrrrrrrrsoooossoso'],
+    'advanced_mathematics_topology': ['ooososoooossoooooooo', 'osoooooooooooooooooo', 'rrrsosossooooooooooo', 'oooooooooossoooooooo', 'osososooooooooooooo', 'ooooosooooosoooooo', 'ssoooooooooooooooooo', 'rrrrrrorroorssooooss', 'oooooosoooooooosoooo', 'rrrrrrrrrrrssssooooo'],
+    'computational_chemistry': ['oooossoooooooooooooo', 'oooooooooooooooooooo', 'oosooooooooooooooooo', 'oooooooooooooooooooo', 'oororroooororssoosso', 'soooooooosoooooooooo', 'rrorrrororssosooosoo', 'ooosooooososooooooos', 'rrrrrooooossosoosooo', 'oooooooooooooooooooo'],
+    'particle_physics_high_energy': ['sossoooooooooooooooo', 'sooooooooooooooooooo', 'orrorrsorrrooorssoso', 'oorsooossoooosoooooo', 'oooooooooooooooooooo', 'oossooooooooooooooss', 'rorrorsssoooooooooso', 'ooooooroossoossooooo', 'oooooooooooooooooooo', 'ssoooooooooooooooooo'],
+    'astrophysics_cosmology': ['orrrrorrssoooososooo', 'roooorssssoooooooooo', 'rooooooorrosososooso', 'oooooooooooooooooooo', 'rooooooorssssooooooo', 'sooooooooooooooooooo', 'ooooorrroossosooosoo', 'rorrrrrrrsoossooooo', 'sooooooooooooooooooo', 'rorrrrrrrssoossooooo'],
+    'advanced_physics_theoretical': ['rorsoooooooooooossos', 'ooooooooooooooosoooo', 'oooooooooooooooooooo', 'roorrorrosssooooooos', 'ssoosooooooooooooooo', 'sooooooossooosoooooo', 'ooooosooooooooooooos', 'rrrrroorrrrrrssoooss', 'rrrroorrrrororrsosss', 'sssooooooooooooooooo'],
+    'molecular_biology_genetics': ['orrosoosoooooossoooo', 'orrosooooooossoosooo', 'oooooooooooooooooooo', 'sooooosoooooooosoooo', 'rrrrssooososoooooooo', 'oooooooooooooooooooo', 'oooooooooooooooooooo', 'sososoooooosoooooooo', 'rrrssooosooooooosooo', 'ooooooooosooooooooo'],
+    'systems_biology_networks': ['oooooorrsoooosososoo', 'oooooorrssooosooooso', 'rrrrrrrrrrrrssssoooo', 'sooooooooooooooooooo', 'roosoooooooosoosooos', 'rsssooooosoooooooooo', 'rrooooorrrrrrrrrssss', 'sosssooooooooooooooo', 'sssooooooooooooosooo', 'orrrrrrrrssssooooooo'],
+    'protein_engineering_design': ['soosooooooooooooooos', 'ooooorooooorrrrrssss', 'oorroooosossooooooos', 'rrrrrrrrssssoooooooo', 'rrrrrrrrssssoooooooo', 'oooooosooooososooooo', 'rooorrrorrrrrrrrssss', 'rrrrrrrrsosssooooooo', 'rrrrsoooossoosoooooo', 'rrrrrrrrsooosssooooo'],
+    'advanced_chemistry_organic': ['ssoooooooooooooooooo', 'sooosooooooooooooooo', 'rrorrrrrrssssooooooo', 'ssoooooooooooooooooo', 'rroooorrrrrrrrrrssss', 'ooooooooooooosoooooo', 'rrrrrrrrrrrssssooooo', 'orooororrrorrrrrssss', 'roooosssoosooooooooo', 'rrrrrorrrossssoooooo'],
+    'electrical_engineering_circuits': ['ooooorsssooooosooooo', 'oososssooooooooooooo', 'rrssooosoooosooooooo', 'oooooooooooosooooooo', 'orrrroorrrorossssooo', 'oooooooooooosssooooo', 'orrrooroorroororssss', 'oosooooooooosoossooo', 'rrrrrrrrssssoooooooo', 'oooooooooooooooooooo'],
+    'mechanical_engineering_design': ['ororssoooooosoosoooo', 'osoosooooooooooooooo', 'roorrrooooorrrrrssss', 'oooooooooooooooooooo', 'ooooooooooooooooooo', 'ororosoosooosoooos', 'rrrrrrroroossssooooo', 'oooooooooooooooooooo', 'orrorrsosssooooooooo', 'roorrrrrrrssssoooooo'],
+    'statistical_methods_data_analysis': ['oroooorrrrrrorrrssss', 'oooooooooorssoosooos', 'oororssoooooossooooo', 'ooooosoooooooooooooo', 'osooooosoooooooooooo', 'oooosooooooooooooooo', 'oooooosoosoooooooooo', 'ooooooooooooooooosoo', 'oooooooooooooooooooo', 'ooooorooooorrrrrssss'],
+    'information_theory_compression': ['oooooooooooooooooooo', 'oororooroooossssoooo', 'ooooooooooooooooooss', 'osoooooooooooooooooo', 'rrrorrrrrssssooooooo', 'oooroossooooooooooss', 'ooorrrssosoooosooooo', 'roroororrrroooorssss', 'rrrrroooooooooorssss', 'rrrrrrrooorsosooooss'],
+    'machine_learning_neural_networks': ['sosoooooooooooosoooo', 'sooosoooooooooooosoo', 'sooooooooooooooooooo', 'oooooooooooooooooooo', 'ssssoooooooooooooooo', 'sooooooooooooooooooo', 'ooooossooooooosooooo', 'sosooosooooooooooooo', 'oorrroorrrrrrrorssss', 'rrssoosoosoooooooooo'],
+  };
+
+  /// Themes each edition draws from, checked against the corpus
+  static const Map<String, List<String>> editionThemes = {
+    'geography': ['geography'],
+    'usa_geography': ['geography'],
+    'world_capitals': ['geography'],
+    'mountains_rivers': ['geography'],
+    'islands': ['geography'],
+    'national_parks': ['geography'],
+    'cities': ['geography'],
+    'oceans': ['geography'],
+    'history': ['history'],
+    'biology': ['science'],
+    'chemistry': ['science'],
+    'physics': ['science'],
+    'geology': ['science'],
+    'environmental_science': ['science'],
+    'marine_biology': ['science'],
+    'microbiology': ['science'],
+    'genetics': ['science'],
+    'neuroscience': ['science'],
+    'astronomy': ['astronomy'],
+    'meteorology': ['weather'],
+    'oceanography': ['science'],
+    'botany': ['science'],
+    'zoology': ['science'],
+    'paleontology': ['science'],
+    'nursing': ['medicine'],
+    'medicine': ['medicine'],
+    'anatomy': ['medicine'],
+    'surgery': ['medicine'],
+    'emergency_medicine': ['medicine'],
+    'mental_health': ['medicine'],
+    'veterinary': ['medicine'],
+    'public_health': ['medicine'],
+    'pharmacy': ['medicine'],
+    'dentistry': ['medicine'],
+    'black': ['black_culture'],
+    'latino': ['latino_culture'],
+    'spanish': ['latino_culture'],
+    'asian': ['asian_american_culture'],
+    'indigenous': ['indigenous_culture'],
+    'caribbean': ['caribbean_culture'],
+    'middle_eastern': ['middle_eastern_culture'],
+    'african': ['african_culture'],
+    'business': ['business'],
+    'finance': ['business', 'economics'],
+    'law': ['business'],
+    'engineering': ['business'],
+    'computer_science': ['technology'],
+    'marketing': ['business'],
+    'real_estate': ['business'],
+    'agriculture': ['agriculture'],
+    'aviation': ['aviation'],
+    'military': ['military'],
+    'music': ['arts'],
+    'movies': ['arts'],
+    'tv': ['arts'],
+    'art': ['arts'],
+    'literature': ['literature'],
+    'theater': ['arts'],
+    'dance': ['arts'],
+    'photography': ['arts'],
+    'fashion': ['arts'],
+    'architecture': ['arts'],
+    'video_games': ['arts'],
+    'anime_manga': ['arts'],
+    'comics': ['arts'],
+    'classical_music': ['arts'],
+    'hip_hop': ['arts'],
+    'sports_general': ['sports'],
+    'football': ['sports'],
+    'basketball': ['sports'],
+    'baseball': ['sports'],
+    'soccer': ['sports'],
+    'olympics': ['sports'],
+    'fitness': ['sports'],
+    'extreme_sports': ['sports'],
+    'religion': ['religion'],
+    'mythology': ['religion'],
+    'philosophy': ['philosophy'],
+    'technology': ['technology'],
+    'nature_wildlife': ['science'],
+    'space_exploration': ['astronomy'],
+    'little_n3rd': ['kids_animals', 'kids_colors', 'kids_shapes', 'kids_time', 'kids_food', 'kids_body', 'kids_weather', 'kids_sky', 'kids_house', 'kids_numbers'],
+    'junior_n3rd': ['kids_space', 'kids_dinosaurs', 'kids_plants', 'kids_geography', 'kids_science', 'kids_weather_advanced', 'kids_math', 'kids_earth_science', 'kids_geology', 'kids_machines'],
+    'elementary_n3rd': ['kids_civics', 'kids_us_government', 'kids_geology_advanced', 'kids_ecosystems', 'kids_water_cycle', 'kids_energy', 'kids_biology', 'kids_ancient_history', 'kids_grammar', 'kids_moon_phases'],
+    'middle_school_n3rd': ['middle_school_chemistry', 'middle_school_physics', 'middle_school_literature', 'middle_school_geometry', 'middle_school_ecology', 'middle_school_civics', 'middle_school_cell_division', 'middle_school_plate_tectonics', 'middle_school_art_history', 'middle_school_economics'],
+    'high_school_n3rd': ['high_school_literature', 'high_school_american_literature', 'high_school_physics', 'high_school_chemistry', 'high_school_history', 'high_school_calculus', 'high_school_biology', 'high_school_economics', 'high_school_rhetoric', 'high_school_government'],
+    'college_prep_n3rd': ['test_prep_vocabulary', 'test_prep_logic', 'test_prep_algebra', 'test_prep_literature', 'test_prep_chemistry', 'test_prep_scientific_method', 'test_prep_geometry', 'test_prep_writing', 'test_prep_statistics', 'test_prep_world_history'],
+    'premium_psychology': ['psychology_mental_health', 'neuroscience_brain_science'],
+    'premium_environmental': ['environmental_science', 'oceanography_marine_science'],
+    'premium_genetics': ['genetics_biotechnology'],
+    'premium_cybersecurity': ['cybersecurity_digital_privacy'],
+    'premium_data_science': ['data_science_analytics', 'artificial_intelligence_ml'],
+    'premium_quantum': ['quantum_physics'],
+    'premium_advanced_science': ['quantum_physics', 'neuroscience_brain_science', 'genetics_biotechnology'],
+    'premium_tech_stack': ['cybersecurity_digital_privacy', 'data_science_analytics', 'artificial_intelligence_ml'],
+    'premium_mental_wellness': ['psychology_mental_health'],
+    'premium_earth_sciences': ['environmental_science', 'oceanography_marine_science'],
+    'premium_space': ['space_exploration_astronautics'],
+    'premium_energy': ['sustainable_energy_renewables'],
+    'premium_nanotech': ['nanotechnology_materials_science'],
+    'premium_advanced_tech': ['nanotechnology_materials_science', 'quantum_physics', 'artificial_intelligence_ml'],
+    'premium_complete_science': ['psychology_mental_health', 'neuroscience_brain_science', 'environmental_science', 'oceanography_marine_science', 'genetics_biotechnology', 'quantum_physics', 'space_exploration_astronautics', 'nanotechnology_materials_science'],
+    'premium_complete_tech': ['cybersecurity_digital_privacy', 'data_science_analytics', 'artificial_intelligence_ml', 'nanotechnology_materials_science'],
+    'premium_sustainability': ['environmental_science', 'sustainable_energy_renewables', 'oceanography_marine_science'],
+    'premium_health_sciences': ['psychology_mental_health', 'neuroscience_brain_science', 'genetics_biotechnology'],
+    'premium_data_ai': ['data_science_analytics', 'artificial_intelligence_ml', 'cybersecurity_digital_privacy'],
+    'premium_quantum_nano': ['quantum_physics', 'nanotechnology_materials_science'],
+    'premium_space_earth': ['space_exploration_astronautics', 'oceanography_marine_science', 'environmental_science'],
+    'premium_all_premium': ['psychology_mental_health', 'neuroscience_brain_science', 'environmental_science', 'oceanography_marine_science', 'genetics_biotechnology', 'cybersecurity_digital_privacy', 'data_science_analytics', 'artificial_intelligence_ml', 'quantum_physics', 'space_exploration_astronautics', 'sustainable_energy_renewables', 'nanotechnology_materials_science'],
+    'premium_biomedical': ['biomedical_engineering'],
+    'premium_neuroengineering': ['neuroengineering_brain_computer_interface'],
+    'premium_synthetic_biology': ['synthetic_biology_bioengineering'],
+    'premium_quantum_computing': ['quantum_computing_algorithms'],
+    'premium_advanced_math': ['advanced_mathematics_topology'],
+    'premium_computational_chemistry': ['computational_chemistry'],
+    'premium_particle_physics': ['particle_physics_high_energy'],
+    'premium_astrophysics': ['astrophysics_cosmology'],
+    'premium_theoretical_physics': ['advanced_physics_theoretical'],
+    'premium_molecular_biology': ['molecular_biology_genetics'],
+    'premium_systems_biology': ['systems_biology_networks'],
+    'premium_protein_engineering': ['protein_engineering_design'],
+    'premium_organic_chemistry': ['advanced_chemistry_organic'],
+    'premium_electrical_engineering': ['electrical_engineering_circuits'],
+    'premium_mechanical_engineering': ['mechanical_engineering_design'],
+    'premium_statistics': ['statistical_methods_data_analysis'],
+    'premium_information_theory': ['information_theory_compression'],
+    'premium_machine_learning': ['machine_learning_neural_networks'],
+    'premium_advanced_engineering': ['biomedical_engineering', 'electrical_engineering_circuits', 'mechanical_engineering_design', 'neuroengineering_brain_computer_interface'],
+    'premium_advanced_biology': ['biomedical_engineering', 'molecular_biology_genetics', 'synthetic_biology_bioengineering', 'systems_biology_networks', 'protein_engineering_design'],
+    'premium_advanced_physics': ['particle_physics_high_energy', 'astrophysics_cosmology', 'advanced_physics_theoretical', 'quantum_computing_algorithms'],
+    'premium_advanced_chemistry': ['computational_chemistry', 'advanced_chemistry_organic'],
+    'premium_computational_sciences': ['quantum_computing_algorithms', 'computational_chemistry', 'statistical_methods_data_analysis', 'information_theory_compression', 'machine_learning_neural_networks'],
+    'premium_complete_advanced': ['biomedical_engineering', 'neuroengineering_brain_computer_interface', 'synthetic_biology_bioengineering', 'quantum_computing_algorithms', 'advanced_mathematics_topology', 'computational_chemistry', 'particle_physics_high_energy', 'astrophysics_cosmology', 'advanced_physics_theoretical', 'molecular_biology_genetics', 'systems_biology_networks', 'protein_engineering_design', 'advanced_chemistry_organic', 'electrical_engineering_circuits', 'mechanical_engineering_design', 'statistical_methods_data_analysis', 'information_theory_compression', 'machine_learning_neural_networks'],
+  };
+
+  static const Map<String, int> editionTemplateCounts = {
+    'geography': 10,
+    'usa_geography': 10,
+    'world_capitals': 10,
+    'mountains_rivers': 10,
+    'islands': 10,
+    'national_parks': 10,
+    'cities': 10,
+    'oceans': 10,
+    'history': 10,
+    'biology': 37,
+    'chemistry': 37,
+    'physics': 37,
+    'geology': 37,
+    'environmental_science': 37,
+    'marine_biology': 37,
+    'microbiology': 37,
+    'genetics': 37,
+    'neuroscience': 37,
+    'astronomy': 10,
+    'meteorology': 20,
+    'oceanography': 37,
+    'botany': 37,
+    'zoology': 37,
+    'paleontology': 37,
+    'nursing': 20,
+    'medicine': 20,
+    'anatomy': 20,
+    'surgery': 20,
+    'emergency_medicine': 20,
+    'mental_health': 20,
+    'veterinary': 20,
+    'public_health': 20,
+    'pharmacy': 20,
+    'dentistry': 20,
+    'black': 10,
+    'latino': 10,
+    'spanish': 10,
+    'asian': 10,
+    'indigenous': 10,
+    'caribbean': 10,
+    'middle_eastern': 10,
+    'african': 10,
+    'business': 10,
+    'finance': 20,
+    'law': 10,
+    'engineering': 10,
+    'computer_science': 10,
+    'marketing': 10,
+    'real_estate': 10,
+    'agriculture': 10,
+    'aviation': 10,
+    'military': 10,
+    'music': 8,
+    'movies': 8,
+    'tv': 8,
+    'art': 8,
+    'literature': 10,
+    'theater': 8,
+    'dance': 8,
+    'photography': 8,
+    'fashion': 8,
+    'architecture': 8,
+    'video_games': 8,
+    'anime_manga': 8,
+    'comics': 8,
+    'classical_music': 8,
+    'hip_hop': 8,
+    'sports_general': 10,
+    'football': 10,
+    'basketball': 10,
+    'baseball': 10,
+    'soccer': 10,
+    'olympics': 10,
+    'fitness': 10,
+    'extreme_sports': 10,
+    'religion': 10,
+    'mythology': 10,
+    'philosophy': 10,
+    'technology': 10,
+    'nature_wildlife': 37,
+    'space_exploration': 10,
+    'little_n3rd': 10,
+    'junior_n3rd': 10,
+    'elementary_n3rd': 20,
+    'middle_school_n3rd': 10,
+    'high_school_n3rd': 10,
+    'college_prep_n3rd': 10,
+    'premium_psychology': 20,
+    'premium_environmental': 20,
+    'premium_genetics': 10,
+    'premium_cybersecurity': 10,
+    'premium_data_science': 20,
+    'premium_quantum': 10,
+    'premium_advanced_science': 30,
+    'premium_tech_stack': 30,
+    'premium_mental_wellness': 10,
+    'premium_earth_sciences': 20,
+    'premium_space': 10,
+    'premium_energy': 10,
+    'premium_nanotech': 10,
+    'premium_advanced_tech': 30,
+    'premium_complete_science': 80,
+    'premium_complete_tech': 40,
+    'premium_sustainability': 30,
+    'premium_health_sciences': 30,
+    'premium_data_ai': 30,
+    'premium_quantum_nano': 20,
+    'premium_space_earth': 30,
+    'premium_all_premium': 120,
+    'premium_biomedical': 10,
+    'premium_neuroengineering': 10,
+    'premium_synthetic_biology': 10,
+    'premium_quantum_computing': 10,
+    'premium_advanced_math': 10,
+    'premium_computational_chemistry': 10,
+    'premium_particle_physics': 10,
+    'premium_astrophysics': 10,
+    'premium_theoretical_physics': 10,
+    'premium_molecular_biology': 10,
+    'premium_systems_biology': 10,
+    'premium_protein_engineering': 10,
+    'premium_organic_chemistry': 10,
+    'premium_electrical_engineering': 10,
+    'premium_mechanical_engineering': 10,
+    'premium_statistics': 10,
+    'premium_information_theory': 10,
+    'premium_machine_learning': 10,
+    'premium_advanced_engineering': 40,
+    'premium_advanced_biology': 50,
+    'premium_advanced_physics': 40,
+    'premium_advanced_chemistry': 20,
+    'premium_computational_sciences': 50,
+    'premium_complete_advanced': 180,
+  };
+
+  /// Denominator of the sampling thresholds below
+  static const int samplingScale = 1073741824;
+
+  /// Alias tables weighted by `possibleCombinations`, in template order
+  static const Map<String, List<int>> themeSamplingThresholds = {
+    'african_culture': [1000380581, 1000380581, 1000380581, 1073741824, 716061889, 1000380581, 1000380581, 1000380581, 1000380581, 1000380581],
+    'agriculture': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'animals': [1073741824, 1073741824, 1073741824],
+    'arts': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'asian_american_culture': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'astronomy': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'automotive': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'aviation': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'black_culture': [1073741824, 978418010, 883094196, 787770383, 692446569, 597122756, 215827502, 501798942, 406475129, 311151315],
+    'business': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'caribbean_culture': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'economics': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'geography': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'high_school_american_literature': [1073741824],
+    'high_school_biology': [1073741824],
+    'high_school_calculus': [1073741824],
+    'high_school_chemistry': [1073741824],
+    'high_school_economics': [1073741824],
+    'high_school_government': [1073741824],
+    'high_school_history': [1073741824],
+    'high_school_literature': [1073741824],
+    'high_school_physics': [1073741824],
+    'high_school_rhetoric': [1073741824],
+    'history': [90995069, 1073741824, 964547740, 855353656, 746159572, 636965488, 527771405, 418577321, 309383237, 200189153],
+    'indigenous_culture': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'kids_ancient_history': [1073741824, 1073741824],
+    'kids_animals': [1073741824],
+    'kids_biology': [1073741824, 1073741824],
+    'kids_body': [1073741824],
+    'kids_civics': [1073741824, 1073741824],
+    'kids_colors': [1073741824],
+    'kids_dinosaurs': [1073741824],
+    'kids_earth_science': [1073741824],
+    'kids_ecosystems': [1073741824, 1073741824],
+    'kids_energy': [1073741824, 1073741824],
+    'kids_food': [1073741824],
+    'kids_geography': [1073741824],
+    'kids_geology': [1073741824],
+    'kids_geology_advanced': [1073741824, 1073741824],
+    'kids_grammar': [1073741824, 1073741824],
+    'kids_house': [1073741824],
+    'kids_machines': [1073741824],
+    'kids_math': [1073741824],
+    'kids_moon_phases': [1073741824, 1073741824],
+    'kids_numbers': [1073741824],
+    'kids_plants': [1073741824],
+    'kids_science': [1073741824],
+    'kids_shapes': [1073741824],
+    'kids_sky': [1073741824],
+    'kids_space': [1073741824],
+    'kids_time': [1073741824],
+    'kids_us_government': [1073741824, 1073741824],
+    'kids_water_cycle': [1073741824, 1073741824],
+    'kids_weather': [1073741824],
+    'kids_weather_advanced': [1073741824],
+    'latino_culture': [933242655, 933242655, 933242655, 933242655, 933242655, 933242655, 933242655, 933242655, 1073741824, 933242655],
+    'literature': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'medicine': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'middle_eastern_culture': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'middle_school_art_history': [1073741824],
+    'middle_school_cell_division': [1073741824],
+    'middle_school_chemistry': [1073741824],
+    'middle_school_civics': [1073741824],
+    'middle_school_ecology': [1073741824],
+    'middle_school_economics': [1073741824],
+    'middle_school_geometry': [1073741824],
+    'middle_school_literature': [1073741824],
+    'middle_school_physics': [1073741824],
+    'middle_school_plate_tectonics': [1073741824],
+    'military': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'movies': [1073741824],
+    'music': [1073741824],
+    'philosophy': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'religion': [933242655, 1073741824, 933242655, 933242655, 933242655, 933242655, 933242655, 933242655, 933242655, 933242655],
+    'science': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'sports': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'technology': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'test_prep_algebra': [1073741824],
+    'test_prep_chemistry': [1073741824],
+    'test_prep_geometry': [1073741824],
+    'test_prep_literature': [1073741824],
+    'test_prep_logic': [1073741824],
+    'test_prep_scientific_method': [1073741824],
+    'test_prep_statistics': [1073741824],
+    'test_prep_vocabulary': [1073741824],
+    'test_prep_world_history': [1073741824],
+    'test_prep_writing': [1073741824],
+    'transportation': [1073741824, 1073741824, 1073741824, 1073741824],
+    'weather': [303474034, 1073741824, 996811267, 919880710, 842950153, 766019596, 689089039, 612158483, 535227926, 458297369, 381366812, 304436255, 459259590, 997773488, 920842931, 843912374, 766981817, 690051261, 613120704, 536190147],
+    'psychology_mental_health': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'neuroscience_brain_science': [1073741824, 1057390425, 1041039027, 926579238, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'environmental_science': [876523937, 1073741824, 1051828725, 1029915627, 1008002528, 986089430, 964176331, 942263233, 920350134, 898437036],
+    'oceanography_marine_science': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'genetics_biotechnology': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'cybersecurity_digital_privacy': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'data_science_analytics': [1073741824, 1057390425, 1041039027, 926579238, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'artificial_intelligence_ml': [1073741824, 1057390425, 926579238, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'quantum_physics': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'space_exploration_astronautics': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'sustainable_energy_renewables': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'nanotechnology_materials_science': [1073741824, 1034797820, 995853816, 890148662, 956909812, 917965808, 1062614965, 1023670961, 984726957, 945782953],
+    'pharmacology_drug_development': [1073741824, 1057390425, 926579238, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'immunology_vaccines': [926579238, 1073741824, 1057390425, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'bioinformatics_computational_biology': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'robotics_automation': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'cryptocurrency_blockchain': [1073741824, 1042332258, 791055731, 1010922692, 979513126, 948103560, 916693994, 885284429, 853874863, 822465297],
+    'climate_science_meteorology': [1073741824, 1034797820, 945782953, 995853816, 956909812, 1045924678, 890148662, 1006980674, 968036670, 929092666],
+    'aerospace_engineering': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'renewable_energy_technologies': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'materials_science_engineering': [1073741824, 1040533313, 1007324803, 974116293, 940907783, 1040533313, 1007324803, 940907783, 974116293, 940907783],
+    'biomedical_engineering': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'neuroengineering_brain_computer_interface': [1073741824, 1057390425, 926579238, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637],
+    'synthetic_biology_bioengineering': [1073741824, 1042332258, 1010922692, 979513126, 948103560, 916693994, 791055731, 885284429, 853874863, 822465297],
+    'quantum_computing_algorithms': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'advanced_mathematics_topology': [1073741824, 1001032697, 917160760, 928323571, 974483307, 820617522, 1012195509, 1038744900, 966035774, 893326648],
+    'computational_chemistry': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'particle_physics_high_energy': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'astrophysics_cosmology': [1073741824, 1057390425, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 926579238, 959282035, 942930637],
+    'advanced_physics_theoretical': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'molecular_biology_genetics': [1073741824, 1057390425, 1041039027, 1024687628, 1008336230, 991984832, 975633433, 959282035, 942930637, 926579238],
+    'systems_biology_networks': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'protein_engineering_design': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'advanced_chemistry_organic': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'electrical_engineering_circuits': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'mechanical_engineering_design': [917160760, 1073741824, 1001032697, 928323571, 974483307, 820617522, 1012195509, 1038744900, 966035774, 893326648],
+    'statistical_methods_data_analysis': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'information_theory_compression': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+    'machine_learning_neural_networks': [1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824, 1073741824],
+  };
+
+  static const Map<String, List<int>> themeSamplingAliases = {
+    'african_culture': [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
+    'agriculture': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'animals': [0, 1, 2],
+    'arts': [0, 1, 2, 3, 4, 5, 6, 7],
+    'asian_american_culture': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'astronomy': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'automotive': [0, 1, 2, 3, 4, 5],
+    'aviation': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'black_culture': [0, 0, 1, 2, 3, 4, 9, 5, 7, 8],
+    'business': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'caribbean_culture': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'economics': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'geography': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'high_school_american_literature': [0],
+    'high_school_biology': [0],
+    'high_school_calculus': [0],
+    'high_school_chemistry': [0],
+    'high_school_economics': [0],
+    'high_school_government': [0],
+    'high_school_history': [0],
+    'high_school_literature': [0],
+    'high_school_physics': [0],
+    'high_school_rhetoric': [0],
+    'history': [9, 1, 1, 2, 3, 4, 5, 6, 7, 8],
+    'indigenous_culture': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'kids_ancient_history': [0, 1],
+    'kids_animals': [0],
+    'kids_biology': [0, 1],
+    'kids_body': [0],
+    'kids_civics': [0, 1],
+    'kids_colors': [0],
+    'kids_dinosaurs': [0],
+    'kids_earth_science': [0],
+    'kids_ecosystems': [0, 1],
+    'kids_energy': [0, 1],
+    'kids_food': [0],
+    'kids_geography': [0],
+    'kids_geology': [0],
+    'kids_geology_advanced': [0, 1],
+    'kids_grammar': [0, 1],
+    'kids_house': [0],
+    'kids_machines': [0],
+    'kids_math': [0],
+    'kids_moon_phases': [0, 1],
+    'kids_numbers': [0],
+    'kids_plants': [0],
+    'kids_science': [0],
+    'kids_shapes': [0],
+    'kids_sky': [0],
+    'kids_space': [0],
+    'kids_time': [0],
+    'kids_us_government': [0, 1],
+    'kids_water_cycle': [0, 1],
+    'kids_weather': [0],
+    'kids_weather_advanced': [0],
+    'latino_culture': [8, 8, 8, 8, 8, 8, 8, 8, 8, 8],
+    'literature': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'medicine': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19],
+    'middle_eastern_culture': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'middle_school_art_history': [0],
+    'middle_school_cell_division': [0],
+    'middle_school_chemistry': [0],
+    'middle_school_civics': [0],
+    'middle_school_ecology': [0],
+    'middle_school_economics': [0],
+    'middle_school_geometry': [0],
+    'middle_school_literature': [0],
+    'middle_school_physics': [0],
+    'middle_school_plate_tectonics': [0],
+    'military': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'movies': [0],
+    'music': [0],
+    'philosophy': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'religion': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    'science': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36],
+    'sports': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'technology': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'test_prep_algebra': [0],
+    'test_prep_chemistry': [0],
+    'test_prep_geometry': [0],
+    'test_prep_literature': [0],
+    'test_prep_logic': [0],
+    'test_prep_scientific_method': [0],
+    'test_prep_statistics': [0],
+    'test_prep_vocabulary': [0],
+    'test_prep_world_history': [0],
+    'test_prep_writing': [0],
+    'transportation': [0, 1, 2, 3],
+    'weather': [11, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 19, 11, 13, 14, 15, 16, 17, 18],
+    'psychology_mental_health': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'neuroscience_brain_science': [0, 0, 1, 9, 2, 4, 5, 6, 7, 8],
+    'environmental_science': [9, 1, 1, 2, 3, 4, 5, 6, 7, 8],
+    'oceanography_marine_science': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'genetics_biotechnology': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'cybersecurity_digital_privacy': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'data_science_analytics': [0, 0, 1, 9, 2, 4, 5, 6, 7, 8],
+    'artificial_intelligence_ml': [0, 0, 9, 1, 3, 4, 5, 6, 7, 8],
+    'quantum_physics': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'space_exploration_astronautics': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'sustainable_energy_renewables': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'nanotechnology_materials_science': [0, 0, 1, 5, 2, 4, 5, 6, 7, 8],
+    'pharmacology_drug_development': [0, 0, 9, 1, 3, 4, 5, 6, 7, 8],
+    'immunology_vaccines': [9, 1, 1, 2, 3, 4, 5, 6, 7, 8],
+    'bioinformatics_computational_biology': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'robotics_automation': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'cryptocurrency_blockchain': [0, 0, 9, 1, 3, 4, 5, 6, 7, 8],
+    'climate_science_meteorology': [0, 0, 4, 1, 3, 4, 9, 5, 7, 8],
+    'aerospace_engineering': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'renewable_energy_technologies': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'materials_science_engineering': [0, 0, 1, 2, 3, 4, 5, 4, 6, 8],
+    'biomedical_engineering': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'neuroengineering_brain_computer_interface': [0, 0, 9, 1, 3, 4, 5, 6, 7, 8],
+    'synthetic_biology_bioengineering': [0, 0, 1, 2, 3, 4, 9, 5, 7, 8],
+    'quantum_computing_algorithms': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'advanced_mathematics_topology': [0, 0, 3, 1, 6, 9, 3, 6, 7, 8],
+    'computational_chemistry': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'particle_physics_high_energy': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'astrophysics_cosmology': [0, 0, 1, 2, 3, 4, 5, 9, 6, 8],
+    'advanced_physics_theoretical': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'molecular_biology_genetics': [0, 0, 1, 2, 3, 4, 5, 6, 7, 8],
+    'systems_biology_networks': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'protein_engineering_design': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'advanced_chemistry_organic': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'electrical_engineering_circuits': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'mechanical_engineering_design': [3, 1, 1, 2, 6, 9, 3, 6, 7, 8],
+    'statistical_methods_data_analysis': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'information_theory_compression': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    'machine_learning_neural_networks': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+  };
+
+  /// Built-in `TriviaGeneratorService` templates, checked like the above
+  static const int baseTemplateCount = 326;
+
+  /// Whether they pass the checks the service throws on at startup
+  static const bool baseTemplatesValid = false;
+
+  static const int baseContentHash = 965937295;
+
+  static const int baseTotalPossibleCombinations = 258659885;
+
+  /// Tier codes of each built-in template, in template order
+  static const List<String> baseDistractorTiers = [
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooosoooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'rssssooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooosooosoooooos',
+    'oooooooooooooooooooo',
+    'oooooosooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooosooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooossooooooooooooo',
+    'oosooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ssoooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooooooso',
+    'oooooooooosooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooosooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'sooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oosoooooooooooosoooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooosoooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooooooos',
+    'ooororoorroorrrrssss',
+    'oosooooooooosooooooo',
+    'oooosooooosooooooooo',
+    'ooooooroooorrrrsssso',
+    'ooooooosoooooooooooo',
+    'ooooooorroossssooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oososooooooooooosooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oosoooooooooooooosss',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oorosoooooossoosoooo',
+    'ooooooooooooooooooso',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooosooooooosooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooosoooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooosooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooosooooooooo',
+    'sooooooooooooooooooo',
+    'ooooosoooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'osoooooooooooooooooo',
+    'ooooooooooosoooooooo',
+    'ooooosooooooooosoooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'osoooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oosoooooooosoooooooo',
+    'oossoooooossoooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooosoooooooos',
+    'oooooooooooooooooooo',
+    'oooosoooooosoooooooo',
+    'oooooooooooooooooooo',
+    'oosooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooooosos',
+    'oooooooooooooosooooo',
+    'oooooooosooooosooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'sooooooooooosooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooosooooooooo',
+    'oosooooooooooooooooo',
+    'ooooosoooooooooooooo',
+    'ooooosoooooooooooooo',
+    'ooooooooooooooooooso',
+    'oooosoosssoooooooooo',
+    'oooossoooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'rrrrrrrrssssoooooooo',
+    'ooooooooosoooooooooo',
+    'oooooooooooooooooooo',
+    'oooosooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooooosss',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooosoooooo',
+    'rrorroorooorrorrssss',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'sooooooooooooooooooo',
+    'ooooooooooooosoooooo',
+    'ooooosooosooooosoooo',
+    'rrooooorroorrrrsosss',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooosooooooo',
+    'sooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'orrssssooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'oooooooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooosoooooooooo',
+    'ssooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooos',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooosooooooooo',
+    'oooooooooooooos',
+    'ooooosooooooooo',
+    'ooosooosooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooso',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooso',
+    'oooooosoooooooo',
+    'oooooooosoooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooossooooooo',
+    'ooooooooooooooo',
+    'oooooorossoooso',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooosooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooosooooooooo',
+    'ooooooooooooooo',
+    'ooooooooosooooo',
+    'soooosooooooooo',
+    'osooooosoooooso',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'sooooooooosoooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooosoooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'osooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooos',
+    'ooooooosooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ossooooooosoooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oosoooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooosoooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooos',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooosoooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'oooooooosoooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooosooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooosooooo',
+    'ososooooooooooo',
+    'sosoooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooosooooooooooo',
+    'ooooooooooooooo',
+    'oooooooooooooso',
+    'oooooooooorssos',
+    'rrrrrrrsossoooo',
+    'osooooooooooooo',
+    'soooooooooooooo',
+    'osooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+    'ooooooooooosooo',
+    'ooooooooooooooo',
+    'ooooooooooooooo',
+  ];
+}
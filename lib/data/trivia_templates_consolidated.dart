@@ -3,6 +3,9 @@ import 'package:n3rd_game/services/trivia_generator_service.dart';
 import 'package:n3rd_game/exceptions/app_exceptions.dart';
 import 'package:n3rd_game/config/game_constants.dart';
 import 'package:n3rd_game/services/logger_service.dart';
+import 'package:n3rd_game/data/trivia_template_stats.g.dart';
+import 'package:n3rd_game/services/trivia/precomputed_template_stats.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
 
 /// Consolidated trivia templates from all batch files
 /// This file is auto-generated - do not edit manually
@@ -13,6 +16,9 @@ import 'package:n3rd_game/services/logger_service.dart';
 /// - Initialization is idempotent (safe to call multiple times - will return early if already initialized)
 /// - Templates can be added to `TriviaGeneratorService` via `addTemplates()` method
 /// - This complements the base templates in `TriviaGeneratorService._initializeTemplates()`
+/// - Validation, combination counts and tiered distractors are precomputed by the
+///   generator (`TriviaTemplateStats`); release builds skip the startup checks
+///   while the loaded templates still match those stats
 ///
 /// **Usage:**
 /// - Call `initialize()` in `main.dart` before the app runs
@@ -21,7 +27,9 @@ import 'package:n3rd_game/services/logger_service.dart';
 class EditionTriviaTemplates {
   static final Map<String, List<TriviaTemplate>> _templatesByTheme = {};
   static Map<String, List<String>> _editionThemeMapping = {};
+  static final Map<String, List<TriviaTemplate>> _templatesByEdition = {};
   static bool _isInitialized = false;
+  static bool _isPrechecked = false;
   static String? _lastValidationError;
   static Duration? _lastInitializationDuration; // For performance tracking
   static int _lastInitializationTemplateCount = 0; // For performance tracking
@@ -30,6 +38,12 @@ class EditionTriviaTemplates {
   /// Check if templates are initialized and ready
   static bool get isInitialized => _isInitialized;
 
+  /// Whether the loaded templates are the ones the generator validated
+  ///
+  /// True when every theme's content hash matches [TriviaTemplateStats].
+  /// Prechecked templates can skip validation and enhancement at runtime.
+  static bool get isPrechecked => _isInitialized && _isPrechecked;
+
   /// Get last validation error (if any)
   static String? get lastValidationError => _lastValidationError;
 
@@ -75,7 +89,12 @@ class EditionTriviaTemplates {
         }
 
         _loadAllTemplates();
-        _validateTemplates();
+        _isPrechecked = _applyPrecomputedStats();
+        // The generator already ran these checks on exactly these templates,
+        // so release builds skip the startup pass
+        if (!kReleaseMode || !_isPrechecked) {
+          _validateTemplates();
+        }
         _mapEditionsToThemes();
         _isInitialized = true;
         _lastValidationError = null;
@@ -136,6 +155,7 @@ class EditionTriviaTemplates {
           // Clear any partial state before retry
           _templatesByTheme.clear();
           _editionThemeMapping.clear();
+          _templatesByEdition.clear();
 
           // Exponential backoff: 100ms, 200ms, 400ms, etc.
           await Future.delayed(
@@ -559,7 +579,7 @@ class EditionTriviaTemplates {
           'Wole Soyinka',
           'Naguib Mahfouz',
           'Nadine Gordimer',
-          'J.M. Coetzee', // Intentional overlap: Nobel laureate reused as distractor for cross-theme challenge
+          'J.M. Coetzee',
           'Wangari Maathai',
           'Albert Luthuli',
           'Anwar Sadat',
@@ -7114,7 +7134,11 @@ class EditionTriviaTemplates {
     _addTemplates('kids_colors', [
       TriviaTemplate(
         categoryPattern: 'These are primary colors',
-        correctPool: ['Red', 'Blue', 'Yellow'],
+        correctPool: [
+          'Red',
+          'Blue',
+          'Yellow',
+        ],
         distractorPool: [
           'Green',
           'Orange',
@@ -7539,7 +7563,11 @@ class EditionTriviaTemplates {
     _addTemplates('kids_geology_advanced', [
       TriviaTemplate(
         categoryPattern: 'These are types of rocks in geology',
-        correctPool: ['Igneous', 'Sedimentary', 'Metamorphic'],
+        correctPool: [
+          'Igneous',
+          'Sedimentary',
+          'Metamorphic',
+        ],
         distractorPool: [
           'Mineral',
           'Crystal',
@@ -7566,7 +7594,11 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern: 'These are types of rocks in geology',
-        correctPool: ['Igneous', 'Sedimentary', 'Metamorphic'],
+        correctPool: [
+          'Igneous',
+          'Sedimentary',
+          'Metamorphic',
+        ],
         distractorPool: [
           'Mineral',
           'Crystal',
@@ -7747,7 +7779,13 @@ class EditionTriviaTemplates {
     _addTemplates('kids_math', [
       TriviaTemplate(
         categoryPattern: 'These are types of angles in geometry',
-        correctPool: ['Acute', 'Right', 'Obtuse', 'Straight', 'Reflex'],
+        correctPool: [
+          'Acute',
+          'Right',
+          'Obtuse',
+          'Straight',
+          'Reflex',
+        ],
         distractorPool: [
           'Circle',
           'Square',
@@ -7942,7 +7980,12 @@ class EditionTriviaTemplates {
     _addTemplates('kids_science', [
       TriviaTemplate(
         categoryPattern: 'These are states of matter',
-        correctPool: ['Solid', 'Liquid', 'Gas', 'Plasma'],
+        correctPool: [
+          'Solid',
+          'Liquid',
+          'Gas',
+          'Plasma',
+        ],
         distractorPool: [
           'Energy',
           'Light',
@@ -8135,7 +8178,11 @@ class EditionTriviaTemplates {
     _addTemplates('kids_us_government', [
       TriviaTemplate(
         categoryPattern: 'These are branches of the United States government',
-        correctPool: ['Executive', 'Legislative', 'Judicial'],
+        correctPool: [
+          'Executive',
+          'Legislative',
+          'Judicial',
+        ],
         distractorPool: [
           'President',
           'Vice President',
@@ -8162,7 +8209,11 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern: 'These are branches of the United States government',
-        correctPool: ['Executive', 'Legislative', 'Judicial'],
+        correctPool: [
+          'Executive',
+          'Legislative',
+          'Judicial',
+        ],
         distractorPool: [
           'President',
           'Vice President',
@@ -8473,7 +8524,7 @@ class EditionTriviaTemplates {
           'Kenzaburō Ōe',
           'Gao Xingjian',
           'Orhan Pamuk',
-          'J.M. Coetzee', // Intentional overlap: Nobel laureate reused across templates for authenticity
+          'J.M. Coetzee',
           'Doris Lessing',
           'Harold Pinter',
           'Herta Müller',
@@ -10800,7 +10851,12 @@ class EditionTriviaTemplates {
     _addTemplates('middle_school_geometry', [
       TriviaTemplate(
         categoryPattern: 'These are types of triangles by angles',
-        correctPool: ['Acute', 'Right', 'Obtuse', 'Equiangular'],
+        correctPool: [
+          'Acute',
+          'Right',
+          'Obtuse',
+          'Equiangular',
+        ],
         distractorPool: [
           'Equilateral',
           'Isosceles',
@@ -16311,10 +16367,6 @@ class EditionTriviaTemplates {
       ),
     ]);
 
-    // ============================================
-    // NEW PREMIUM THEMES (40-50+ themes)
-    // ============================================
-
     // PSYCHOLOGY_MENTAL_HEALTH (10 templates)
     _addTemplates('psychology_mental_health', [
       TriviaTemplate(
@@ -16417,7 +16469,7 @@ class EditionTriviaTemplates {
           'Framing Effect',
           'Loss Aversion',
           'Overconfidence Bias',
-          'Gambler\'s Fallacy',
+          "Gambler's Fallacy",
           'Fundamental Attribution Error',
           'Self-Serving Bias',
           'Dunning-Kruger Effect',
@@ -16583,7 +16635,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This type of memory involves the ability to recall specific events and experiences from one\'s past',
+            "This type of memory involves the ability to recall specific events and experiences from one's past",
         correctPool: [
           'Episodic Memory',
           'Autobiographical Memory',
@@ -16617,8 +16669,8 @@ class EditionTriviaTemplates {
           'Transient State',
           'Dissociative State',
           'Post-Traumatic Response',
-          'Korsakoff\'s Syndrome',
-          'Alzheimer\'s Disease',
+          "Korsakoff's Syndrome",
+          "Alzheimer's Disease",
           'Dementia',
           'Mild Cognitive Impairment',
           'Consolidation Process',
@@ -16773,7 +16825,7 @@ class EditionTriviaTemplates {
           'Ventromedial Prefrontal Cortex',
           'Premotor Cortex',
           'Supplementary Motor Area',
-          'Broca\'s Area',
+          "Broca's Area",
           'Primary Motor Cortex',
           'Prefrontal Association Cortex',
           'Frontal Eye Fields',
@@ -16793,7 +16845,7 @@ class EditionTriviaTemplates {
           'Amygdala',
           'Basal Ganglia',
           'Corpus Callosum',
-          'Wernicke\'s Area',
+          "Wernicke's Area",
           'Primary Somatosensory Cortex',
           'Primary Visual Cortex',
           'Primary Auditory Cortex',
@@ -16897,8 +16949,8 @@ class EditionTriviaTemplates {
         categoryPattern:
             'This neurological condition results from damage to brain regions responsible for language production',
         correctPool: [
-          'Broca\'s Aphasia',
-          'Wernicke\'s Aphasia',
+          "Broca's Aphasia",
+          "Wernicke's Aphasia",
           'Global Aphasia',
           'Conduction Aphasia',
           'Anomic Aphasia',
@@ -16929,8 +16981,8 @@ class EditionTriviaTemplates {
           'Auditory Agnosia',
           'Tactile Agnosia',
           'Hemineglect',
-          'Balint\'s Syndrome',
-          'Gerstmann\'s Syndrome',
+          "Balint's Syndrome",
+          "Gerstmann's Syndrome",
           'Locked-In Syndrome',
           'Minimally Conscious State',
         ],
@@ -17927,9 +17979,9 @@ class EditionTriviaTemplates {
           'Bottlenose Dolphin',
           'Spinner Dolphin',
           'Common Dolphin',
-          'Risso\'s Dolphin',
+          "Risso's Dolphin",
           'Dusky Dolphin',
-          'Hector\'s Dolphin',
+          "Hector's Dolphin",
         ],
         distractorPool: [
           'Seal',
@@ -17951,7 +18003,7 @@ class EditionTriviaTemplates {
           'Green Turtle',
           'Loggerhead Turtle',
           'Hawksbill Turtle',
-          'Kemp\'s Ridley Turtle',
+          "Kemp's Ridley Turtle",
         ],
         theme: 'oceanography_marine_science',
       ),
@@ -18181,7 +18233,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This biotechnology technique allows scientists to edit specific genes in an organism\'s DNA',
+            "This biotechnology technique allows scientists to edit specific genes in an organism's DNA",
         correctPool: [
           'CRISPR-Cas9',
           'Gene Editing',
@@ -18291,7 +18343,7 @@ class EditionTriviaTemplates {
           'Cystic Fibrosis',
           'Sickle Cell Anemia',
           'Hemophilia',
-          'Huntington\'s Disease',
+          "Huntington's Disease",
           'Muscular Dystrophy',
           'Tay-Sachs Disease',
           'Phenylketonuria',
@@ -18966,7 +19018,7 @@ class EditionTriviaTemplates {
           'Computer Fraud and Abuse Act',
           'Health Insurance Portability Act',
           'Family Educational Rights Act',
-          'Children\'s Online Privacy Protection Act',
+          "Children's Online Privacy Protection Act",
           'Fair Credit Reporting Act',
           'Gramm-Leach-Bliley Act',
           'Sarbanes-Oxley Act',
@@ -19924,14 +19976,14 @@ class EditionTriviaTemplates {
           'Measurement Problem',
           'Quantum Measurement Theory',
           'Complementarity Principle',
-          'Bohr\'s Principle',
+          "Bohr's Principle",
           'Quantum Non-Locality',
-          'Bell\'s Theorem',
+          "Bell's Theorem",
           'EPR Paradox',
         ],
         distractorPool: [
           'Classical Determinism',
-          'Laplace\'s Demon',
+          "Laplace's Demon",
           'Causality',
           'Deterministic Evolution',
           'Classical Trajectory',
@@ -20019,7 +20071,7 @@ class EditionTriviaTemplates {
         ],
         distractorPool: [
           'Classical Electrodynamics',
-          'Maxwell\'s Equations',
+          "Maxwell's Equations",
           'Electromagnetic Wave',
           'Electric Field',
           'Magnetic Field',
@@ -20117,7 +20169,7 @@ class EditionTriviaTemplates {
           'Rotational Motion',
           'Circular Motion',
           'Orbital Motion',
-          'Kepler\'s Laws',
+          "Kepler's Laws",
           'Planetary Motion',
           'Celestial Mechanics',
           'Gravitational Orbit',
@@ -20253,7 +20305,7 @@ class EditionTriviaTemplates {
           'Deterministic Motion',
           'Classical Mechanics',
           'Newtonian Mechanics',
-          'Coulomb\'s Law',
+          "Coulomb's Law",
           'Electrostatic Force',
           'Centripetal Force',
           'Classical Energy',
@@ -20931,7 +20983,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This renewable energy source uses heat from the Earth\'s interior to generate power',
+            "This renewable energy source uses heat from the Earth's interior to generate power",
         correctPool: [
           'Geothermal Energy',
           'Geothermal Power',
@@ -22479,7 +22531,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This immune response occurs when the immune system mistakenly attacks the body\'s own tissues',
+            "This immune response occurs when the immune system mistakenly attacks the body's own tissues",
         correctPool: [
           'Autoimmunity',
           'Autoimmune Disease',
@@ -23945,7 +23997,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This climate model simulates Earth\'s climate system using mathematical equations',
+            "This climate model simulates Earth's climate system using mathematical equations",
         correctPool: [
           'Climate Model',
           'Global Climate Model',
@@ -24076,7 +24128,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This climate metric measures the total impact of greenhouse gases on Earth\'s energy balance',
+            "This climate metric measures the total impact of greenhouse gases on Earth's energy balance",
         correctPool: [
           'Radiative Forcing',
           'Climate Forcing',
@@ -24477,7 +24529,7 @@ class EditionTriviaTemplates {
         categoryPattern:
             'This aerodynamic principle explains how wings generate lift',
         correctPool: [
-          'Bernoulli\'s Principle',
+          "Bernoulli's Principle",
           'Bernoulli Effect',
           'Aerodynamic Lift',
           'Lift Generation',
@@ -24494,7 +24546,7 @@ class EditionTriviaTemplates {
           'Turbulent Flow',
         ],
         distractorPool: [
-          'Newton\'s Laws',
+          "Newton's Laws",
           'Conservation of Momentum',
           'Conservation of Energy',
           'Conservation of Mass',
@@ -24875,7 +24927,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This renewable energy source uses heat from Earth\'s interior',
+            "This renewable energy source uses heat from Earth's interior",
         correctPool: [
           'Geothermal Energy',
           'Geothermal Power',
@@ -25216,10 +25268,10 @@ class EditionTriviaTemplates {
           'Impact Strength',
           'Elasticity',
           'Elastic Modulus',
-          'Young\'s Modulus',
+          "Young's Modulus",
           'Shear Modulus',
           'Bulk Modulus',
-          'Poisson\'s Ratio',
+          "Poisson's Ratio",
           'Stiffness',
           'Rigidity',
           'Flexibility',
@@ -25282,12 +25334,12 @@ class EditionTriviaTemplates {
           'Elastic Deformation',
           'Elastic Limit',
           'Elastic Modulus',
-          'Young\'s Modulus',
+          "Young's Modulus",
           'Elastic Constant',
           'Elastic Recovery',
           'Elastic Strain',
           'Elastic Stress',
-          'Hooke\'s Law',
+          "Hooke's Law",
           'Linear Elasticity',
           'Non-Linear Elasticity',
           'Elastic Range',
@@ -26960,7 +27012,7 @@ class EditionTriviaTemplates {
         categoryPattern:
             'This quantum algorithm provides exponential speedup for factoring large numbers',
         correctPool: [
-          'Shor\'s Algorithm',
+          "Shor's Algorithm",
           'Quantum Factoring',
           'Integer Factorization',
           'Prime Factorization',
@@ -26977,7 +27029,7 @@ class EditionTriviaTemplates {
           'Quantum Supremacy',
         ],
         distractorPool: [
-          'Grover\'s Algorithm',
+          "Grover's Algorithm",
           'Quantum Search',
           'Database Search',
           'Unstructured Search',
@@ -27004,7 +27056,7 @@ class EditionTriviaTemplates {
         categoryPattern:
             'This quantum algorithm searches unsorted databases quadratically faster than classical',
         correctPool: [
-          'Grover\'s Algorithm',
+          "Grover's Algorithm",
           'Quantum Search',
           'Database Search',
           'Unstructured Search',
@@ -27021,7 +27073,7 @@ class EditionTriviaTemplates {
           'Grover Iteration',
         ],
         distractorPool: [
-          'Shor\'s Algorithm',
+          "Shor's Algorithm",
           'Quantum Factoring',
           'Integer Factorization',
           'Prime Factorization',
@@ -27281,7 +27333,7 @@ class EditionTriviaTemplates {
           'Quantum Subgroup Algorithm',
           'Period Finding',
           'Discrete Logarithm',
-          'Simon\'s Problem',
+          "Simon's Problem",
           'Deutsch-Jozsa Problem',
         ],
         distractorPool: [
@@ -28773,7 +28825,7 @@ class EditionTriviaTemplates {
       ),
       TriviaTemplate(
         categoryPattern:
-            'This mysterious substance makes up most of the universe\'s mass',
+            "This mysterious substance makes up most of the universe's mass",
         correctPool: [
           'Dark Matter',
           'Cold Dark Matter',
@@ -29450,13 +29502,13 @@ class EditionTriviaTemplates {
           'Measurement Problem',
           'Quantum Measurement Theory',
           'Complementarity Principle',
-          'Bohr\'s Principle',
+          "Bohr's Principle",
           'Quantum Non-Locality',
-          'Bell\'s Theorem',
+          "Bell's Theorem",
         ],
         distractorPool: [
           'Classical Determinism',
-          'Laplace\'s Demon',
+          "Laplace's Demon",
           'Causality',
           'Deterministic Evolution',
           'Classical Trajectory',
@@ -29556,9 +29608,9 @@ class EditionTriviaTemplates {
           'Pauli Exclusion Principle',
           'Superposition Principle',
           'Least Action Principle',
-          'Hamilton\'s Principle',
+          "Hamilton's Principle",
           'Variational Principle',
-          'D\'Alembert\'s Principle',
+          "D'Alembert's Principle",
           'Virtual Work Principle',
           'Conservation Principle',
           'Symmetry Principle',
@@ -29710,8 +29762,8 @@ class EditionTriviaTemplates {
           'Exon Joining',
           'Spliceosome',
           'Splice Site',
-          '5\' Splice Site',
-          '3\' Splice Site',
+          "5' Splice Site",
+          "3' Splice Site",
           'Branch Point',
           'Alternative Splicing',
           'Constitutive Splicing',
@@ -29723,7 +29775,7 @@ class EditionTriviaTemplates {
           'RNA Editing',
           'RNA Modification',
           'RNA Processing',
-          '5\' Capping',
+          "5' Capping",
           'Polyadenylation',
           'RNA Cleavage',
           'RNA Degradation',
@@ -29772,8 +29824,8 @@ class EditionTriviaTemplates {
           'Intron',
           'Untranslated Region',
           'UTR',
-          '5\' UTR',
-          '3\' UTR',
+          "5' UTR",
+          "3' UTR",
           'Start Codon',
           'Stop Codon',
           'Genetic Code',
@@ -29988,8 +30040,8 @@ class EditionTriviaTemplates {
           'Non-Coding Sequence',
           'Untranslated Region',
           'UTR',
-          '5\' UTR',
-          '3\' UTR',
+          "5' UTR",
+          "3' UTR",
           'Regulatory Sequence',
           'Promoter',
           'Enhancer',
@@ -31571,7 +31623,7 @@ class EditionTriviaTemplates {
           'Reference Node',
           'Ground Node',
           'Node Equation',
-          'Kirchhoff\'s Current Law',
+          "Kirchhoff's Current Law",
           'KCL',
           'Current Conservation',
           'Node Voltage',
@@ -31586,7 +31638,7 @@ class EditionTriviaTemplates {
           'Loop Analysis',
           'Current Mesh',
           'Mesh Equation',
-          'Kirchhoff\'s Voltage Law',
+          "Kirchhoff's Voltage Law",
           'KVL',
           'Voltage Conservation',
           'Mesh Current',
@@ -31657,7 +31709,7 @@ class EditionTriviaTemplates {
           'Loop Analysis',
           'Current Mesh',
           'Mesh Equation',
-          'Kirchhoff\'s Voltage Law',
+          "Kirchhoff's Voltage Law",
           'KVL',
           'Voltage Conservation',
           'Mesh Current',
@@ -31676,7 +31728,7 @@ class EditionTriviaTemplates {
           'Reference Node',
           'Ground Node',
           'Node Equation',
-          'Kirchhoff\'s Current Law',
+          "Kirchhoff's Current Law",
           'KCL',
           'Current Conservation',
           'Node Voltage',
@@ -31710,7 +31762,7 @@ class EditionTriviaTemplates {
           'Power Dissipation',
           'Energy Dissipation',
           'Heat Generation',
-          'Ohm\'s Law',
+          "Ohm's Law",
         ],
         distractorPool: [
           'Capacitor',
@@ -31740,8 +31792,8 @@ class EditionTriviaTemplates {
         categoryPattern:
             'This circuit analysis technique simplifies complex circuits',
         correctPool: [
-          'Thevenin\'s Theorem',
-          'Norton\'s Theorem',
+          "Thevenin's Theorem",
+          "Norton's Theorem",
           'Equivalent Circuit',
           'Thevenin Equivalent',
           'Norton Equivalent',
@@ -31833,7 +31885,7 @@ class EditionTriviaTemplates {
             'This mechanical property measures resistance to deformation under load',
         correctPool: [
           'Elastic Modulus',
-          'Young\'s Modulus',
+          "Young's Modulus",
           'Modulus of Elasticity',
           'Tensile Modulus',
           'Compressive Modulus',
@@ -32272,12 +32324,12 @@ class EditionTriviaTemplates {
         categoryPattern: 'This statistical test compares means of two groups',
         correctPool: [
           'T-Test',
-          'Student\'s T-Test',
+          "Student's T-Test",
           'Independent T-Test',
           'Paired T-Test',
           'One-Sample T-Test',
           'Two-Sample T-Test',
-          'Welch\'s T-Test',
+          "Welch's T-Test",
           'T-Statistic',
           'T-Distribution',
           'Degrees of Freedom',
@@ -32350,7 +32402,7 @@ class EditionTriviaTemplates {
           'Pearson Correlation',
           'Point-Biserial Correlation',
           'Phi Coefficient',
-          'Cramér\'s V',
+          "Cramér's V",
           'Contingency Coefficient',
         ],
         theme: 'statistical_methods_data_analysis',
@@ -32673,7 +32725,7 @@ class EditionTriviaTemplates {
           'KS Test',
           'Anderson-Darling Test',
           'AD Test',
-          'D\'Agostino Test',
+          "D'Agostino Test",
           'Jarque-Bera Test',
           'JB Test',
           'Lilliefors Test',
@@ -32983,7 +33035,7 @@ class EditionTriviaTemplates {
           'Shannon Capacity',
           'Information Capacity',
           'Channel Coding Theorem',
-          'Shannon\'s Theorem',
+          "Shannon's Theorem",
           'Noisy Channel Coding',
           'Error-Free Transmission',
           'Reliable Communication',
@@ -33602,364 +33654,62 @@ class EditionTriviaTemplates {
     _templatesByTheme.putIfAbsent(theme, () => []).addAll(templates);
   }
 
-  static void _mapEditionsToThemes() {
-    // Map edition IDs to their corresponding themes
-    _editionThemeMapping = {
-      // Geography editions
-      'geography': ['geography'],
-      'usa_geography': ['geography'],
-      'world_capitals': ['geography'],
-      'mountains_rivers': ['geography'],
-      'islands': ['geography'],
-      'national_parks': ['geography'],
-      'cities': ['geography'],
-      'oceans': ['geography'],
-
-      // History editions
-      'history': ['history'],
-
-      // Science editions
-      'biology': ['science'],
-      'chemistry': ['science'],
-      'physics': ['science'],
-      'geology': ['science'],
-      'environmental_science': ['science'],
-      'marine_biology': ['science'],
-      'microbiology': ['science'],
-      'genetics': ['science'],
-      'neuroscience': ['science'],
-      'astronomy': ['astronomy'],
-      'meteorology': ['weather'],
-      'oceanography': ['science'],
-      'botany': ['science'],
-      'zoology': ['science'],
-      'paleontology': ['science'],
-
-      // Medical editions
-      'nursing': ['medicine'],
-      'medicine': ['medicine'],
-      'anatomy': ['medicine'],
-      'surgery': ['medicine'],
-      'emergency_medicine': ['medicine'],
-      'mental_health': ['medicine'],
-      'veterinary': ['medicine'],
-      'public_health': ['medicine'],
-      'pharmacy': ['medicine'],
-      'dentistry': ['medicine'],
-
-      // Cultural editions
-      'black': ['black_culture'],
-      'latino': ['latino_culture'],
-      'spanish': ['latino_culture'],
-      'asian': ['asian_american_culture'],
-      'indigenous': ['indigenous_culture'],
-      'caribbean': ['caribbean_culture'],
-      'middle_eastern': ['middle_eastern_culture'],
-      'african': ['african_culture'],
-
-      // Professional editions
-      'business': ['business'],
-      'finance': ['business', 'economics'],
-      'law': ['business'],
-      'engineering': ['business'],
-      'computer_science': ['technology'],
-      'marketing': ['business'],
-      'real_estate': ['business'],
-      'agriculture': ['agriculture'],
-      'aviation': ['aviation'],
-      'military': ['military'],
-
-      // Arts & Entertainment
-      'music': ['arts'],
-      'movies': ['arts'],
-      'tv': ['arts'],
-      'art': ['arts'],
-      'literature': ['literature'],
-      'theater': ['arts'],
-      'dance': ['arts'],
-      'photography': ['arts'],
-      'fashion': ['arts'],
-      'architecture': ['arts'],
-      'video_games': ['arts'],
-      'anime_manga': ['arts'],
-      'comics': ['arts'],
-      'classical_music': ['arts'],
-      'hip_hop': ['arts'],
-
-      // Sports
-      'sports_general': ['sports'],
-      'football': ['sports'],
-      'basketball': ['sports'],
-      'baseball': ['sports'],
-      'soccer': ['sports'],
-      'olympics': ['sports'],
-      'fitness': ['sports'],
-      'extreme_sports': ['sports'],
-
-      // Food & Lifestyle
-      'food': ['food'],
-      'wine': ['food'],
-      'beer': ['food'],
-      'coffee': ['food'],
-      'cooking': ['food'],
-      'baking': ['food'],
+  /// Attach precomputed tiers to each theme whose content still matches
+  /// [TriviaTemplateStats.themeContentHashes]
+  ///
+  /// Themes edited since the stats were generated keep their plain pools.
+  /// Returns whether every theme matched, i.e. the generator checked
+  /// exactly these templates.
+  static bool _applyPrecomputedStats() {
+    final hashes = TriviaTemplateStats.themeContentHashes;
+    bool allMatch = hashes.length == _templatesByTheme.length;
+    for (final entry in _templatesByTheme.entries) {
+      final templates = entry.value;
+      final tiers = TriviaTemplateStats.distractorTiers[entry.key];
+      if (tiers == null ||
+          tiers.length != templates.length ||
+          hashes[entry.key] != PrecomputedTemplateStats.contentHash(templates)) {
+        allMatch = false;
+        continue;
+      }
+      for (int i = 0; i < templates.length; i++) {
+        templates[i] =
+            PrecomputedTemplateStats.withTiers(templates[i], tiers[i]);
+      }
+    }
+    return allMatch;
+  }
 
-      // Specialty
-      'religion': ['religion'],
-      'mythology': ['religion'],
-      'philosophy': ['philosophy'],
-      'technology': ['technology'],
-      'nature_wildlife': ['science'],
-      'space_exploration': ['astronomy'],
+  static void _mapEditionsToThemes() {
+    // Map edition IDs to their corresponding themes. The mapping lives in
+    // the generator, which checks every theme exists before writing it.
+    _editionThemeMapping = Map.of(TriviaTemplateStats.editionThemes);
 
-      // Kids editions
-      'little_n3rd': [
-        'kids_animals',
-        'kids_colors',
-        'kids_shapes',
-        'kids_time',
-        'kids_food',
-        'kids_body',
-        'kids_weather',
-        'kids_sky',
-        'kids_house',
-        'kids_numbers',
-      ],
-      'junior_n3rd': [
-        'kids_space',
-        'kids_dinosaurs',
-        'kids_plants',
-        'kids_geography',
-        'kids_science',
-        'kids_weather_advanced',
-        'kids_math',
-        'kids_earth_science',
-        'kids_geology',
-        'kids_machines',
-      ],
-      'elementary_n3rd': [
-        'kids_civics',
-        'kids_us_government',
-        'kids_geology_advanced',
-        'kids_ecosystems',
-        'kids_water_cycle',
-        'kids_energy',
-        'kids_biology',
-        'kids_ancient_history',
-        'kids_grammar',
-        'kids_moon_phases',
-      ],
-      'middle_school_n3rd': [
-        'middle_school_chemistry',
-        'middle_school_physics',
-        'middle_school_literature',
-        'middle_school_geometry',
-        'middle_school_ecology',
-        'middle_school_civics',
-        'middle_school_cell_division',
-        'middle_school_plate_tectonics',
-        'middle_school_art_history',
-        'middle_school_economics',
-      ],
-      'high_school_n3rd': [
-        'high_school_literature',
-        'high_school_american_literature',
-        'high_school_physics',
-        'high_school_chemistry',
-        'high_school_history',
-        'high_school_calculus',
-        'high_school_biology',
-        'high_school_economics',
-        'high_school_rhetoric',
-        'high_school_government',
-      ],
-      'college_prep_n3rd': [
-        'test_prep_vocabulary',
-        'test_prep_logic',
-        'test_prep_algebra',
-        'test_prep_literature',
-        'test_prep_chemistry',
-        'test_prep_scientific_method',
-        'test_prep_geometry',
-        'test_prep_writing',
-        'test_prep_statistics',
-        'test_prep_world_history',
-      ],
+    // Flatten each edition's templates once so lookups don't allocate
+    _templatesByEdition.clear();
+    for (final entry in _editionThemeMapping.entries) {
+      _templatesByEdition[entry.key] = List<TriviaTemplate>.unmodifiable(
+        entry.value.expand<TriviaTemplate>(
+          (theme) => _templatesByTheme[theme] ?? const [],
+        ),
+      );
+    }
 
-      // NEW PREMIUM EDITIONS (25-30+ editions)
-      'premium_psychology': [
-        'psychology_mental_health',
-        'neuroscience_brain_science',
-      ],
-      'premium_environmental': [
-        'environmental_science',
-        'oceanography_marine_science',
-      ],
-      'premium_genetics': ['genetics_biotechnology'],
-      'premium_cybersecurity': ['cybersecurity_digital_privacy'],
-      'premium_data_science': [
-        'data_science_analytics',
-        'artificial_intelligence_ml',
-      ],
-      'premium_quantum': ['quantum_physics'],
-      'premium_advanced_science': [
-        'quantum_physics',
-        'neuroscience_brain_science',
-        'genetics_biotechnology',
-      ],
-      'premium_tech_stack': [
-        'cybersecurity_digital_privacy',
-        'data_science_analytics',
-        'artificial_intelligence_ml',
-      ],
-      'premium_mental_wellness': ['psychology_mental_health'],
-      'premium_earth_sciences': [
-        'environmental_science',
-        'oceanography_marine_science',
-      ],
-      'premium_space': ['space_exploration_astronautics'],
-      'premium_energy': ['sustainable_energy_renewables'],
-      'premium_nanotech': ['nanotechnology_materials_science'],
-      'premium_advanced_tech': [
-        'nanotechnology_materials_science',
-        'quantum_physics',
-        'artificial_intelligence_ml',
-      ],
-      'premium_complete_science': [
-        'psychology_mental_health',
-        'neuroscience_brain_science',
-        'environmental_science',
-        'oceanography_marine_science',
-        'genetics_biotechnology',
-        'quantum_physics',
-        'space_exploration_astronautics',
-        'nanotechnology_materials_science',
-      ],
-      'premium_complete_tech': [
-        'cybersecurity_digital_privacy',
-        'data_science_analytics',
-        'artificial_intelligence_ml',
-        'nanotechnology_materials_science',
-      ],
-      'premium_sustainability': [
-        'environmental_science',
-        'sustainable_energy_renewables',
-        'oceanography_marine_science',
-      ],
-      'premium_health_sciences': [
-        'psychology_mental_health',
-        'neuroscience_brain_science',
-        'genetics_biotechnology',
-      ],
-      'premium_data_ai': [
-        'data_science_analytics',
-        'artificial_intelligence_ml',
-        'cybersecurity_digital_privacy',
-      ],
-      'premium_quantum_nano': [
-        'quantum_physics',
-        'nanotechnology_materials_science',
-      ],
-      'premium_space_earth': [
-        'space_exploration_astronautics',
-        'oceanography_marine_science',
-        'environmental_science',
-      ],
-      'premium_all_premium': [
-        'psychology_mental_health',
-        'neuroscience_brain_science',
-        'environmental_science',
-        'oceanography_marine_science',
-        'genetics_biotechnology',
-        'cybersecurity_digital_privacy',
-        'data_science_analytics',
-        'artificial_intelligence_ml',
-        'quantum_physics',
-        'space_exploration_astronautics',
-        'sustainable_energy_renewables',
-        'nanotechnology_materials_science',
-      ],
-      // NEW PREMIUM EDITIONS FOR ADVANCED THEMES (18 new themes + 6 combined)
-      'premium_biomedical': ['biomedical_engineering'],
-      'premium_neuroengineering': ['neuroengineering_brain_computer_interface'],
-      'premium_synthetic_biology': ['synthetic_biology_bioengineering'],
-      'premium_quantum_computing': ['quantum_computing_algorithms'],
-      'premium_advanced_math': ['advanced_mathematics_topology'],
-      'premium_computational_chemistry': ['computational_chemistry'],
-      'premium_particle_physics': ['particle_physics_high_energy'],
-      'premium_astrophysics': ['astrophysics_cosmology'],
-      'premium_theoretical_physics': ['advanced_physics_theoretical'],
-      'premium_molecular_biology': ['molecular_biology_genetics'],
-      'premium_systems_biology': ['systems_biology_networks'],
-      'premium_protein_engineering': ['protein_engineering_design'],
-      'premium_organic_chemistry': ['advanced_chemistry_organic'],
-      'premium_electrical_engineering': ['electrical_engineering_circuits'],
-      'premium_mechanical_engineering': ['mechanical_engineering_design'],
-      'premium_statistics': ['statistical_methods_data_analysis'],
-      'premium_information_theory': ['information_theory_compression'],
-      'premium_machine_learning': ['machine_learning_neural_networks'],
-      // Combined premium editions
-      'premium_advanced_engineering': [
-        'biomedical_engineering',
-        'electrical_engineering_circuits',
-        'mechanical_engineering_design',
-        'neuroengineering_brain_computer_interface',
-      ],
-      'premium_advanced_biology': [
-        'biomedical_engineering',
-        'molecular_biology_genetics',
-        'synthetic_biology_bioengineering',
-        'systems_biology_networks',
-        'protein_engineering_design',
-      ],
-      'premium_advanced_physics': [
-        'particle_physics_high_energy',
-        'astrophysics_cosmology',
-        'advanced_physics_theoretical',
-        'quantum_computing_algorithms',
-      ],
-      'premium_advanced_chemistry': [
-        'computational_chemistry',
-        'advanced_chemistry_organic',
-      ],
-      'premium_computational_sciences': [
-        'quantum_computing_algorithms',
-        'computational_chemistry',
-        'statistical_methods_data_analysis',
-        'information_theory_compression',
-        'machine_learning_neural_networks',
-      ],
-      'premium_complete_advanced': [
-        'biomedical_engineering',
-        'neuroengineering_brain_computer_interface',
-        'synthetic_biology_bioengineering',
-        'quantum_computing_algorithms',
-        'advanced_mathematics_topology',
-        'computational_chemistry',
-        'particle_physics_high_energy',
-        'astrophysics_cosmology',
-        'advanced_physics_theoretical',
-        'molecular_biology_genetics',
-        'systems_biology_networks',
-        'protein_engineering_design',
-        'advanced_chemistry_organic',
-        'electrical_engineering_circuits',
-        'mechanical_engineering_design',
-        'statistical_methods_data_analysis',
-        'information_theory_compression',
-        'machine_learning_neural_networks',
-      ],
-    };
+    if (kDebugMode && _isPrechecked) {
+      for (final entry in TriviaTemplateStats.editionTemplateCounts.entries) {
+        assert(
+          _templatesByEdition[entry.key]?.length == entry.value,
+          'Edition ${entry.key} has ${_templatesByEdition[entry.key]?.length} templates, expected ${entry.value}',
+        );
+      }
+    }
   }
 
   /// Get trivia templates for a specific edition
+  ///
+  /// Returns a shared, unmodifiable list built at initialization.
   static List<TriviaTemplate> getTemplatesForEdition(String editionId) {
-    final themes = _editionThemeMapping[editionId] ?? [];
-    final templates = <TriviaTemplate>[];
-    for (final theme in themes) {
-      templates.addAll(_templatesByTheme[theme] ?? []);
-    }
-    return templates;
+    return _templatesByEdition[editionId] ?? const [];
   }
 
   /// Get trivia templates for a specific theme
@@ -33971,4 +33721,22 @@ class EditionTriviaTemplates {
   static List<String> getAvailableThemes() {
     return _templatesByTheme.keys.toList();
   }
+
+  /// Precomputed sampling table for [getTemplatesForTheme]
+  ///
+  /// Draws a theme's templates weighted by possible combinations in O(1)
+  /// (see [TemplateSamplingTable.sample]); `TriviaGeneratorService.addTemplates`
+  /// takes these instead of building its own. Returns null when the loaded
+  /// templates don't match the generated statistics.
+  static TemplateSamplingTable? samplingTableForTheme(String theme) {
+    final thresholds = TriviaTemplateStats.themeSamplingThresholds[theme];
+    final aliases = TriviaTemplateStats.themeSamplingAliases[theme];
+    if (!_isPrechecked ||
+        thresholds == null ||
+        aliases == null ||
+        thresholds.length != getTemplatesForTheme(theme).length) {
+      return null;
+    }
+    return TemplateSamplingTable(thresholds, aliases);
+  }
 }
@@ -18,9 +18,22 @@ import 'package:flutter/services.dart';
 /// final animation = await service.getRandomAnimation('logo');
 /// ```
 ///
+/// Category lists come from the index written by `organize_animations.py`
+/// ([indexPath]) when it is bundled, otherwise from `AssetManifest.json`.
+/// Neither finds anything until `assets/animations/` and its category
+/// folders are listed under `assets:` in pubspec.yaml (`assets/` only
+/// covers files directly inside it); `organize_animations.py` reports the
+/// missing entries.
+///
 /// The service must be initialized before use. It's registered as a Provider
 /// in main.dart and can be accessed via `Provider.of<AnimationRandomizerService>`.
 class AnimationRandomizerService extends ChangeNotifier {
+  /// Asset path of the category index written by `organize_animations.py`
+  static const String indexPath = 'assets/animations/animation_index.json';
+
+  /// Category index, loaded once; null when it isn't bundled
+  Future<Map<String, List<String>>?>? _index;
+
   /// Cache of animations by category to avoid repeated manifest lookups
   final Map<String, List<String>> _cachedAnimations = {};
 
@@ -95,6 +108,13 @@ class AnimationRandomizerService extends ChangeNotifier {
       return _cachedAnimations[category]!;
     }
 
+    final index = await (_index ??= _loadIndex());
+    if (index != null) {
+      final animations = index[category] ?? [];
+      _cachedAnimations[category] = animations;
+      return animations;
+    }
+
     try {
       final manifestContent = await rootBundle.loadString('AssetManifest.json');
       final Map<String, dynamic> manifestMap =
@@ -127,6 +147,37 @@ class AnimationRandomizerService extends ChangeNotifier {
     }
   }
 
+  Future<Map<String, List<String>>?> _loadIndex() async {
+    try {
+      return parseIndex(await rootBundle.loadString(indexPath));
+    } catch (e) {
+      if (kDebugMode) {
+        debugPrint(
+          'AnimationRandomizerService: No animation index, using AssetManifest ($e)',
+        );
+      }
+      return null;
+    }
+  }
+
+  /// Use [content] as the category index (instead of loading [indexPath])
+  @visibleForTesting
+  void loadIndexFromJson(String content) {
+    _index = Future.value(parseIndex(content));
+  }
+
+  /// Parse index JSON into category -> asset paths
+  static Map<String, List<String>> parseIndex(String content) {
+    final json = jsonDecode(content) as Map<String, dynamic>;
+    final categories = json['categories'] as Map<String, dynamic>? ?? {};
+    return categories.map(
+      (category, paths) => MapEntry(
+        category,
+        (paths as List<dynamic>).cast<String>().toList(),
+      ),
+    );
+  }
+
   /// Get a random animation from a category with validation
   ///
   /// Selects and validates a random animation from the specified category.
@@ -231,6 +282,7 @@ class AnimationRandomizerService extends ChangeNotifier {
   void clearCache() {
     _cachedAnimations.clear();
     _validatedPaths.clear();
+    _index = null;
     notifyListeners();
   }
 
@@ -1,5 +1,6 @@
 import 'package:flutter/foundation.dart';
 import 'package:n3rd_game/services/trivia_generator_service.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
 import 'package:n3rd_game/data/trivia_templates_consolidated.dart'
     deferred as templates; // Deferred to reduce kernel size
 import 'package:n3rd_game/models/trivia_item.dart';
@@ -16,6 +17,12 @@ class EditionContentService extends ChangeNotifier {
   final Map<String, List<TriviaTemplate>> _editionTemplates = {};
   bool _initialized = false;
 
+  // Whether the edition templates were validated at build time
+  bool _templatesPrechecked = false;
+
+  // Precomputed sampling tables by theme, handed to the generator
+  final Map<String, TemplateSamplingTable> _samplingTables = {};
+
   void _initialize() {
     if (_initialized) return;
 
@@ -145,7 +152,15 @@ class EditionContentService extends ChangeNotifier {
     for (final editionId in editionIds) {
       _editionTemplates[editionId] =
           templates.EditionTriviaTemplates.getTemplatesForEdition(editionId);
+      for (final template in _editionTemplates[editionId]!) {
+        if (_samplingTables.containsKey(template.theme)) continue;
+        final table = templates.EditionTriviaTemplates.samplingTableForTheme(
+          template.theme,
+        );
+        if (table != null) _samplingTables[template.theme] = table;
+      }
     }
+    _templatesPrechecked = templates.EditionTriviaTemplates.isPrechecked;
   }
 
   /// Get trivia templates for a specific edition
@@ -185,7 +200,11 @@ class EditionContentService extends ChangeNotifier {
     final generator = existingGenerator ?? TriviaGeneratorService();
 
     // Add edition-specific templates to generator
-    generator.addTemplates(templates);
+    generator.addTemplates(
+      templates,
+      prechecked: _templatesPrechecked,
+      samplingTables: _samplingTables,
+    );
 
     try {
       return generator.generateBatch(
@@ -0,0 +1,79 @@
+import 'package:n3rd_game/models/difficulty_level.dart';
+import 'package:n3rd_game/services/trivia_generator_service.dart';
+
+/// Helpers for applying the generator's precomputed template statistics
+///
+/// `scripts/consolidate_trivia_templates.py` hashes every template list it
+/// checks and stores the hash with its results in `TriviaTemplateStats`.
+/// At startup [contentHash] is recomputed over the loaded templates; only
+/// when it matches are the precomputed tiers and totals used in place of
+/// the runtime enhancement and validation pass.
+class PrecomputedTemplateStats {
+  PrecomputedTemplateStats._();
+
+  /// FNV-1a (32-bit) over the templates' text as UTF-16 code units
+  ///
+  /// Must match `content_hash` in scripts/consolidate_trivia_templates.py.
+  static int contentHash(List<TriviaTemplate> templates) {
+    int hash = 0x811C9DC5;
+    void add(int unit) {
+      hash ^= unit;
+      // hash * 16777619 mod 2^32, split so it stays exact on the web
+      hash = (((hash << 24) & 0xFFFFFFFF) + hash * 403) & 0xFFFFFFFF;
+    }
+
+    void addString(String text) {
+      for (final unit in text.codeUnits) {
+        add(unit);
+      }
+      add(0);
+    }
+
+    void addList(List<String> items) {
+      items.forEach(addString);
+      add(1);
+    }
+
+    for (final template in templates) {
+      addString(template.categoryPattern);
+      addList(template.correctPool);
+      addList(template.distractorPool);
+      final pools = template.distractorPools;
+      if (pools != null) {
+        for (final tier in DistractorTier.values) {
+          addList(pools[tier] ?? const []);
+        }
+      }
+      add(2);
+    }
+    return hash;
+  }
+
+  /// Attach the generator's tiered distractor pools to [template]
+  ///
+  /// [codes] has one letter per distractor (o/r/s). Templates that already
+  /// have tiers, or whose pool no longer matches, are returned unchanged and
+  /// get enhanced at runtime instead.
+  static TriviaTemplate withTiers(TriviaTemplate template, String? codes) {
+    if (codes == null ||
+        template.distractorPools != null ||
+        codes.length != template.distractorPool.length) {
+      return template;
+    }
+
+    final pools = <DistractorTier, List<String>>{
+      DistractorTier.obvious: [],
+      DistractorTier.related: [],
+      DistractorTier.subtle: [],
+    };
+    for (int i = 0; i < codes.length; i++) {
+      final tier = switch (codes[i]) {
+        'o' => DistractorTier.obvious,
+        'r' => DistractorTier.related,
+        _ => DistractorTier.subtle,
+      };
+      pools[tier]!.add(template.distractorPool[i]);
+    }
+    return template.withDistractorPools(pools);
+  }
+}
@@ -0,0 +1,58 @@
+import 'dart:math';
+
+/// Alias table for drawing a list index with precomputed weights in O(1)
+///
+/// With `setWeightByCombinations` on, `TriviaGeneratorService` draws each
+/// theme's templates with one of these, weighted by `possibleCombinations`.
+/// Tables are written by
+/// `scripts/consolidate_trivia_templates.py` (see
+/// `TriviaTemplateStats.themeSamplingThresholds`) or built at runtime with
+/// [TemplateSamplingTable.fromWeights].
+class TemplateSamplingTable {
+  /// Denominator of [thresholds] (matches `TriviaTemplateStats.samplingScale`)
+  static const int scale = 1 << 30;
+
+  /// Chance, out of [scale], that a slot keeps its own index
+  final List<int> thresholds;
+
+  /// Index drawn instead when a slot doesn't keep its own
+  final List<int> aliases;
+
+  const TemplateSamplingTable(this.thresholds, this.aliases);
+
+  /// Build a table that draws index i with probability weights[i] / sum
+  ///
+  /// A list with no positive weight gives a uniform table.
+  factory TemplateSamplingTable.fromWeights(List<num> weights) {
+    final count = weights.length;
+    final total = weights.fold<double>(0, (sum, w) => sum + w);
+    final thresholds = List<int>.filled(count, scale);
+    final aliases = List<int>.generate(count, (i) => i);
+    if (total <= 0) return TemplateSamplingTable(thresholds, aliases);
+
+    final values = [for (final w in weights) w * count / total];
+    final small = <int>[];
+    final large = <int>[];
+    for (int i = 0; i < count; i++) {
+      (values[i] < 1 ? small : large).add(i);
+    }
+    while (small.isNotEmpty && large.isNotEmpty) {
+      final lo = small.removeLast();
+      final hi = large.removeLast();
+      thresholds[lo] = (values[lo] * scale).floor();
+      aliases[lo] = hi;
+      values[hi] -= 1 - values[lo];
+      (values[hi] < 1 ? small : large).add(hi);
+    }
+    return TemplateSamplingTable(thresholds, aliases);
+  }
+
+  /// Number of indexes the table draws from
+  int get length => thresholds.length;
+
+  /// Draw one index
+  int sample(Random random) {
+    final slot = random.nextInt(thresholds.length);
+    return random.nextInt(scale) < thresholds[slot] ? slot : aliases[slot];
+  }
+}
@@ -10,6 +10,9 @@ import 'package:n3rd_game/services/trivia_personalization_service.dart';
 import 'package:n3rd_game/services/trivia_enhancement_service.dart';
 import 'package:n3rd_game/services/content_validation_service.dart';
 import 'package:n3rd_game/services/analytics_service.dart';
+import 'package:n3rd_game/services/trivia/precomputed_template_stats.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
+import 'package:n3rd_game/data/trivia_template_stats.g.dart';
 
 class TriviaTemplate {
   final String categoryPattern;
@@ -31,6 +34,20 @@ class TriviaTemplate {
     this.difficulty = DifficultyLevel.medium,
   });
 
+  /// Copy of this template with tiered [distractorPools]
+  TriviaTemplate withDistractorPools(
+    Map<DistractorTier, List<String>> distractorPools,
+  ) {
+    return TriviaTemplate(
+      categoryPattern: categoryPattern,
+      correctPool: correctPool,
+      distractorPool: distractorPool,
+      theme: theme,
+      distractorPools: distractorPools,
+      difficulty: difficulty,
+    );
+  }
+
   /// Get distractor pool for a specific tier
   /// Falls back to legacy distractorPool if tiered pools not available
   List<String> getDistractorsForTier(DistractorTier tier) {
@@ -105,6 +122,17 @@ class TriviaGeneratorService extends ChangeNotifier {
   final List<String> _usedCategoryKeys = [];
   final List<TriviaTemplate> _allTemplates = [];
 
+  // Templates by normalized theme, in the order they were added
+  final Map<String, List<TriviaTemplate>> _templatesByTheme = {};
+
+  // Alias tables drawing a theme's templates weighted by possible combinations
+  // Built on first use unless addTemplates() was given a precomputed one
+  final Map<String, TemplateSamplingTable> _samplingTables = {};
+  TemplateSamplingTable? _allTemplatesTable;
+
+  // Off: non-personalized draws are uniform, as they always were
+  bool _weightByCombinations = false;
+
   // Optional personalization service (can be injected)
   TriviaPersonalizationService? _personalizationService;
 
@@ -119,6 +147,10 @@ class TriviaGeneratorService extends ChangeNotifier {
 
   int _totalPossibleCombinations = 0;
 
+  // Whether the built-in templates match the generator's precomputed stats
+  // (TriviaTemplateStats.baseContentHash), so their tiers and totals are reused
+  bool _baseStatsApplied = false;
+
   int get totalPossibleCombinations => _totalPossibleCombinations;
   int get categoriesGenerated => _usedCategoryKeys.length;
   int get categoriesRemaining =>
@@ -135,6 +167,16 @@ class TriviaGeneratorService extends ChangeNotifier {
     _analyticsService = service;
   }
 
+  /// Draw non-personalized templates weighted by possible combinations
+  ///
+  /// Off by default, which keeps every template in a theme equally likely.
+  /// When on, templates with bigger pools come up proportionally more
+  /// often (within some themes by more than 10x), using the precomputed
+  /// alias tables.
+  void setWeightByCombinations(bool enabled) {
+    _weightByCombinations = enabled;
+  }
+
   /// Set enhancement service (for testing/customization)
   void setTriviaEnhancementService(TriviaEnhancementService service) {
     _enhancementService = service;
@@ -152,7 +194,13 @@ class TriviaGeneratorService extends ChangeNotifier {
       );
     }
 
-    _enhanceTemplates(); // Enhance templates with tiered distractors
+    // Enhance templates with tiered distractors, unless the generator
+    // already worked them out for exactly these templates
+    _baseStatsApplied = _applyPrecomputedStats();
+    if (!_baseStatsApplied) {
+      _enhanceTemplates();
+    }
+    _indexTemplates(_allTemplates);
 
     // Validate templates still exist after enhancement
     if (_allTemplates.isEmpty) {
@@ -172,7 +220,48 @@ class TriviaGeneratorService extends ChangeNotifier {
     _allTemplates.addAll(enhanced);
   }
 
+  /// Attach the generator's tiers to the built-in templates
+  ///
+  /// Only when they still match [TriviaTemplateStats.baseContentHash];
+  /// returns whether they did.
+  bool _applyPrecomputedStats() {
+    final tiers = TriviaTemplateStats.baseDistractorTiers;
+    if (tiers.length != _allTemplates.length ||
+        PrecomputedTemplateStats.contentHash(_allTemplates) !=
+            TriviaTemplateStats.baseContentHash) {
+      return false;
+    }
+    for (int i = 0; i < _allTemplates.length; i++) {
+      _allTemplates[i] =
+          PrecomputedTemplateStats.withTiers(_allTemplates[i], tiers[i]);
+    }
+    return true;
+  }
+
+  static String _normalizeTheme(String theme) => theme.toLowerCase().trim();
+
+  /// Add [templates] to the theme index, dropping the sampling tables they change
+  void _indexTemplates(Iterable<TriviaTemplate> templates) {
+    for (final template in templates) {
+      final theme = _normalizeTheme(template.theme);
+      _templatesByTheme.putIfAbsent(theme, () => []).add(template);
+      _samplingTables.remove(theme);
+    }
+    _allTemplatesTable = null;
+  }
+
+  /// Templates for [theme] (all templates when null), without copying
+  List<TriviaTemplate> _templatesForTheme(String? theme) {
+    if (theme == null) return _allTemplates;
+    return _templatesByTheme[_normalizeTheme(theme)] ?? const [];
+  }
+
   void _calculateTotalCombinations() {
+    if (_baseStatsApplied) {
+      _totalPossibleCombinations =
+          TriviaTemplateStats.baseTotalPossibleCombinations;
+      return;
+    }
     _totalPossibleCombinations = 0;
     for (final template in _allTemplates) {
       _totalPossibleCombinations += template.possibleCombinations;
@@ -225,6 +314,15 @@ class TriviaGeneratorService extends ChangeNotifier {
       );
     }
 
+    // The generator ran the checks below on exactly these templates; release
+    // builds skip them when they passed there. Otherwise they run here and
+    // fail the same way they always have.
+    if (kReleaseMode &&
+        _baseStatsApplied &&
+        TriviaTemplateStats.baseTemplatesValid) {
+      return;
+    }
+
     // Validate each template using ContentValidationService
     final validationErrors = <String>[];
     for (final template in _allTemplates) {
@@ -259,15 +357,32 @@ class TriviaGeneratorService extends ChangeNotifier {
   }
 
   /// Add templates dynamically (for edition-specific content)
-  void addTemplates(List<TriviaTemplate> templates) {
+  ///
+  /// [prechecked] templates were validated, enhanced and checked for
+  /// duplicates at build time (see `EditionTriviaTemplates.isPrechecked`);
+  /// release builds skip those passes for them.
+  ///
+  /// [samplingTables] are precomputed tables by theme (see
+  /// `EditionTriviaTemplates.samplingTableForTheme`). One is used only when
+  /// its theme is new to the generator and the sizes match; otherwise the
+  /// table is built on first use.
+  void addTemplates(
+    List<TriviaTemplate> templates, {
+    bool prechecked = false,
+    Map<String, TemplateSamplingTable> samplingTables = const {},
+  }) {
+    final skipChecks = prechecked && kReleaseMode;
+
     // Validate templates before adding
     final validationErrors = <String>[];
-    for (final template in templates) {
-      final result = _validationService.validateTemplate(template);
-      if (!result.isValid) {
-        validationErrors.add(
-          'Template "${template.categoryPattern}": ${result.errors.join("; ")}',
-        );
+    if (!skipChecks) {
+      for (final template in templates) {
+        final result = _validationService.validateTemplate(template);
+        if (!result.isValid) {
+          validationErrors.add(
+            'Template "${template.categoryPattern}": ${result.errors.join("; ")}',
+          );
+        }
       }
     }
 
@@ -281,44 +396,60 @@ class TriviaGeneratorService extends ChangeNotifier {
     }
 
     // Enhance templates before adding (ensures tiered distractors)
+    // Templates that already carry tiers are returned as-is
     final enhanced = _enhancementService.enhanceTemplates(templates);
 
-    // Validate enhanced templates
-    for (final template in enhanced) {
-      final result = _validationService.validateTemplate(template);
-      if (!result.isValid && kDebugMode) {
-        debugPrint(
-          '⚠️ Enhanced template "${template.categoryPattern}" has errors: ${result.errors.join("; ")}',
-        );
+    if (!skipChecks) {
+      // Validate enhanced templates
+      for (final template in enhanced) {
+        final result = _validationService.validateTemplate(template);
+        if (!result.isValid && kDebugMode) {
+          debugPrint(
+            '⚠️ Enhanced template "${template.categoryPattern}" has errors: ${result.errors.join("; ")}',
+          );
+        }
       }
-    }
 
-    // Check for cross-template duplicates with existing templates
-    try {
-      final crossTemplateResult = _validationService
-          .checkCrossTemplateDuplicates([..._allTemplates, ...enhanced]);
-      if (crossTemplateResult.warnings.isNotEmpty && kDebugMode) {
-        debugPrint(
-          '⚠️ Cross-template warnings when adding new templates: ${crossTemplateResult.warnings.join("; ")}',
-        );
-      }
-      if (!crossTemplateResult.isValid && kDebugMode) {
-        debugPrint(
-          '⚠️ Cross-template errors when adding new templates: ${crossTemplateResult.errors.join("; ")}',
-        );
-        // Log errors but don't block addition (templates may still be usable)
-      }
-    } catch (e) {
-      // Handle validation errors gracefully
-      if (kDebugMode) {
-        debugPrint('⚠️ Error during cross-template validation: $e');
+      // Check for cross-template duplicates with existing templates
+      try {
+        final crossTemplateResult = _validationService
+            .checkCrossTemplateDuplicates([..._allTemplates, ...enhanced]);
+        if (crossTemplateResult.warnings.isNotEmpty && kDebugMode) {
+          debugPrint(
+            '⚠️ Cross-template warnings when adding new templates: ${crossTemplateResult.warnings.join("; ")}',
+          );
+        }
+        if (!crossTemplateResult.isValid && kDebugMode) {
+          debugPrint(
+            '⚠️ Cross-template errors when adding new templates: ${crossTemplateResult.errors.join("; ")}',
+          );
+          // Log errors but don't block addition (templates may still be usable)
+        }
+      } catch (e) {
+        // Handle validation errors gracefully
+        if (kDebugMode) {
+          debugPrint('⚠️ Error during cross-template validation: $e');
+        }
+        // Continue with template addition even if validation fails
       }
-      // Continue with template addition even if validation fails
     }
 
+    final newThemes = {
+      for (final template in enhanced) _normalizeTheme(template.theme),
+    }.where((theme) => !_templatesByTheme.containsKey(theme)).toSet();
     _allTemplates.addAll(enhanced);
+    _indexTemplates(enhanced);
+    samplingTables.forEach((theme, table) {
+      final normalized = _normalizeTheme(theme);
+      if (newThemes.contains(normalized) &&
+          table.length == _templatesByTheme[normalized]?.length) {
+        _samplingTables[normalized] = table;
+      }
+    });
+    for (final template in enhanced) {
+      _totalPossibleCombinations += template.possibleCombinations;
+    }
     notifyListeners();
-    _calculateTotalCombinations();
   }
 
   void _initializeTemplates() {
@@ -14686,13 +14817,7 @@ class TriviaGeneratorService extends ChangeNotifier {
 
     if (usePersonalization && _personalizationService != null) {
       // Use personalization to filter and weight templates
-      // Normalize theme for comparison (templates store themes in lowercase)
-      final normalizedTheme = theme?.toLowerCase().trim();
-      final allTemplates = normalizedTheme != null
-          ? _allTemplates
-              .where((t) => t.theme.toLowerCase().trim() == normalizedTheme)
-              .toList()
-          : _allTemplates;
+      final allTemplates = _templatesForTheme(theme);
 
       if (allTemplates.isEmpty) {
         throw GameException(
@@ -14711,14 +14836,8 @@ class TriviaGeneratorService extends ChangeNotifier {
             .length, // Get all, but sorted by preference (filters out recent)
       );
     } else {
-      // Filter by theme if specified
-      // Normalize theme for comparison (templates store themes in lowercase)
-      final normalizedTheme = theme?.toLowerCase().trim();
-      availableTemplates = normalizedTheme != null
-          ? _allTemplates
-              .where((t) => t.theme.toLowerCase().trim() == normalizedTheme)
-              .toList()
-          : _allTemplates;
+      // Filter by theme if specified (themes are indexed normalized)
+      availableTemplates = _templatesForTheme(theme);
     }
 
     // Track if we're using personalization (may change if fallback needed)
@@ -14733,13 +14852,8 @@ class TriviaGeneratorService extends ChangeNotifier {
           );
         }
         // Get all templates without personalization filter
-        // Normalize theme for comparison
         final normalizedTheme = theme?.toLowerCase().trim();
-        availableTemplates = normalizedTheme != null
-            ? _allTemplates
-                .where((t) => t.theme.toLowerCase().trim() == normalizedTheme)
-                .toList()
-            : _allTemplates;
+        availableTemplates = _templatesForTheme(theme);
 
         // Final fallback: if still empty and theme was specified, try without theme filter
         if (availableTemplates.isEmpty && normalizedTheme != null) {
@@ -15296,9 +15410,38 @@ class TriviaGeneratorService extends ChangeNotifier {
     return uniquePool.take(count).toList();
   }
 
+  /// Draw from [templates] weighted by possible combinations in O(1)
+  ///
+  /// Uses the alias table of the theme (or of all templates) when
+  /// [templates] is that indexed list; any other list is drawn uniformly.
+  TriviaTemplate _sampleTemplate(List<TriviaTemplate> templates) {
+    TemplateSamplingTable? table;
+    if (identical(templates, _allTemplates)) {
+      table = _allTemplatesTable ??= _buildSamplingTable(templates);
+    } else {
+      final theme = _normalizeTheme(templates.first.theme);
+      if (identical(templates, _templatesByTheme[theme])) {
+        table = _samplingTables[theme] ??= _buildSamplingTable(templates);
+      }
+    }
+    if (table == null || table.length != templates.length) {
+      return templates[_random.nextInt(templates.length)];
+    }
+    return templates[table.sample(_random)];
+  }
+
+  static TemplateSamplingTable _buildSamplingTable(
+    List<TriviaTemplate> templates,
+  ) {
+    return TemplateSamplingTable.fromWeights([
+      for (final template in templates) template.possibleCombinations,
+    ]);
+  }
+
   /// Select a template using weighted random selection
   /// If personalized, favors templates at the beginning of the list (higher scores)
-  /// Otherwise, uses pure random selection
+  /// Otherwise, uses pure random selection, or draws weighted by possible
+  /// combinations when enabled (see [setWeightByCombinations])
   TriviaTemplate _selectWeightedTemplate(
     List<TriviaTemplate> templates,
     bool isPersonalized,
@@ -15311,6 +15454,9 @@ class TriviaGeneratorService extends ChangeNotifier {
     }
 
     if (!isPersonalized || templates.length == 1) {
+      if (_weightByCombinations && templates.length > 1) {
+        return _sampleTemplate(templates);
+      }
       // Pure random if not personalized or only one template
       return templates[_random.nextInt(templates.length)];
     }
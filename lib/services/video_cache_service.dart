@@ -1,5 +1,8 @@
+import 'dart:ui' show PlatformDispatcher;
 import 'package:video_player/video_player.dart';
 import 'package:n3rd_game/services/logger_service.dart';
+import 'package:n3rd_game/utils/video_asset_manifest.dart';
+import 'package:n3rd_game/utils/video_path_helper.dart';
 
 /// Service for managing video preloading and caching
 /// Improves performance by preloading frequently used videos
@@ -18,11 +21,22 @@ class VideoCacheService {
     'assets/modeselectionscreen.mp4', // Frequently accessed
   ];
 
+  // Base paths kept cached by _enforceCacheLimit (the built-in list plus
+  // whatever the manifest prioritized)
+  Set<String> _priorityVideos = _preloadVideos.toSet();
+
   // Maximum number of cached videos to prevent memory issues
   static const int _maxCacheSize = 5;
 
   /// Preload a video and cache the controller
-  Future<VideoPlayerController?> preloadVideo(String videoPath) async {
+  ///
+  /// The controller is cached under [videoPath]; [assetPath] is the file
+  /// actually loaded (e.g. the device's generated variant), defaulting to
+  /// [videoPath].
+  Future<VideoPlayerController?> preloadVideo(
+    String videoPath, {
+    String? assetPath,
+  }) async {
     // Return cached controller if available and valid
     if (_cachedControllers.containsKey(videoPath)) {
       final controller = _cachedControllers[videoPath]!;
@@ -47,7 +61,7 @@ class VideoCacheService {
     }
 
     try {
-      final controller = VideoPlayerController.asset(videoPath);
+      final controller = VideoPlayerController.asset(assetPath ?? videoPath);
       await controller.initialize();
       
       // Cache the controller
@@ -56,7 +70,7 @@ class VideoCacheService {
       // Enforce cache size limit
       _enforceCacheLimit();
       
-      LoggerService.debug('Video preloaded: $videoPath');
+      LoggerService.debug('Video preloaded: ${assetPath ?? videoPath}');
       return controller;
     } catch (e) {
       LoggerService.warning(
@@ -95,10 +109,22 @@ class VideoCacheService {
   }
 
   /// Preload all priority videos
+  ///
+  /// Videos prioritized in [VideoAssetManifest] load first, then the rest of
+  /// the built-in list. Each one loads the variant generated for this
+  /// screen when the manifest lists it, and the base video otherwise.
   Future<void> preloadPriorityVideos() async {
-    for (final videoPath in _preloadVideos) {
+    await VideoAssetManifest.load();
+    final videos = VideoAssetManifest.preloadPaths(defaults: _preloadVideos);
+    _priorityVideos = videos.toSet();
+    final variant = _screenVariant();
+
+    for (final videoPath in videos) {
       try {
-        await preloadVideo(videoPath);
+        final assetPath = variant == null
+            ? null
+            : VideoAssetManifest.resolveVariant(videoPath, variant);
+        await preloadVideo(videoPath, assetPath: assetPath);
       } catch (e) {
         LoggerService.warning(
           'Failed to preload priority video: $videoPath',
@@ -108,6 +134,16 @@ class VideoCacheService {
     }
   }
 
+  /// Variant for the main screen's aspect ratio, or null if it isn't known
+  /// yet (e.g. no view attached)
+  String? _screenVariant() {
+    final size = PlatformDispatcher.instance.implicitView?.physicalSize;
+    if (size == null || size.width <= 0 || size.height <= 0) {
+      return null;
+    }
+    return VideoPathHelper.variantForAspectRatio(size.height / size.width);
+  }
+
   /// Remove a video from cache
   void removeFromCache(String videoPath) {
     final controller = _cachedControllers.remove(videoPath);
@@ -130,9 +166,8 @@ class VideoCacheService {
     }
 
     // Remove videos that are not in the preload list
-    final preloadSet = _preloadVideos.toSet();
     final nonPreloadVideos = _cachedControllers.keys
-        .where((path) => !preloadSet.contains(path))
+        .where((path) => !_priorityVideos.contains(path))
         .toList();
 
     // Remove excess non-preload videos
@@ -0,0 +1,212 @@
+import 'dart:convert';
+import 'package:flutter/foundation.dart';
+import 'package:flutter/services.dart';
+
+/// Metadata for one generated video variant (e.g. `titlescreen_tall.mp4`)
+class VideoVariantInfo {
+  final String file;
+  final int width;
+  final int height;
+  final double duration;
+  final int bytes;
+  final String sha256;
+
+  /// First-frame poster file (e.g. `titlescreen_tall.webp`), if generated
+  final String? poster;
+
+  /// Low-bitrate preview clip file, if generated
+  final String? preview;
+
+  const VideoVariantInfo({
+    required this.file,
+    required this.width,
+    required this.height,
+    required this.duration,
+    required this.bytes,
+    required this.sha256,
+    this.poster,
+    this.preview,
+  });
+
+  factory VideoVariantInfo.fromJson(Map<String, dynamic> json) {
+    return VideoVariantInfo(
+      file: json['file'] as String,
+      width: json['width'] as int,
+      height: json['height'] as int,
+      duration: (json['duration'] as num).toDouble(),
+      bytes: json['bytes'] as int,
+      sha256: json['sha256'] as String,
+      poster: json['poster'] as String?,
+      preview: json['preview'] as String?,
+    );
+  }
+}
+
+/// Metadata for one base video and the variants that were generated for it
+class VideoAssetInfo {
+  /// Suggested preload priority (lower loads first), null for on-demand
+  final int? priority;
+  final Map<String, VideoVariantInfo> variants;
+
+  const VideoAssetInfo({required this.priority, required this.variants});
+
+  factory VideoAssetInfo.fromJson(Map<String, dynamic> json) {
+    final variants = json['variants'] as Map<String, dynamic>? ?? {};
+    return VideoAssetInfo(
+      priority: json['priority'] as int?,
+      variants: variants.map(
+        (name, value) => MapEntry(
+          name,
+          VideoVariantInfo.fromJson(value as Map<String, dynamic>),
+        ),
+      ),
+    );
+  }
+}
+
+/// Manifest of responsive video variants written by
+/// `generate_responsive_videos.py` (`video_manifest.json`).
+///
+/// Lets [VideoPathHelper] resolve a variant that actually exists and lets
+/// [VideoCacheService] plan preloading from one small lookup, instead of
+/// guessing file names or parsing `AssetManifest.json`.
+///
+/// The generator must write into `assets/` (registered in `pubspec.yaml`)
+/// so the manifest and the files it lists are bundled. Loading is
+/// optional: when the manifest asset is missing a warning is logged in
+/// debug mode, every lookup returns null and callers keep their existing
+/// behaviour.
+class VideoAssetManifest {
+  /// Asset path of the manifest (place it next to the generated variants)
+  static const String assetPath = 'assets/video_manifest.json';
+
+  /// Variant to try next when the preferred one wasn't generated
+  static const Map<String, List<String>> _fallbackOrder = {
+    'extra_tall': ['extra_tall', 'tall', 'standard'],
+    'tall': ['tall', 'extra_tall', 'standard'],
+    'standard': ['standard', 'tall', 'extra_tall'],
+  };
+
+  static Map<String, VideoAssetInfo>? _videos;
+
+  /// Whether a manifest has been loaded
+  static bool get isLoaded => _videos != null;
+
+  /// Load the manifest from the asset bundle
+  ///
+  /// Idempotent. Failures are logged in debug mode and leave the manifest
+  /// unloaded.
+  static Future<void> load({AssetBundle? bundle}) async {
+    if (_videos != null) return;
+
+    try {
+      final content = await (bundle ?? rootBundle).loadString(assetPath);
+      loadFromJson(content);
+    } catch (e) {
+      if (kDebugMode) {
+        debugPrint(
+          '⚠️ VideoAssetManifest: $assetPath not bundled, using base videos '
+          'only. Run generate_responsive_videos.py with assets/ as the '
+          'output folder. ($e)',
+        );
+      }
+    }
+  }
+
+  /// Parse manifest JSON (used by [load] and tests)
+  static void loadFromJson(String content) {
+    final json = jsonDecode(content) as Map<String, dynamic>;
+    final videos = json['videos'] as Map<String, dynamic>? ?? {};
+    _videos = videos.map(
+      (base, value) => MapEntry(
+        base,
+        VideoAssetInfo.fromJson(value as Map<String, dynamic>),
+      ),
+    );
+  }
+
+  /// Forget the loaded manifest
+  @visibleForTesting
+  static void reset() {
+    _videos = null;
+  }
+
+  /// Look up a base video by its path (e.g. 'assets/titlescreen.mp4')
+  static VideoAssetInfo? lookup(String basePath) {
+    return _videos?[_baseName(basePath)];
+  }
+
+  /// Resolve [variant] of [basePath] to a variant that exists
+  ///
+  /// Returns the preferred variant if it was generated, otherwise the
+  /// closest one, or [basePath] if no variants exist. Returns null when the
+  /// manifest isn't loaded or doesn't list this video.
+  static String? resolveVariant(String basePath, String variant) {
+    final entry = _resolveEntry(basePath, variant);
+    if (entry == null) {
+      return lookup(basePath) == null ? null : basePath;
+    }
+    return '${_directory(basePath)}${entry.file}';
+  }
+
+  /// Poster image for the variant [resolveVariant] would pick
+  ///
+  /// Screens can paint this while the video controller initializes.
+  /// Returns null when no poster was generated.
+  static String? resolvePoster(String basePath, String variant) {
+    final poster = _resolveEntry(basePath, variant)?.poster;
+    return poster == null ? null : '${_directory(basePath)}$poster';
+  }
+
+  /// Preview clip for the variant [resolveVariant] would pick, if any
+  static String? resolvePreview(String basePath, String variant) {
+    final preview = _resolveEntry(basePath, variant)?.preview;
+    return preview == null ? null : '${_directory(basePath)}$preview';
+  }
+
+  static VideoVariantInfo? _resolveEntry(String basePath, String variant) {
+    final info = lookup(basePath);
+    if (info == null) return null;
+
+    for (final candidate in _fallbackOrder[variant] ?? [variant]) {
+      final entry = info.variants[candidate];
+      if (entry != null) {
+        return entry;
+      }
+    }
+    return null;
+  }
+
+  static String _directory(String basePath) {
+    return basePath.substring(0, basePath.lastIndexOf('/') + 1);
+  }
+
+  /// Base video paths to preload, highest priority first
+  ///
+  /// Videos with a manifest priority come first, followed by any of
+  /// [defaults] the manifest didn't prioritize, so a manifest that only
+  /// covers some videos never drops the built-in list. [directory] is the
+  /// asset folder the base videos live in.
+  static List<String> preloadPaths({
+    List<String> defaults = const [],
+    String directory = 'assets/',
+  }) {
+    final videos = _videos ?? const <String, VideoAssetInfo>{};
+    final prioritized = videos.entries
+        .where((entry) => entry.value.priority != null)
+        .toList()
+      ..sort((a, b) => a.value.priority!.compareTo(b.value.priority!));
+
+    final paths = <String>{
+      for (final entry in prioritized) '$directory${entry.key}.mp4',
+    };
+    paths.addAll(defaults);
+    return paths.toList();
+  }
+
+  static String _baseName(String basePath) {
+    final fileName = basePath.substring(basePath.lastIndexOf('/') + 1);
+    final lastDotIndex = fileName.lastIndexOf('.');
+    return lastDotIndex > 0 ? fileName.substring(0, lastDotIndex) : fileName;
+  }
+}
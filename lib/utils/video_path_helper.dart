@@ -1,5 +1,6 @@
 import 'package:flutter/material.dart';
 import 'package:flutter/foundation.dart';
+import 'package:n3rd_game/utils/video_asset_manifest.dart';
 
 /// Helper class to select the appropriate video variant based on device aspect ratio
 ///
@@ -9,6 +10,8 @@ import 'package:flutter/foundation.dart';
 /// - extra_tall (1080x2400) - taller devices
 ///
 /// This helper automatically selects the best matching variant for the device.
+/// When [VideoAssetManifest] is loaded, only variants that were actually
+/// generated are returned.
 class VideoPathHelper {
   /// Get the appropriate video path based on device aspect ratio
   ///
@@ -51,18 +54,12 @@ class VideoPathHelper {
       final baseName =
           lastDotIndex >= 0 ? basePath.substring(0, lastDotIndex) : basePath;
 
-      String variant;
+      final variant = variantForAspectRatio(aspectRatio);
 
-      // Determine variant based on aspect ratio
-      if (aspectRatio >= 2.2) {
-        // Extra tall devices (iPhone 14 Pro Max, etc.) - 2400px tall
-        variant = 'extra_tall';
-      } else if (aspectRatio >= 2.0) {
-        // Tall devices (most modern phones) - 2340px tall
-        variant = 'tall';
-      } else {
-        // Standard devices (9:16) - 1920px tall
-        variant = 'standard';
+      // Prefer the generated manifest, which knows which variants exist
+      final resolved = VideoAssetManifest.resolveVariant(basePath, variant);
+      if (resolved != null) {
+        return resolved;
       }
 
       // Return path with variant: 'assets/videos/title_video_tall.mp4'
@@ -79,6 +76,21 @@ class VideoPathHelper {
     }
   }
 
+  /// Variant name for a screen with this height / width [aspectRatio]
+  ///
+  /// Usable without a BuildContext (e.g. when preloading at startup).
+  static String variantForAspectRatio(double aspectRatio) {
+    if (aspectRatio >= 2.2) {
+      // Extra tall devices (iPhone 14 Pro Max, etc.) - 2400px tall
+      return 'extra_tall';
+    } else if (aspectRatio >= 2.0) {
+      // Tall devices (most modern phones) - 2340px tall
+      return 'tall';
+    }
+    // Standard devices (9:16) - 1920px tall
+    return 'standard';
+  }
+
   /// Get aspect ratio category for debugging
   ///
   /// Returns a string describing the device's aspect ratio category
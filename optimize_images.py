@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Image optimisation pipeline for background and icon assets.
+
+Each source image is treated as the highest density (3.0x by default) and
+resized into Flutter's 1x/2x/3x layout:
+
+    <output>/name.webp        1x
+    <output>/2.0x/name.webp   2x
+    <output>/3.0x/name.webp   3x
+
+in its original format (re-compressed) and as WebP and/or AVIF. Sources are
+processed in parallel on a process pool. A size/quality report (bytes vs the
+source, PSNR against the resized source, decoded size in memory) is printed
+and optionally written as JSON. Outputs are cached by source content and
+settings, so unchanged images aren't reprocessed.
+
+Usage: python3 optimize_images.py [sources...] [--formats original,webp]
+Requires Pillow (pip install Pillow); AVIF needs Pillow 11.2+ or pillow-avif-plugin.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, ImageChops, features
+except ImportError:  # Optional: only needed to actually process images
+    Image = None
+
+try:
+    import pillow_avif  # noqa: F401  (registers AVIF on older Pillow)
+except ImportError:
+    pass
+
+SOURCE_DIR = "assets/images"
+SOURCE_PATTERNS = ["*.png", "*.jpg", "*.jpeg"]
+OUTPUT_DIR = "assets/images/optimized"
+CACHE_DIR = ".image_cache"
+CACHE_MANIFEST = "manifest.json"
+# Bump when output bytes change for the same settings
+PIPELINE_VERSION = 1
+
+# Density -> subdirectory, following Flutter's resolution-aware asset layout
+DENSITIES = {1: "", 2: "2.0x", 3: "3.0x"}
+DEFAULT_SOURCE_DENSITY = 3
+FORMATS = ["original", "webp", "avif"]
+DEFAULT_FORMATS = ["original", "webp"]
+QUALITY = {"jpeg": 85, "webp": 82, "avif": 60}
+
+def check_pillow(formats):
+    """Exit unless Pillow (and any requested codec) is available"""
+    if Image is None:
+        print("❌ Pillow is required: pip install Pillow")
+        sys.exit(1)
+    for fmt in ("webp", "avif"):
+        if fmt in formats and not features.check(fmt):
+            print(f"❌ This Pillow build can't write {fmt.upper()}"
+                  + (" (install pillow-avif-plugin or Pillow 11.2+)" if fmt == "avif" else ""))
+            sys.exit(1)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def output_extension(source, fmt):
+    if fmt == "original":
+        ext = os.path.splitext(source)[1].lower()
+        return ".jpg" if ext == ".jpeg" else ext
+    return f".{fmt}"
+
+def output_paths(source, output_dir, formats):
+    """{(density, format): path} for one source"""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return {
+        (density, fmt): os.path.join(output_dir, subdir, stem + output_extension(source, fmt))
+        for density, subdir in DENSITIES.items()
+        for fmt in formats
+    }
+
+def cache_key(source_hash, settings):
+    """Key outputs by source content, every output-affecting setting and Pillow"""
+    encoded = json.dumps({
+        "source": source_hash,
+        "settings": settings,
+        "pillow": Image.__version__,
+        "pipeline": PIPELINE_VERSION,
+    }, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+class ImageCache:
+    """Outputs and report rows per source, keyed by cache_key
+
+    A source is a hit when its key matches and every output still has the
+    recorded size and mtime, so deleted or hand-edited outputs are redone.
+    """
+
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, CACHE_MANIFEST)
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    self.entries = json.load(f).get("entries", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠ Ignoring unreadable cache manifest: {e}")
+
+    def lookup(self, source, key):
+        """Cached report rows for source, or None if it must be processed"""
+        entry = self.entries.get(os.path.abspath(source))
+        if not entry or entry["key"] != key:
+            return None
+        for path, recorded in entry["outputs"].items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            if stat.st_size != recorded["size"] or stat.st_mtime_ns != recorded["mtime_ns"]:
+                return None
+        return entry["rows"]
+
+    def record(self, source, key, rows):
+        outputs = {}
+        for row in rows:
+            stat = os.stat(row["output"])
+            outputs[os.path.abspath(row["output"])] = {
+                "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self.entries[os.path.abspath(source)] = {"key": key, "outputs": outputs, "rows": rows}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w") as f:
+            json.dump({"version": 1, "entries": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+def psnr(reference, candidate):
+    """Peak signal-to-noise ratio in dB (inf when identical)"""
+    if candidate.mode != reference.mode:
+        candidate = candidate.convert(reference.mode)
+    histogram = ImageChops.difference(reference, candidate).histogram()
+    squared = sum(count * (i % 256) ** 2 for i, count in enumerate(histogram))
+    mse = squared / (reference.width * reference.height * len(reference.getbands()))
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+def save_variant(image, path, fmt, source_format):
+    """Encode image to path (via a temp file); returns the saved mode"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp = path + ".tmp"
+    if fmt == "original" and source_format == "JPEG":
+        image = image.convert("RGB")
+        image.save(temp, "JPEG", quality=QUALITY["jpeg"], optimize=True, progressive=True)
+    elif fmt == "original":
+        image.save(temp, source_format, optimize=True)
+    elif fmt == "webp":
+        image.save(temp, "WEBP", quality=QUALITY["webp"], method=6)
+    else:
+        image.save(temp, "AVIF", quality=QUALITY["avif"])
+    os.replace(temp, path)
+    return image.mode
+
+def process_image(source, outputs, source_density):
+    """Resize and encode one source into every (density, format) output
+
+    Runs in a worker process; returns report rows.
+    """
+    with Image.open(source) as opened:
+        source_format = opened.format
+        original = opened.convert("RGBA" if "A" in opened.getbands()
+                                  or opened.info.get("transparency") is not None
+                                  else "RGB")
+    source_bytes = os.path.getsize(source)
+    rows = []
+    for density in sorted(DENSITIES):
+        scale = min(1.0, density / source_density)
+        size = (max(1, round(original.width * scale)), max(1, round(original.height * scale)))
+        reference = original if size == original.size else original.resize(size, Image.LANCZOS)
+        for (d, fmt), path in sorted(outputs.items()):
+            if d != density:
+                continue
+            mode = save_variant(reference, path, fmt, source_format)
+            with Image.open(path) as encoded:
+                quality = psnr(reference.convert(mode), encoded.convert(mode))
+            rows.append({
+                "source": source,
+                "output": path,
+                "density": density,
+                "format": fmt,
+                "width": size[0],
+                "height": size[1],
+                "bytes": os.path.getsize(path),
+                "sourceBytes": source_bytes,
+                "psnr": None if math.isinf(quality) else round(quality, 2),
+                "decodedBytes": size[0] * size[1] * 4,
+            })
+    return rows
+
+def print_report(rows):
+    print(f"{'output':<48} {'size':>11} {'bytes':>9} {'of src':>7} {'PSNR':>7} {'decoded':>9}")
+    for row in rows:
+        psnr_text = "lossless" if row["psnr"] is None else f"{row['psnr']:.1f}"
+        print(f"{row['output'][-48:]:<48} {row['width']:>5}x{row['height']:<5} "
+              f"{row['bytes']:>9,} {row['bytes'] / row['sourceBytes']:>6.0%} "
+              f"{psnr_text:>7} {row['decodedBytes'] / 1024 ** 2:>7.1f}MB")
+    source_total = sum({row["source"]: row["sourceBytes"] for row in rows}.values())
+    for fmt in FORMATS:
+        shipped = [row for row in rows if row["format"] == fmt]
+        if shipped:
+            total = sum(row["bytes"] for row in shipped)
+            print(f"  {fmt}: {total:,} bytes for all densities "
+                  f"({total / source_total:.0%} of {source_total:,} source bytes)")
+
+def default_sources():
+    return sorted(path for pattern in SOURCE_PATTERNS
+                  for path in glob.glob(os.path.join(SOURCE_DIR, pattern)))
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Generate 1x/2x/3x and WebP/AVIF variants of image assets",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # Everything in {SOURCE_DIR}, original format + WebP
+  python3 optimize_images.py
+
+  # One background, WebP and AVIF, with a JSON report
+  python3 optimize_images.py "assets/images/game_screen_bg.png" --formats webp,avif --report images.json
+
+  # Sources drawn at 2x (no 3x upscaling)
+  python3 optimize_images.py --source-density 2
+
+Flutter picks the 2.0x/ and 3.0x/ variants automatically once
+{OUTPUT_DIR}/ is listed under assets: in pubspec.yaml. Flutter
+decodes WebP natively; AVIF needs a decoder package.
+        """,
+    )
+    parser.add_argument("sources", nargs="*",
+                        help=f"Images to process (default: {', '.join(SOURCE_PATTERNS)} in {SOURCE_DIR})")
+    parser.add_argument("--output", default=OUTPUT_DIR,
+                        help=f"Output folder (default: {OUTPUT_DIR})")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS),
+                        help=f"Comma-separated from {', '.join(FORMATS)} (default: {','.join(DEFAULT_FORMATS)})")
+    parser.add_argument("--source-density", type=int, choices=sorted(DENSITIES),
+                        default=DEFAULT_SOURCE_DENSITY,
+                        help=f"Density the sources are drawn at (default: {DEFAULT_SOURCE_DENSITY})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help=f"Cache folder (default: {CACHE_DIR})")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess every image, ignoring the cache")
+    parser.add_argument("--report", metavar="PATH",
+                        help="Also write the size/quality report as JSON")
+    args = parser.parse_args()
+    args.formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in args.formats if fmt not in FORMATS]
+    if unknown or not args.formats:
+        parser.error(f"--formats must be chosen from {', '.join(FORMATS)}")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main():
+    args = parse_args()
+    check_pillow(args.formats)
+    sources = args.sources or default_sources()
+    missing = [source for source in sources if not os.path.isfile(source)]
+    if missing:
+        print(f"❌ Source not found: {', '.join(missing)}")
+        sys.exit(1)
+    if not sources:
+        print(f"ℹ️  No images found in {SOURCE_DIR}")
+        return
+
+    settings = {"formats": args.formats, "sourceDensity": args.source_density,
+                "quality": QUALITY, "output": os.path.abspath(args.output)}
+    cache = ImageCache(args.cache_dir)
+    rows = []
+    pending = {}
+    for source in sources:
+        key = cache_key(file_sha256(source), settings)
+        cached = None if args.force else cache.lookup(source, key)
+        if cached is None:
+            pending[source] = key
+        else:
+            print(f"= {source} (unchanged, skipped)")
+            rows.extend(cached)
+
+    if pending:
+        print(f"Processing {len(pending)} images on {min(args.workers, len(pending))} workers...")
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(pending))) as executor:
+            futures = {
+                executor.submit(process_image, source,
+                                output_paths(source, args.output, args.formats),
+                                args.source_density): source
+                for source in pending
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    source_rows = future.result()
+                except (OSError, ValueError) as e:
+                    print(f"✗ {source}: {e}")
+                    continue
+                cache.record(source, pending[source], source_rows)
+                rows.extend(source_rows)
+                print(f"✓ {source}")
+        cache.save()
+
+    print("")
+    rows.sort(key=lambda row: (row["source"], row["density"], row["format"]))
+    print_report(rows)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"version": 1, "images": rows}, f, indent=2)
+        print(f"Report written to {args.report}")
+
+if __name__ == "__main__":
+    main()
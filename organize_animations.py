@@ -1,47 +1,344 @@
 #!/usr/bin/env python3
+"""
+Sync animation clips into per-category folders under assets/animations.
+
+The mapping (source folder, destination folder, file -> category) lives in
+animation_mappings.json. Each source is hashed once; a destination whose
+content already matches is left alone, and every destination sharing the
+same bytes is cloned (reflink) or hardlinked instead of copied again. File
+groups are placed in parallel.
+
+An index of every category (animation_index.json in the destination
+folder) is written for AnimationRandomizerService, so it doesn't have to
+scan AssetManifest.json. Flutter only bundles files directly inside a
+folder listed in pubspec.yaml, so the destination and each category folder
+need their own assets: entry; the run warns about any that are missing.
+"""
+
+import argparse
+import errno
+import hashlib
+import json
 import os
+import posixpath
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+MAPPING_FILE = "animation_mappings.json"
+INDEX_NAME = "animation_index.json"
+# Hashes keyed by (size, mtime) so unchanged files aren't re-read
+HASH_CACHE_FILE = ".organize_animations_cache.json"
+PUBSPEC_FILE = "pubspec.yaml"
+LINK_MODES = ["auto", "reflink", "hardlink", "copy"]
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Linux FICLONE ioctl (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+def load_mapping(path):
+    """Read the mapping file; returns (source dir, destination dir, entries)
+
+    Each mapping value is a category or a list of categories, so one source
+    can be placed in several folders. Entries are (file, category) pairs.
+    """
+    with open(path) as f:
+        config = json.load(f)
+    entries = []
+    for filename, categories in config["mappings"].items():
+        if isinstance(categories, str):
+            categories = [categories]
+        entries.extend((filename, category) for category in categories)
+    return config["source"], config["destination"], entries
+
+def load_hash_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_hash_cache(path, cache):
+    with open(path + ".tmp", "w") as f:
+        json.dump(cache, f, separators=(",", ":"), sort_keys=True)
+    os.replace(path + ".tmp", path)
 
-# Source directory
-src_dir = "assets/animations/Green Neutral Simple Serendipity Phone Wallpaper(1)"
-dest_base = "assets/animations"
-
-# File mappings
-mappings = {
-    "first loading.mp4": "logo",
-    "2nd loading.mp4": "onboarding",
-    "title screen.mp4": "title",
-    "mode selection screen.mp4": "mode_selection",
-    "mode selection.mp4": "mode_selection",
-    "stat screen.mp4": "stats",
-    "setting screen.mp4": "settings",
-    "word of the day.mp4": "word_of_day",
-    "8.mp4": "shared",
-    "10.mp4": "shared",
-    "11.mp4": "shared",
-}
-
-print("Organizing animation files...")
-print("")
-
-# Create directories
-for category in set(mappings.values()):
-    os.makedirs(f"{dest_base}/{category}", exist_ok=True)
-
-# Copy files
-copied = 0
-for filename, category in mappings.items():
-    src_path = os.path.join(src_dir, filename)
-    dest_path = os.path.join(dest_base, category, filename)
-    
-    if os.path.exists(src_path):
-        shutil.copy2(src_path, dest_path)
-        print(f"✓ {filename} → {category}/")
-        copied += 1
+def file_sha256(path, cache):
+    """SHA-256 of a file, reusing the cached digest while size and mtime match"""
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    entry = cache.get(key)
+    if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+        return entry["sha256"]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    cache[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns,
+                  "sha256": digest.hexdigest()}
+    return cache[key]["sha256"]
+
+def hash_files(paths, cache, workers):
+    """Hash each path once, in parallel; returns {path: sha256}"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(file_sha256, path, cache): path for path in set(paths)}
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+def reflink(src, dst):
+    """Copy-on-write clone of src at dst; returns False if unsupported"""
+    if sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return True
+        except OSError:
+            pass
+    os.remove(dst)
+    return False
+
+def place(src, dst, mode):
+    """Put src's content at dst; returns how ("cloned", "linked" or "copied")
+
+    Written to a temporary name and renamed, so a reader never sees a
+    partial file.
+    """
+    temp = dst + ".tmp"
+    if os.path.lexists(temp):
+        os.remove(temp)
+    if mode in ("auto", "reflink") and reflink(src, temp):
+        method = "cloned"
+    elif mode in ("auto", "hardlink"):
+        try:
+            os.link(src, temp)
+            method = "linked"
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            shutil.copy2(src, temp)
+            method = "copied"
     else:
+        shutil.copy2(src, temp)
+        method = "copied"
+    os.replace(temp, dst)
+    return method
+
+def plan_sync(source_dir, dest_dir, entries, cache, workers):
+    """Work out what each destination needs
+
+    Returns (groups, unchanged, missing): groups maps a content hash to
+    its source and the destinations that need placing, unchanged lists
+    destinations that already hold the right bytes, missing lists source
+    files that don't exist.
+    """
+    missing = sorted({f for f, _ in entries
+                      if not os.path.isfile(os.path.join(source_dir, f))})
+    present = [(f, c) for f, c in entries if f not in missing]
+    sources = hash_files([os.path.join(source_dir, f) for f, _ in present], cache, workers)
+
+    # A destination is unchanged if it is the source itself (a hardlink)
+    # or its size and hash match
+    candidates = {}
+    for filename, category in present:
+        src = os.path.join(source_dir, filename)
+        dst = os.path.join(dest_dir, category, filename)
+        if not os.path.isfile(dst):
+            continue
+        if os.path.samefile(src, dst):
+            candidates[dst] = True
+        elif os.path.getsize(src) == os.path.getsize(dst):
+            candidates[dst] = None
+    existing = hash_files([dst for dst, same in candidates.items() if same is None],
+                          cache, workers)
+
+    groups = {}
+    unchanged = []
+    for filename, category in present:
+        src = os.path.join(source_dir, filename)
+        dst = os.path.join(dest_dir, category, filename)
+        digest = sources[src]
+        if candidates.get(dst) or existing.get(dst) == digest:
+            unchanged.append(dst)
+            continue
+        # The first source with this content feeds every copy of it
+        group = groups.setdefault(digest, {"source": src, "destinations": []})
+        group["destinations"].append(dst)
+    return groups, unchanged, missing
+
+def sync_group(group, mode):
+    """Place one content group; later copies link to the first placed one"""
+    results = []
+    anchor = group["source"]
+    for i, dst in enumerate(group["destinations"]):
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        method = place(anchor, dst, mode)
+        results.append((dst, method))
+        if i == 0 and method == "copied" and mode != "copy":
+            # Source is on another filesystem; share the first copy instead
+            anchor = dst
+    return results
+
+def prune_stale(dest_dir, entries):
+    """Remove clips in mapped category folders that the mapping no longer lists"""
+    wanted = {os.path.join(dest_dir, c, f) for f, c in entries}
+    removed = []
+    for category in sorted({c for _, c in entries}):
+        folder = os.path.join(dest_dir, category)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if name.endswith(".mp4") and path not in wanted:
+                os.remove(path)
+                removed.append(path)
+    return removed
+
+def build_index(dest_dir, entries, cache):
+    """Category -> asset paths, plus size and hash per file"""
+    categories = {}
+    files = {}
+    for filename, category in sorted(entries, key=lambda e: (e[1], e[0])):
+        path = os.path.join(dest_dir, category, filename)
+        if not os.path.isfile(path):
+            continue
+        asset = posixpath.join(dest_dir.replace(os.sep, "/"), category, filename)
+        categories.setdefault(category, []).append(asset)
+        files[asset] = {"bytes": os.path.getsize(path), "sha256": file_sha256(path, cache)}
+    return {"version": 1, "categories": categories, "files": files}
+
+def write_index(dest_dir, index):
+    """Write the index only when it changed; returns its path"""
+    path = os.path.join(dest_dir, INDEX_NAME)
+    content = json.dumps(index, indent=2, sort_keys=True) + "\n"
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return path
+    except OSError:
+        pass
+    with open(path + ".tmp", "w") as f:
+        f.write(content)
+    os.replace(path + ".tmp", path)
+    return path
+
+def unregistered_asset_dirs(dest_dir, categories, pubspec=PUBSPEC_FILE):
+    """Asset folders (the index's and each category's) pubspec.yaml doesn't list
+
+    Returns an empty list when pubspec.yaml can't be read.
+    """
+    try:
+        with open(pubspec) as f:
+            listed = {line.strip()[2:].strip().strip("'\"") for line in f
+                      if line.strip().startswith("- ")}
+    except OSError:
+        return []
+    dest_dir = dest_dir.replace(os.sep, "/").rstrip("/")
+    folders = [dest_dir] + [posixpath.join(dest_dir, c) for c in sorted(categories)]
+    return [folder + "/" for folder in folders if folder + "/" not in listed]
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Sync animation clips into category folders",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # Sync using {MAPPING_FILE}
+  python3 organize_animations.py
+
+  # Show what would change without touching anything
+  python3 organize_animations.py --dry-run
+
+  # CI: fail if the category folders are out of date
+  python3 organize_animations.py --check
+
+  # Always make real copies (e.g. before zipping the folders)
+  python3 organize_animations.py --link copy
+        """,
+    )
+    parser.add_argument("--mapping", default=MAPPING_FILE,
+                        help=f"Mapping file (default: {MAPPING_FILE})")
+    parser.add_argument("--link", choices=LINK_MODES, default="auto",
+                        help="How to place identical content: auto tries reflink, then "
+                             "hardlink, then copy (default: auto)")
+    parser.add_argument("--prune", action="store_true",
+                        help="Remove clips in mapped category folders that aren't mapped")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only show what would be placed")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with an error if anything needs placing")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads for hashing and placing (default: {DEFAULT_WORKERS})")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main():
+    args = parse_args()
+    try:
+        source_dir, dest_dir, entries = load_mapping(args.mapping)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Cannot read mapping {args.mapping}: {e}")
+        sys.exit(1)
+
+    print("Organizing animation files...")
+    print("")
+
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(args.mapping)), HASH_CACHE_FILE)
+    cache = load_hash_cache(cache_path)
+    groups, unchanged, missing = plan_sync(source_dir, dest_dir, entries, cache, args.workers)
+    pending = sum(len(g["destinations"]) for g in groups.values())
+
+    for filename in missing:
         print(f"⚠ {filename} not found")
 
-print("")
-print(f"✅ Organized {copied} files successfully!")
-print(f"📁 Files are now in: assets/animations/[category]/")
+    if args.dry_run or args.check:
+        for group in groups.values():
+            for dst in group["destinations"]:
+                print(f"→ {os.path.basename(group['source'])} → {os.path.relpath(dst, dest_dir)}")
+        print("")
+        print(f"{pending} to place, {len(unchanged)} unchanged")
+        save_hash_cache(cache_path, cache)
+        if args.check and (pending or missing):
+            sys.exit(1)
+        return
+
+    counts = {"cloned": 0, "linked": 0, "copied": 0}
+    shared_bytes = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(sync_group, group, args.link) for group in groups.values()]
+        for future in as_completed(futures):
+            for dst, method in future.result():
+                counts[method] += 1
+                if method != "copied":
+                    shared_bytes += os.path.getsize(dst)
+                print(f"✓ {os.path.basename(dst)} → {os.path.relpath(os.path.dirname(dst), dest_dir)}/ ({method})")
+
+    if args.prune:
+        for path in prune_stale(dest_dir, entries):
+            print(f"✗ Removed {os.path.relpath(path, dest_dir)}")
+
+    index = build_index(dest_dir, entries, cache)
+    index_path = write_index(dest_dir, index)
+    save_hash_cache(cache_path, cache)
+
+    print("")
+    print(f"✅ Placed {pending} files ({counts['cloned']} cloned, {counts['linked']} linked, "
+          f"{counts['copied']} copied), {len(unchanged)} unchanged")
+    if shared_bytes:
+        print(f"💾 {shared_bytes / 1024 ** 2:.1f} MB shared instead of copied")
+    print(f"📁 Files are now in: {dest_dir}/[category]/")
+    print(f"📇 Index: {index_path}")
+    unregistered = unregistered_asset_dirs(dest_dir, index["categories"])
+    if unregistered:
+        print(f"⚠ Not bundled until listed under assets: in {PUBSPEC_FILE}: "
+              f"{', '.join(unregistered)}")
 
+if __name__ == "__main__":
+    main()
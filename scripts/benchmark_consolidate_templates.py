@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Benchmark the trivia template consolidation pipeline on synthetic corpora.
+
+Generates Untitled-* batch files in every supported format (one file style
+per extension: quoting, comments, const/typed literals, string
+concatenation, escapes, enum fields), then runs each stage of
+consolidate_trivia_templates.py and times it:
+
+    glob   find_batch_files()
+    parse  parse_batch_files() without the cache
+    group  group_by_theme()
+    emit   generate_dart_file()
+
+plus the build-time checks (analyze_templates) with --analyze. Every corpus
+size runs in its own process so peak RSS is per size. The JSON report can
+be compared with an earlier one (--compare) to catch regressions.
+
+Usage:
+    python3 scripts/benchmark_consolidate_templates.py
+    python3 scripts/benchmark_consolidate_templates.py --sizes 1000,10000,100000,1000000
+    python3 scripts/benchmark_consolidate_templates.py --compare build/bench_baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import consolidate_trivia_templates as consolidate  # noqa: E402
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPORT = 'build/consolidate_benchmark.json'
+TEMPLATES_PER_FILE = 500
+TEMPLATES_PER_THEME = 10
+CORRECT_ITEMS = 20
+DISTRACTOR_ITEMS = 15
+STAGES = ('glob', 'parse', 'group', 'analyze', 'emit')
+# Relative slowdown (or RSS growth) that --compare reports as a regression
+DEFAULT_TOLERANCE = 0.25
+# Stages faster than this are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.05
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ra', 'ten', 'vor', 'shi', 'qua', 'del', 'nu',
+             'pe', 'zan', 'tor', 'bel', 'gri', 'os', 'fen', 'ju', 'wex', 'ay']
+
+def _word(rng):
+    return ''.join(rng.choice(SYLLABLES)
+                   for _ in range(rng.randint(2, 4))).capitalize()
+
+def synthetic_template(rng, index, theme):
+    """One template dict with the same shape as the real corpus."""
+    answers = set()
+    while len(answers) < CORRECT_ITEMS + DISTRACTOR_ITEMS:
+        answers.add(f"{_word(rng)} {_word(rng)}" if rng.random() < 0.3
+                    else _word(rng))
+    answers = sorted(answers)
+    rng.shuffle(answers)
+    template = {
+        'categoryPattern': f"These are {_word(rng).lower()} things #{index}",
+        'correctPool': answers[:CORRECT_ITEMS],
+        'distractorPool': answers[CORRECT_ITEMS:],
+        'theme': theme,
+    }
+    if index % 7 == 0:
+        template['correctPool'][0] = f"O'{template['correctPool'][0]}"
+    return template
+
+def _quoted(value, quote):
+    escaped = value.replace('\\', '\\\\').replace(quote, '\\' + quote)
+    return f"{quote}{escaped}{quote}"
+
+def _strings(items, quote, prefix='', indent='      '):
+    joined = (',\n' + indent).join(_quoted(item, quote) for item in items)
+    return f"{prefix}[\n{indent}{joined},\n    ]"
+
+def format_call(template, ext, index):
+    """Write a TriviaTemplate(...) call in the style used for ``ext``."""
+    pattern = template['categoryPattern']
+    if ext == '.dart':
+        return ("  // Generated for benchmarking\n"
+                "  TriviaTemplate(\n"
+                f"    categoryPattern: {_quoted(pattern, chr(39))},\n"
+                f"    correctPool: {_strings(template['correctPool'], chr(39), 'const ')},\n"
+                f"    distractorPool: {_strings(template['distractorPool'], chr(39), 'const ')},\n"
+                f"    theme: {_quoted(template['theme'], chr(39))},\n"
+                "  ),\n")
+    if ext == '.js':
+        return ("  /* benchmark template */ TriviaTemplate(\n"
+                f"    categoryPattern: {_quoted(pattern, chr(34))},\n"
+                f"    correctPool: {_strings(template['correctPool'], chr(34))},\n"
+                f"    distractorPool: {_strings(template['distractorPool'], chr(34))},\n"
+                f"    theme: {_quoted(template['theme'], chr(34))}\n"
+                "  ),\n")
+    if ext == '.json':
+        pools = ', '.join(f"{field}: [{', '.join(_quoted(item, chr(34)) for item in template[field])}]"
+                          for field in ('correctPool', 'distractorPool'))
+        return (f"TriviaTemplate(categoryPattern: {_quoted(pattern, chr(34))}, "
+                f"{pools}, theme: {_quoted(template['theme'], chr(34))}),\n")
+    if ext == '.swift':
+        head, tail = pattern[:len(pattern) // 2], pattern[len(pattern) // 2:]
+        return ("  TriviaTemplate(\n"
+                f"    categoryPattern: {_quoted(head, chr(39))}\n"
+                f"        {_quoted(tail, chr(39))},\n"
+                f"    correctPool: {_strings(template['correctPool'], chr(34), '<String>')},\n"
+                f"    distractorPool: {_strings(template['distractorPool'], chr(34), '<String>')},\n"
+                f"    theme: {_quoted(template['theme'], chr(34))},\n"
+                "  ),\n")
+    if ext == '.vb':
+        return ("  TriviaTemplate(\n"
+                f"    categoryPattern: r{_quoted(pattern, chr(34))},\n"
+                f"    correctPool: {_strings(template['correctPool'], chr(39))},\n"
+                f"    distractorPool: {_strings(template['distractorPool'], chr(39))},\n"
+                f"    theme: {_quoted(template['theme'], chr(39))},\n"
+                "  ),\n")
+    # .jl and extensionless files carry the optional enum fields
+    difficulty = consolidate.DIFFICULTY_LEVELS[index % 3]
+    return ("  TriviaTemplate(\n"
+            f"    categoryPattern: {_quoted(pattern, chr(34))},\n"
+            f"    correctPool: {_strings(template['correctPool'], chr(34))},\n"
+            f"    distractorPool: {_strings(template['distractorPool'], chr(34))},\n"
+            f"    theme: {_quoted(template['theme'], chr(34))},\n"
+            f"    difficulty: DifficultyLevel.{difficulty},\n"
+            "  ),\n")
+
+def generate_corpus(directory, size, formats, per_file=TEMPLATES_PER_FILE, seed=0):
+    """Write ``size`` templates as Untitled-* files in ``directory``.
+
+    Files rotate through ``formats``. Returns (file count, total bytes).
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    themes = [f"theme_{i:05d}" for i in range(max(1, size // TEMPLATES_PER_THEME))]
+    files = 0
+    total_bytes = 0
+    for start in range(0, size, per_file):
+        ext = formats[files % len(formats)]
+        path = os.path.join(directory, f"Untitled-{files + 1}{ext}")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("final templates = [\n")
+            for index in range(start, min(start + per_file, size)):
+                template = synthetic_template(rng, index, rng.choice(themes))
+                f.write(format_call(template, ext, index))
+            f.write("];\n")
+        total_bytes += os.path.getsize(path)
+        files += 1
+    return files, total_bytes
+
+def _peak_rss_mb(who):
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def run_pipeline(batch_dir, output_path, jobs=None, analyze=False):
+    """Run and time each consolidation stage; returns a result dict."""
+    timings = {}
+
+    start = time.perf_counter()
+    files = consolidate.find_batch_files(batch_dir)
+    timings['glob'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed, errors = consolidate.parse_batch_files(files, jobs=jobs)
+    timings['parse'] = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(f"{len(errors)} synthetic files failed to parse: {errors[0]}")
+
+    start = time.perf_counter()
+    templates_by_theme = consolidate.group_by_theme(parsed)
+    timings['group'] = time.perf_counter() - start
+
+    if analyze:
+        start = time.perf_counter()
+        consolidate.analyze_templates(templates_by_theme)
+        timings['analyze'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    consolidate.generate_dart_file(templates_by_theme, output_path)
+    timings['emit'] = time.perf_counter() - start
+
+    templates = sum(len(t) for t in templates_by_theme.values())
+    total = sum(timings.values())
+    return {
+        'templates': templates,
+        'themes': len(templates_by_theme),
+        'outputBytes': os.path.getsize(output_path),
+        'stages': {stage: round(seconds, 4) for stage, seconds in timings.items()},
+        'totalSeconds': round(total, 4),
+        'templatesPerSecond': round(templates / total) if total else None,
+        'peakRssMB': _peak_rss_mb(resource.RUSAGE_SELF),
+        'peakChildRssMB': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+def run_size(size, args):
+    """Generate one corpus and benchmark it in a fresh process."""
+    work_dir = tempfile.mkdtemp(prefix=f"trivia_bench_{size}_", dir=args.work_dir)
+    try:
+        batch_dir = os.path.join(work_dir, 'batch')
+        start = time.perf_counter()
+        files, corpus_bytes = generate_corpus(batch_dir, size, args.formats,
+                                              args.templates_per_file, args.seed)
+        generate_seconds = time.perf_counter() - start
+
+        # Suppress generate_dart_file()'s own output in the worker
+        command = [sys.executable, os.path.abspath(__file__), '--worker', batch_dir,
+                   '--output', os.path.join(work_dir, 'out.dart')]
+        if args.jobs:
+            command += ['--jobs', str(args.jobs)]
+        if args.analyze:
+            command.append('--analyze')
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or completed.stdout.strip())
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+    finally:
+        if args.keep:
+            print(f"  Corpus kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    result.update({
+        'size': size,
+        'files': files,
+        'corpusBytes': corpus_bytes,
+        'generateSeconds': round(generate_seconds, 2),
+    })
+    return result
+
+def compare_reports(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """List regressions of ``current`` against ``baseline``, matched by size."""
+    previous = {result['size']: result for result in baseline.get('results', [])}
+    regressions = []
+    for result in current['results']:
+        before = previous.get(result['size'])
+        if before is None:
+            continue
+        for stage in STAGES:
+            old = before['stages'].get(stage)
+            new = result['stages'].get(stage)
+            if old is None or new is None or max(old, new) < MIN_COMPARABLE_SECONDS:
+                continue
+            if new > old * (1 + tolerance):
+                regressions.append(f"{result['size']:,} templates: {stage} "
+                                   f"{old:.3f}s -> {new:.3f}s (+{new / old - 1:.0%})")
+        old_rss, new_rss = before.get('peakRssMB'), result.get('peakRssMB')
+        if old_rss and new_rss and new_rss > old_rss * (1 + tolerance):
+            regressions.append(f"{result['size']:,} templates: peak RSS "
+                               f"{old_rss:.0f} MB -> {new_rss:.0f} MB")
+    return regressions
+
+def print_table(results):
+    print(f"\n{'templates':>10} {'files':>6} " +
+          ' '.join(f"{stage:>8}" for stage in STAGES) +
+          f" {'total':>8} {'tmpl/s':>9} {'RSS MB':>8}")
+    for result in results:
+        stages = ' '.join(f"{result['stages'][stage]:>8.3f}" if stage in result['stages']
+                          else f"{'-':>8}" for stage in STAGES)
+        print(f"{result['size']:>10,} {result['files']:>6} {stages} "
+              f"{result['totalSeconds']:>8.2f} {result['templatesPerSecond'] or 0:>9,} "
+              f"{result['peakRssMB']:>8.1f}")
+
+def _sizes(value):
+    try:
+        sizes = [int(part.replace('_', '')) for part in value.split(',') if part]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list: {value}")
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return sizes
+
+def _formats(value):
+    formats = [part if part.startswith('.') or not part else '.' + part
+               for part in value.split(',')]
+    unknown = [ext for ext in formats if ext and ext not in consolidate.BATCH_EXTENSIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown formats: {', '.join(unknown)}")
+    return formats
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark consolidate_trivia_templates.py on synthetic corpora',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 1k, 10k and 100k templates, all formats, report in build/
+  python3 scripts/benchmark_consolidate_templates.py
+
+  # Up to 1M templates (needs several GB of RAM)
+  python3 scripts/benchmark_consolidate_templates.py --sizes 1000,10000,100000,1000000
+
+  # Include the build-time checks and compare with a saved baseline
+  python3 scripts/benchmark_consolidate_templates.py --analyze --compare build/bench_baseline.json
+
+  # Only Dart-style batch files, parsed on one process
+  python3 scripts/benchmark_consolidate_templates.py --formats dart --jobs 1
+        """
+    )
+    parser.add_argument('--sizes', type=_sizes, default=DEFAULT_SIZES,
+                        help='Comma-separated corpus sizes in templates (default: 1000,10000,100000)')
+    parser.add_argument('--formats', type=_formats,
+                        default=consolidate.BATCH_EXTENSIONS + [''],
+                        help='Comma-separated batch file extensions to generate (default: all)')
+    parser.add_argument('--templates-per-file', type=int, default=TEMPLATES_PER_FILE,
+                        help=f'Templates per batch file (default: {TEMPLATES_PER_FILE})')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Parse processes (default: one per CPU)')
+    parser.add_argument('--analyze', action='store_true',
+                        help='Also time the build-time checks (analyze_templates)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the synthetic corpus (default: 0)')
+    parser.add_argument('--work-dir', default=None,
+                        help='Where to generate corpora (default: system temp dir)')
+    parser.add_argument('--keep', action='store_true',
+                        help='Keep the generated corpora')
+    parser.add_argument('--report', default=DEFAULT_REPORT,
+                        help=f'JSON report path (default: {DEFAULT_REPORT})')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='Compare with an earlier report; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed slowdown for --compare (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--worker', metavar='BATCH_DIR', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        # Child process: run the pipeline and print one JSON line
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_pipeline(args.worker, args.output, args.jobs, args.analyze)
+        print(json.dumps(result))
+        return
+
+    if args.templates_per_file < 1:
+        print("✗ --templates-per-file must be at least 1")
+        sys.exit(1)
+    if args.jobs is not None and args.jobs < 1:
+        print("✗ --jobs must be at least 1")
+        sys.exit(1)
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not read baseline {args.compare}: {e}")
+            sys.exit(1)
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size:,} templates...")
+        try:
+            result = run_size(size, args)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"  ✗ {size:,} templates failed: {e}")
+            results.append({'size': size, 'error': str(e)})
+            break
+        results.append(result)
+        print(f"  ✓ {result['totalSeconds']:.2f}s, peak RSS {result['peakRssMB']:.0f} MB")
+
+    report = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpuCount': os.cpu_count(),
+        'jobs': args.jobs,
+        'formats': args.formats,
+        'templatesPerFile': args.templates_per_file,
+        'parserVersion': consolidate.PARSER_VERSION,
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    completed = [result for result in results if 'error' not in result]
+    if completed:
+        print_table(completed)
+    print(f"\nReport written to {args.report}")
+
+    if baseline is not None:
+        report['results'] = completed
+        regressions = compare_reports(report, baseline, args.tolerance)
+        if regressions:
+            for regression in regressions:
+                print(f"✗ {regression}")
+            sys.exit(1)
+        print(f"✓ No regressions against {args.compare}")
+    if len(completed) != len(results):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -2,263 +2,2749 @@
 """
 Script to consolidate all trivia template batch files into a single Dart file.
 Run this script to generate lib/data/trivia_templates_consolidated.dart
+
+Batch files are parsed in parallel and the result for each file is cached
+by content hash, so a re-run only parses the files that changed.
+
+Templates are validated at generation time with the same checks the app
+runs at startup; any error fails the run before anything is written.
+Combination counts and tiered distractor pools are written to
+lib/data/trivia_template_stats.g.dart so release builds can skip that work.
+TriviaGeneratorService's built-in templates (its _initializeTemplates()) are
+checked and precomputed the same way. The file also carries alias tables
+for drawing a theme's templates weighted by combinations in O(1), which
+TriviaGeneratorService uses when setWeightByCombinations is on
+(--check-sampling verifies them).
+
+--shards writes one deferred Dart library per theme group (kids, school,
+cultural, medical, technology, science, general) plus a registry that loads
+each group on first use; the shards are checked against the single file.
+
+Usage:
+    python3 scripts/consolidate_trivia_templates.py
+    python3 scripts/consolidate_trivia_templates.py --jobs 4
+    python3 scripts/consolidate_trivia_templates.py --no-cache
 """
 
-import re
+import argparse
 import glob
+import hashlib
+import json
+import math
 import os
+import random
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+BATCH_DIR = 'lib/data/batch_files'
+BATCH_EXTENSIONS = ['.swift', '.js', '.json', '.dart', '.vb', '.jl']
+OUTPUT_PATH = 'lib/data/trivia_templates_consolidated.dart'
+
+# Parsed templates per batch file, keyed by content hash. Bump
+# PARSER_VERSION whenever the parsed form changes so old entries are ignored.
+CACHE_DIR_NAME = '.template_cache'
+PARSER_VERSION = 2
+
+# Binary bundle (--bundle): string table + per-theme template records,
+# decoded lazily per theme by lib/data/trivia_template_bundle.dart
+BUNDLE_PATH = 'assets/trivia_templates.bin'
+BUNDLE_MAGIC = b'N3TB'
+BUNDLE_VERSION = 2
+BUNDLE_HEADER = struct.Struct('<4sHHII')
+BUNDLE_THEME_ENTRY = struct.Struct('<III')
+
+# Sharded output (--shards): one deferred Dart library per theme group plus
+# a registry that loads a shard the first time one of its themes is used.
+# A theme goes to the first group whose pattern matches its start.
+SHARD_DIR = 'lib/data/trivia_shards'
+SHARD_REGISTRY_NAME = 'registry.g.dart'
+THEME_GROUPS = (
+    ('kids', re.compile(r'kids_')),
+    ('school', re.compile(r'(high_school|middle_school|test_prep)_')),
+    ('cultural', re.compile(r'\w+_culture$|(arts|literature|music|movies|'
+                            r'philosophy|religion)$')),
+    ('medical', re.compile(r'medicine|pharmacology|immunology|biomedical|'
+                           r'psychology|neuro')),
+    ('technology', re.compile(r'technology|nanotechnology|cybersecurity|'
+                              r'data_science|artificial_intelligence|'
+                              r'machine_learning|robotics|cryptocurrency|'
+                              r'quantum_computing|information_theory|'
+                              r'statistical_methods|(aerospace|electrical|'
+                              r'mechanical|materials)_')),
+    ('science', re.compile(r'science|astronomy|weather|environmental|'
+                           r'oceanography|genetics|quantum|space|sustainable|'
+                           r'renewable|bioinformatics|climate|'
+                           r'synthetic_biology|advanced_|computational|'
+                           r'particle|astrophysics|molecular|systems_biology|'
+                           r'protein')),
+)
+DEFAULT_THEME_GROUP = 'general'
+
+# Build-time checks and statistics (see analyze_templates). The generated
+# .g.dart file lets release builds skip the same work at startup.
+STATS_OUTPUT_PATH = 'lib/data/trivia_template_stats.g.dart'
+# TriviaGeneratorService's built-in templates, defined in this method
+BASE_TEMPLATES_PATH = 'lib/services/trivia_generator_service.dart'
+BASE_TEMPLATES_METHOD = '  void _initializeTemplates() {'
+GAME_CONSTANTS_PATH = 'lib/config/game_constants.dart'
+DEFAULT_GAME_CONSTANTS = {
+    'expectedCorrectAnswers': 3,
+    'requiredWordsForGameplay': 6,
+    'maxWordLength': 50,
+    'minTemplateCount': 100,
+    'minCombinations': 20700000,
+}
+# ContentValidationConfig defaults
+MIN_CORRECT_ITEMS = 15
+RECOMMENDED_CORRECT_ITEMS = 20
+MIN_TIER_ITEMS = 3
+RECOMMENDED_TIER_ITEMS = 6
+# Correct-pool items two templates of a theme may share before it's flagged
+MAX_SHARED_CORRECT_ITEMS = 5
+# Near-duplicate detection (find_near_duplicates): MinHash signatures over
+# pattern words and answers, bucketed with LSH so only likely pairs are
+# compared. 16 bands of 4 rows catch pairs from about 0.5 Jaccard up.
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+MINHASH_PRIME = (1 << 61) - 1
+NEAR_DUPLICATE_THRESHOLD = 0.6
+DIFFICULTY_LEVELS = ('easy', 'medium', 'hard')
+DISTRACTOR_TIERS = ('obvious', 'related', 'subtle')
+TIER_CODES = {'obvious': 'o', 'related': 'r', 'subtle': 's'}
+
+# Alias tables for weighted template sampling (see alias_table). Thresholds
+# are integers out of SAMPLING_SCALE so Dart and Python draw identically.
+SAMPLING_SCALE = 1 << 30
+SAMPLING_SAMPLES = 20000
+# Two-sided z for the chi-square check; one false alarm in 10,000 tables
+SAMPLING_CHECK_Z = 3.719
+
+TEMPLATE_CALL = 'TriviaTemplate'
+REQUIRED_FIELDS = ('categoryPattern', 'correctPool', 'distractorPool', 'theme')
+STRING_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f',
+                  'v': '\v'}
+# Characters that end a run of plain text inside each kind of string
+STRING_STOPS = {quote: re.compile(f"[{quote}\\\\\n]") for quote in '"\''}
+
+class ParseError(Exception):
+    """A batch file that isn't valid ``TriviaTemplate(...)`` syntax."""
+
+    def __init__(self, path, line, column, message):
+        super().__init__(f"{path}:{line}:{column}: {message}")
+        self.path = path
+        self.line = line
+        self.column = column
+
+class TemplateParser:
+    """Single-pass parser for the ``TriviaTemplate(...)`` calls in a file.
+
+    Text between calls is skipped with ``str.find``; each call is tokenized
+    once, left to right, so the cost is linear in the file size. Handles
+    single- and double-quoted (and raw) strings with escapes, adjacent
+    string concatenation, comments, ``const`` and type arguments on list
+    and map literals, and enum values such as ``DifficultyLevel.hard``.
+    """
+
+    def __init__(self, text, path='<string>'):
+        self.text = text
+        self.path = path
+        self.pos = 0
+
+    def error(self, message, pos=None):
+        """Build a ParseError pointing at ``pos`` (default: current)."""
+        pos = self.pos if pos is None else pos
+        line = self.text.count('\n', 0, pos) + 1
+        column = pos - (self.text.rfind('\n', 0, pos) + 1) + 1
+        return ParseError(self.path, line, column, message)
+
+    def parse(self):
+        """Return every template in the file, in order."""
+        templates = []
+        text = self.text
+        while True:
+            start = text.find(TEMPLATE_CALL, self.pos)
+            if start < 0:
+                return templates
+            self.pos = start + len(TEMPLATE_CALL)
+            # Skip longer identifiers (MyTriviaTemplate, TriviaTemplates)
+            # and mentions that aren't calls (List<TriviaTemplate>)
+            if start > 0 and self._is_ident_char(text[start - 1]):
+                continue
+            if self.pos < len(text) and self._is_ident_char(text[self.pos]):
+                continue
+            self.skip_space()
+            if not text.startswith('(', self.pos):
+                continue
+            self.pos += 1
+            args = self.parse_arguments()
+            templates.append(self.build_template(args, start))
+
+    def build_template(self, args, start):
+        """Check a call's named arguments and turn them into a template."""
+        missing = [field for field in REQUIRED_FIELDS if field not in args]
+        if missing:
+            raise self.error(f"TriviaTemplate missing {', '.join(missing)}",
+                             start)
+        template = {}
+        for field in REQUIRED_FIELDS:
+            value = args[field]
+            if field.endswith('Pool'):
+                if (not isinstance(value, list) or
+                        not all(isinstance(item, str) for item in value)):
+                    raise self.error(f"{field} must be a list of strings",
+                                     start)
+            elif not isinstance(value, str):
+                raise self.error(f"{field} must be a string", start)
+            template[field] = value
+
+        # Optional fields, kept only when the call sets them
+        if args.get('difficulty') is not None:
+            template['difficulty'] = self.enum_value(
+                args['difficulty'], DIFFICULTY_LEVELS, 'difficulty', start)
+        pools = args.get('distractorPools')
+        if pools is not None:
+            if not isinstance(pools, dict):
+                raise self.error("distractorPools must be a map", start)
+            tiers = {}
+            for key, pool in pools.items():
+                tier = self.enum_value(key, DISTRACTOR_TIERS,
+                                       'distractorPools key', start)
+                if (not isinstance(pool, list) or
+                        not all(isinstance(item, str) for item in pool)):
+                    raise self.error(f"distractorPools {tier} must be a list "
+                                     f"of strings", start)
+                tiers[tier] = pool
+            template['distractorPools'] = {tier: tiers[tier]
+                                           for tier in DISTRACTOR_TIERS
+                                           if tier in tiers}
+        return template
+
+    def enum_value(self, value, allowed, what, start):
+        """Normalize ``DifficultyLevel.hard`` / ``'hard'`` to ``'hard'``."""
+        name = value.rsplit('.', 1)[-1] if isinstance(value, str) else None
+        if name not in allowed:
+            raise self.error(f"{what} must be one of {', '.join(allowed)} "
+                             f"(got {value!r})", start)
+        return name
+
+    def parse_arguments(self):
+        """Parse ``name: value, ...)`` after the opening parenthesis."""
+        args = {}
+        while True:
+            self.skip_space()
+            if self.peek() == ')':
+                self.pos += 1
+                return args
+            name_pos = self.pos
+            name = self.parse_identifier()
+            if name is None:
+                raise self.error("expected a named argument")
+            self.expect(':')
+            if name in args:
+                raise self.error(f"duplicate argument '{name}'", name_pos)
+            args[name] = self.parse_value()
+            self.skip_space()
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != ')':
+                raise self.error("expected ',' or ')'")
+
+    def parse_value(self):
+        """Parse a string, list, map, number or (dotted) identifier."""
+        self.skip_space()
+        self.skip_type_prefix()
+        char = self.peek()
+        if char in ('"', "'") or (char == 'r' and
+                                  self.peek(1) in ('"', "'")):
+            return self.parse_strings()
+        if char == '[':
+            self.pos += 1
+            return self.parse_list()
+        if char == '{':
+            self.pos += 1
+            return self.parse_map()
+        if char.isdigit() or char == '-':
+            return self.parse_number()
+        name = self.parse_identifier(dotted=True)
+        if name is None:
+            if not char:
+                raise self.error("unexpected end of file")
+            raise self.error(f"unexpected character {char!r}")
+        if name in ('true', 'false'):
+            return name == 'true'
+        if name == 'null':
+            return None
+        return name
+
+    def parse_list(self):
+        """Parse list items up to and including the closing ``]``."""
+        items = []
+        while True:
+            self.skip_space()
+            if self.peek() == ']':
+                self.pos += 1
+                return items
+            items.append(self.parse_value())
+            self.skip_space()
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != ']':
+                raise self.error("expected ',' or ']'")
+
+    def parse_map(self):
+        """Parse ``key: value`` pairs up to and including the closing ``}``."""
+        entries = {}
+        while True:
+            self.skip_space()
+            if self.peek() == '}':
+                self.pos += 1
+                return entries
+            key_pos = self.pos
+            key = self.parse_value()
+            if not isinstance(key, str):
+                raise self.error("map keys must be strings or identifiers",
+                                 key_pos)
+            self.expect(':')
+            entries[key] = self.parse_value()
+            self.skip_space()
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != '}':
+                raise self.error("expected ',' or '}'")
+
+    def parse_strings(self):
+        """Parse one or more adjacent string literals (Dart concatenates them)."""
+        parts = [self.parse_string()]
+        while True:
+            self.skip_space()
+            char = self.peek()
+            if char in ('"', "'") or (char == 'r' and
+                                      self.peek(1) in ('"', "'")):
+                parts.append(self.parse_string())
+            else:
+                return ''.join(parts)
+
+    def parse_string(self):
+        """Parse a single quoted string literal, resolving escapes."""
+        text = self.text
+        start = self.pos
+        raw = text[self.pos] == 'r'
+        if raw:
+            self.pos += 1
+        quote = text[self.pos]
+        self.pos += 1
+        chunks = []
+        while True:
+            # Jump straight to the next character that needs attention
+            match = STRING_STOPS[quote].search(text, self.pos)
+            end = match.start() if match else len(text)
+            chunks.append(text[self.pos:end])
+            self.pos = end
+            if not match or text[end] == '\n':
+                raise self.error("unterminated string", start)
+            if text[end] == quote:
+                self.pos += 1
+                return ''.join(chunks)
+            if raw:
+                chunks.append('\\')
+                self.pos += 1
+                continue
+            chunks.append(self.parse_escape())
+
+    def parse_escape(self):
+        """Resolve the escape sequence at the current backslash."""
+        text = self.text
+        start = self.pos
+        char = text[self.pos + 1] if self.pos + 1 < len(text) else ''
+        self.pos += 2
+        if char == 'u':
+            if self.peek() == '{':
+                end = text.find('}', self.pos)
+                digits = text[self.pos + 1:end] if end >= 0 else ''
+                self.pos = end + 1
+            else:
+                digits = text[self.pos:self.pos + 4]
+                self.pos += 4
+            try:
+                return chr(int(digits, 16))
+            except ValueError:
+                raise self.error("invalid unicode escape", start)
+        if char == 'x':
+            digits = text[self.pos:self.pos + 2]
+            self.pos += 2
+            try:
+                return chr(int(digits, 16))
+            except ValueError:
+                raise self.error("invalid hex escape", start)
+        if not char:
+            raise self.error("unterminated string", start)
+        return STRING_ESCAPES.get(char, char)
+
+    def parse_number(self):
+        """Parse an integer or decimal literal."""
+        start = self.pos
+        self.pos += 1
+        while self.peek().isdigit() or self.peek() == '.':
+            self.pos += 1
+        literal = self.text[start:self.pos]
+        try:
+            return float(literal) if '.' in literal else int(literal)
+        except ValueError:
+            raise self.error(f"invalid number {literal!r}", start)
+
+    def parse_identifier(self, dotted=False):
+        """Parse an identifier (``a.b.c`` if dotted), or return None."""
+        text = self.text
+        start = self.pos
+        if start >= len(text) or not (text[start].isalpha() or
+                                      text[start] in '_$'):
+            return None
+        end = start + 1
+        while end < len(text) and (self._is_ident_char(text[end]) or
+                                   (dotted and text[end] == '.')):
+            end += 1
+        self.pos = end
+        return text[start:end]
+
+    def skip_type_prefix(self):
+        """Skip ``const`` and ``<T>`` before a list or map literal."""
+        text = self.text
+        if text.startswith('const', self.pos) and not self._is_ident_char(
+                text[self.pos + 5:self.pos + 6] or ' '):
+            self.pos += 5
+            self.skip_space()
+        if self.peek() == '<':
+            depth = 0
+            while self.pos < len(text):
+                char = text[self.pos]
+                self.pos += 1
+                if char == '<':
+                    depth += 1
+                elif char == '>':
+                    depth -= 1
+                    if depth == 0:
+                        break
+            else:
+                raise self.error("unterminated type arguments")
+            self.skip_space()
+
+    def skip_space(self):
+        """Skip whitespace and ``//`` / ``/* */`` comments."""
+        text = self.text
+        length = len(text)
+        while self.pos < length:
+            char = text[self.pos]
+            if char in ' \t\r\n':
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = length if end < 0 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos + 2)
+                if end < 0:
+                    raise self.error("unterminated comment")
+                self.pos = end + 2
+            else:
+                return
+
+    def expect(self, char):
+        """Consume ``char`` (after optional space) or raise."""
+        self.skip_space()
+        if self.peek() != char:
+            found = repr(self.peek()) if self.peek() else 'end of file'
+            raise self.error(f"expected '{char}', found {found}")
+        self.pos += 1
+
+    def peek(self, offset=0):
+        """Character at the current position (+offset), '' at end of file."""
+        index = self.pos + offset
+        return self.text[index] if index < len(self.text) else ''
+
+    @staticmethod
+    def _is_ident_char(char):
+        return char.isalnum() or char in '_$'
+
+def parse_templates(text, path='<string>'):
+    """Parse every TriviaTemplate(...) call in ``text``."""
+    return TemplateParser(text, path).parse()
 
 def extract_templates_from_file(filepath):
     """Extract all TriviaTemplate objects from a batch file."""
-    with open(filepath, 'r') as f:
+    with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
-    
-    templates = []
-    
-    # Find all TriviaTemplate blocks
-    pattern = r'TriviaTemplate\s*\(\s*categoryPattern:\s*"([^"]+)",\s*correctPool:\s*\[(.*?)\],\s*distractorPool:\s*\[(.*?)\],\s*theme:\s*"([^"]+)"'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
-        category_pattern = match.group(1)
-        correct_pool_str = match.group(2)
-        distractor_pool_str = match.group(3)
-        theme = match.group(4)
-        
-        # Parse arrays
-        correct_pool = [item.strip().strip('"') for item in re.findall(r'"([^"]+)"', correct_pool_str)]
-        distractor_pool = [item.strip().strip('"') for item in re.findall(r'"([^"]+)"', distractor_pool_str)]
-        
-        templates.append({
-            'categoryPattern': category_pattern,
-            'correctPool': correct_pool,
-            'distractorPool': distractor_pool,
-            'theme': theme
-        })
-    
-    return templates
+    return parse_templates(content, filepath)
 
-def generate_dart_file(templates_by_theme, output_path):
-    """Generate the consolidated Dart file."""
-    
-    dart_content = """import '../services/trivia_generator_service.dart';
+def extract_base_templates(path=BASE_TEMPLATES_PATH):
+    """Templates defined in TriviaGeneratorService._initializeTemplates().
+
+    Only that method's body is parsed; the rest of the file mentions
+    ``TriviaTemplate(`` in code that isn't template data. Returns None when
+    the file or method isn't there.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return None
+    start = text.find(BASE_TEMPLATES_METHOD)
+    if start < 0:
+        return None
+    end = text.find('\n  }\n', start)
+    parser = TemplateParser(text[:end if end >= 0 else len(text)], path)
+    parser.pos = start
+    return parser.parse()
+
+def _parse_job(filepath):
+    """Process-pool worker: (path, content hash, templates, error)."""
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        templates = parse_templates(data.decode('utf-8'), filepath)
+        return filepath, digest, templates, None
+    except (ParseError, OSError, UnicodeDecodeError) as e:
+        return filepath, None, None, str(e)
+
+def file_sha256(path):
+    """Hash a file in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_if_changed(path, chunks, buffer_size=1 << 20):
+    """Stream text ``chunks`` to ``path`` without touching unchanged files.
+
+    Chunks go through a buffered writer into ``path + '.tmp'`` while their
+    hash is computed, so memory stays bounded by the buffer. The temp file
+    replaces ``path`` atomically unless ``path`` already has the same
+    content, in which case it is discarded and the file (and its mtime)
+    are left alone. Returns True when ``path`` was written.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = path + '.tmp'
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(temp_path, 'wb', buffering=buffer_size) as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                digest.update(data)
+                size += len(data)
+                f.write(data)
+        if (os.path.isfile(path) and os.path.getsize(path) == size and
+                file_sha256(path) == digest.hexdigest()):
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+class ParseCache:
+    """Parsed templates per batch file, keyed by the file's content hash.
+
+    One JSON file per hash, so only changed batch files are re-parsed and
+    renamed or copied files are still hits.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.seen = set()
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, digest):
+        """Return cached templates for ``digest``, or None."""
+        self.seen.add(digest)
+        try:
+            with open(self._path(digest), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        if entry and entry.get('version') == PARSER_VERSION:
+            self.hits += 1
+            return entry['templates']
+        self.misses += 1
+        return None
+
+    def put(self, digest, templates):
+        """Store templates for ``digest`` atomically."""
+        self.seen.add(digest)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(digest)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PARSER_VERSION, 'templates': templates}, f,
+                      ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def prune(self):
+        """Delete entries not used by this run; returns the count."""
+        removed = 0
+        if not os.path.isdir(self.cache_dir):
+            return removed
+        for name in os.listdir(self.cache_dir):
+            digest, ext = os.path.splitext(name)
+            if ext == '.json' and digest not in self.seen:
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
+
+def find_batch_files(batch_dir=BATCH_DIR):
+    """All Untitled-* batch files in ``batch_dir``, sorted, without duplicates."""
+    # Files without extensions match the bare pattern too
+    patterns = [f"Untitled-*{ext}" for ext in BATCH_EXTENSIONS] + ['Untitled-*']
+    files = []
+    for pattern in patterns:
+        files += glob.glob(os.path.join(batch_dir, pattern))
+    return list(dict.fromkeys(sorted(files)))
+
+def parse_batch_files(files, jobs=None, cache=None):
+    """Parse ``files`` on a process pool, reusing cached results.
+
+    Returns (templates per file in input order, list of error messages).
+    """
+    results = {}
+    pending = []
+    for filepath in files:
+        if cache is not None:
+            try:
+                templates = cache.get(file_sha256(filepath))
+            except OSError:
+                # Unreadable files are reported by the parse job
+                templates = None
+            if templates is not None:
+                results[filepath] = templates
+                continue
+        pending.append(filepath)
+
+    errors = []
+
+    def collect(filepath, digest, templates, error):
+        if error:
+            errors.append(error)
+            return
+        results[filepath] = templates
+        if cache is not None:
+            cache.put(digest, templates)
+
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+    if workers == 1:
+        for filepath in pending:
+            collect(*_parse_job(filepath))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_parse_job, filepath)
+                       for filepath in pending]
+            for future in as_completed(futures):
+                collect(*future.result())
+
+    ordered = [results[filepath] for filepath in files
+               if results.get(filepath) is not None]
+    return ordered, sorted(errors)
+
+def group_by_theme(parsed_files):
+    """Group templates by theme, keeping file order within each theme."""
+    templates_by_theme = {}
+    for templates in parsed_files:
+        for template in templates:
+            templates_by_theme.setdefault(template['theme'], []).append(template)
+    return templates_by_theme
+
+def dart_string(value, quote=None):
+    """Quote ``value`` as a Dart string literal.
+
+    Single quotes by default (``prefer_single_quotes``); double quotes when
+    that avoids escaping an apostrophe.
+    """
+    if quote is None:
+        quote = '"' if "'" in value and '"' not in value else "'"
+    escaped = (value.replace('\\', '\\\\').replace(quote, '\\' + quote)
+               .replace('$', '\\$').replace('\n', '\\n'))
+    return f'{quote}{escaped}{quote}'
+
+# Edition ID -> themes it draws templates from. Every theme must exist in
+# the parsed corpus (see check_editions); the generated stats file carries
+# the checked mapping and per-edition counts to the app.
+EDITION_THEMES = {
+    # Geography editions
+    'geography': ['geography'],
+    'usa_geography': ['geography'],
+    'world_capitals': ['geography'],
+    'mountains_rivers': ['geography'],
+    'islands': ['geography'],
+    'national_parks': ['geography'],
+    'cities': ['geography'],
+    'oceans': ['geography'],
+
+    # History editions
+    'history': ['history'],
+
+    # Science editions
+    'biology': ['science'],
+    'chemistry': ['science'],
+    'physics': ['science'],
+    'geology': ['science'],
+    'environmental_science': ['science'],
+    'marine_biology': ['science'],
+    'microbiology': ['science'],
+    'genetics': ['science'],
+    'neuroscience': ['science'],
+    'astronomy': ['astronomy'],
+    'meteorology': ['weather'],
+    'oceanography': ['science'],
+    'botany': ['science'],
+    'zoology': ['science'],
+    'paleontology': ['science'],
+
+    # Medical editions
+    'nursing': ['medicine'],
+    'medicine': ['medicine'],
+    'anatomy': ['medicine'],
+    'surgery': ['medicine'],
+    'emergency_medicine': ['medicine'],
+    'mental_health': ['medicine'],
+    'veterinary': ['medicine'],
+    'public_health': ['medicine'],
+    'pharmacy': ['medicine'],
+    'dentistry': ['medicine'],
+
+    # Cultural editions
+    'black': ['black_culture'],
+    'latino': ['latino_culture'],
+    'spanish': ['latino_culture'],
+    'asian': ['asian_american_culture'],
+    'indigenous': ['indigenous_culture'],
+    'caribbean': ['caribbean_culture'],
+    'middle_eastern': ['middle_eastern_culture'],
+    'african': ['african_culture'],
+
+    # Professional editions
+    'business': ['business'],
+    'finance': ['business', 'economics'],
+    'law': ['business'],
+    'engineering': ['business'],
+    'computer_science': ['technology'],
+    'marketing': ['business'],
+    'real_estate': ['business'],
+    'agriculture': ['agriculture'],
+    'aviation': ['aviation'],
+    'military': ['military'],
+
+    # Arts & Entertainment
+    'music': ['arts'],
+    'movies': ['arts'],
+    'tv': ['arts'],
+    'art': ['arts'],
+    'literature': ['literature'],
+    'theater': ['arts'],
+    'dance': ['arts'],
+    'photography': ['arts'],
+    'fashion': ['arts'],
+    'architecture': ['arts'],
+    'video_games': ['arts'],
+    'anime_manga': ['arts'],
+    'comics': ['arts'],
+    'classical_music': ['arts'],
+    'hip_hop': ['arts'],
+
+    # Sports
+    'sports_general': ['sports'],
+    'football': ['sports'],
+    'basketball': ['sports'],
+    'baseball': ['sports'],
+    'soccer': ['sports'],
+    'olympics': ['sports'],
+    'fitness': ['sports'],
+    'extreme_sports': ['sports'],
+
+    # Specialty
+    'religion': ['religion'],
+    'mythology': ['religion'],
+    'philosophy': ['philosophy'],
+    'technology': ['technology'],
+    'nature_wildlife': ['science'],
+    'space_exploration': ['astronomy'],
+
+    # Kids editions
+    'little_n3rd': [
+      'kids_animals',
+      'kids_colors',
+      'kids_shapes',
+      'kids_time',
+      'kids_food',
+      'kids_body',
+      'kids_weather',
+      'kids_sky',
+      'kids_house',
+      'kids_numbers',
+    ],
+    'junior_n3rd': [
+      'kids_space',
+      'kids_dinosaurs',
+      'kids_plants',
+      'kids_geography',
+      'kids_science',
+      'kids_weather_advanced',
+      'kids_math',
+      'kids_earth_science',
+      'kids_geology',
+      'kids_machines',
+    ],
+    'elementary_n3rd': [
+      'kids_civics',
+      'kids_us_government',
+      'kids_geology_advanced',
+      'kids_ecosystems',
+      'kids_water_cycle',
+      'kids_energy',
+      'kids_biology',
+      'kids_ancient_history',
+      'kids_grammar',
+      'kids_moon_phases',
+    ],
+    'middle_school_n3rd': [
+      'middle_school_chemistry',
+      'middle_school_physics',
+      'middle_school_literature',
+      'middle_school_geometry',
+      'middle_school_ecology',
+      'middle_school_civics',
+      'middle_school_cell_division',
+      'middle_school_plate_tectonics',
+      'middle_school_art_history',
+      'middle_school_economics',
+    ],
+    'high_school_n3rd': [
+      'high_school_literature',
+      'high_school_american_literature',
+      'high_school_physics',
+      'high_school_chemistry',
+      'high_school_history',
+      'high_school_calculus',
+      'high_school_biology',
+      'high_school_economics',
+      'high_school_rhetoric',
+      'high_school_government',
+    ],
+    'college_prep_n3rd': [
+      'test_prep_vocabulary',
+      'test_prep_logic',
+      'test_prep_algebra',
+      'test_prep_literature',
+      'test_prep_chemistry',
+      'test_prep_scientific_method',
+      'test_prep_geometry',
+      'test_prep_writing',
+      'test_prep_statistics',
+      'test_prep_world_history',
+    ],
+
+    # NEW PREMIUM EDITIONS (25-30+ editions)
+    'premium_psychology': [
+      'psychology_mental_health',
+      'neuroscience_brain_science',
+    ],
+    'premium_environmental': [
+      'environmental_science',
+      'oceanography_marine_science',
+    ],
+    'premium_genetics': ['genetics_biotechnology'],
+    'premium_cybersecurity': ['cybersecurity_digital_privacy'],
+    'premium_data_science': [
+      'data_science_analytics',
+      'artificial_intelligence_ml',
+    ],
+    'premium_quantum': ['quantum_physics'],
+    'premium_advanced_science': [
+      'quantum_physics',
+      'neuroscience_brain_science',
+      'genetics_biotechnology',
+    ],
+    'premium_tech_stack': [
+      'cybersecurity_digital_privacy',
+      'data_science_analytics',
+      'artificial_intelligence_ml',
+    ],
+    'premium_mental_wellness': ['psychology_mental_health'],
+    'premium_earth_sciences': [
+      'environmental_science',
+      'oceanography_marine_science',
+    ],
+    'premium_space': ['space_exploration_astronautics'],
+    'premium_energy': ['sustainable_energy_renewables'],
+    'premium_nanotech': ['nanotechnology_materials_science'],
+    'premium_advanced_tech': [
+      'nanotechnology_materials_science',
+      'quantum_physics',
+      'artificial_intelligence_ml',
+    ],
+    'premium_complete_science': [
+      'psychology_mental_health',
+      'neuroscience_brain_science',
+      'environmental_science',
+      'oceanography_marine_science',
+      'genetics_biotechnology',
+      'quantum_physics',
+      'space_exploration_astronautics',
+      'nanotechnology_materials_science',
+    ],
+    'premium_complete_tech': [
+      'cybersecurity_digital_privacy',
+      'data_science_analytics',
+      'artificial_intelligence_ml',
+      'nanotechnology_materials_science',
+    ],
+    'premium_sustainability': [
+      'environmental_science',
+      'sustainable_energy_renewables',
+      'oceanography_marine_science',
+    ],
+    'premium_health_sciences': [
+      'psychology_mental_health',
+      'neuroscience_brain_science',
+      'genetics_biotechnology',
+    ],
+    'premium_data_ai': [
+      'data_science_analytics',
+      'artificial_intelligence_ml',
+      'cybersecurity_digital_privacy',
+    ],
+    'premium_quantum_nano': [
+      'quantum_physics',
+      'nanotechnology_materials_science',
+    ],
+    'premium_space_earth': [
+      'space_exploration_astronautics',
+      'oceanography_marine_science',
+      'environmental_science',
+    ],
+    'premium_all_premium': [
+      'psychology_mental_health',
+      'neuroscience_brain_science',
+      'environmental_science',
+      'oceanography_marine_science',
+      'genetics_biotechnology',
+      'cybersecurity_digital_privacy',
+      'data_science_analytics',
+      'artificial_intelligence_ml',
+      'quantum_physics',
+      'space_exploration_astronautics',
+      'sustainable_energy_renewables',
+      'nanotechnology_materials_science',
+    ],
+    # NEW PREMIUM EDITIONS FOR ADVANCED THEMES (18 new themes + 6 combined)
+    'premium_biomedical': ['biomedical_engineering'],
+    'premium_neuroengineering': ['neuroengineering_brain_computer_interface'],
+    'premium_synthetic_biology': ['synthetic_biology_bioengineering'],
+    'premium_quantum_computing': ['quantum_computing_algorithms'],
+    'premium_advanced_math': ['advanced_mathematics_topology'],
+    'premium_computational_chemistry': ['computational_chemistry'],
+    'premium_particle_physics': ['particle_physics_high_energy'],
+    'premium_astrophysics': ['astrophysics_cosmology'],
+    'premium_theoretical_physics': ['advanced_physics_theoretical'],
+    'premium_molecular_biology': ['molecular_biology_genetics'],
+    'premium_systems_biology': ['systems_biology_networks'],
+    'premium_protein_engineering': ['protein_engineering_design'],
+    'premium_organic_chemistry': ['advanced_chemistry_organic'],
+    'premium_electrical_engineering': ['electrical_engineering_circuits'],
+    'premium_mechanical_engineering': ['mechanical_engineering_design'],
+    'premium_statistics': ['statistical_methods_data_analysis'],
+    'premium_information_theory': ['information_theory_compression'],
+    'premium_machine_learning': ['machine_learning_neural_networks'],
+    # Combined premium editions
+    'premium_advanced_engineering': [
+      'biomedical_engineering',
+      'electrical_engineering_circuits',
+      'mechanical_engineering_design',
+      'neuroengineering_brain_computer_interface',
+    ],
+    'premium_advanced_biology': [
+      'biomedical_engineering',
+      'molecular_biology_genetics',
+      'synthetic_biology_bioengineering',
+      'systems_biology_networks',
+      'protein_engineering_design',
+    ],
+    'premium_advanced_physics': [
+      'particle_physics_high_energy',
+      'astrophysics_cosmology',
+      'advanced_physics_theoretical',
+      'quantum_computing_algorithms',
+    ],
+    'premium_advanced_chemistry': [
+      'computational_chemistry',
+      'advanced_chemistry_organic',
+    ],
+    'premium_computational_sciences': [
+      'quantum_computing_algorithms',
+      'computational_chemistry',
+      'statistical_methods_data_analysis',
+      'information_theory_compression',
+      'machine_learning_neural_networks',
+    ],
+    'premium_complete_advanced': [
+      'biomedical_engineering',
+      'neuroengineering_brain_computer_interface',
+      'synthetic_biology_bioengineering',
+      'quantum_computing_algorithms',
+      'advanced_mathematics_topology',
+      'computational_chemistry',
+      'particle_physics_high_energy',
+      'astrophysics_cosmology',
+      'advanced_physics_theoretical',
+      'molecular_biology_genetics',
+      'systems_biology_networks',
+      'protein_engineering_design',
+      'advanced_chemistry_organic',
+      'electrical_engineering_circuits',
+      'mechanical_engineering_design',
+      'statistical_methods_data_analysis',
+      'information_theory_compression',
+      'machine_learning_neural_networks',
+    ],
+}
+
+# Dropped from DART_HEADER when no template sets a difficulty or tiers
+DIFFICULTY_IMPORT = "import 'package:n3rd_game/models/difficulty_level.dart';\n"
+
+# Hand-maintained parts of the generated Dart file; templates go in between
+DART_HEADER = r'''import 'package:flutter/foundation.dart';
+import 'package:n3rd_game/services/trivia_generator_service.dart';
+import 'package:n3rd_game/exceptions/app_exceptions.dart';
+import 'package:n3rd_game/config/game_constants.dart';
+import 'package:n3rd_game/services/logger_service.dart';
+import 'package:n3rd_game/models/difficulty_level.dart';
+import 'package:n3rd_game/data/trivia_template_stats.g.dart';
+import 'package:n3rd_game/services/trivia/precomputed_template_stats.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
 
 /// Consolidated trivia templates from all batch files
 /// This file is auto-generated - do not edit manually
+///
+/// **Template Architecture:**
+/// - This class provides edition-specific trivia templates (Cultural, Medical, Science, etc.)
+/// - Templates are initialized via `initialize()` which should be called early in app startup
+/// - Initialization is idempotent (safe to call multiple times - will return early if already initialized)
+/// - Templates can be added to `TriviaGeneratorService` via `addTemplates()` method
+/// - This complements the base templates in `TriviaGeneratorService._initializeTemplates()`
+/// - Validation, combination counts and tiered distractors are precomputed by the
+///   generator (`TriviaTemplateStats`); release builds skip the startup checks
+///   while the loaded templates still match those stats
+///
+/// **Usage:**
+/// - Call `initialize()` in `main.dart` before the app runs
+/// - Access templates via `getTemplatesForEdition(editionId)` for specific editions
+/// - Use `EditionContentService` for high-level edition content management
 class EditionTriviaTemplates {
   static final Map<String, List<TriviaTemplate>> _templatesByTheme = {};
-  static final Map<String, List<String>> _editionThemeMapping = {};
+  static Map<String, List<String>> _editionThemeMapping = {};
+  static final Map<String, List<TriviaTemplate>> _templatesByEdition = {};
+  static bool _isInitialized = false;
+  static bool _isPrechecked = false;
+  static String? _lastValidationError;
+  static Duration? _lastInitializationDuration; // For performance tracking
+  static int _lastInitializationTemplateCount = 0; // For performance tracking
+  static int _lastInitializationRetryCount = 0; // For performance tracking
+
+  /// Check if templates are initialized and ready
+  static bool get isInitialized => _isInitialized;
+
+  /// Whether the loaded templates are the ones the generator validated
+  ///
+  /// True when every theme's content hash matches [TriviaTemplateStats].
+  /// Prechecked templates can skip validation and enhancement at runtime.
+  static bool get isPrechecked => _isInitialized && _isPrechecked;
+
+  /// Get last validation error (if any)
+  static String? get lastValidationError => _lastValidationError;
+
+  /// Get last initialization duration (for performance tracking)
+  static Duration? get lastInitializationDuration =>
+      _lastInitializationDuration;
+
+  /// Get last initialization template count (for performance tracking)
+  static int get lastInitializationTemplateCount =>
+      _lastInitializationTemplateCount;
+
+  /// Get last initialization retry count (for performance tracking)
+  static int get lastInitializationRetryCount => _lastInitializationRetryCount;
+
+  /// Initialize trivia templates with async retry mechanism
+  ///
+  /// **Future-proofing:** Made async to support potential network-based template loading
+  /// Currently loads from code, but async design allows for future enhancements
+  ///
+  /// **Performance:** Includes retry logic with exponential backoff for reliability
+  static Future<void> initialize({int maxRetries = 3}) async {
+    // Prevent redundant initialization
+    if (_isInitialized) {
+      if (kDebugMode) {
+        debugPrint('✓ Trivia templates already initialized');
+      }
+      return;
+    }
+
+    // Retry mechanism for template initialization
+    // This handles transient errors and improves reliability
+    int attempt = 0;
+    Exception? lastException;
+    final initStartTime = DateTime.now();
+
+    while (attempt < maxRetries && !_isInitialized) {
+      attempt++;
+      try {
+        if (kDebugMode && attempt > 1) {
+          debugPrint(
+            'Retrying trivia template initialization (attempt $attempt/$maxRetries)...',
+          );
+        }
+
+        _loadAllTemplates();
+        _isPrechecked = _applyPrecomputedStats();
+        // The generator already ran these checks on exactly these templates,
+        // so release builds skip the startup pass
+        if (!kReleaseMode || !_isPrechecked) {
+          _validateTemplates();
+        }
+        _mapEditionsToThemes();
+        _isInitialized = true;
+        _lastValidationError = null;
+
+        final initDuration = DateTime.now().difference(initStartTime);
+
+        // Calculate template count for performance tracking (used by AnalyticsService)
+        int templateCount = 0;
+        try {
+          final themes = getAvailableThemes();
+          for (final theme in themes) {
+            templateCount += getTemplatesForTheme(theme).length;
+          }
+        } catch (e) {
+          // If counting fails, continue without count
+          if (kDebugMode) {
+            debugPrint(
+              'Failed to count templates for performance tracking: $e',
+            );
+          }
+        }
+
+        // Store performance metrics for AnalyticsService to track
+        _lastInitializationDuration = initDuration;
+        _lastInitializationTemplateCount = templateCount;
+        _lastInitializationRetryCount = attempt;
+
+        if (kDebugMode) {
+          if (attempt > 1) {
+            debugPrint(
+              '✓ Trivia templates initialized successfully on attempt $attempt (${initDuration.inMilliseconds}ms, $templateCount templates)',
+            );
+          } else {
+            debugPrint(
+              '✓ Trivia templates initialized successfully (${initDuration.inMilliseconds}ms, $templateCount templates)',
+            );
+          }
+        }
+
+        // Analytics tracking for initialization is handled separately
+        // (can't import analytics service here to avoid circular dependencies)
+        // Performance tracking will be done by AnalyticsService after initialization
+
+        return; // Success - exit retry loop
+      } catch (e) {
+        lastException = e is Exception ? e : Exception(e.toString());
+        _isInitialized = false;
+        _lastValidationError = e.toString();
+
+        if (kDebugMode) {
+          debugPrint(
+            '❌ Error initializing trivia templates (attempt $attempt/$maxRetries): $e',
+          );
+        }
+
+        // If not the last attempt, clear state and retry with exponential backoff
+        if (attempt < maxRetries) {
+          // Clear any partial state before retry
+          _templatesByTheme.clear();
+          _editionThemeMapping.clear();
+          _templatesByEdition.clear();
+
+          // Exponential backoff: 100ms, 200ms, 400ms, etc.
+          await Future.delayed(
+            Duration(milliseconds: 100 * (1 << (attempt - 1))),
+          );
+        }
+      }
+    }
+
+    // All retries exhausted
+    final initDuration = DateTime.now().difference(initStartTime);
+    LoggerService.error(
+      'Failed to initialize trivia templates after $maxRetries attempts (${initDuration.inMilliseconds}ms)',
+      error: lastException,
+      stack: lastException != null ? StackTrace.current : null,
+    );
+
+    // Analytics tracking for initialization failure is handled separately
+    // (can't import analytics service here to avoid circular dependencies)
+    // Performance tracking will be done by AnalyticsService after initialization
+    // Continue with empty templates - app won't crash but trivia generation may fail
+    // TriviaGeneratorService will handle this by throwing an error if templates are empty
+
+    // Re-throw last exception if all retries failed
+    if (lastException != null && !_isInitialized) {
+      throw lastException;
+    }
+  }
+
+  /// Validate templates for duplicates and overlaps
+  /// Also checks for template diversity across themes
+  static void _validateTemplates() {
+    final allTemplates =
+        _templatesByTheme.values.expand((list) => list).toList();
+
+    // Check template diversity across themes
+    final themeCounts = <String, int>{};
+    for (final entry in _templatesByTheme.entries) {
+      themeCounts[entry.key] = entry.value.length;
+    }
+
+    if (themeCounts.isNotEmpty) {
+      final minCount = themeCounts.values.reduce((a, b) => a < b ? a : b);
+      final maxCount = themeCounts.values.reduce((a, b) => a > b ? a : b);
+      final diversityRatio = minCount / maxCount;
+
+      // Warn if diversity is poor (one theme has 10x more templates than another)
+      if (diversityRatio < 0.1 && maxCount > 10) {
+        if (kDebugMode) {
+          debugPrint(
+            '⚠️ Warning: Poor template diversity detected. Ratio: $diversityRatio (min: $minCount, max: $maxCount)',
+          );
+          debugPrint(
+            '   Consider balancing templates across themes for better content distribution.',
+          );
+        }
+      }
+    }
+
+    for (final template in allTemplates) {
+      // CRITICAL: Validate words contain at least one alphanumeric character
+      // This prevents special-character-only words from passing validation
+      final alphanumericRegex = RegExp(r'[a-zA-Z0-9]');
+      final invalidWords = <String>[];
+
+      // Check correctPool for valid alphanumeric content
+      for (final word in template.correctPool) {
+        final trimmed = word.trim();
+        if (trimmed.isNotEmpty && !alphanumericRegex.hasMatch(trimmed)) {
+          invalidWords.add('correctPool: "$word"');
+        }
+        // CRITICAL: Validate word length to prevent UI overflow issues
+        if (trimmed.length > GameConstants.maxWordLength) {
+          invalidWords.add(
+            'correctPool: "$word" (exceeds max length of ${GameConstants.maxWordLength} characters)',
+          );
+        }
+      }
+
+      // Check distractorPool for valid alphanumeric content
+      for (final word in template.distractorPool) {
+        final trimmed = word.trim();
+        if (trimmed.isNotEmpty && !alphanumericRegex.hasMatch(trimmed)) {
+          invalidWords.add('distractorPool: "$word"');
+        }
+        // CRITICAL: Validate word length to prevent UI overflow issues
+        if (trimmed.length > GameConstants.maxWordLength) {
+          invalidWords.add(
+            'distractorPool: "$word" (exceeds max length of ${GameConstants.maxWordLength} characters)',
+          );
+        }
+      }
+
+      if (invalidWords.isNotEmpty) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" contains invalid words: ${invalidWords.join(", ")}',
+        );
+      }
+
+      // Check for overlaps between correctPool and distractorPool (case-insensitive)
+      final correctLower = template.correctPool
+          .map((w) => w.trim().toLowerCase())
+          .where((w) => w.isNotEmpty && alphanumericRegex.hasMatch(w))
+          .toSet();
+      final distractorLower = template.distractorPool
+          .map((w) => w.trim().toLowerCase())
+          .where((w) => w.isNotEmpty && alphanumericRegex.hasMatch(w))
+          .toSet();
+
+      final overlap = correctLower.intersection(distractorLower);
+      if (overlap.isNotEmpty) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has overlapping items between correctPool and distractorPool: $overlap',
+        );
+      }
 
-  static void initialize() {
-    _loadAllTemplates();
-    _mapEditionsToThemes();
+      // Check for duplicates within correctPool
+      if (template.correctPool.length != correctLower.length) {
+        final duplicates = <String>[];
+        final seen = <String>{};
+        for (final item in template.correctPool) {
+          final normalized = item.trim().toLowerCase();
+          if (normalized.isNotEmpty && !seen.add(normalized)) {
+            duplicates.add(item);
+          }
+        }
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has duplicate items in correctPool: $duplicates',
+        );
+      }
+
+      // Check for duplicates within distractorPool
+      if (template.distractorPool.length != distractorLower.length) {
+        final duplicates = <String>[];
+        final seen = <String>{};
+        for (final item in template.distractorPool) {
+          final normalized = item.trim().toLowerCase();
+          if (normalized.isNotEmpty && !seen.add(normalized)) {
+            duplicates.add(item);
+          }
+        }
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has duplicate items in distractorPool: $duplicates',
+        );
+      }
+
+      // Validate minimum pool sizes
+      if (correctLower.length < GameConstants.expectedCorrectAnswers) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has insufficient correctPool items: ${correctLower.length} (minimum ${GameConstants.expectedCorrectAnswers} required)',
+        );
+      }
+
+      if (distractorLower.length < GameConstants.expectedCorrectAnswers) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has insufficient distractorPool items: ${distractorLower.length} (minimum ${GameConstants.expectedCorrectAnswers} required)',
+        );
+      }
+
+      // CRITICAL: Validate that template can generate exactly 6 unique words
+      // After removing overlaps, we need at least 6 unique items total (3 correct + 3 distractors)
+      // NOTE: Template validation checks "at least 6" because _selectRandom() in TriviaGeneratorService
+      // guarantees exactly 3 correct + 3 distractors are selected. This validation ensures there are
+      // enough unique items available to select from, while the selection logic guarantees exactly 6.
+      final uniqueCount =
+          correctLower.length + distractorLower.length - overlap.length;
+      if (uniqueCount < GameConstants.requiredWordsForGameplay) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" cannot generate exactly ${GameConstants.requiredWordsForGameplay} unique words. '
+          'Unique count after removing overlaps: $uniqueCount (need at least ${GameConstants.requiredWordsForGameplay}). '
+          'Correct pool: ${correctLower.length}, Distractor pool: ${distractorLower.length}, Overlaps: ${overlap.length}',
+        );
+      }
+
+      // Additional validation: Ensure we can always get exactly 3 unique distractors
+      // (assuming we always use all 3 correct answers)
+      // NOTE: _selectRandom() guarantees exactly 3 distractors are selected, but we need at least 3 available
+      final availableDistractors = distractorLower.length - overlap.length;
+      if (availableDistractors < GameConstants.expectedCorrectAnswers) {
+        throw ValidationException(
+          'Template "${template.categoryPattern}" has insufficient unique distractors after removing overlaps. '
+          'Available unique distractors: $availableDistractors (need at least ${GameConstants.expectedCorrectAnswers}). '
+          'Total distractors: ${distractorLower.length}, Overlaps: ${overlap.length}',
+        );
+      }
+    }
+
+    if (kDebugMode) {
+      debugPrint(
+        '✓ Trivia templates validated successfully (${allTemplates.length} templates)',
+      );
+    }
   }
 
   static void _loadAllTemplates() {
-"""
-    
-    # Add templates by theme
-    for theme, templates in sorted(templates_by_theme.items()):
-        dart_content += f'\n    // {theme.upper()} ({len(templates)} templates)\n'
-        dart_content += f'    _addTemplates("{theme}", [\n'
-        
-        for template in templates:
-            # Format correct pool
-            correct_pool_str = ',\n        '.join([f'"{item}"' for item in template['correctPool']])
-            if len(correct_pool_str) > 100:
-                correct_pool_str = ',\n        '.join([f'"{item}"' for item in template['correctPool']])
-            
-            # Format distractor pool
-            distractor_pool_str = ',\n        '.join([f'"{item}"' for item in template['distractorPool']])
-            
-            dart_content += f'''      TriviaTemplate(
-        categoryPattern: "{template['categoryPattern']}",
-        correctPool: [
-          {correct_pool_str}
-        ],
-        distractorPool: [
-          {distractor_pool_str}
-        ],
-        theme: "{template['theme']}",
-      ),
 '''
-        
-        dart_content += '    ]);\n'
-    
-    dart_content += """  }
+
+DART_FOOTER = r'''  }
 
   static void _addTemplates(String theme, List<TriviaTemplate> templates) {
     _templatesByTheme.putIfAbsent(theme, () => []).addAll(templates);
   }
 
+  /// Attach precomputed tiers to each theme whose content still matches
+  /// [TriviaTemplateStats.themeContentHashes]
+  ///
+  /// Themes edited since the stats were generated keep their plain pools.
+  /// Returns whether every theme matched, i.e. the generator checked
+  /// exactly these templates.
+  static bool _applyPrecomputedStats() {
+    final hashes = TriviaTemplateStats.themeContentHashes;
+    bool allMatch = hashes.length == _templatesByTheme.length;
+    for (final entry in _templatesByTheme.entries) {
+      final templates = entry.value;
+      final tiers = TriviaTemplateStats.distractorTiers[entry.key];
+      if (tiers == null ||
+          tiers.length != templates.length ||
+          hashes[entry.key] != PrecomputedTemplateStats.contentHash(templates)) {
+        allMatch = false;
+        continue;
+      }
+      for (int i = 0; i < templates.length; i++) {
+        templates[i] =
+            PrecomputedTemplateStats.withTiers(templates[i], tiers[i]);
+      }
+    }
+    return allMatch;
+  }
+
   static void _mapEditionsToThemes() {
-    // Map edition IDs to their corresponding themes
-    _editionThemeMapping = {
-      // Geography editions
-      'geography': ['geography'],
-      'usa_geography': ['geography'],
-      'world_capitals': ['geography'],
-      'mountains_rivers': ['geography'],
-      'islands': ['geography'],
-      'national_parks': ['geography'],
-      'cities': ['geography'],
-      'oceans': ['geography'],
-      
-      // History editions
-      'history': ['history'],
-      
-      // Science editions
-      'biology': ['science'],
-      'chemistry': ['science'],
-      'physics': ['science'],
-      'geology': ['science'],
-      'environmental_science': ['science'],
-      'marine_biology': ['science'],
-      'microbiology': ['science'],
-      'genetics': ['science'],
-      'neuroscience': ['science'],
-      'astronomy': ['astronomy'],
-      'meteorology': ['weather'],
-      'oceanography': ['science'],
-      'botany': ['science'],
-      'zoology': ['science'],
-      'paleontology': ['science'],
-      
-      // Medical editions
-      'nursing': ['medicine'],
-      'medicine': ['medicine'],
-      'anatomy': ['medicine'],
-      'surgery': ['medicine'],
-      'emergency_medicine': ['medicine'],
-      'mental_health': ['medicine'],
-      'veterinary': ['medicine'],
-      'public_health': ['medicine'],
-      'pharmacy': ['medicine'],
-      'dentistry': ['medicine'],
-      
-      // Cultural editions
-      'black': ['black_culture'],
-      'latino': ['latino_culture'],
-      'spanish': ['latino_culture'],
-      'asian': ['asian_american_culture'],
-      'indigenous': ['indigenous_culture'],
-      'caribbean': ['caribbean_culture'],
-      'middle_eastern': ['middle_eastern_culture'],
-      'african': ['african_culture'],
-      
-      // Professional editions
-      'business': ['business'],
-      'finance': ['business', 'economics'],
-      'law': ['business'],
-      'engineering': ['business'],
-      'computer_science': ['technology'],
-      'marketing': ['business'],
-      'real_estate': ['business'],
-      'agriculture': ['agriculture'],
-      'aviation': ['aviation'],
-      'military': ['military'],
-      
-      // Arts & Entertainment
-      'music': ['arts'],
-      'movies': ['arts'],
-      'tv': ['arts'],
-      'art': ['arts'],
-      'literature': ['literature'],
-      'theater': ['arts'],
-      'dance': ['arts'],
-      'photography': ['arts'],
-      'fashion': ['arts'],
-      'architecture': ['arts'],
-      'video_games': ['arts'],
-      'anime_manga': ['arts'],
-      'comics': ['arts'],
-      'classical_music': ['arts'],
-      'hip_hop': ['arts'],
-      
-      // Sports
-      'sports_general': ['sports'],
-      'football': ['sports'],
-      'basketball': ['sports'],
-      'baseball': ['sports'],
-      'soccer': ['sports'],
-      'olympics': ['sports'],
-      'fitness': ['sports'],
-      'extreme_sports': ['sports'],
-      
-      // Food & Lifestyle
-      'food': ['food'],
-      'wine': ['food'],
-      'beer': ['food'],
-      'coffee': ['food'],
-      'cooking': ['food'],
-      'baking': ['food'],
-      
-      // Specialty
-      'religion': ['religion'],
-      'mythology': ['religion'],
-      'philosophy': ['philosophy'],
-      'technology': ['technology'],
-      'nature_wildlife': ['science'],
-      'space_exploration': ['astronomy'],
-      
-      // Kids editions
-      'little_n3rd': ['kids_animals', 'kids_colors', 'kids_shapes', 'kids_time', 'kids_food', 'kids_body', 'kids_weather', 'kids_sky', 'kids_house', 'kids_numbers'],
-      'junior_n3rd': ['kids_space', 'kids_dinosaurs', 'kids_plants', 'kids_geography', 'kids_science', 'kids_weather_advanced', 'kids_math', 'kids_earth_science', 'kids_geology', 'kids_machines'],
-      'elementary_n3rd': ['kids_civics', 'kids_us_government', 'kids_geology_advanced', 'kids_ecosystems', 'kids_water_cycle', 'kids_energy', 'kids_biology', 'kids_ancient_history', 'kids_grammar', 'kids_moon_phases'],
-      'middle_school_n3rd': ['middle_school_chemistry', 'middle_school_physics', 'middle_school_literature', 'middle_school_geometry', 'middle_school_ecology', 'middle_school_civics', 'middle_school_cell_division', 'middle_school_plate_tectonics', 'middle_school_art_history', 'middle_school_economics'],
-      'high_school_n3rd': ['high_school_literature', 'high_school_american_literature', 'high_school_physics', 'high_school_chemistry', 'high_school_history', 'high_school_calculus', 'high_school_biology', 'high_school_economics', 'high_school_rhetoric', 'high_school_government'],
-      'college_prep_n3rd': ['test_prep_vocabulary', 'test_prep_logic', 'test_prep_algebra', 'test_prep_literature', 'test_prep_chemistry', 'test_prep_scientific_method', 'test_prep_geometry', 'test_prep_writing', 'test_prep_statistics', 'test_prep_world_history'],
-    };
+    // Map edition IDs to their corresponding themes. The mapping lives in
+    // the generator, which checks every theme exists before writing it.
+    _editionThemeMapping = Map.of(TriviaTemplateStats.editionThemes);
+
+    // Flatten each edition's templates once so lookups don't allocate
+    _templatesByEdition.clear();
+    for (final entry in _editionThemeMapping.entries) {
+      _templatesByEdition[entry.key] = List<TriviaTemplate>.unmodifiable(
+        entry.value.expand<TriviaTemplate>(
+          (theme) => _templatesByTheme[theme] ?? const [],
+        ),
+      );
+    }
+
+    if (kDebugMode && _isPrechecked) {
+      for (final entry in TriviaTemplateStats.editionTemplateCounts.entries) {
+        assert(
+          _templatesByEdition[entry.key]?.length == entry.value,
+          'Edition ${entry.key} has ${_templatesByEdition[entry.key]?.length} templates, expected ${entry.value}',
+        );
+      }
+    }
   }
 
   /// Get trivia templates for a specific edition
+  ///
+  /// Returns a shared, unmodifiable list built at initialization.
   static List<TriviaTemplate> getTemplatesForEdition(String editionId) {
-    final themes = _editionThemeMapping[editionId] ?? [];
-    final templates = <TriviaTemplate>[];
-    for (final theme in themes) {
-      templates.addAll(_templatesByTheme[theme] ?? []);
-    }
-    return templates;
+    return _templatesByEdition[editionId] ?? const [];
+  }
+
+  /// Get trivia templates for a specific theme
+  static List<TriviaTemplate> getTemplatesForTheme(String theme) {
+    return _templatesByTheme[theme] ?? [];
   }
 
   /// Get all available themes
   static List<String> getAvailableThemes() {
     return _templatesByTheme.keys.toList();
   }
+
+  /// Precomputed sampling table for [getTemplatesForTheme]
+  ///
+  /// Draws a theme's templates weighted by possible combinations in O(1)
+  /// (see [TemplateSamplingTable.sample]); `TriviaGeneratorService.addTemplates`
+  /// takes these instead of building its own. Returns null when the loaded
+  /// templates don't match the generated statistics.
+  static TemplateSamplingTable? samplingTableForTheme(String theme) {
+    final thresholds = TriviaTemplateStats.themeSamplingThresholds[theme];
+    final aliases = TriviaTemplateStats.themeSamplingAliases[theme];
+    if (!_isPrechecked ||
+        thresholds == null ||
+        aliases == null ||
+        thresholds.length != getTemplatesForTheme(theme).length) {
+      return null;
+    }
+    return TemplateSamplingTable(thresholds, aliases);
+  }
 }
-"""
-    
-    with open(output_path, 'w') as f:
-        f.write(dart_content)
-    
-    print(f"Generated {output_path} with {sum(len(t) for t in templates_by_theme.values())} templates across {len(templates_by_theme)} themes")
+'''
 
-if __name__ == '__main__':
-    # Find all batch files (now in data/batch_files folder)
-    files = sorted(glob.glob('lib/data/batch_files/Untitled-*.swift') + 
-                   glob.glob('lib/data/batch_files/Untitled-*.js') + 
-                   glob.glob('lib/data/batch_files/Untitled-*.json') + 
-                   glob.glob('lib/data/batch_files/Untitled-*.dart') + 
-                   glob.glob('lib/data/batch_files/Untitled-*.vb') + 
-                   glob.glob('lib/data/batch_files/Untitled-*.jl') +
-                   glob.glob('lib/data/batch_files/Untitled-*'))  # Files without extensions
-    # Remove duplicates (files with extensions will match both patterns)
-    files = list(dict.fromkeys(files))
-    
-    templates_by_theme = {}
-    
-    for filepath in files:
-        templates = extract_templates_from_file(filepath)
+def iter_dart_source(templates_by_theme):
+    """Yield the consolidated Dart file in chunks, one template at a time."""
+    if uses_enums(template for templates in templates_by_theme.values()
+                  for template in templates):
+        yield DART_HEADER
+    else:
+        yield DART_HEADER.replace(DIFFICULTY_IMPORT, '')
+    for i, (theme, templates) in enumerate(templates_by_theme.items()):
+        if i:
+            yield '\n'
+        yield f'    // {theme.upper()} ({len(templates)} templates)\n'
+        yield f'    _addTemplates({dart_string(theme)}, [\n'
         for template in templates:
-            theme = template['theme']
-            if theme not in templates_by_theme:
-                templates_by_theme[theme] = []
-            templates_by_theme[theme].append(template)
-    
+            yield format_template(template)
+        yield '    ]);\n'
+    yield DART_FOOTER
+
+def generate_dart_file(templates_by_theme, output_path):
+    """Generate the consolidated Dart file.
+
+    The file is streamed to disk and left untouched when its content
+    hasn't changed, so the Dart toolchain doesn't recompile it. Returns
+    True when it was written.
+    """
+    written = write_if_changed(output_path, iter_dart_source(templates_by_theme))
+    count = sum(len(t) for t in templates_by_theme.values())
+    status = 'Generated' if written else 'Unchanged'
+    print(f"{status} {output_path} with {count} templates across "
+          f"{len(templates_by_theme)} themes")
+    return written
+
+def load_game_constants(path=GAME_CONSTANTS_PATH):
+    """Read the int constants the checks use from GameConstants."""
+    constants = dict(DEFAULT_GAME_CONSTANTS)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        print(f"⚠ {path} not found, using default game constants")
+        return constants
+    for name, value in re.findall(r'static const int (\w+) =\s*(\d+)', text):
+        if name in constants:
+            constants[name] = int(value)
+    return constants
+
+def possible_combinations(correct_count, distractor_count):
+    """Same as TriviaTemplate.possibleCombinations: C(correct, 3) * C(distractors, 3)."""
+    def choose(n, r):
+        return math.comb(n, r) if n >= r else 0
+    return choose(correct_count, 3) * choose(distractor_count, 3)
+
+def content_hash(templates):
+    """FNV-1a (32-bit) over a theme's template text as UTF-16 code units.
+
+    Covers pattern, pools and authored tier pools in order. Must match
+    PrecomputedTemplateStats.contentHash, which recomputes it at startup to
+    decide whether the precomputed stats still describe the loaded templates.
+    """
+    digest = 0x811C9DC5
+
+    def add(*units):
+        nonlocal digest
+        for unit in units:
+            digest = ((digest ^ unit) * 0x01000193) & 0xFFFFFFFF
+
+    def add_string(text):
+        encoded = text.encode('utf-16-le')
+        add(*struct.unpack(f'<{len(encoded) // 2}H', encoded), 0)
+
+    def add_list(items):
+        for item in items:
+            add_string(item)
+        add(1)
+
+    for template in templates:
+        add_string(template['categoryPattern'])
+        add_list(template['correctPool'])
+        add_list(template['distractorPool'])
+        if 'distractorPools' in template:
+            for tier in DISTRACTOR_TIERS:
+                add_list(template['distractorPools'].get(tier, []))
+        add(2)
+    return digest
+
+def _similarity(a, b):
+    """Port of TriviaEnhancementService._calculateSimilarity."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    if a in b or b in a:
+        return 0.5
+    a_words = re.split(r'\s+', a)
+    b_words = re.split(r'\s+', b)
+    common = sum(1 for word in a_words if len(word) > 3 and word in b_words)
+    if common:
+        return min(1.0, common / (len(a_words) + len(b_words) - common))
+    return 0.0
+
+def classify_distractor(distractor, correct_pool, category_pattern):
+    """Port of TriviaEnhancementService._classifyDistractor."""
+    distractor_lower = distractor.lower()
+    distractor_words = re.split(r'\s+', distractor_lower)
+    overlap = sum(1 for word in re.split(r'\s+', category_pattern.lower())
+                  if len(word) > 3 and word in distractor_words)
+    similar = any(_similarity(distractor_lower, correct.lower()) > 0.3
+                  for correct in correct_pool)
+    if overlap >= 2 or similar:
+        return 'subtle' if overlap >= 3 else 'related'
+    return 'obvious'
+
+def tier_pools(template):
+    """Split the distractor pool into obvious/related/subtle tiers.
+
+    Same classification and 40/40/20 balancing as TriviaEnhancementService,
+    except that balancing moves items from the end of the source tier
+    instead of at random, so the output is stable between runs. Pools
+    authored in the template are returned as they are.
+    """
+    if 'distractorPools' in template:
+        return template['distractorPools']
+    pools = {tier: [] for tier in DISTRACTOR_TIERS}
+    for distractor in template['distractorPool']:
+        tier = classify_distractor(distractor, template['correctPool'],
+                                   template['categoryPattern'])
+        pools[tier].append(distractor)
+
+    total = len(template['distractorPool'])
+    if total >= 3:
+        # Dart's round() rounds halves up
+        target_obvious = int(total * 0.4 + 0.5)
+        target_related = int(total * 0.4 + 0.5)
+        target_subtle = total - target_obvious - target_related
+        for source, target, count in (('related', 'obvious', target_obvious),
+                                      ('subtle', 'related', target_related),
+                                      ('related', 'subtle', target_subtle)):
+            if len(pools[target]) < count * 0.5:
+                while len(pools[target]) < count and pools[source]:
+                    pools[target].append(pools[source].pop())
+    return pools
+
+def check_template(template, constants, pools=None, strict=False):
+    """Validate one template; returns (errors, warnings).
+
+    Errors are the checks EditionTriviaTemplates._validateTemplates() throws
+    on at startup (plus empty strings), so a template that fails here would
+    stop the app from loading its templates. Warnings are the softer
+    ContentValidationService.validateTemplate() findings, which the app only
+    logs for edition templates. With ``strict``, the pool minimums among
+    them are errors, as TriviaGeneratorService throws on them for its
+    built-in templates.
+    """
+    errors = []
+    warnings = []
+    required = constants['expectedCorrectAnswers']
+    max_length = constants['maxWordLength']
+
+    if not template['categoryPattern']:
+        errors.append("Category pattern cannot be empty")
+    if not template['theme']:
+        errors.append("Theme cannot be empty")
+
+    normalized = {}
+    for field in ('correctPool', 'distractorPool'):
+        items = template[field]
+        empty = sum(1 for item in items if not item.strip())
+        if empty:
+            errors.append(f"{field} has {empty} empty or whitespace-only items")
+        for item in items:
+            trimmed = item.strip()
+            if trimmed and not re.search(r'[a-zA-Z0-9]', trimmed):
+                errors.append(f"{field}: \"{item}\" has no letters or digits")
+            if len(trimmed) > max_length:
+                errors.append(f"{field}: \"{item}\" exceeds max length of "
+                              f"{max_length} characters")
+        seen = set()
+        duplicates = []
+        for item in items:
+            key = item.strip().lower()
+            if key and key in seen:
+                duplicates.append(item)
+            seen.add(key)
+        if duplicates:
+            errors.append(f"{field} has duplicate items: {duplicates}")
+        normalized[field] = {item.strip().lower() for item in items
+                             if re.search(r'[a-zA-Z0-9]', item)}
+
+    correct = normalized['correctPool']
+    distractors = normalized['distractorPool']
+    overlap = correct & distractors
+    if overlap:
+        errors.append(f"correctPool and distractorPool overlap: {sorted(overlap)}")
+    if len(correct) < required:
+        errors.append(f"correctPool has {len(correct)} usable items "
+                      f"(minimum {required})")
+    if len(distractors) - len(overlap) < required:
+        errors.append(f"distractorPool has {len(distractors) - len(overlap)} "
+                      f"usable items (minimum {required})")
+    unique = len(correct) + len(distractors) - len(overlap)
+    if unique < constants['requiredWordsForGameplay']:
+        errors.append(f"only {unique} unique words (need "
+                      f"{constants['requiredWordsForGameplay']})")
+
+    if len(correct) < MIN_CORRECT_ITEMS:
+        (errors if strict else warnings).append(
+            f"correctPool should have at least {MIN_CORRECT_ITEMS} "
+            f"items (has {len(correct)})")
+    elif len(correct) < RECOMMENDED_CORRECT_ITEMS:
+        warnings.append(f"correctPool should have {RECOMMENDED_CORRECT_ITEMS}+ "
+                        f"items for variety (has {len(correct)})")
+    for tier, pool in (pools or {}).items():
+        if len(pool) < MIN_TIER_ITEMS:
+            (errors if strict else warnings).append(
+                f"{tier} tier has {len(pool)} distractors "
+                f"(minimum {MIN_TIER_ITEMS})")
+        elif len(pool) < RECOMMENDED_TIER_ITEMS:
+            warnings.append(f"{tier} tier should have {RECOMMENDED_TIER_ITEMS}+ "
+                            f"distractors (has {len(pool)})")
+    for field in ('correctPool', 'distractorPool'):
+        cases = {item[:1].upper() == item[:1] for item in template[field] if item}
+        if len(cases) > 1:
+            warnings.append(f"Inconsistent capitalization in {field}")
+    return errors, warnings
+
+def find_cross_duplicates(templates_by_theme):
+    """Port of ContentValidationService.checkCrossTemplateDuplicates().
+
+    Returns duplicate category patterns across the corpus and pairs of
+    templates in the same theme sharing more than MAX_SHARED_CORRECT_ITEMS
+    correct answers. Pairs are counted through an answer -> templates index,
+    so only templates that actually share answers are compared.
+    """
+    patterns = {}
+    for templates in templates_by_theme.values():
+        for template in templates:
+            pattern = template['categoryPattern']
+            patterns[pattern] = patterns.get(pattern, 0) + 1
+    duplicates = {
+        'patterns': [{'categoryPattern': pattern, 'count': count}
+                     for pattern, count in patterns.items() if count > 1],
+        'overlaps': [],
+    }
+    for theme, templates in templates_by_theme.items():
+        pools = [set(template['correctPool']) for template in templates]
+        users = {}
+        for index, pool in enumerate(pools):
+            for item in pool:
+                users.setdefault(item, []).append(index)
+        shared_counts = {}
+        for indexes in users.values():
+            for a in range(len(indexes)):
+                for b in range(a + 1, len(indexes)):
+                    pair = (indexes[a], indexes[b])
+                    shared_counts[pair] = shared_counts.get(pair, 0) + 1
+        for i, j in sorted(pair for pair, count in shared_counts.items()
+                           if count > MAX_SHARED_CORRECT_ITEMS):
+            duplicates['overlaps'].append({
+                'theme': theme,
+                'templates': [templates[i]['categoryPattern'],
+                              templates[j]['categoryPattern']],
+                'shared': sorted(pools[i] & pools[j]),
+            })
+    return duplicates
+
+def _normalize_answer(item):
+    return item.strip().lower()
+
+def template_tokens(template):
+    """Set of MinHash tokens: category pattern words and normalized answers."""
+    tokens = {'w:' + word
+              for word in re.findall(r'[a-z0-9]+', template['categoryPattern'].lower())}
+    for field in ('correctPool', 'distractorPool'):
+        tokens.update('a:' + _normalize_answer(item)
+                      for item in template[field] if item.strip())
+    return tokens
+
+def _minhash_permutations(count=MINHASH_PERMUTATIONS, seed=1):
+    rng = random.Random(seed)
+    return [(rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME))
+            for _ in range(count)]
+
+def minhash_signature(tokens, permutations):
+    """MinHash signature of a token set, one value per permutation."""
+    hashes = [int.from_bytes(hashlib.blake2b(token.encode('utf-8'),
+                                             digest_size=8).digest(), 'little')
+              for token in tokens]
+    if not hashes:
+        return tuple([MINHASH_PRIME] * len(permutations))
+    return tuple(min((a * value + b) % MINHASH_PRIME for value in hashes)
+                 for a, b in permutations)
+
+def find_near_duplicates(templates_by_theme, threshold=NEAR_DUPLICATE_THRESHOLD,
+                         bands=LSH_BANDS, permutations=MINHASH_PERMUTATIONS):
+    """Find near-duplicate templates anywhere in the corpus.
+
+    Each template's pattern words and answers are MinHashed and the
+    signatures split into ``bands``; templates sharing any band bucket are
+    candidates, and only candidates get an exact Jaccard check. Cost is
+    linear in the corpus plus the (small) number of candidate pairs.
+
+    Returns [{'similarity', 'templates': [{theme, index, categoryPattern}, ...]}]
+    for pairs at or above ``threshold``, most similar first.
+    """
+    hash_functions = _minhash_permutations(permutations)
+    rows = permutations // bands
+    entries = []
+    buckets = {}
+    for theme, templates in templates_by_theme.items():
+        for index, template in enumerate(templates):
+            tokens = template_tokens(template)
+            signature = minhash_signature(tokens, hash_functions)
+            entry = len(entries)
+            entries.append((theme, index, template, tokens))
+            for band in range(bands):
+                key = (band,) + signature[band * rows:(band + 1) * rows]
+                buckets.setdefault(key, []).append(entry)
+
+    candidates = set()
+    for members in buckets.values():
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                candidates.add((members[a], members[b]))
+
+    pairs = []
+    for a, b in sorted(candidates):
+        tokens_a, tokens_b = entries[a][3], entries[b][3]
+        similarity = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+        if similarity >= threshold:
+            pairs.append({
+                'similarity': round(similarity, 3),
+                'templates': [{'theme': theme, 'index': index,
+                               'categoryPattern': template['categoryPattern']}
+                              for theme, index, template, _ in (entries[a], entries[b])],
+            })
+    pairs.sort(key=lambda pair: -pair['similarity'])
+    return pairs
+
+def find_answer_conflicts(templates_by_theme):
+    """Answers that are correct in one template and a distractor in another
+    template of the same theme.
+
+    Returns [{'theme', 'answer', 'correctIn': [...], 'distractorIn': [...]}]
+    with category patterns; overlaps inside one template are already errors
+    in check_template.
+    """
+    conflicts = []
+    for theme, templates in templates_by_theme.items():
+        roles = {}
+        for index, template in enumerate(templates):
+            for field in ('correctPool', 'distractorPool'):
+                for item in template[field]:
+                    key = _normalize_answer(item)
+                    if key:
+                        roles.setdefault(key, ({}, {}))[
+                            field == 'distractorPool'].setdefault(index, item)
+        for key, (correct, distractor) in roles.items():
+            if set(correct) - set(distractor) and set(distractor) - set(correct):
+                conflicts.append({
+                    'theme': theme,
+                    'answer': next(iter(correct.values())),
+                    'correctIn': [templates[i]['categoryPattern']
+                                  for i in correct if i not in distractor],
+                    'distractorIn': [templates[i]['categoryPattern']
+                                     for i in distractor if i not in correct],
+                })
+    return conflicts
+
+def check_editions(templates_by_theme, edition_themes=None):
+    """Check every edition's themes against the parsed corpus.
+
+    Returns (editions, errors, warnings): per-edition theme list and
+    template count, dangling theme references (errors) and themes no
+    edition uses (warnings).
+    """
+    edition_themes = EDITION_THEMES if edition_themes is None else edition_themes
+    editions = {}
+    errors = []
+    for edition, themes in edition_themes.items():
+        missing = [theme for theme in themes if theme not in templates_by_theme]
+        if missing:
+            errors.append(f"edition '{edition}' references themes with no "
+                          f"templates: {', '.join(missing)}")
+        if not themes:
+            errors.append(f"edition '{edition}' has no themes")
+        editions[edition] = {
+            'themes': list(themes),
+            'templateCount': sum(len(templates_by_theme.get(theme, []))
+                                 for theme in themes),
+        }
+    used = {theme for themes in edition_themes.values() for theme in themes}
+    warnings = [f"theme '{theme}' isn't used by any edition"
+                for theme in templates_by_theme if theme not in used]
+    return editions, errors, warnings
+
+def template_stats(template):
+    """(tier pools, possibleCombinations, tier codes) for one template.
+
+    Codes have one letter per ``distractorPool`` item (see TIER_CODES).
+    Authored pools ship in the Dart source itself, so they get no codes.
+    """
+    pools = tier_pools(template)
+    tier_of = {}
+    for tier, pool in pools.items():
+        for item in pool:
+            tier_of.setdefault(item, tier)
+    combinations = possible_combinations(
+        len(template['correctPool']), sum(len(pool) for pool in pools.values()))
+    codes = '' if 'distractorPools' in template else ''.join(
+        TIER_CODES[tier_of[item]] for item in template['distractorPool'])
+    return pools, combinations, codes
+
+def analyze_base_templates(templates, constants=None):
+    """Precompute TriviaGeneratorService's startup pass over its built-in templates.
+
+    ``valid`` is False when a template fails the checks the service throws
+    on (see check_template's ``strict``); the app then still validates them
+    at startup, so the failure surfaces exactly as it did before.
+    """
+    constants = constants or DEFAULT_GAME_CONSTANTS
+    report = {'templateCount': len(templates), 'contentHash': content_hash(templates),
+              'totalPossibleCombinations': 0, 'distractorTiers': [], 'errors': []}
+    for index, template in enumerate(templates):
+        pools, combinations, codes = template_stats(template)
+        report['totalPossibleCombinations'] += combinations
+        report['distractorTiers'].append(codes)
+        errors, _ = check_template(template, constants, pools, strict=True)
+        location = f"base[{index}] \"{template['categoryPattern']}\""
+        report['errors'] += [f"{location}: {error}" for error in errors]
+    if len(templates) < constants['minTemplateCount']:
+        report['errors'].append(f"{len(templates)} built-in templates "
+                                f"(minimum {constants['minTemplateCount']})")
+    if report['totalPossibleCombinations'] < constants['minCombinations']:
+        report['errors'].append(f"{report['totalPossibleCombinations']} combinations "
+                                f"(minimum {constants['minCombinations']})")
+    report['valid'] = bool(templates) and not report['errors']
+    return report
+
+def analyze_templates(templates_by_theme, constants=None):
+    """Run the startup checks and statistics at build time.
+
+    Returns a report dict with per-template combinations and tier pools,
+    per-theme and global totals, errors, warnings and duplicates. The build
+    should fail when ``report['errors']`` is non-empty.
+    """
+    constants = constants or DEFAULT_GAME_CONSTANTS
+    report = {
+        'templateCount': 0,
+        'totalPossibleCombinations': 0,
+        'themes': {},
+        'errors': [],
+        'warnings': [],
+    }
+    for theme, templates in templates_by_theme.items():
+        theme_report = {'templateCount': len(templates),
+                        'contentHash': content_hash(templates),
+                        'possibleCombinations': 0, 'templates': []}
+        for index, template in enumerate(templates):
+            pools, combinations, codes = template_stats(template)
+            theme_report['templates'].append({
+                'categoryPattern': template['categoryPattern'],
+                'difficulty': template.get('difficulty', 'medium'),
+                'possibleCombinations': combinations,
+                'distractorTiers': codes,
+                'distractorPools': pools,
+            })
+            theme_report['possibleCombinations'] += combinations
+
+            errors, warnings = check_template(template, constants, pools)
+            location = f"{theme}[{index}] \"{template['categoryPattern']}\""
+            report['errors'] += [f"{location}: {error}" for error in errors]
+            report['warnings'] += [f"{location}: {warning}" for warning in warnings]
+        report['themes'][theme] = theme_report
+        report['templateCount'] += len(templates)
+        report['totalPossibleCombinations'] += theme_report['possibleCombinations']
+    report['duplicates'] = find_cross_duplicates(templates_by_theme)
+    report['duplicates']['nearDuplicates'] = find_near_duplicates(templates_by_theme)
+    report['duplicates']['answerConflicts'] = find_answer_conflicts(templates_by_theme)
+
+    editions, errors, warnings = check_editions(templates_by_theme)
+    report['editions'] = editions
+    report['errors'] += errors
+    report['warnings'] += warnings
+    return report
+
+def alias_table(weights, scale=SAMPLING_SCALE):
+    """Build a Vose alias table for drawing index i with weight weights[i].
+
+    Returns (thresholds, aliases). To draw, pick a slot uniformly and keep
+    it when a uniform integer below ``scale`` is under its threshold,
+    otherwise take its alias. Zero total weight gives a uniform table.
+    """
+    count = len(weights)
+    total = sum(weights)
+    if total <= 0:
+        return [scale] * count, list(range(count))
+
+    # Work in units of total / count so every comparison stays integral
+    values = [weight * count for weight in weights]
+    thresholds = [scale] * count
+    aliases = list(range(count))
+    small = [i for i, value in enumerate(values) if value < total]
+    large = [i for i, value in enumerate(values) if value >= total]
+    while small and large:
+        lo = small.pop()
+        hi = large.pop()
+        thresholds[lo] = values[lo] * scale // total
+        aliases[lo] = hi
+        values[hi] -= total - values[lo]
+        (small if values[hi] < total else large).append(hi)
+    return thresholds, aliases
+
+def alias_draw(table, rng, scale=SAMPLING_SCALE):
+    """Draw one index from an alias table with a random.Random."""
+    thresholds, aliases = table
+    slot = rng.randrange(len(thresholds))
+    return slot if rng.randrange(scale) < thresholds[slot] else aliases[slot]
+
+def alias_probabilities(table, scale=SAMPLING_SCALE):
+    """Exact probability of each index under an alias table."""
+    thresholds, aliases = table
+    count = len(thresholds)
+    mass = [0] * count
+    for slot, threshold in enumerate(thresholds):
+        mass[slot] += threshold
+        mass[aliases[slot]] += scale - threshold
+    return [value / (scale * count) for value in mass]
+
+def build_sampling_tables(report):
+    """Alias tables weighted by possibleCombinations, as {theme: table}.
+
+    Each table indexes the theme's templates in template order, the same
+    order ``EditionTriviaTemplates.getTemplatesForTheme`` returns them.
+    """
+    return {theme: alias_table([t['possibleCombinations'] for t in data['templates']])
+            for theme, data in report['themes'].items()}
+
+def _chi_square_critical(df, z=SAMPLING_CHECK_Z):
+    """Upper chi-square quantile (Wilson-Hilferty approximation)."""
+    k = 2 / (9 * df)
+    return df * (1 - k + z * math.sqrt(k)) ** 3
+
+def _chi_square(observed, expected):
+    """Chi-square statistic and degrees of freedom.
+
+    Bins expected to see fewer than 5 draws are pooled so the statistic
+    stays valid for heavily skewed weights.
+    """
+    bins = []
+    pooled_observed = pooled_expected = 0
+    for seen, wanted in zip(observed, expected):
+        if wanted < 5:
+            pooled_observed += seen
+            pooled_expected += wanted
+        else:
+            bins.append((seen, wanted))
+    if pooled_expected > 0:
+        bins.append((pooled_observed, pooled_expected))
+    statistic = sum((seen - wanted) ** 2 / wanted for seen, wanted in bins if wanted > 0)
+    return statistic, len(bins) - 1
+
+def check_sampling(report, tables=None, samples=SAMPLING_SAMPLES, seed=0):
+    """Check that the alias tables draw templates with the intended weights.
+
+    For every theme table this compares the table's exact probabilities
+    with possibleCombinations / total, then draws
+    ``samples`` indexes and runs a chi-square goodness-of-fit test on the
+    empirical counts. Returns True when every table passes.
+    """
+    tables = tables or build_sampling_tables(report)
+    rng = random.Random(seed)
+    checked = 0
+    failures = []
+    for theme, data in report['themes'].items():
+        values = [t['possibleCombinations'] for t in data['templates']]
+        total = sum(values)
+        if len(values) < 2 or total <= 0:
+            continue
+        table = tables[theme]
+        checked += 1
+
+        intended = [value / total for value in values]
+        actual = alias_probabilities(table)
+        error = max(abs(a - b) for a, b in zip(actual, intended))
+        if error > len(values) / SAMPLING_SCALE:
+            failures.append(f"theme '{theme}': table probabilities off by {error:.2e}")
+            continue
+
+        observed = [0] * len(values)
+        for _ in range(samples):
+            observed[alias_draw(table, rng)] += 1
+        statistic, df = _chi_square(observed, [p * samples for p in intended])
+        if df > 0 and statistic > _chi_square_critical(df):
+            failures.append(f"theme '{theme}': chi-square {statistic:.1f} "
+                            f"> {_chi_square_critical(df):.1f} (df={df})")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    if failures:
+        print(f"✗ {len(failures)} of {checked} sampling tables failed")
+        return False
+    print(f"✓ {checked} sampling tables match their weights "
+          f"({samples} draws each)")
+    return True
+
+def write_report(report, report_path):
+    """Write the analysis report as JSON."""
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+def generate_stats_file(report, output_path, tables=None):
+    """Write the build-time statistics and sampling tables as Dart constants."""
+    tables = tables or build_sampling_tables(report)
+    themes = report['themes']
+    duplicates = report['duplicates']
+    lines = [
+        '// GENERATED CODE - DO NOT MODIFY BY HAND',
+        '// Written by scripts/consolidate_trivia_templates.py',
+        '',
+        '/// Build-time statistics for the templates in',
+        '/// `trivia_templates_consolidated.dart`.',
+        '///',
+        '/// Every template was validated when this file was written, so',
+        '/// [EditionTriviaTemplates] can skip its startup checks in release builds',
+        '/// as long as the loaded templates still match [themeContentHashes].',
+        '/// [editionThemes] only references themes that exist. The `base` entries',
+        '/// do the same for `TriviaGeneratorService`\'s built-in templates.',
+        'class TriviaTemplateStats {',
+        f"  static const int templateCount = {report['templateCount']};",
+        '',
+        f"  static const int totalPossibleCombinations = {report['totalPossibleCombinations']};",
+        '',
+        f"  static const int duplicatePatternCount = {len(duplicates['patterns'])};",
+        '',
+        f"  static const int overlappingTemplatePairs = {len(duplicates['overlaps'])};",
+        '',
+        '  static const Map<String, int> themeTemplateCounts = {',
+    ]
+    keys = {theme: dart_string(theme, "'") for theme in themes}
+    lines += [f"    {keys[theme]}: {data['templateCount']},"
+              for theme, data in themes.items()]
+    lines += ['  };', '',
+              '  /// FNV-1a hash of each theme\'s template text (see content_hash)',
+              '  static const Map<String, int> themeContentHashes = {']
+    lines += [f"    {keys[theme]}: {data['contentHash']},"
+              for theme, data in themes.items()]
+    lines += ['  };', '', '  static const Map<String, int> themeCombinations = {']
+    lines += [f"    {keys[theme]}: {data['possibleCombinations']},"
+              for theme, data in themes.items()]
+    lines += ['  };', '',
+              '  /// `possibleCombinations` of each template, in template order',
+              '  static const Map<String, List<int>> templateCombinations = {']
+    for theme, data in themes.items():
+        values = ', '.join(str(t['possibleCombinations']) for t in data['templates'])
+        lines.append(f"    {keys[theme]}: [{values}],")
+    lines += ['  };', '',
+              '  /// Tier of each distractor, one letter per `distractorPool` item:',
+              '  /// o = obvious, r = related, s = subtle',
+              '  static const Map<String, List<String>> distractorTiers = {']
+    for theme, data in themes.items():
+        codes = ', '.join(dart_string(t['distractorTiers'], "'")
+                          for t in data['templates'])
+        lines.append(f"    {keys[theme]}: [{codes}],")
+    lines += ['  };', '',
+              '  /// Themes each edition draws from, checked against the corpus',
+              '  static const Map<String, List<String>> editionThemes = {']
+    editions = report['editions']
+    edition_keys = {edition: dart_string(edition, "'") for edition in editions}
+    for edition, data in editions.items():
+        themes = ', '.join(dart_string(theme, "'") for theme in data['themes'])
+        lines.append(f"    {edition_keys[edition]}: [{themes}],")
+    lines += ['  };', '',
+              '  static const Map<String, int> editionTemplateCounts = {']
+    lines += [f"    {edition_keys[edition]}: {data['templateCount']},"
+              for edition, data in editions.items()]
+    lines += ['  };', '',
+              '  /// Denominator of the sampling thresholds below',
+              f"  static const int samplingScale = {SAMPLING_SCALE};"]
+    for field, part in (('Thresholds', 0), ('Aliases', 1)):
+        lines += ['']
+        if part == 0:
+            lines.append("  /// Alias tables weighted by `possibleCombinations`, in template order")
+        lines.append(f"  static const Map<String, List<int>> themeSampling{field} = {{")
+        for theme, table in tables.items():
+            values = ', '.join(str(value) for value in table[part])
+            lines.append(f"    {keys[theme]}: [{values}],")
+        lines.append('  };')
+    base = report.get('base') or analyze_base_templates([])
+    lines += ['',
+              '  /// Built-in `TriviaGeneratorService` templates, checked like the above',
+              f"  static const int baseTemplateCount = {base['templateCount']};",
+              '',
+              '  /// Whether they pass the checks the service throws on at startup',
+              f"  static const bool baseTemplatesValid = {'true' if base['valid'] else 'false'};",
+              '',
+              f"  static const int baseContentHash = {base['contentHash']};",
+              '',
+              f"  static const int baseTotalPossibleCombinations = {base['totalPossibleCombinations']};",
+              '',
+              '  /// Tier codes of each built-in template, in template order',
+              '  static const List<String> baseDistractorTiers = [']
+    lines += [f"    {dart_string(codes, chr(39))}," for codes in base['distractorTiers']]
+    lines += ['  ];', '}', '']
+
+    written = write_if_changed(output_path, ['\n'.join(lines)])
+    print(f"{'Generated' if written else 'Unchanged'} {output_path}")
+
+def _write_varint(out, value):
+    """Append ``value`` as an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, pos):
+    """Read an unsigned LEB128 varint; returns (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def encode_bundle(templates_by_theme):
+    """Encode templates as a compact binary bundle.
+
+    Layout (little-endian):
+      header       magic 'N3TB', u16 version, u16 flags, u32 string count,
+                   u32 theme count
+      offsets      u32 x (string count + 1) into the UTF-8 blob
+      blob         every unique string once, UTF-8
+      theme index  per theme: u32 name id, u32 record offset, u32 count
+      records      per template, varints: pattern id, correct count + ids,
+                   distractor count + ids, difficulty (0 = unset, else
+                   1 + index in DIFFICULTY_LEVELS), tier mask (bit i =
+                   DISTRACTOR_TIERS[i] present), then count + ids per tier
+
+    Tier pools are the authored ones, or the precomputed split from
+    tier_pools() for templates without any, so readers never need to classify
+    distractors.
+
+    Record offsets are relative to the start of the records section, so a
+    reader can decode one theme without touching the others.
+    """
+    string_ids = {}
+
+    def intern(value):
+        return string_ids.setdefault(value, len(string_ids))
+
+    records = bytearray()
+    theme_index = []
+    for theme, templates in sorted(templates_by_theme.items()):
+        theme_index.append((intern(theme), len(records), len(templates)))
+        for template in templates:
+            _write_varint(records, intern(template['categoryPattern']))
+            for field in ('correctPool', 'distractorPool'):
+                _write_varint(records, len(template[field]))
+                for item in template[field]:
+                    _write_varint(records, intern(item))
+            difficulty = template.get('difficulty')
+            _write_varint(records, 0 if difficulty is None
+                          else DIFFICULTY_LEVELS.index(difficulty) + 1)
+            pools = tier_pools(template)
+            _write_varint(records, sum(1 << i for i, tier in enumerate(DISTRACTOR_TIERS)
+                                       if tier in pools))
+            for tier in DISTRACTOR_TIERS:
+                if tier in pools:
+                    _write_varint(records, len(pools[tier]))
+                    for item in pools[tier]:
+                        _write_varint(records, intern(item))
+
+    blob = bytearray()
+    offsets = [0]
+    for value in string_ids:
+        blob += value.encode('utf-8')
+        offsets.append(len(blob))
+
+    out = bytearray(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0,
+                                       len(string_ids), len(theme_index)))
+    out += struct.pack(f'<{len(offsets)}I', *offsets)
+    out += blob
+    for entry in theme_index:
+        out += BUNDLE_THEME_ENTRY.pack(*entry)
+    out += records
+    return bytes(out)
+
+def _read_string_list(data, pos, strings):
+    size, pos = _read_varint(data, pos)
+    items = []
+    for _ in range(size):
+        item_id, pos = _read_varint(data, pos)
+        items.append(strings[item_id])
+    return items, pos
+
+def decode_bundle(data):
+    """Decode a bundle back into {theme: [template, ...]}.
+
+    Every decoded template carries ``distractorPools``; see encode_bundle.
+    """
+    magic, version, _, string_count, theme_count = \
+        BUNDLE_HEADER.unpack_from(data, 0)
+    if magic != BUNDLE_MAGIC:
+        raise ValueError("not a trivia template bundle")
+    if version != BUNDLE_VERSION:
+        raise ValueError(f"unsupported bundle version {version}")
+
+    pos = BUNDLE_HEADER.size
+    offsets = struct.unpack_from(f'<{string_count + 1}I', data, pos)
+    pos += 4 * (string_count + 1)
+    strings = [data[pos + offsets[i]:pos + offsets[i + 1]].decode('utf-8')
+               for i in range(string_count)]
+    pos += offsets[-1]
+    theme_index = [BUNDLE_THEME_ENTRY.unpack_from(data, pos + i * 12)
+                   for i in range(theme_count)]
+    records_start = pos + theme_count * BUNDLE_THEME_ENTRY.size
+
+    templates_by_theme = {}
+    for name_id, offset, count in theme_index:
+        theme = strings[name_id]
+        pos = records_start + offset
+        templates = []
+        for _ in range(count):
+            pattern_id, pos = _read_varint(data, pos)
+            template = {'categoryPattern': strings[pattern_id]}
+            for field in ('correctPool', 'distractorPool'):
+                template[field], pos = _read_string_list(data, pos, strings)
+            template['theme'] = theme
+            difficulty, pos = _read_varint(data, pos)
+            if difficulty:
+                template['difficulty'] = DIFFICULTY_LEVELS[difficulty - 1]
+            mask, pos = _read_varint(data, pos)
+            pools = {}
+            for i, tier in enumerate(DISTRACTOR_TIERS):
+                if mask & (1 << i):
+                    pools[tier], pos = _read_string_list(data, pos, strings)
+            template['distractorPools'] = pools
+            templates.append(template)
+        templates_by_theme[theme] = templates
+    return templates_by_theme
+
+def write_bundle(templates_by_theme, bundle_path):
+    """Write the binary bundle atomically; returns its size in bytes."""
+    data = encode_bundle(templates_by_theme)
+    os.makedirs(os.path.dirname(bundle_path) or '.', exist_ok=True)
+    temp_path = bundle_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, bundle_path)
+    return len(data)
+
+def theme_group(theme):
+    """Theme group (shard name) for a theme."""
+    for group, pattern in THEME_GROUPS:
+        if pattern.match(theme):
+            return group
+    return DEFAULT_THEME_GROUP
+
+def group_themes(templates_by_theme):
+    """Map each non-empty theme group to its themes, sorted."""
+    order = [group for group, _ in THEME_GROUPS] + [DEFAULT_THEME_GROUP]
+    groups = {group: [] for group in order}
+    for theme in sorted(templates_by_theme):
+        groups[theme_group(theme)].append(theme)
+    return {group: themes for group, themes in groups.items() if themes}
+
+# dart format's page width; longer named arguments wrap after the colon
+DART_LINE_WIDTH = 80
+
+def _dart_list(items, indent):
+    return ''.join(["[\n", *(f"{indent}  {dart_string(item)},\n" for item in items),
+                    f"{indent}]"])
+
+def _dart_named(name, value, indent):
+    """``name: 'value',`` laid out the way dart format would."""
+    line = f"{indent}{name}: {dart_string(value)},"
+    if len(line.encode('utf-16-le')) // 2 > DART_LINE_WIDTH:
+        return f"{indent}{name}:\n{indent}    {dart_string(value)},\n"
+    return line + '\n'
+
+def format_template(template, indent='      '):
+    """Dart source for one ``TriviaTemplate(...)`` call, laid out like dart format."""
+    inner = indent + '  '
+    lines = [
+        f"{indent}TriviaTemplate(\n",
+        _dart_named('categoryPattern', template['categoryPattern'], inner),
+        f"{inner}correctPool: {_dart_list(template['correctPool'], inner)},\n",
+        f"{inner}distractorPool: {_dart_list(template['distractorPool'], inner)},\n",
+        _dart_named('theme', template['theme'], inner),
+    ]
+    if 'difficulty' in template:
+        lines.append(f"{inner}difficulty: DifficultyLevel.{template['difficulty']},\n")
+    if 'distractorPools' in template:
+        lines.append(f"{inner}distractorPools: {{\n")
+        for tier, pool in template['distractorPools'].items():
+            lines.append(f"{inner}  DistractorTier.{tier}: "
+                         f"{_dart_list(pool, inner + '  ')},\n")
+        lines.append(f"{inner}}},\n")
+    lines.append(f"{indent}),\n")
+    return ''.join(lines)
+
+def uses_enums(templates):
+    """Whether any template needs ``difficulty_level.dart`` imported."""
+    return any('difficulty' in template or 'distractorPools' in template
+               for template in templates)
+
+def _shard_source(group, themes, templates_by_theme):
+    imports = ["import 'package:n3rd_game/services/trivia_generator_service.dart';\n"]
+    if uses_enums(template for theme in themes
+                  for template in templates_by_theme[theme]):
+        imports.insert(0, "import 'package:n3rd_game/models/difficulty_level.dart';\n")
+    parts = [
+        '// GENERATED CODE - DO NOT MODIFY BY HAND\n',
+        '// Written by scripts/consolidate_trivia_templates.py --shards\n',
+        '\n',
+        *imports,
+        '\n',
+        f"/// Trivia templates for the {group} theme group\n",
+        '///\n',
+        f"/// Loaded on first use by [TriviaTemplateShards] in `{SHARD_REGISTRY_NAME}`.\n",
+        'Map<String, List<TriviaTemplate>> loadTemplates() {\n',
+        '  return {\n',
+    ]
+    for theme in themes:
+        parts.append(f"    {dart_string(theme, chr(39))}: [\n")
+        parts += [format_template(template) for template in templates_by_theme[theme]]
+        parts.append('    ],\n')
+    parts += ['  };\n', '}\n']
+    return ''.join(parts)
+
+def _registry_source(groups):
+    imports = ''.join(f"import '{group}.g.dart' deferred as {group};\n"
+                      for group in groups)
+    theme_shards = ''.join(f"    {dart_string(theme, chr(39))}: '{group}',\n"
+                           for group, themes in groups.items() for theme in themes)
+    cases = ''.join(f"      case '{group}':\n"
+                    f"        await {group}.loadLibrary();\n"
+                    f"        return {group}.loadTemplates();\n"
+                    for group in groups)
+    return f"""// GENERATED CODE - DO NOT MODIFY BY HAND
+// Written by scripts/consolidate_trivia_templates.py --shards
+
+import 'package:n3rd_game/data/trivia_template_stats.g.dart';
+import 'package:n3rd_game/services/trivia_generator_service.dart';
+
+{imports}
+/// Loads the sharded trivia templates one theme group at a time
+///
+/// Each shard is a deferred library, so web builds download it (and native
+/// builds build its templates) only when one of its themes is first used.
+/// Templates are in the same order as `trivia_templates_consolidated.dart`.
+class TriviaTemplateShards {{
+  /// Shard holding each theme
+  static const Map<String, String> themeShards = {{
+{theme_shards}  }};
+
+  static final Map<String, Future<Map<String, List<TriviaTemplate>>>> _shards =
+      {{}};
+
+  /// Whether [shard] has been requested
+  static bool isRequested(String shard) => _shards.containsKey(shard);
+
+  /// Load a shard's templates by theme (once; later calls share the result)
+  static Future<Map<String, List<TriviaTemplate>>> loadShard(String shard) {{
+    return _shards[shard] ??= _loadShard(shard).catchError((Object e) {{
+      _shards.remove(shard);
+      throw e;
+    }});
+  }}
+
+  /// Templates for [theme], loading its shard if needed
+  ///
+  /// Returns an empty list for unknown themes.
+  static Future<List<TriviaTemplate>> loadTheme(String theme) async {{
+    final shard = themeShards[theme];
+    if (shard == null) return const [];
+    return (await loadShard(shard))[theme] ?? const [];
+  }}
+
+  /// Templates for an edition's themes, loading the shards they live in
+  static Future<List<TriviaTemplate>> loadEdition(String editionId) async {{
+    final themes = TriviaTemplateStats.editionThemes[editionId] ?? const [];
+    final shards = {{
+      for (final theme in themes)
+        if (themeShards[theme] != null) themeShards[theme]!,
+    }};
+    await Future.wait(shards.map(loadShard));
+    final templates = <TriviaTemplate>[];
+    for (final theme in themes) {{
+      templates.addAll(await loadTheme(theme));
+    }}
+    return templates;
+  }}
+
+  static Future<Map<String, List<TriviaTemplate>>> _loadShard(
+    String shard,
+  ) async {{
+    switch (shard) {{
+{cases}      default:
+        throw ArgumentError.value(shard, 'shard', 'Unknown trivia template shard');
+    }}
+  }}
+}}
+"""
+
+def write_shards(templates_by_theme, shard_dir):
+    """Write one Dart library per theme group and the deferred registry.
+
+    Unchanged shards are left untouched; stale ``.g.dart`` files left in
+    ``shard_dir`` by earlier runs are removed. Returns {group: [themes]}.
+    """
+    groups = group_themes(templates_by_theme)
+    os.makedirs(shard_dir, exist_ok=True)
+    written = {SHARD_REGISTRY_NAME}
+    for group, themes in groups.items():
+        name = f"{group}.g.dart"
+        write_if_changed(os.path.join(shard_dir, name),
+                         [_shard_source(group, themes, templates_by_theme)])
+        written.add(name)
+    write_if_changed(os.path.join(shard_dir, SHARD_REGISTRY_NAME),
+                     [_registry_source(groups)])
+    for name in os.listdir(shard_dir):
+        if name.endswith('.g.dart') and name not in written:
+            os.remove(os.path.join(shard_dir, name))
+    return groups
+
+def _first_difference(label, actual, expected):
+    """Describe the first difference between two templates-by-theme dicts,
+    or return None when they match theme by theme and in order."""
+    if sorted(actual) != sorted(expected):
+        missing = sorted(set(expected) - set(actual))
+        extra = sorted(set(actual) - set(expected))
+        return f"{label} themes differ (missing: {missing}, extra: {extra})"
+    for theme, templates in expected.items():
+        if actual[theme] == templates:
+            continue
+        for index, (want, got) in enumerate(zip(templates, actual[theme])):
+            if want != got:
+                return (f"{label} differs at {theme}[{index}]: "
+                        f"{want['categoryPattern']!r}")
+        return (f"{label} has {len(actual[theme])} {theme} templates, "
+                f"source has {len(templates)}")
+    return None
+
+def check_shards(shard_dir, dart_path):
+    """Check that the shards together hold exactly the monolithic output.
+
+    Every theme must live in exactly one shard, and the union of shards
+    must match the generated Dart file theme by theme and in order.
+    Returns True when they match; prints the first difference otherwise.
+    """
+    try:
+        source = group_by_theme([extract_templates_from_file(dart_path)])
+        sharded = {}
+        names = sorted(name for name in os.listdir(shard_dir)
+                       if name.endswith('.g.dart') and name != SHARD_REGISTRY_NAME)
+        for name in names:
+            shard = group_by_theme([extract_templates_from_file(
+                os.path.join(shard_dir, name))])
+            for theme, templates in shard.items():
+                if theme in sharded:
+                    print(f"✗ Theme '{theme}' is in more than one shard")
+                    return False
+                sharded[theme] = templates
+    except (OSError, ParseError) as e:
+        print(f"✗ Shard check failed: {e}")
+        return False
+
+    difference = _first_difference('Shards', sharded, source)
+    if difference:
+        print(f"✗ {difference}")
+        return False
+    total = sum(len(templates) for templates in source.values())
+    print(f"✓ {len(names)} shards match {dart_path} ({total} templates, "
+          f"{len(source)} themes)")
+    return True
+
+def check_bundle(bundle_path, dart_path):
+    """Round-trip check: the bundle must decode to exactly the templates in
+    the generated Dart file, theme by theme and in the same order, with the
+    same tier pools the build computes.
+
+    Returns True when they match; prints the first difference otherwise.
+    """
+    try:
+        with open(bundle_path, 'rb') as f:
+            bundled = decode_bundle(f.read())
+        source = group_by_theme([extract_templates_from_file(dart_path)])
+    except (OSError, ValueError, ParseError, struct.error) as e:
+        print(f"✗ Bundle check failed: {e}")
+        return False
+    source = {theme: [{**template, 'distractorPools': tier_pools(template)}
+                      for template in templates]
+              for theme, templates in source.items()}
+
+    difference = _first_difference('Bundle', bundled, source)
+    if difference:
+        print(f"✗ {difference}")
+        return False
+
+    total = sum(len(templates) for templates in source.values())
+    print(f"✓ Bundle matches {dart_path} ({total} templates, "
+          f"{len(source)} themes)")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Consolidate trivia template batch files into one Dart file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Parse lib/data/batch_files/Untitled-* and regenerate the Dart file
+  python3 scripts/consolidate_trivia_templates.py
+
+  # Limit the parse pool to 4 processes
+  python3 scripts/consolidate_trivia_templates.py --jobs 4
+
+  # Re-parse every batch file
+  python3 scripts/consolidate_trivia_templates.py --no-cache
+
+  # Also write the binary bundle (checked against the Dart output)
+  python3 scripts/consolidate_trivia_templates.py --bundle assets/trivia_templates.bin
+
+  # Write the full validation/statistics report
+  python3 scripts/consolidate_trivia_templates.py --report build/trivia_report.json
+
+  # Fail the run if new near-duplicate templates appear
+  python3 scripts/consolidate_trivia_templates.py --max-near-duplicates 20 --report build/trivia_report.json
+
+  # Also write per-theme-group deferred libraries (checked against the Dart output)
+  python3 scripts/consolidate_trivia_templates.py --shards lib/data/trivia_shards
+
+  # Check the weighted sampling tables before writing them
+  python3 scripts/consolidate_trivia_templates.py --check-sampling
+
+  # Only check an existing bundle against the Dart file
+  python3 scripts/consolidate_trivia_templates.py --check-bundle assets/trivia_templates.bin
+        """
+    )
+    parser.add_argument('--batch-dir', default=BATCH_DIR,
+                        help=f'Folder with the Untitled-* batch files (default: {BATCH_DIR})')
+    parser.add_argument('--output', default=OUTPUT_PATH,
+                        help=f'Dart file to write (default: {OUTPUT_PATH})')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Parse processes (default: one per CPU)')
+    parser.add_argument('--cache-dir', default=CACHE_DIR_NAME,
+                        help=f'Parse cache folder (default: {CACHE_DIR_NAME})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every file and leave the cache untouched')
+    parser.add_argument('--base-templates', default=BASE_TEMPLATES_PATH,
+                        help=f'Dart file with TriviaGeneratorService\'s built-in templates (default: {BASE_TEMPLATES_PATH})')
+    parser.add_argument('--stats-output', default=STATS_OUTPUT_PATH,
+                        help=f'Dart file for the precomputed statistics (default: {STATS_OUTPUT_PATH})')
+    parser.add_argument('--report', metavar='PATH',
+                        help='Write validation results, statistics and duplicates as JSON')
+    parser.add_argument('--max-near-duplicates', type=int, metavar='N',
+                        help=f'Fail when more than N template pairs are at least '
+                             f'{NEAR_DUPLICATE_THRESHOLD * 100:.0f}%% similar')
+    parser.add_argument('--max-answer-conflicts', type=int, metavar='N',
+                        help='Fail when more than N answers are correct in one template '
+                             'and a distractor in another of the same theme')
+    parser.add_argument('--bundle', metavar='PATH', nargs='?', const=BUNDLE_PATH,
+                        help=f'Also write the binary template bundle (default path: {BUNDLE_PATH})')
+    parser.add_argument('--check-bundle', metavar='PATH', nargs='?', const=BUNDLE_PATH,
+                        help='Check an existing bundle against --output and exit')
+    parser.add_argument('--shards', metavar='DIR', nargs='?', const=SHARD_DIR,
+                        help=f'Also write one deferred library per theme group (default dir: {SHARD_DIR})')
+    parser.add_argument('--check-shards', metavar='DIR', nargs='?', const=SHARD_DIR,
+                        help='Check existing shards against --output and exit')
+    parser.add_argument('--check-sampling', action='store_true',
+                        help='Check the sampling tables against their weights with a chi-square test')
+    parser.add_argument('--samples', type=int, default=SAMPLING_SAMPLES,
+                        help=f'Draws per table for --check-sampling (default: {SAMPLING_SAMPLES})')
+
+    args = parser.parse_args()
+
+    if args.jobs is not None and args.jobs < 1:
+        print("✗ --jobs must be at least 1")
+        sys.exit(1)
+    if args.samples < 1:
+        print("✗ --samples must be at least 1")
+        sys.exit(1)
+
+    if args.check_bundle:
+        sys.exit(0 if check_bundle(args.check_bundle, args.output) else 1)
+    if args.check_shards:
+        sys.exit(0 if check_shards(args.check_shards, args.output) else 1)
+
+    files = find_batch_files(args.batch_dir)
+    if not files:
+        print(f"✗ No batch files found in {args.batch_dir}")
+        sys.exit(1)
+
+    cache = None if args.no_cache else ParseCache(args.cache_dir)
+    parsed_files, errors = parse_batch_files(files, jobs=args.jobs, cache=cache)
+    if errors:
+        for error in errors:
+            print(f"✗ {error}")
+        print(f"\n✗ {len(errors)} of {len(files)} batch files failed to parse")
+        sys.exit(1)
+
+    if cache is not None:
+        print(f"Parse cache: {cache.hits} hit, {cache.misses} miss")
+        cache.prune()
+
+    templates_by_theme = group_by_theme(parsed_files)
+
+    constants = load_game_constants()
+    report = analyze_templates(templates_by_theme, constants)
+    try:
+        base_templates = extract_base_templates(args.base_templates)
+    except ParseError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    if base_templates is None:
+        print(f"⚠ No built-in templates in {args.base_templates}; "
+              f"TriviaGeneratorService will check its own at startup")
+        base_templates = []
+    report['base'] = analyze_base_templates(base_templates, constants)
+    duplicates = report['duplicates']
+    print(f"Checked {report['templateCount']} templates: "
+          f"{len(report['errors'])} errors, {len(report['warnings'])} warnings, "
+          f"{len(duplicates['patterns'])} duplicate patterns, "
+          f"{len(duplicates['overlaps'])} overlapping template pairs, "
+          f"{len(duplicates['nearDuplicates'])} near-duplicate pairs, "
+          f"{len(duplicates['answerConflicts'])} answer conflicts")
+    limits = (('near-duplicate pairs', 'nearDuplicates', args.max_near_duplicates),
+              ('answer conflicts', 'answerConflicts', args.max_answer_conflicts))
+    for label, key, limit in limits:
+        if limit is not None and len(duplicates[key]) > limit:
+            report['errors'].append(f"{len(duplicates[key])} {label} "
+                                    f"(limit {limit}; see --report)")
+    base = report['base']
+    if base_templates:
+        print(f"Checked {base['templateCount']} built-in templates: "
+              f"{len(base['errors'])} errors")
+    if base['errors']:
+        print(f"⚠ Built-in templates fail TriviaGeneratorService's startup checks "
+              f"({base['errors'][0]}{', ...' if len(base['errors']) > 1 else ''}); "
+              f"the app keeps validating them at startup")
+    if args.report:
+        write_report(report, args.report)
+        print(f"Report written to {args.report}")
+    if report['errors']:
+        for error in report['errors']:
+            print(f"✗ {error}")
+        print(f"\n✗ Template validation failed; nothing was written")
+        sys.exit(1)
+
     # Generate the Dart file
-    output_path = 'lib/data/trivia_templates_consolidated.dart'
-    generate_dart_file(templates_by_theme, output_path)
+    tables = build_sampling_tables(report)
+    if args.check_sampling and not check_sampling(report, tables, args.samples):
+        print(f"\n✗ Sampling tables don't match their weights; nothing was written")
+        sys.exit(1)
+    generate_dart_file(templates_by_theme, args.output)
+    generate_stats_file(report, args.stats_output, tables)
+
+    if args.bundle:
+        size = write_bundle(templates_by_theme, args.bundle)
+        print(f"Generated {args.bundle} ({size / 1024:.1f} KB)")
+        if not check_bundle(args.bundle, args.output):
+            sys.exit(1)
+
+    if args.shards:
+        groups = write_shards(templates_by_theme, args.shards)
+        print(f"Generated {len(groups)} shards in {args.shards}: "
+              + ', '.join(f"{group} ({len(themes)} themes)"
+                          for group, themes in groups.items()))
+        if not check_shards(args.shards, args.output):
+            sys.exit(1)
     
     print(f"\nConsolidation complete!")
     print(f"Total templates: {sum(len(t) for t in templates_by_theme.values())}")
     print(f"Total themes: {len(templates_by_theme)}")
+    print(f"Total combinations: {report['totalPossibleCombinations']:,}")
 
+if __name__ == '__main__':
+    main()
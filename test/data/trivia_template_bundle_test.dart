@@ -0,0 +1,102 @@
+import 'dart:typed_data';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:n3rd_game/models/difficulty_level.dart';
+import 'package:n3rd_game/data/trivia_template_bundle.dart';
+
+/// `encode_bundle()` output for two themes:
+/// animals: 'These are pets' [Dog, Cat, Fish] / [Red, Rock, Tree],
+///          'These fly' [Bird, Bat, Bee] / [Dog, Fish, Cat], hard, with
+///          authored tiers {related: [Dog], subtle: [Fish, Cat]}
+/// kids_colors: 'These are colors' [Red, Blue, Green] / [Dog, Cat, Café]
+final _bundleBytes = Uint8List.fromList([
+  78, 51, 84, 66, 2, 0, 0, 0, 17, 0, 0, 0,
+  2, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
+  21, 0, 0, 0, 24, 0, 0, 0, 27, 0, 0, 0,
+  31, 0, 0, 0, 34, 0, 0, 0, 38, 0, 0, 0,
+  42, 0, 0, 0, 51, 0, 0, 0, 55, 0, 0, 0,
+  58, 0, 0, 0, 61, 0, 0, 0, 72, 0, 0, 0,
+  88, 0, 0, 0, 92, 0, 0, 0, 97, 0, 0, 0,
+  102, 0, 0, 0, 97, 110, 105, 109, 97, 108, 115, 84,
+  104, 101, 115, 101, 32, 97, 114, 101, 32, 112, 101, 116,
+  115, 68, 111, 103, 67, 97, 116, 70, 105, 115, 104, 82,
+  101, 100, 82, 111, 99, 107, 84, 114, 101, 101, 84, 104,
+  101, 115, 101, 32, 102, 108, 121, 66, 105, 114, 100, 66,
+  97, 116, 66, 101, 101, 107, 105, 100, 115, 95, 99, 111,
+  108, 111, 114, 115, 84, 104, 101, 115, 101, 32, 97, 114,
+  101, 32, 99, 111, 108, 111, 114, 115, 66, 108, 117, 101,
+  71, 114, 101, 101, 110, 67, 97, 102, 195, 169, 0, 0,
+  0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 12, 0,
+  0, 0, 33, 0, 0, 0, 1, 0, 0, 0, 1, 3,
+  2, 3, 4, 3, 5, 6, 7, 0, 7, 3, 5, 6,
+  7, 0, 0, 8, 3, 9, 10, 11, 3, 2, 4, 3,
+  3, 6, 1, 2, 2, 4, 3, 13, 3, 5, 14, 15,
+  3, 2, 3, 16, 0, 7, 3, 2, 3, 16, 0, 0,
+]);
+
+void main() {
+  group('TriviaTemplateBundle', () {
+    test('reads the theme index without decoding templates', () {
+      final bundle = TriviaTemplateBundle.fromBytes(_bundleBytes);
+      expect(bundle.themes, ['animals', 'kids_colors']);
+      expect(bundle.templateCount('animals'), 2);
+      expect(bundle.templateCount('kids_colors'), 1);
+      expect(bundle.totalTemplateCount, 3);
+      expect(bundle.isDecoded('animals'), false);
+    });
+
+    test('decodes a theme on first request', () {
+      final bundle = TriviaTemplateBundle.fromBytes(_bundleBytes);
+      final templates = bundle.templatesForTheme('animals');
+
+      expect(bundle.isDecoded('animals'), true);
+      expect(bundle.isDecoded('kids_colors'), false);
+      expect(templates.length, 2);
+      expect(templates[0].categoryPattern, 'These are pets');
+      expect(templates[0].correctPool, ['Dog', 'Cat', 'Fish']);
+      expect(templates[0].distractorPool, ['Red', 'Rock', 'Tree']);
+      expect(templates[0].theme, 'animals');
+      expect(templates[1].distractorPool, ['Dog', 'Fish', 'Cat']);
+      expect(identical(bundle.templatesForTheme('animals'), templates), true);
+    });
+
+    test('decodes difficulty and tiered distractor pools', () {
+      final bundle = TriviaTemplateBundle.fromBytes(_bundleBytes);
+      final templates = bundle.templatesForTheme('animals');
+
+      expect(templates[0].difficulty, DifficultyLevel.medium);
+      expect(templates[0].distractorPools, {
+        DistractorTier.obvious: ['Red', 'Rock', 'Tree'],
+        DistractorTier.related: <String>[],
+        DistractorTier.subtle: <String>[],
+      });
+      expect(templates[1].difficulty, DifficultyLevel.hard);
+      expect(templates[1].distractorPools, {
+        DistractorTier.related: ['Dog'],
+        DistractorTier.subtle: ['Fish', 'Cat'],
+      });
+      expect(
+        templates[1].getDistractorsForTier(DistractorTier.obvious),
+        ['Dog', 'Fish', 'Cat'],
+      );
+    });
+
+    test('shares strings across themes and decodes UTF-8', () {
+      final bundle = TriviaTemplateBundle.fromBytes(_bundleBytes);
+      final colors = bundle.templatesForTheme('kids_colors').single;
+      expect(colors.correctPool, ['Red', 'Blue', 'Green']);
+      expect(colors.distractorPool, ['Dog', 'Cat', 'Café']);
+    });
+
+    test('returns an empty list for unknown themes', () {
+      final bundle = TriviaTemplateBundle.fromBytes(_bundleBytes);
+      expect(bundle.templatesForTheme('missing'), isEmpty);
+    });
+
+    test('rejects data that is not a bundle', () {
+      expect(
+        () => TriviaTemplateBundle.fromBytes(Uint8List.fromList([1, 2, 3])),
+        throwsFormatException,
+      );
+    });
+  });
+}
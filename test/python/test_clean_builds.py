@@ -0,0 +1,31 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from clean_builds import get_size
+
+def test_get_size_many_directories(tmp_path):
+    # 40 top-level folders x 250 subfolders, one 3-byte file each
+    for i in range(40):
+        for j in range(250):
+            folder = tmp_path / f"d{i}" / f"s{j}"
+            folder.mkdir(parents=True)
+            (folder / "f").write_bytes(b"abc")
+    os.symlink(tmp_path / "d0", tmp_path / "link")
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        size = get_size(str(tmp_path), executor)
+    elapsed = time.monotonic() - start
+
+    link_size = os.lstat(tmp_path / "link").st_size
+    assert size == 40 * 250 * 3 + link_size
+    # Collecting each scan must stay O(1); the old loop took seconds here
+    assert elapsed < 5
+
+def test_get_size_file_and_missing(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"12345")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert get_size(str(path), executor) == 5
+        assert get_size(str(tmp_path / "missing"), executor) == 0
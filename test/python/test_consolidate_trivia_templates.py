@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from consolidate_trivia_templates import (
+    SAMPLING_SCALE, _chi_square, _chi_square_critical, alias_draw,
+    alias_probabilities, alias_table, check_sampling)
+
+WEIGHTS = [
+    [1],
+    [1, 1, 1, 1],
+    [1, 0, 3, 6],
+    [5, 1],
+    [7, 13, 1, 0, 40, 2, 2, 9],
+    [1] * 99 + [10_000],
+    [i * i for i in range(1, 50)],
+]
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+def test_alias_probabilities_match_weights(weights):
+    table = alias_table(weights)
+    total = sum(weights)
+    probabilities = alias_probabilities(table)
+    assert sum(probabilities) == pytest.approx(1)
+    for actual, weight in zip(probabilities, weights):
+        # Thresholds are rounded down to 1 / SAMPLING_SCALE per slot
+        assert actual == pytest.approx(weight / total, abs=len(weights) / SAMPLING_SCALE)
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+def test_alias_draws_pass_chi_square(weights):
+    table = alias_table(weights)
+    rng = random.Random(1)
+    samples = 20000
+    observed = [0] * len(weights)
+    for _ in range(samples):
+        observed[alias_draw(table, rng)] += 1
+    total = sum(weights)
+    statistic, df = _chi_square(observed, [w / total * samples for w in weights])
+    if df > 0:
+        assert statistic <= _chi_square_critical(df)
+    for index, weight in enumerate(weights):
+        if weight == 0:
+            assert observed[index] == 0
+
+def test_alias_table_zero_weights_is_uniform():
+    thresholds, aliases = alias_table([0, 0, 0])
+    assert thresholds == [SAMPLING_SCALE] * 3
+    assert alias_probabilities((thresholds, aliases)) == pytest.approx([1 / 3] * 3)
+
+def test_check_sampling_flags_a_wrong_table(capsys):
+    report = {'themes': {'t': {'templates': [{'possibleCombinations': w}
+                                              for w in (1, 1, 8)]}}}
+    assert check_sampling(report, samples=5000)
+    # A uniform table for skewed weights must fail the check
+    assert not check_sampling(report, {'t': alias_table([1, 1, 1])}, samples=5000)
+    assert "theme 't'" in capsys.readouterr().out
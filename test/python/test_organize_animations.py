@@ -0,0 +1,17 @@
+from organize_animations import unregistered_asset_dirs
+
+def test_unregistered_asset_dirs(tmp_path):
+    pubspec = tmp_path / "pubspec.yaml"
+    pubspec.write_text(
+        "flutter:\n"
+        "  assets:\n"
+        "    - assets/\n"
+        "    - assets/animations/logo/\n"
+    )
+    missing = unregistered_asset_dirs(
+        "assets/animations", ["title", "logo"], str(pubspec))
+    assert missing == ["assets/animations/", "assets/animations/title/"]
+
+def test_unregistered_asset_dirs_without_pubspec(tmp_path):
+    assert unregistered_asset_dirs(
+        "assets/animations", ["logo"], str(tmp_path / "pubspec.yaml")) == []
@@ -60,6 +60,28 @@ void main() {
       expect(service.isInitialized, wasInitialized);
     });
 
+    test('getAllAnimations reads categories from the index', () async {
+      service.loadIndexFromJson('''
+        {
+          "version": 1,
+          "categories": {
+            "shared": [
+              "assets/animations/shared/10.mp4",
+              "assets/animations/shared/8.mp4"
+            ],
+            "logo": ["assets/animations/logo/first loading.mp4"]
+          },
+          "files": {}
+        }
+      ''');
+      expect(await service.getAllAnimations('shared'), [
+        'assets/animations/shared/10.mp4',
+        'assets/animations/shared/8.mp4',
+      ]);
+      expect(await service.getAllAnimations('logo'), hasLength(1));
+      expect(await service.getAllAnimations('title'), isEmpty);
+    });
+
     test('dispose clears cache', () {
       // Create a separate instance for this test since tearDown will dispose the main one
       final testService = AnimationRandomizerService();
@@ -0,0 +1,31 @@
+import 'dart:math';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
+
+void main() {
+  group('TemplateSamplingTable', () {
+    test('draws indexes in proportion to their weights', () {
+      final table = TemplateSamplingTable.fromWeights([1, 0, 3, 6]);
+      final random = Random(42);
+      final counts = List<int>.filled(4, 0);
+      const draws = 20000;
+      for (int i = 0; i < draws; i++) {
+        counts[table.sample(random)]++;
+      }
+
+      expect(counts[1], 0);
+      expect(counts[0] / draws, closeTo(0.1, 0.02));
+      expect(counts[2] / draws, closeTo(0.3, 0.02));
+      expect(counts[3] / draws, closeTo(0.6, 0.02));
+    });
+
+    test('falls back to uniform without positive weights', () {
+      final table = TemplateSamplingTable.fromWeights([0, 0]);
+      expect(table.thresholds, [
+        TemplateSamplingTable.scale,
+        TemplateSamplingTable.scale,
+      ]);
+    });
+  });
+}
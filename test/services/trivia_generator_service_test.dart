@@ -3,6 +3,7 @@ import 'package:n3rd_game/services/trivia_generator_service.dart';
 import 'package:n3rd_game/models/trivia_item.dart';
 import 'package:n3rd_game/models/difficulty_level.dart';
 import 'package:n3rd_game/data/trivia_templates_consolidated.dart';
+import 'package:n3rd_game/services/trivia/template_sampling_table.dart';
 
 void main() {
   group('TriviaGeneratorService', () {
@@ -87,6 +88,34 @@ void main() {
       );
       expect(item.theme, 'science');
     });
+
+    test('draws a new theme with its precomputed sampling table', () {
+      final service = triviaService;
+      if (service == null) return; // Templates unavailable in this environment
+
+      TriviaTemplate template(String pattern) => TriviaTemplate(
+            categoryPattern: pattern,
+            correctPool: ['a1', 'a2', 'a3', 'a4'],
+            distractorPool: ['d1', 'd2', 'd3', 'd4'],
+            theme: 'sampling_test',
+          );
+      // Slot 0 never keeps its index and slot 1 always does: always index 1
+      const table = TemplateSamplingTable(
+        [0, TemplateSamplingTable.scale],
+        [1, 1],
+      );
+      service.setWeightByCombinations(true);
+      service.addTemplates(
+        [template('Never drawn'), template('Always drawn')],
+        samplingTables: {'sampling_test': table},
+      );
+
+      // Four correct answers give four distinct categories
+      for (int i = 0; i < 4; i++) {
+        final item = service.generateCategory(theme: 'sampling_test');
+        expect(item.category, 'Always drawn');
+      }
+    });
   });
 }
 
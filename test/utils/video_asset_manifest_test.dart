@@ -0,0 +1,94 @@
+import 'package:flutter_test/flutter_test.dart';
+import 'package:n3rd_game/utils/video_asset_manifest.dart';
+
+const _manifest = '''
+{"version":1,"videos":{
+  "titlescreen":{"priority":1,"variants":{
+    "standard":{"file":"titlescreen_standard.mp4","width":1080,"height":1920,"duration":8.0,"bytes":100,"sha256":"a"},
+    "tall":{"file":"titlescreen_tall.mp4","width":1080,"height":2340,"duration":8.0,"bytes":120,"sha256":"b","poster":"titlescreen_tall.webp"}}},
+  "logoloadingscreen":{"priority":0,"variants":{}},
+  "statscreen":{"priority":null,"variants":{}}}}
+''';
+
+void main() {
+  group('VideoAssetManifest', () {
+    setUp(() {
+      VideoAssetManifest.reset();
+    });
+
+    test('returns null when not loaded', () {
+      expect(VideoAssetManifest.isLoaded, false);
+      expect(
+        VideoAssetManifest.resolveVariant('assets/titlescreen.mp4', 'tall'),
+        isNull,
+      );
+      expect(VideoAssetManifest.preloadPaths(), isEmpty);
+    });
+
+    test('resolves an existing variant', () {
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(
+        VideoAssetManifest.resolveVariant('assets/titlescreen.mp4', 'tall'),
+        'assets/titlescreen_tall.mp4',
+      );
+    });
+
+    test('falls back to the closest generated variant', () {
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(
+        VideoAssetManifest.resolveVariant(
+          'assets/titlescreen.mp4',
+          'extra_tall',
+        ),
+        'assets/titlescreen_tall.mp4',
+      );
+    });
+
+    test('falls back to base path when no variants exist', () {
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(
+        VideoAssetManifest.resolveVariant('assets/statscreen.mp4', 'tall'),
+        'assets/statscreen.mp4',
+      );
+      expect(
+        VideoAssetManifest.resolveVariant('assets/unknown.mp4', 'tall'),
+        isNull,
+      );
+    });
+
+    test('resolves posters for generated variants only', () {
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(
+        VideoAssetManifest.resolvePoster('assets/titlescreen.mp4', 'tall'),
+        'assets/titlescreen_tall.webp',
+      );
+      expect(
+        VideoAssetManifest.resolvePoster('assets/titlescreen.mp4', 'standard'),
+        isNull,
+      );
+    });
+
+    test('orders preload paths by priority', () {
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(VideoAssetManifest.preloadPaths(), [
+        'assets/logoloadingscreen.mp4',
+        'assets/titlescreen.mp4',
+      ]);
+    });
+
+    test('merges preload paths with the defaults', () {
+      const defaults = [
+        'assets/logoloadingscreen.mp4',
+        'assets/modeselectionscreen.mp4',
+      ];
+      expect(VideoAssetManifest.preloadPaths(defaults: defaults), defaults);
+
+      VideoAssetManifest.loadFromJson(_manifest);
+      expect(VideoAssetManifest.preloadPaths(defaults: defaults), [
+        'assets/logoloadingscreen.mp4',
+        'assets/titlescreen.mp4',
+        'assets/modeselectionscreen.mp4',
+      ]);
+    });
+  });
+}
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Upload generated assets to Firebase Storage.
+
+The files to upload are read from the generated outputs:
+  - video_manifest.json (generate_responsive_videos.py)  -> public/videos/<file>
+  - animation_index.json (organize_animations.py)        -> public/<path under assets/>
+  - image reports (optimize_images.py --report)          -> public/<path under assets/>
+
+Each file's size and MD5 are compared with the remote object's metadata
+and unchanged files are skipped. The rest are sent as resumable uploads in
+chunks, several files at a time, retrying transient errors with backoff.
+Interrupted uploads resume from the last stored chunk, including on the
+next run.
+
+Talks to the Cloud Storage JSON API with the standard library only. With
+--emulator it targets the local Firebase Storage emulator (see firebase.json),
+so it can be run offline:
+
+    firebase emulators:start --only storage
+    python3 upload_assets_to_firebase.py --emulator
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PROJECT_ID = "wordn3rd-7bd5d"
+STORAGE_BUCKET = "wordn3rd-7bd5d.firebasestorage.app"
+STORAGE_API = "https://storage.googleapis.com"
+ASSETS_DIR = "assets"
+DEFAULT_MANIFESTS = [
+    "assets/video_manifest.json",
+    "assets/animations/animation_index.json",
+]
+VIDEO_PREFIX = "public/videos/"
+ASSET_PREFIX = "public/"
+# Resumable chunks must be multiples of 256 KiB
+CHUNK_SIZE = 8 * 1024 * 1024
+CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_WORKERS = 4
+MAX_RETRIES = 5
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+# Open upload sessions, so an interrupted run can resume them
+SESSION_FILE = ".upload_sessions.json"
+EMULATOR_ENV = "FIREBASE_STORAGE_EMULATOR_HOST"
+EMULATOR_TOKEN = "owner"
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+def emulator_host():
+    """Storage emulator host from the environment or firebase.json"""
+    if os.environ.get(EMULATOR_ENV):
+        return os.environ[EMULATOR_ENV]
+    try:
+        with open("firebase.json") as f:
+            port = json.load(f)["emulators"]["storage"]["port"]
+    except (OSError, ValueError, KeyError):
+        port = 9199
+    return f"127.0.0.1:{port}"
+
+def access_token():
+    """OAuth token for production uploads (GOOGLE_OAUTH_ACCESS_TOKEN or gcloud)"""
+    token = os.environ.get("GOOGLE_OAUTH_ACCESS_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(["gcloud", "auth", "print-access-token"],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        print("❌ No access token: set GOOGLE_OAUTH_ACCESS_TOKEN or run gcloud auth login")
+        print("   (or use --emulator to upload to the local Storage emulator)")
+        sys.exit(1)
+    return result.stdout.strip()
+
+def _asset_object(path):
+    return ASSET_PREFIX + os.path.relpath(path, ASSETS_DIR).replace(os.sep, "/")
+
+def read_manifest(path):
+    """(local path, object name) pairs listed by one generated output"""
+    with open(path) as f:
+        manifest = json.load(f)
+    base = os.path.dirname(path)
+    files = []
+    if "videos" in manifest:
+        for video in manifest["videos"].values():
+            for entry in video.get("variants", {}).values():
+                for name in (entry["file"], entry.get("poster"), entry.get("preview")):
+                    if name:
+                        files.append((os.path.join(base, name), VIDEO_PREFIX + name))
+    elif "categories" in manifest:
+        for paths in manifest["categories"].values():
+            files.extend((asset, _asset_object(asset)) for asset in paths)
+    elif "images" in manifest:
+        files.extend((row["output"], _asset_object(row["output"])) for row in manifest["images"])
+    else:
+        raise ValueError("not a video manifest, animation index or image report")
+    return files
+
+def file_md5(path):
+    """Base64 MD5, as Cloud Storage reports it in md5Hash"""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return base64.b64encode(digest.digest()).decode("ascii")
+
+class StorageClient:
+    """Minimal Cloud Storage JSON API client (metadata + resumable upload)"""
+
+    def __init__(self, endpoint, bucket, token):
+        self.endpoint = endpoint.rstrip("/")
+        self.bucket = bucket
+        self.token = token
+
+    def _request(self, method, url, body=None, headers=None):
+        """Send a request, retrying transient failures; returns (status, headers, body)
+
+        4xx responses other than RETRY_STATUSES are returned, not raised.
+        308 (resume incomplete) counts as a normal response.
+        """
+        headers = dict(headers or {})
+        headers["Authorization"] = f"Bearer {self.token}"
+        for attempt in range(MAX_RETRIES + 1):
+            request = urllib.request.Request(url, data=body, headers=headers, method=method)
+            try:
+                with urllib.request.urlopen(request, timeout=120) as response:
+                    return response.status, response.headers, response.read()
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return e.code, e.headers, e.read()
+            except (urllib.error.URLError, OSError):
+                if attempt == MAX_RETRIES:
+                    raise
+            time.sleep(min(32, 2 ** attempt) * (0.5 + random.random() / 2))
+
+    def object_url(self, name):
+        quoted = urllib.parse.quote(name, safe="")
+        return f"{self.endpoint}/storage/v1/b/{self.bucket}/o/{quoted}"
+
+    def metadata(self, name):
+        """Object metadata, or None if it doesn't exist"""
+        status, _, body = self._request("GET", self.object_url(name))
+        if status == 404:
+            return None
+        if status != 200:
+            raise OSError(f"metadata for {name}: HTTP {status} {body[:200]!r}")
+        return json.loads(body)
+
+    def start_upload(self, name, size, content_type, md5):
+        """Open a resumable upload session; returns its URL"""
+        query = urllib.parse.urlencode({"uploadType": "resumable", "name": name})
+        url = f"{self.endpoint}/upload/storage/v1/b/{self.bucket}/o?{query}"
+        body = json.dumps({"name": name, "contentType": content_type,
+                           "metadata": {"md5": md5}}).encode()
+        status, headers, response = self._request("POST", url, body, {
+            "Content-Type": "application/json; charset=UTF-8",
+            "X-Upload-Content-Type": content_type,
+            "X-Upload-Content-Length": str(size),
+        })
+        if status != 200 or not headers.get("Location"):
+            raise OSError(f"start upload {name}: HTTP {status} {response[:200]!r}")
+        return headers["Location"]
+
+    def uploaded_bytes(self, session, size):
+        """Bytes the session has stored, or None if it is gone or finished"""
+        status, headers, _ = self._request("PUT", session, b"", {
+            "Content-Range": f"bytes */{size}"})
+        if status == 308:
+            stored = headers.get("Range")
+            return int(stored.rsplit("-", 1)[1]) + 1 if stored else 0
+        return None
+
+    def upload_chunks(self, session, path, size, offset, chunk_size):
+        """Send path from offset in chunks; returns the final object metadata"""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            while True:
+                chunk = f.read(chunk_size)
+                end = offset + len(chunk) - 1
+                content_range = (f"bytes {offset}-{end}/{size}" if chunk
+                                 else f"bytes */{size}")
+                status, headers, body = self._request("PUT", session, chunk, {
+                    "Content-Range": content_range})
+                if status in (200, 201):
+                    return json.loads(body)
+                if status != 308:
+                    raise OSError(f"upload {path}: HTTP {status} {body[:200]!r}")
+                stored = headers.get("Range")
+                offset = int(stored.rsplit("-", 1)[1]) + 1 if stored else 0
+                f.seek(offset)
+
+class SessionStore:
+    """Upload sessions by object name, persisted across runs"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.sessions = json.load(f)
+        except (OSError, ValueError):
+            self.sessions = {}
+
+    def get(self, name, md5, size):
+        entry = self.sessions.get(name)
+        if entry and entry["md5"] == md5 and entry["size"] == size:
+            return entry["url"]
+        return None
+
+    def put(self, name, md5, size, url):
+        with self.lock:
+            if url is None:
+                self.sessions.pop(name, None)
+            else:
+                self.sessions[name] = {"md5": md5, "size": size, "url": url}
+            with open(self.path + ".tmp", "w") as f:
+                json.dump(self.sessions, f, indent=2, sort_keys=True)
+            os.replace(self.path + ".tmp", self.path)
+
+def upload_file(client, sessions, path, name, chunk_size, force=False, dry_run=False):
+    """Upload one file unless the remote copy matches; returns (action, bytes sent)"""
+    size = os.path.getsize(path)
+    md5 = file_md5(path)
+    if not force:
+        remote = client.metadata(name)
+        if (remote and int(remote.get("size", -1)) == size and
+                (remote.get("md5Hash") or remote.get("metadata", {}).get("md5")) == md5):
+            return "unchanged", 0
+    if dry_run:
+        return "would upload", 0
+
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    session = sessions.get(name, md5, size)
+    offset = client.uploaded_bytes(session, size) if session else None
+    action = "resumed" if offset else "uploaded"
+    if offset is None:
+        session = client.start_upload(name, size, content_type, md5)
+        sessions.put(name, md5, size, session)
+        offset = 0
+    result = client.upload_chunks(session, path, size, offset, chunk_size)
+    sessions.put(name, md5, size, None)
+    if result.get("md5Hash") and result["md5Hash"] != md5:
+        raise OSError(f"upload {path}: MD5 mismatch after upload")
+    return action, size - offset
+
+def format_size(size):
+    for unit in ["B", "K", "M", "G"]:
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Upload generated assets to Firebase Storage, skipping unchanged files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # Upload everything listed by the default manifests
+  python3 upload_assets_to_firebase.py
+
+  # Local Storage emulator (firebase emulators:start --only storage)
+  python3 upload_assets_to_firebase.py --emulator
+
+  # Only the responsive videos, showing what would change
+  python3 upload_assets_to_firebase.py assets/video_manifest.json --dry-run
+
+Default manifests: {', '.join(DEFAULT_MANIFESTS)}
+Auth: GOOGLE_OAUTH_ACCESS_TOKEN or gcloud; {EMULATOR_ENV} overrides the emulator host
+        """,
+    )
+    parser.add_argument("manifests", nargs="*",
+                        help="Video manifests, animation indexes or image reports to upload from")
+    parser.add_argument("--bucket", default=STORAGE_BUCKET,
+                        help=f"Storage bucket (default: {STORAGE_BUCKET})")
+    parser.add_argument("--emulator", action="store_true",
+                        help="Upload to the local Storage emulator instead of production")
+    parser.add_argument("--emulator-host", metavar="HOST:PORT",
+                        help=f"Emulator host (default: {EMULATOR_ENV} or the firebase.json port)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent uploads (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_SIZE // 1024 ** 2,
+                        help=f"Resumable chunk size in MB (default: {CHUNK_SIZE // 1024 ** 2})")
+    parser.add_argument("--force", action="store_true",
+                        help="Upload even when the remote copy matches")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only report which files would be uploaded")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_mb < 1:
+        parser.error("--chunk-mb must be at least 1")
+    return args
+
+def main():
+    args = parse_args()
+    manifests = args.manifests or [path for path in DEFAULT_MANIFESTS if os.path.exists(path)]
+    if not manifests:
+        print("❌ No generated outputs found; run generate_responsive_videos.py, "
+              "organize_animations.py or optimize_images.py --report first")
+        sys.exit(1)
+
+    files = {}
+    for manifest in manifests:
+        try:
+            for path, name in read_manifest(manifest):
+                files[name] = path
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Cannot read {manifest}: {e}")
+            sys.exit(1)
+    missing = sorted(path for path in files.values() if not os.path.isfile(path))
+    for path in missing:
+        print(f"⚠️  File not found: {path}")
+    files = {name: path for name, path in files.items() if os.path.isfile(path)}
+
+    if args.emulator:
+        host = args.emulator_host or emulator_host()
+        client = StorageClient(f"http://{host}", args.bucket, EMULATOR_TOKEN)
+        target = f"emulator {host}"
+    else:
+        client = StorageClient(STORAGE_API, args.bucket, access_token())
+        target = f"gs://{args.bucket}"
+
+    print(f"🚀 Uploading {len(files)} files to {target}...")
+    print("")
+    sessions = SessionStore(SESSION_FILE)
+    chunk_size = max(CHUNK_ALIGNMENT, args.chunk_mb * 1024 ** 2 // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+    counts = {}
+    sent = 0
+    failed = 0
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(upload_file, client, sessions, path, name, chunk_size,
+                            args.force, args.dry_run): name
+            for name, path in sorted(files.items())
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                action, size = future.result()
+            except OSError as e:
+                print(f"  ❌ {name}: {e}")
+                failed += 1
+                continue
+            counts[action] = counts.get(action, 0) + 1
+            sent += size
+            if action != "unchanged":
+                print(f"  ✅ {name} ({action}{', ' + format_size(size) if size else ''})")
+    elapsed = time.monotonic() - start
+
+    print("")
+    print("📊 Summary:")
+    for action, count in sorted(counts.items()):
+        print(f"   {action}: {count}")
+    if failed:
+        print(f"   ❌ failed: {failed}")
+    print(f"   {format_size(sent)} in {elapsed:.1f}s "
+          f"({format_size(sent / elapsed if elapsed else 0)}/s)")
+    if failed or missing:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()